@@ -76,6 +76,19 @@ TEMPLATES = [
 WSGI_APPLICATION = "wsgi.application"
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+# Per process memory cache. Point to a shared backend (memcached, redis) when running multiple workers.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "sailfish",
+        "TIMEOUT": 60 * 60,
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
@@ -147,6 +160,45 @@ LOGGING = {
     },
 }
 
+# Handlers of these loggers run on a background thread, importer hot loops do not
+# wait for log formatting and file writes.
+LOGGING_CONFIG = "divisions.common.logging_queue.configure_logging"
+LOGGING_QUEUE_LOGGERS = [""]
+LOGGING_QUEUE_SIZE = 10000
+
+# Jobs of run_scheduler command, each runs a management command with options every
+# interval_seconds or on a five field cron expression (UTC).
+SCHEDULER_JOBS = [
+    {
+        "name": "wallet_balances",
+        "command": "import_wallet_balances",
+        "options": {"provider": "BYBIT", "wallet_type": "DERIVATIVE", "currency": "USDT"},
+        "interval_seconds": 60,
+    },
+    {
+        "name": "trading_data",
+        "command": "import_trading_data",
+        "options": {
+            "provider": "BYBIT",
+            "trading_category": "linear",
+            "number_of_pages": 1,
+        },
+        "interval_seconds": 300,
+    },
+    {
+        "name": "account_transfers",
+        "command": "import_account_transfers",
+        "options": {"provider": "BYBIT", "wallet_type": "DERIVATIVE", "currency": "USDT"},
+        "cron": "0 * * * *",
+    },
+]
+
 BYBIT_API_URL = "https://api.bybit.com/"
 BYBIT_API_KEY = "<TAG>"
 BYBIT_API_SECRET_KEY = "<TAG>"
+# Raw API response pages are archived here when set, see replay_response_archive command.
+BYBIT_RESPONSE_ARCHIVE_DIR = None
+
+GOOGLE_SHEETS_CREDENTIALS_FILE = "<TAG>"
+# Last published cell values per spreadsheet, reporter sends only what differs from it.
+SHEETS_REPORT_SNAPSHOT_DIR = BASE_DIR / "sheets_snapshots"
@@ -0,0 +1,12 @@
+from conf.settings_base import *  # noqa: F401,F403
+
+# Tests run against in memory SQLite and log to console only.
+# ex. python manage.py test --settings=conf.settings_test
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    }
+}
+LOGGING["handlers"]["log_file"] = {"class": "logging.NullHandler"}  # noqa: F405
+LOGGING_QUEUE_LOGGERS = []
@@ -0,0 +1,101 @@
+import gzip
+import hashlib
+import logging
+import pathlib
+import time
+import typing
+import uuid
+
+import simplejson
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE_NAME = "index.jsonl"
+
+
+class ArchiveEntry(typing.NamedTuple):
+    endpoint: str
+    params: dict
+    # Request window (startTime/endTime) and fetch time, epoch milliseconds.
+    window_start: typing.Optional[int]
+    window_end: typing.Optional[int]
+    fetched_at: int
+    path: str
+
+
+class ResponseArchive(object):
+    """
+    Raw API response pages stored gzip compressed on local disk, one file per page
+    under a directory per endpoint. Every endpoint directory has an index of JSON
+    lines with endpoint, request params, params window and fetch time of each page.
+    """
+
+    LOG_PREFIX = "[BYBIT-RESPONSE-ARCHIVE]"
+
+    def __init__(self, directory: typing.Union[str, pathlib.Path]):
+        self.directory = pathlib.Path(directory)
+
+    def write(
+        self, endpoint: str, params: typing.Optional[dict], content: bytes
+    ) -> ArchiveEntry:
+        params = dict(params or {})
+        fetched_at = int(time.time() * 1000)
+        endpoint_directory = self.directory / _get_endpoint_directory_name(
+            endpoint=endpoint
+        )
+        page_directory = endpoint_directory / time.strftime(
+            "%Y-%m-%d", time.gmtime(fetched_at / 1000)
+        )
+        page_directory.mkdir(parents=True, exist_ok=True)
+        # Params hash groups pages of one request, uuid keeps concurrent fetches apart.
+        page_path = page_directory / "{}-{}-{}.json.gz".format(
+            fetched_at,
+            hashlib.sha1(
+                simplejson.dumps(params, sort_keys=True).encode("utf-8")
+            ).hexdigest()[:12],
+            uuid.uuid4().hex[:8],
+        )
+        with gzip.open(page_path, "wb") as f:
+            f.write(content)
+
+        entry = ArchiveEntry(
+            endpoint=endpoint,
+            params=params,
+            window_start=params.get("startTime"),
+            window_end=params.get("endTime"),
+            fetched_at=fetched_at,
+            path=str(page_path.relative_to(self.directory)),
+        )
+        # One short line per write, appends from concurrent processes do not interleave.
+        with open(endpoint_directory / INDEX_FILE_NAME, "a") as f:
+            f.write(simplejson.dumps(entry._asdict()) + "\n")
+
+        return entry
+
+    def read(self, entry: ArchiveEntry) -> bytes:
+        with gzip.open(self.directory / entry.path, "rb") as f:
+            return f.read()
+
+    def iter_entries(
+        self, endpoints: typing.Optional[typing.Collection[str]] = None
+    ) -> typing.Iterator[ArchiveEntry]:
+        endpoint_directory_names = (
+            {_get_endpoint_directory_name(endpoint=endpoint) for endpoint in endpoints}
+            if endpoints is not None
+            else None
+        )
+        for index_path in sorted(self.directory.glob("*/{}".format(INDEX_FILE_NAME))):
+            if (
+                endpoint_directory_names is not None
+                and index_path.parent.name not in endpoint_directory_names
+            ):
+                continue
+
+            with open(index_path) as f:
+                for line in f:
+                    if line.strip():
+                        yield ArchiveEntry(**simplejson.loads(line))
+
+
+def _get_endpoint_directory_name(endpoint: str) -> str:
+    return endpoint.strip("/").replace("/", "_")
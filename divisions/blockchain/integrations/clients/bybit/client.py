@@ -7,11 +7,14 @@ import requests
 import hashlib
 import hmac
 import logging
+import threading
+import orjson
 import simplejson
 from urllib import parse as url_parser
 
 from django.conf import settings
 
+from divisions.blockchain.integrations.clients.bybit import archive as response_archive
 from divisions.blockchain.integrations.clients.bybit import enums
 from divisions.blockchain.integrations.clients.bybit import exceptions
 from divisions.common import enums as common_enums
@@ -19,6 +22,19 @@ from divisions.common import utils as common_utils
 
 logger = logging.getLogger(__name__)
 
+# HTTP connections are pooled per thread for whole process, clients created by every
+# scheduled run reuse them. requests.Session is not thread safe, so worker threads
+# (scheduler jobs, transfer windows) do not share one.
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+
+    return session
+
 
 class ByBitClient(object):
     API_BASE_URL = settings.BYBIT_API_URL
@@ -26,9 +42,28 @@ class ByBitClient(object):
     API_SECRET_KEY = settings.BYBIT_API_SECRET_KEY
     VALID_STATUS_CODES = [200]
     REQUEST_EXPIRATION = 5000  # value in ms
+    RESPONSE_ARCHIVE_DIR = settings.BYBIT_RESPONSE_ARCHIVE_DIR
 
     LOG_PREFIX = "[BYBIT-CLIENT]"
 
+    def __init__(
+        self, archive: typing.Optional[response_archive.ResponseArchive] = None
+    ):
+        # Raw response pages are archived when archive is given or configured, so
+        # history can be replayed into importers without refetching it.
+        if archive is None and self.RESPONSE_ARCHIVE_DIR:
+            archive = response_archive.ResponseArchive(
+                directory=self.RESPONSE_ARCHIVE_DIR
+            )
+
+        self.archive = archive
+        # Requests and pages of paginated responses made by this client, read by
+        # import run stages. Client is used from several threads, so counters are
+        # updated under lock.
+        self.request_count = 0
+        self.page_count = 0
+        self._counts_lock = threading.Lock()
+
     def get_market_instruments(
         self,
         category: enums.TradingCategory,
@@ -58,6 +93,7 @@ class ByBitClient(object):
         order_id: typing.Optional[str] = None,
         order_status: typing.Optional[enums.TradeOrderStatus] = None,
         order_filter: typing.Optional[str] = None,
+        decimal_fields: typing.Optional[typing.Collection[str]] = None,
     ) -> typing.List[dict]:
         params = {"limit": limit, "category": category.value}
 
@@ -79,6 +115,7 @@ class ByBitClient(object):
             params=params,
             data_field="list",
             depth=depth,
+            decimal_fields=decimal_fields,
         )
 
     def get_trade_positions(
@@ -110,6 +147,7 @@ class ByBitClient(object):
         order_id: typing.Optional[str] = None,
         from_datetime: typing.Optional[datetime.datetime] = None,
         to_datetime: typing.Optional[datetime.datetime] = None,
+        decimal_fields: typing.Optional[typing.Collection[str]] = None,
     ) -> typing.List[dict]:
         params = {"limit": limit, "category": category.value, "symbol": symbol}
 
@@ -135,6 +173,7 @@ class ByBitClient(object):
             params=params,
             data_field="list",
             depth=depth,
+            decimal_fields=decimal_fields,
         )
 
     def get_trade_positions_profit_and_loss(
@@ -145,6 +184,7 @@ class ByBitClient(object):
         limit: int = 50,
         from_datetime: typing.Optional[datetime.datetime] = None,
         to_datetime: typing.Optional[datetime.datetime] = None,
+        decimal_fields: typing.Optional[typing.Collection[str]] = None,
     ) -> typing.List[dict]:
         params = {"symbol": symbol, "limit": limit, "category": category.value}
 
@@ -164,6 +204,7 @@ class ByBitClient(object):
             params=params,
             depth=depth,
             data_field="list",
+            decimal_fields=decimal_fields,
         )
 
     def get_transactions(
@@ -219,12 +260,10 @@ class ByBitClient(object):
         if currency:
             params["coin"] = currency.value
 
-        return self._get_response_content(
-            response=self._request(
-                endpoint="/asset/v3/private/transfer/account-coins/balance/query",
-                method=common_enums.HttpMethod.GET,
-                params=params,
-            )
+        return self._request_content(
+            endpoint="/asset/v3/private/transfer/account-coins/balance/query",
+            method=common_enums.HttpMethod.GET,
+            params=params,
         )
 
     def get_wallet_internal_transfers(
@@ -318,15 +357,33 @@ class ByBitClient(object):
             endpoint="/v5/asset/withdraw/query-record",
             method=common_enums.HttpMethod.GET,
             params=params,
-            data_field="list",
+            data_field="rows",
             depth=depth,
         )
 
-    def _get_response_content(self, response: requests.Response) -> dict:
-        content = simplejson.loads(
-            response.content,
-            parse_float=decimal.Decimal,
-        )
+    def _get_response_content(
+        self,
+        response: requests.Response,
+        data_field: typing.Optional[str] = None,
+        decimal_fields: typing.Optional[typing.Collection[str]] = None,
+    ) -> dict:
+        content = None
+        if decimal_fields is not None:
+            try:
+                content = self._decode_selective(
+                    content=response.content,
+                    data_field=data_field,
+                    decimal_fields=decimal_fields,
+                )
+            except orjson.JSONDecodeError:
+                # Ex. NaN literals, accepted by simplejson but not strict JSON.
+                content = None
+
+        if content is None:
+            content = simplejson.loads(
+                response.content,
+                parse_float=decimal.Decimal,
+            )
 
         # TODO: Later on map all codes and handle properly
         if (
@@ -341,6 +398,29 @@ class ByBitClient(object):
 
         return content["result"]
 
+    @staticmethod
+    def _decode_selective(
+        content: bytes, data_field: str, decimal_fields: typing.Collection[str]
+    ) -> dict:
+        # Decodes floats as floats and turns only fields caller's schema reads as
+        # decimals into Decimal. Amounts mostly come as strings, which are left to
+        # schema. repr gives shortest literal of float, same as parsed number up to
+        # 15 significant digits.
+        decoded_content = orjson.loads(content)
+        result = decoded_content.get("result")
+        if isinstance(result, dict) and isinstance(result.get(data_field), list):
+            to_decimal = decimal.Decimal
+            for row in result[data_field]:
+                if row.__class__ is not dict:
+                    continue
+
+                for field in decimal_fields:
+                    value = row.get(field)
+                    if value.__class__ is float:
+                        row[field] = to_decimal(repr(value))
+
+        return decoded_content
+
     def _get_paginated_response(
         self,
         endpoint: str,
@@ -349,18 +429,21 @@ class ByBitClient(object):
         data_field: str,
         params: typing.Optional[dict] = None,
         payload: typing.Optional[dict] = None,
+        decimal_fields: typing.Optional[typing.Collection[str]] = None,
     ) -> typing.List[dict]:
         data = []
 
         for _ in range(depth):
-            response = self._get_response_content(
-                response=self._request(
-                    endpoint=endpoint,
-                    method=method,
-                    params=params,
-                    payload=payload,
-                )
+            response = self._request_content(
+                endpoint=endpoint,
+                method=method,
+                params=params,
+                payload=payload,
+                data_field=data_field,
+                decimal_fields=decimal_fields,
             )
+            with self._counts_lock:
+                self.page_count += 1
             data.extend(response.get(data_field, []))
 
             if not response.get("nextPageCursor", False):
@@ -370,6 +453,28 @@ class ByBitClient(object):
 
         return data
 
+    def _request_content(
+        self,
+        endpoint: str,
+        method: common_enums.HttpMethod,
+        params: typing.Optional[dict] = None,
+        payload: typing.Optional[dict] = None,
+        data_field: typing.Optional[str] = None,
+        decimal_fields: typing.Optional[typing.Collection[str]] = None,
+    ) -> dict:
+        response = self._request(
+            endpoint=endpoint, method=method, params=params, payload=payload
+        )
+        content = self._get_response_content(
+            response=response, data_field=data_field, decimal_fields=decimal_fields
+        )
+        # Only pages accepted by API (retCode OK) are archived, so replay never
+        # meets error pages.
+        if self.archive is not None:
+            self._archive_response(endpoint=endpoint, params=params, response=response)
+
+        return content
+
     def _request(
         self,
         endpoint: str,
@@ -377,6 +482,8 @@ class ByBitClient(object):
         params: typing.Optional[dict] = None,
         payload: typing.Optional[dict] = None,
     ) -> requests.Response:
+        with self._counts_lock:
+            self.request_count += 1
         url = url_parser.urljoin(base=self.API_BASE_URL, url=endpoint)
         signature_payload = self._construct_signature_payload(
             params=params, payload=payload, method=method
@@ -386,7 +493,7 @@ class ByBitClient(object):
         )
 
         try:
-            response = requests.request(
+            response = _get_session().request(
                 url=url,
                 method=method.value,
                 params=params,
@@ -416,6 +523,19 @@ class ByBitClient(object):
 
         return response
 
+    def _archive_response(
+        self, endpoint: str, params: typing.Optional[dict], response: requests.Response
+    ) -> None:
+        try:
+            self.archive.write(
+                endpoint=endpoint, params=params, content=response.content
+            )
+        except Exception as e:
+            msg = "Unable to archive response (endpoint={}). Error: {}".format(
+                endpoint, common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}. Continue.".format(self.LOG_PREFIX, msg))
+
     @staticmethod
     def _construct_signature_payload(
         params: typing.Optional[dict],
@@ -57,3 +57,21 @@ class WalletInternalTransferStatus(enum.Enum):
     SUCCESS = "SUCCESS"
     PENDING = "PENDING"
     FAILED = "FAILED"
+
+
+class DepositStatus(enum.Enum):
+    UNKNOWN = 0
+    TO_BE_CONFIRMED = 1
+    PROCESSING = 2
+    SUCCESS = 3
+    FAILED = 4
+
+
+class WithdrawalStatus(enum.Enum):
+    SECURITY_CHECK = "SecurityCheck"
+    PENDING = "Pending"
+    SUCCESS = "success"
+    CANCELLED_BY_USER = "CancelByUser"
+    REJECTED = "Reject"
+    FAILED = "Fail"
+    BLOCKCHAIN_CONFIRMED = "BlockchainConfirmed"
@@ -0,0 +1,76 @@
+import atexit
+import logging
+import logging.config
+import logging.handlers
+import os
+import queue
+
+from django.conf import settings
+
+_listeners = []
+
+
+class _BlockingQueueHandler(logging.handlers.QueueHandler):
+    # Waits for free queue slot instead of dropping record when listener falls
+    # behind, memory stays bounded and no line is lost.
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue.put(record)
+
+
+class _LoggerListener(object):
+    def __init__(self, logger: logging.Logger, queue_size: int):
+        self.logger = logger
+        self.handlers = list(logger.handlers)
+        self.queue_handler = _BlockingQueueHandler(queue.Queue(maxsize=queue_size))
+        self.listener = logging.handlers.QueueListener(
+            self.queue_handler.queue, *self.handlers, respect_handler_level=True
+        )
+
+    def start(self) -> None:
+        for handler in self.handlers:
+            self.logger.removeHandler(handler)
+
+        self.logger.addHandler(self.queue_handler)
+        self.listener.start()
+
+    def stop(self) -> None:
+        # Writes records still queued.
+        self.listener.stop()
+
+    def restore_handlers(self) -> None:
+        self.logger.removeHandler(self.queue_handler)
+        for handler in self.handlers:
+            self.logger.addHandler(handler)
+
+
+def configure_logging(logging_settings: dict) -> None:
+    """
+    Configures logging from LOGGING and moves handlers of LOGGING_QUEUE_LOGGERS to
+    a background listener thread. Logging calls only put records to a queue, while
+    formatting and file writes happen on the listener thread.
+    """
+    stop_listeners()
+    logging.config.dictConfig(logging_settings)
+    for logger_name in settings.LOGGING_QUEUE_LOGGERS:
+        logger_listener = _LoggerListener(
+            logger=logging.getLogger(logger_name),
+            queue_size=settings.LOGGING_QUEUE_SIZE,
+        )
+        logger_listener.start()
+        _listeners.append(logger_listener)
+
+
+def stop_listeners() -> None:
+    while _listeners:
+        _listeners.pop().stop()
+
+
+def _restore_handlers_in_child() -> None:
+    # Listener thread is not copied to forked processes, they log synchronously.
+    while _listeners:
+        _listeners.pop().restore_handlers()
+
+
+atexit.register(stop_listeners)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restore_handlers_in_child)
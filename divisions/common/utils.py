@@ -1,5 +1,9 @@
+import base64
+import datetime
 import typing
 
+import simplejson
+
 from divisions.common import constants
 from divisions.common import enums
 
@@ -19,3 +23,24 @@ def convert_timestamp_to_milliseconds(timestamp: typing.Union[int, float]) -> in
 
 def get_chain_currency(currency: enums.Currency) -> enums.Currency:
     return constants.TRANSACTION_CHAIN_CURRENCY_MAP[currency]
+
+
+def encode_keyset_cursor(values: typing.Sequence[typing.Any]) -> str:
+    return (
+        base64.urlsafe_b64encode(
+            simplejson.dumps(
+                [
+                    value.isoformat() if isinstance(value, datetime.datetime) else value
+                    for value in values
+                ]
+            ).encode("utf-8")
+        )
+        .decode("ascii")
+        .rstrip("=")
+    )
+
+
+def decode_keyset_cursor(cursor: str) -> typing.List[typing.Any]:
+    return simplejson.loads(
+        base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+    )
@@ -22,3 +22,36 @@ class AggregationPeriod(enum.Enum):
     MONTH = 2
     WEEK = 3
     YEAR = 4
+
+
+class CostBasisMethod(enum.Enum):
+    FIFO = "FIFO"
+    AVERAGE_COST = "AVERAGE_COST"
+
+
+class ImportStream(enum.Enum):
+    TRANSACTION_LOG = "TRANSACTION_LOG"
+    TRADE_PNL = "TRADE_PNL"
+    TRADE_ORDERS = "TRADE_ORDERS"
+    TRADE_EXECUTIONS = "TRADE_EXECUTIONS"
+    TRADE_POSITIONS = "TRADE_POSITIONS"
+    MARKET_INSTRUMENTS = "MARKET_INSTRUMENTS"
+    WALLET_BALANCES = "WALLET_BALANCES"
+    WALLET_INTERNAL_TRANSFERS = "WALLET_INTERNAL_TRANSFERS"
+    WALLET_EXTERNAL_TRANSFERS = "WALLET_EXTERNAL_TRANSFERS"
+
+
+class ImportRunStatus(enum.Enum):
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+
+class ExportDataset(enum.Enum):
+    EXECUTIONS = "EXECUTIONS"
+    PNL = "PNL"
+
+
+class ExportFormat(enum.Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
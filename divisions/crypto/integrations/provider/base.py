@@ -1,6 +1,7 @@
 import abc
 import datetime
 import logging
+import threading
 import typing
 
 import marshmallow
@@ -8,6 +9,7 @@ import marshmallow
 from divisions.common import enums as common_enums
 from divisions.common import utils as common_utils
 from divisions.crypto import enums as crypto_enums
+from divisions.crypto.integrations.provider import columnar
 from divisions.crypto.integrations.provider import enums
 from divisions.crypto.integrations.provider import messages
 
@@ -17,6 +19,12 @@ class BaseProvider(object):
 
     def __init__(self):
         self.log_prefix = "[{}-PROVIDER]".format(self.provider.name)
+        # In tolerant mode invalid rows are dropped from page instead of failing it,
+        # they are collected in rejected_rows until caller pops them. Pages may be
+        # validated on worker threads while caller pops, list is guarded by lock.
+        self.tolerant_validation = False
+        self.rejected_rows = []
+        self._rejected_rows_lock = threading.Lock()
 
     @property
     @abc.abstractmethod
@@ -91,6 +99,77 @@ class BaseProvider(object):
     ) -> typing.List[messages.TradeExecution]:
         raise NotImplementedError
 
+    # Columnar variants of high-volume pages. Providers without a direct columnar
+    # path return messages packed into columns.
+    def get_trade_positions_profit_and_loss_batch(
+        self,
+        trading_category: enums.TradingCategory,
+        market_instrument_symbol: str,
+        depth: int = 1,
+        limit: int = 50,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> columnar.ColumnarBatch:
+        return columnar.ColumnarBatch.from_messages(
+            message_class=messages.TradePnLPosition,
+            messages=self.get_trade_positions_profit_and_loss(
+                trading_category=trading_category,
+                market_instrument_symbol=market_instrument_symbol,
+                depth=depth,
+                limit=limit,
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+            ),
+        )
+
+    def get_trade_orders_batch(
+        self,
+        trading_category: enums.TradingCategory,
+        depth: int = 1,
+        limit: int = 50,
+        market_instrument_symbol: typing.Optional[str] = None,
+        order_id: typing.Optional[str] = None,
+        order_status: typing.Optional[enums.TradeOrderStatus] = None,
+        order_filter: typing.Optional[str] = None,
+    ) -> columnar.ColumnarBatch:
+        return columnar.ColumnarBatch.from_messages(
+            message_class=messages.TradeOrder,
+            messages=self.get_trade_orders(
+                trading_category=trading_category,
+                depth=depth,
+                limit=limit,
+                market_instrument_symbol=market_instrument_symbol,
+                order_id=order_id,
+                order_status=order_status,
+                order_filter=order_filter,
+            ),
+        )
+
+    def get_trade_executions_batch(
+        self,
+        trading_category: enums.TradingCategory,
+        market_instrument_symbol: str,
+        depth: int = 1,
+        limit: int = 50,
+        execution_type: typing.Optional[enums.TradeExecutionType] = None,
+        order_id: typing.Optional[str] = None,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> columnar.ColumnarBatch:
+        return columnar.ColumnarBatch.from_messages(
+            message_class=messages.TradeExecution,
+            messages=self.get_trade_executions(
+                trading_category=trading_category,
+                market_instrument_symbol=market_instrument_symbol,
+                depth=depth,
+                limit=limit,
+                execution_type=execution_type,
+                order_id=order_id,
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+            ),
+        )
+
     @abc.abstractmethod
     def get_wallet_balances(
         self,
@@ -111,6 +190,43 @@ class BaseProvider(object):
     ) -> typing.List[messages.WalletTransfer]:
         pass
 
+    @abc.abstractmethod
+    def get_wallet_deposit_transfers(
+        self,
+        wallet_type: enums.WalletType,
+        depth: int = 1,
+        limit: int = 50,
+        currency: typing.Optional[common_enums.Currency] = None,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> typing.List[messages.WalletTransfer]:
+        pass
+
+    @abc.abstractmethod
+    def get_wallet_withdrawal_transfers(
+        self,
+        wallet_type: enums.WalletType,
+        depth: int = 1,
+        limit: int = 50,
+        currency: typing.Optional[common_enums.Currency] = None,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> typing.List[messages.WalletTransfer]:
+        pass
+
+    @abc.abstractmethod
+    def get_transactions(
+        self,
+        wallet_type: enums.WalletType,
+        depth: int = 1,
+        limit: int = 50,
+        trading_category: typing.Optional[enums.TradingCategory] = None,
+        currency: typing.Optional[common_enums.Currency] = None,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> typing.List[messages.TransactionLogEntry]:
+        pass
+
     def _validate_marshmallow_schema(
         self,
         data: typing.Union[dict, typing.List[dict]],
@@ -125,6 +241,66 @@ class BaseProvider(object):
                     self.log_prefix, common_utils.get_exception_message(exception=e)
                 )
             )
+            if not self.tolerant_validation:
+                return None
+
+            return self._validate_valid_rows(data=data, schema=schema, error=e)
+
+        return validated_data
+
+    def get_api_call_counts(self) -> typing.Tuple[int, int]:
+        # Number of API requests and response pages made so far.
+        return 0, 0
+
+    def pop_rejected_rows(self) -> typing.List[messages.RejectedRow]:
+        with self._rejected_rows_lock:
+            rejected_rows, self.rejected_rows = self.rejected_rows, []
+
+        return rejected_rows
+
+    def _validate_valid_rows(
+        self,
+        data: typing.Union[dict, typing.List[dict]],
+        schema: marshmallow.schema.Schema,
+        error: marshmallow.exceptions.ValidationError,
+    ) -> typing.Optional[dict]:
+        # Only page schemas (list of rows nested in single field) can be validated
+        # partially, errors of other schemas are not bound to a row.
+        data_type = next(iter(schema.fields))
+        row_errors = (
+            error.messages.get(data_type) if isinstance(error.messages, dict) else None
+        )
+        if not isinstance(data, list) or not isinstance(row_errors, dict):
+            return None
+
+        if not all(
+            isinstance(index, int) and index < len(data) for index in row_errors
+        ):
+            return None
+
+        try:
+            validated_data = schema.load(
+                data=[row for index, row in enumerate(data) if index not in row_errors],
+                unknown=marshmallow.EXCLUDE,
+            )
+        except marshmallow.exceptions.ValidationError as e:
+            self.logger.error(
+                "{} Valid rows do not comply with validation schema. Errors: {}.".format(
+                    self.log_prefix, common_utils.get_exception_message(exception=e)
+                )
+            )
             return None
 
+        page_rejected_rows = [
+            messages.RejectedRow(data_type=data_type, row=data[index], errors=errors)
+            for index, errors in row_errors.items()
+        ]
+        with self._rejected_rows_lock:
+            self.rejected_rows.extend(page_rejected_rows)
+
+        self.logger.warning(
+            "{} Rejected {} of {} rows (data_type={}).".format(
+                self.log_prefix, len(row_errors), len(data), data_type
+            )
+        )
         return validated_data
@@ -1,4 +1,6 @@
 import datetime
+import decimal
+import enum
 import typing
 
 from divisions.blockchain.integrations.clients.bybit import (
@@ -14,16 +16,23 @@ from divisions.common import enums as common_enums
 from divisions.common import utils as common_utils
 from divisions.crypto import enums as crypto_enums
 from divisions.crypto.integrations.provider import base
+from divisions.crypto.integrations.provider import columnar
 from divisions.crypto.integrations.provider import enums
 from divisions.crypto.integrations.provider import exceptions
 from divisions.crypto.integrations.provider import messages
+from divisions.crypto.integrations.provider.bybit import converters
 from divisions.crypto.integrations.provider.bybit import schemas
+from divisions.crypto.integrations.provider.bybit import transaction_log
 
 
 class ByBitProvider(base.BaseProvider):
-    def __init__(self):
+    def __init__(
+        self, use_fast_converters: bool = True, use_selective_decoding: bool = True
+    ):
         super(ByBitProvider, self).__init__()
         self._rest_api_client = None
+        self.use_fast_converters = use_fast_converters
+        self.use_selective_decoding = use_selective_decoding
 
     @property
     def provider(self) -> crypto_enums.CryptoProvider:
@@ -138,6 +147,52 @@ class ByBitProvider(base.BaseProvider):
         from_datetime: typing.Optional[datetime.datetime] = None,
         to_datetime: typing.Optional[datetime.datetime] = None,
     ) -> typing.List[messages.TradePnLPosition]:
+        response = self._get_trade_positions_profit_and_loss_response(
+            trading_category=trading_category,
+            market_instrument_symbol=market_instrument_symbol,
+            depth=depth,
+            limit=limit,
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+        )
+        return self._convert_trade_positions_profit_and_loss(response=response)
+
+    def get_trade_positions_profit_and_loss_batch(
+        self,
+        trading_category: enums.TradingCategory,
+        market_instrument_symbol: str,
+        depth: int = 1,
+        limit: int = 50,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> columnar.ColumnarBatch:
+        response = self._get_trade_positions_profit_and_loss_response(
+            trading_category=trading_category,
+            market_instrument_symbol=market_instrument_symbol,
+            depth=depth,
+            limit=limit,
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+        )
+        if self.use_fast_converters:
+            batch = converters.TRADE_PNL_POSITIONS.convert_columnar(rows=response)
+            if batch is not None:
+                return batch
+
+        return columnar.ColumnarBatch.from_messages(
+            message_class=messages.TradePnLPosition,
+            messages=self._convert_trade_positions_profit_and_loss(response=response),
+        )
+
+    def _get_trade_positions_profit_and_loss_response(
+        self,
+        trading_category: enums.TradingCategory,
+        market_instrument_symbol: str,
+        depth: int = 1,
+        limit: int = 50,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> typing.List[dict]:
         if trading_category != enums.TradingCategory.LINEAR:
             msg = "Trading category {} not supported".format(trading_category.name)
             self.logger.error("{} {}.".format(self.log_prefix, msg))
@@ -151,6 +206,9 @@ class ByBitProvider(base.BaseProvider):
                 symbol=market_instrument_symbol,
                 from_datetime=from_datetime,
                 to_datetime=to_datetime,
+                decimal_fields=self._get_decimal_fields(
+                    converter=converters.TRADE_PNL_POSITIONS
+                ),
             )
         except rest_api_client_exceptions.ByBitClientError as e:
             msg = "Unable to fetch trade positions PnL from API (market_instrument_symbol={}, category={}, from_datetime={}, to_datetime={}). Error: {}".format(
@@ -163,6 +221,16 @@ class ByBitProvider(base.BaseProvider):
             self.logger.exception("{} {}.".format(self.log_prefix, msg))
             raise exceptions.APIClientError(msg)
 
+        return response
+
+    def _convert_trade_positions_profit_and_loss(
+        self, response: typing.List[dict]
+    ) -> typing.List[messages.TradePnLPosition]:
+        if self.use_fast_converters:
+            converted_messages = converters.TRADE_PNL_POSITIONS.convert(rows=response)
+            if converted_messages is not None:
+                return converted_messages
+
         validated_data = self._validate_marshmallow_schema(
             data=response, schema=schemas.TradePnLPositions()
         )
@@ -202,6 +270,56 @@ class ByBitProvider(base.BaseProvider):
         order_status: typing.Optional[enums.TradeOrderStatus] = None,
         order_filter: typing.Optional[str] = None,
     ) -> typing.List[messages.TradeOrder]:
+        response = self._get_trade_orders_response(
+            trading_category=trading_category,
+            depth=depth,
+            limit=limit,
+            market_instrument_symbol=market_instrument_symbol,
+            order_id=order_id,
+            order_status=order_status,
+            order_filter=order_filter,
+        )
+        return self._convert_trade_orders(response=response)
+
+    def get_trade_orders_batch(
+        self,
+        trading_category: enums.TradingCategory,
+        depth: int = 1,
+        limit: int = 50,
+        market_instrument_symbol: typing.Optional[str] = None,
+        order_id: typing.Optional[str] = None,
+        order_status: typing.Optional[enums.TradeOrderStatus] = None,
+        order_filter: typing.Optional[str] = None,
+    ) -> columnar.ColumnarBatch:
+        response = self._get_trade_orders_response(
+            trading_category=trading_category,
+            depth=depth,
+            limit=limit,
+            market_instrument_symbol=market_instrument_symbol,
+            order_id=order_id,
+            order_status=order_status,
+            order_filter=order_filter,
+        )
+        if self.use_fast_converters:
+            batch = converters.TRADE_ORDERS.convert_columnar(rows=response)
+            if batch is not None:
+                return batch
+
+        return columnar.ColumnarBatch.from_messages(
+            message_class=messages.TradeOrder,
+            messages=self._convert_trade_orders(response=response),
+        )
+
+    def _get_trade_orders_response(
+        self,
+        trading_category: enums.TradingCategory,
+        depth: int = 1,
+        limit: int = 50,
+        market_instrument_symbol: typing.Optional[str] = None,
+        order_id: typing.Optional[str] = None,
+        order_status: typing.Optional[enums.TradeOrderStatus] = None,
+        order_filter: typing.Optional[str] = None,
+    ) -> typing.List[dict]:
         try:
             response = self.get_rest_api_client().get_trade_orders(
                 category=trading_category.convert_to_internal(provider=self.provider),
@@ -213,6 +331,9 @@ class ByBitProvider(base.BaseProvider):
                 if order_status
                 else None,
                 order_filter=order_filter,
+                decimal_fields=self._get_decimal_fields(
+                    converter=converters.TRADE_ORDERS
+                ),
             )
         except rest_api_client_exceptions.ByBitClientError as e:
             msg = "Unable to fetch trade orders from API (market_instrument_symbol={}, category={}). Error: {}".format(
@@ -223,6 +344,16 @@ class ByBitProvider(base.BaseProvider):
             self.logger.exception("{} {}.".format(self.log_prefix, msg))
             raise exceptions.APIClientError(msg)
 
+        return response
+
+    def _convert_trade_orders(
+        self, response: typing.List[dict]
+    ) -> typing.List[messages.TradeOrder]:
+        if self.use_fast_converters:
+            converted_messages = converters.TRADE_ORDERS.convert(rows=response)
+            if converted_messages is not None:
+                return converted_messages
+
         validated_data = self._validate_marshmallow_schema(
             data=response, schema=schemas.TradeOrders()
         )
@@ -261,6 +392,60 @@ class ByBitProvider(base.BaseProvider):
         from_datetime: typing.Optional[datetime.datetime] = None,
         to_datetime: typing.Optional[datetime.datetime] = None,
     ) -> typing.List[messages.TradeExecution]:
+        response = self._get_trade_executions_response(
+            trading_category=trading_category,
+            market_instrument_symbol=market_instrument_symbol,
+            depth=depth,
+            limit=limit,
+            execution_type=execution_type,
+            order_id=order_id,
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+        )
+        return self._convert_trade_executions(response=response)
+
+    def get_trade_executions_batch(
+        self,
+        trading_category: enums.TradingCategory,
+        market_instrument_symbol: str,
+        depth: int = 1,
+        limit: int = 50,
+        execution_type: typing.Optional[enums.TradeExecutionType] = None,
+        order_id: typing.Optional[str] = None,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> columnar.ColumnarBatch:
+        response = self._get_trade_executions_response(
+            trading_category=trading_category,
+            market_instrument_symbol=market_instrument_symbol,
+            depth=depth,
+            limit=limit,
+            execution_type=execution_type,
+            order_id=order_id,
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+        )
+        if self.use_fast_converters:
+            batch = converters.TRADE_EXECUTIONS.convert_columnar(rows=response)
+            if batch is not None:
+                return batch
+
+        return columnar.ColumnarBatch.from_messages(
+            message_class=messages.TradeExecution,
+            messages=self._convert_trade_executions(response=response),
+        )
+
+    def _get_trade_executions_response(
+        self,
+        trading_category: enums.TradingCategory,
+        market_instrument_symbol: str,
+        depth: int = 1,
+        limit: int = 50,
+        execution_type: typing.Optional[enums.TradeExecutionType] = None,
+        order_id: typing.Optional[str] = None,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> typing.List[dict]:
         try:
             response = self.get_rest_api_client().get_trade_executions(
                 category=trading_category.convert_to_internal(provider=self.provider),
@@ -275,6 +460,9 @@ class ByBitProvider(base.BaseProvider):
                 else None,
                 from_datetime=from_datetime,
                 to_datetime=to_datetime,
+                decimal_fields=self._get_decimal_fields(
+                    converter=converters.TRADE_EXECUTIONS
+                ),
             )
         except rest_api_client_exceptions.ByBitClientError as e:
             msg = "Unable to fetch trade executions from API (market_instrument_symbol={}, category={}). Error: {}".format(
@@ -285,6 +473,16 @@ class ByBitProvider(base.BaseProvider):
             self.logger.exception("{} {}.".format(self.log_prefix, msg))
             raise exceptions.APIClientError(msg)
 
+        return response
+
+    def _convert_trade_executions(
+        self, response: typing.List[dict]
+    ) -> typing.List[messages.TradeExecution]:
+        if self.use_fast_converters:
+            converted_messages = converters.TRADE_EXECUTIONS.convert(rows=response)
+            if converted_messages is not None:
+                return converted_messages
+
         validated_data = self._validate_marshmallow_schema(
             data=response, schema=schemas.TradeExecutions()
         )
@@ -423,10 +621,9 @@ class ByBitProvider(base.BaseProvider):
                     type=enums.WalletTransferType.INTERNAL_DEPOSIT.value
                     if wallet_type == to_recipient
                     else enums.WalletTransferType.INTERNAL_WITHDRAWAL.value,
-                    status=enums.WalletTransferStatus.convert_from_internal(
-                        status=rest_api_client_enums.WalletInternalTransferStatus(
-                            wallet_internal_transfer["status"]
-                        )
+                    status=self._convert_wallet_transfer_status(
+                        status_enum=rest_api_client_enums.WalletInternalTransferStatus,
+                        status=wallet_internal_transfer["status"],
                     ).value,
                     txid=wallet_internal_transfer["transaction_id"],
                     from_recipient=from_recipient.name,
@@ -441,3 +638,228 @@ class ByBitProvider(base.BaseProvider):
             )
 
         return wallet_transfers
+
+    def get_wallet_deposit_transfers(
+        self,
+        wallet_type: enums.WalletType,
+        depth: int = 1,
+        limit: int = 50,
+        currency: typing.Optional[common_enums.Currency] = None,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> typing.List[messages.WalletTransfer]:
+        try:
+            response = self.get_rest_api_client().get_wallet_deposit_transfers(
+                depth=depth,
+                limit=limit,
+                currency=currency,
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+            )
+        except rest_api_client_exceptions.ByBitClientError as e:
+            msg = "Unable to fetch wallet deposit transfers from API (currency={}). Error: {}".format(
+                currency,
+                common_utils.get_exception_message(exception=e),
+            )
+            self.logger.exception("{} {}.".format(self.log_prefix, msg))
+            raise exceptions.APIClientError(msg)
+
+        validated_data = self._validate_marshmallow_schema(
+            data=response, schema=schemas.WalletDepositTransfers()
+        )
+        if validated_data is None:
+            raise exceptions.DataValidationError(
+                "Wallet deposit transfers response data is not valid"
+            )
+
+        return [
+            messages.WalletTransfer(
+                transaction_currency=wallet_deposit_transfer["currency"],
+                chain_currency=wallet_deposit_transfer["chain"],
+                type=enums.WalletTransferType.DEPOSIT.value,
+                status=self._convert_wallet_transfer_status(
+                    status_enum=rest_api_client_enums.DepositStatus,
+                    status=wallet_deposit_transfer["status"],
+                ).value,
+                txid=wallet_deposit_transfer["txid"],
+                from_recipient=None,
+                to_recipient=wallet_type.name,
+                portfolio_type=wallet_type.name,
+                amount=wallet_deposit_transfer["amount"],
+                fee=wallet_deposit_transfer["fee"],
+                network_datetime=datetime.datetime.fromtimestamp(
+                    wallet_deposit_transfer["created_at"], tz=datetime.timezone.utc
+                ),
+            )
+            for wallet_deposit_transfer in validated_data["wallet_deposit_transfers"]
+        ]
+
+    def get_wallet_withdrawal_transfers(
+        self,
+        wallet_type: enums.WalletType,
+        depth: int = 1,
+        limit: int = 50,
+        currency: typing.Optional[common_enums.Currency] = None,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> typing.List[messages.WalletTransfer]:
+        try:
+            response = self.get_rest_api_client().get_wallet_withdrawal_transfers(
+                depth=depth,
+                limit=limit,
+                withdrawal_type=rest_api_client_enums.WithdrawalType.ON_CHAIN,
+                currency=currency,
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+            )
+        except rest_api_client_exceptions.ByBitClientError as e:
+            msg = "Unable to fetch wallet withdrawal transfers from API (currency={}). Error: {}".format(
+                currency,
+                common_utils.get_exception_message(exception=e),
+            )
+            self.logger.exception("{} {}.".format(self.log_prefix, msg))
+            raise exceptions.APIClientError(msg)
+
+        validated_data = self._validate_marshmallow_schema(
+            data=response, schema=schemas.WalletWithdrawalTransfers()
+        )
+        if validated_data is None:
+            raise exceptions.DataValidationError(
+                "Wallet withdrawal transfers response data is not valid"
+            )
+
+        return [
+            messages.WalletTransfer(
+                transaction_currency=wallet_withdrawal_transfer["currency"],
+                chain_currency=wallet_withdrawal_transfer["chain"],
+                type=enums.WalletTransferType.WITHDRAWAL.value,
+                status=self._convert_wallet_transfer_status(
+                    status_enum=rest_api_client_enums.WithdrawalStatus,
+                    status=wallet_withdrawal_transfer["status"],
+                ).value,
+                # Chain txid is empty until broadcast, withdrawal id is stable across status changes.
+                txid=wallet_withdrawal_transfer["withdrawal_id"],
+                from_recipient=wallet_type.name,
+                to_recipient=wallet_withdrawal_transfer["to_address"],
+                portfolio_type=wallet_type.name,
+                amount=wallet_withdrawal_transfer["amount"],
+                fee=wallet_withdrawal_transfer["fee"],
+                network_datetime=datetime.datetime.fromtimestamp(
+                    wallet_withdrawal_transfer["created_at"], tz=datetime.timezone.utc
+                ),
+            )
+            for wallet_withdrawal_transfer in validated_data[
+                "wallet_withdrawal_transfers"
+            ]
+        ]
+
+    def get_transactions(
+        self,
+        wallet_type: enums.WalletType,
+        depth: int = 1,
+        limit: int = 50,
+        trading_category: typing.Optional[enums.TradingCategory] = None,
+        currency: typing.Optional[common_enums.Currency] = None,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> typing.List[messages.TransactionLogEntry]:
+        if wallet_type != enums.WalletType.GENERAL:
+            msg = "Wallet type {} is not supported for transaction log".format(
+                wallet_type.name
+            )
+            self.logger.info("{} {}. Exiting.".format(self.log_prefix, msg))
+            raise exceptions.DataValidationError(msg)
+
+        try:
+            response = self.get_rest_api_client().get_transactions(
+                depth=depth,
+                limit=limit,
+                account_type=wallet_type.convert_to_internal(
+                    provider=self.provider
+                ).value,
+                category=trading_category.convert_to_internal(
+                    provider=self.provider
+                ).value
+                if trading_category
+                else None,
+                currency=currency.value if currency else None,
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+            )
+        except rest_api_client_exceptions.ByBitClientError as e:
+            msg = "Unable to fetch transactions from API (wallet_type={}, currency={}). Error: {}".format(
+                wallet_type.name,
+                currency,
+                common_utils.get_exception_message(exception=e),
+            )
+            self.logger.exception("{} {}.".format(self.log_prefix, msg))
+            raise exceptions.APIClientError(msg)
+
+        validated_data = self._validate_marshmallow_schema(
+            data=response, schema=schemas.Transactions()
+        )
+        if validated_data is None:
+            raise exceptions.DataValidationError(
+                "Transactions response data is not valid"
+            )
+
+        transactions = []
+        for transaction in validated_data["transactions"]:
+            transaction_log_entry = messages.TransactionLogEntry(
+                currency=transaction["currency"],
+                market_instrument_name=transaction["symbol"],
+                type=transaction["type"].upper(),
+                side=transaction["side"],
+                quantity=transaction["quantity"] or decimal.Decimal("0"),
+                position_size=transaction["position_size"] or decimal.Decimal("0"),
+                price=transaction["price"],
+                funding=transaction["funding"] or decimal.Decimal("0"),
+                fee=transaction["fee"] or decimal.Decimal("0"),
+                cash_flow=transaction["cash_flow"] or decimal.Decimal("0"),
+                change=transaction["change"],
+                wallet_balance=transaction["wallet_balance"],
+                fee_rate=transaction["fee_rate"],
+                trade_id=transaction["trade_id"],
+                order_id=transaction["order_id"],
+                created_at=datetime.datetime.fromtimestamp(
+                    transaction["created_at"] / 1000, tz=datetime.timezone.utc
+                ),
+            )
+            transactions.append(
+                transaction_log_entry._replace(
+                    transaction_id=transaction_log.get_transaction_id(
+                        entry=transaction_log_entry
+                    )
+                )
+            )
+
+        return transactions
+
+    def get_api_call_counts(self) -> typing.Tuple[int, int]:
+        if self._rest_api_client is None:
+            return 0, 0
+
+        return self._rest_api_client.request_count, self._rest_api_client.page_count
+
+    def _convert_wallet_transfer_status(
+        self, status_enum: typing.Type[enum.Enum], status: typing.Any
+    ) -> enums.WalletTransferStatus:
+        # Statuses API adds later are kept as pending, transfer status is updated once
+        # it settles to a known one.
+        try:
+            return enums.WalletTransferStatus.convert_from_internal(
+                status=status_enum(status)
+            )
+        except ValueError:
+            self.logger.warning(
+                "{} Unknown wallet transfer status, stored as pending (status_enum={}, status={}).".format(
+                    self.log_prefix, status_enum.__name__, status
+                )
+            )
+            return enums.WalletTransferStatus.PENDING
+
+    def _get_decimal_fields(
+        self, converter: converters.RowConverter
+    ) -> typing.Optional[typing.FrozenSet[str]]:
+        # None makes client decode whole response with Decimal floats.
+        return converter.decimal_data_keys if self.use_selective_decoding else None
@@ -0,0 +1,217 @@
+import datetime
+import decimal
+import typing
+
+from marshmallow import fields
+
+from divisions.crypto.integrations.provider import columnar
+from divisions.crypto.integrations.provider import messages
+from divisions.crypto.integrations.provider.bybit import schemas
+
+
+class RowConverter(object):
+    # Fast path for high-volume pages. Schema fields are compiled once into a flat
+    # list of (data key, parser) in message field order, rows are converted straight
+    # into message tuples. Parsers accept exactly what schema accepts, on any invalid
+    # row page is not converted (None) and caller falls back to marshmallow schema
+    # which reports the errors.
+    def __init__(
+        self,
+        schema: schemas.Schema,
+        message_class: typing.Type[typing.NamedTuple],
+        message_fields: typing.Dict[str, str],
+        millisecond_timestamp_fields: typing.Sequence[str] = (),
+    ):
+        self.message_class = message_class
+        # Fields client needs decoded as exact decimals, see ByBitClient decoding.
+        self.decimal_data_keys = frozenset(
+            schema_field.data_key or schema_field_name
+            for schema_field_name, schema_field in schema.fields.items()
+            if isinstance(schema_field, fields.Decimal)
+        )
+        self._field_parsers = []
+        # Columnar batches keep timestamps as epoch milliseconds, so their parsers
+        # are the ones before datetime conversion.
+        self._column_parsers = []
+        for message_field in message_class._fields:
+            schema_field_name = message_fields[message_field]
+            schema_field = schema.fields[schema_field_name]
+            data_key = schema_field.data_key or schema_field_name
+            parser = _get_field_parser(schema_field=schema_field)
+            self._column_parsers.append((message_field, data_key, parser))
+            if schema_field_name in millisecond_timestamp_fields:
+                parser = _get_timestamp_parser(parser=parser)
+
+            self._field_parsers.append((data_key, parser))
+
+    def convert(
+        self, rows: typing.List[dict]
+    ) -> typing.Optional[typing.List[typing.NamedTuple]]:
+        message_class = self.message_class
+        field_parsers = self._field_parsers
+        new_message = tuple.__new__
+        try:
+            return [
+                new_message(
+                    message_class,
+                    [parser(row[data_key]) for data_key, parser in field_parsers],
+                )
+                for row in rows
+            ]
+        except (KeyError, TypeError, ValueError, ArithmeticError, AttributeError):
+            return None
+
+    def convert_columnar(
+        self, rows: typing.List[dict]
+    ) -> typing.Optional[columnar.ColumnarBatch]:
+        # Same validation as convert, values are parsed column by column and no
+        # per-row message is created.
+        try:
+            return columnar.ColumnarBatch.from_columns(
+                message_class=self.message_class,
+                columns={
+                    message_field: [parser(row[data_key]) for row in rows]
+                    for message_field, data_key, parser in self._column_parsers
+                },
+            )
+        except (KeyError, TypeError, ValueError, ArithmeticError, AttributeError):
+            return None
+
+
+def _get_field_parser(schema_field: fields.Field) -> typing.Callable:
+    if isinstance(schema_field, fields.Decimal):
+        parser = _parse_decimal
+    elif isinstance(schema_field, fields.Integer):
+        parser = _parse_integer
+    elif isinstance(schema_field, fields.Boolean):
+        parser = _get_boolean_parser(
+            truthy=schema_field.truthy, falsy=schema_field.falsy
+        )
+    elif isinstance(schema_field, fields.String):
+        parser = _parse_string
+    else:
+        raise ValueError(
+            "Field type {} has no fast path parser".format(type(schema_field).__name__)
+        )
+
+    if schema_field.allow_none:
+        return _get_nullable_parser(parser=parser)
+
+    return parser
+
+
+def _parse_decimal(value: typing.Any) -> decimal.Decimal:
+    if value is True or value is False:
+        raise ValueError("Boolean is not a decimal")
+
+    number = decimal.Decimal(str(value))
+    if not number.is_finite():
+        raise ValueError("Special decimal values are not allowed")
+
+    return number
+
+
+def _parse_integer(value: typing.Any) -> int:
+    if value is True or value is False:
+        raise ValueError("Boolean is not an integer")
+
+    return int(value)
+
+
+def _parse_string(value: typing.Any) -> str:
+    if value.__class__ is not str:
+        raise TypeError("Value is not a string")
+
+    return value
+
+
+def _get_boolean_parser(truthy: typing.Set, falsy: typing.Set) -> typing.Callable:
+    def parse_boolean(value: typing.Any) -> bool:
+        if value in truthy:
+            return True
+
+        if value in falsy:
+            return False
+
+        raise ValueError("Value is not a boolean")
+
+    return parse_boolean
+
+
+def _get_nullable_parser(parser: typing.Callable) -> typing.Callable:
+    def parse_nullable(value: typing.Any) -> typing.Any:
+        return None if value is None else parser(value)
+
+    return parse_nullable
+
+
+def _get_timestamp_parser(parser: typing.Callable) -> typing.Callable:
+    # Same as schema post_load (ms -> s) followed by fromtimestamp in provider client.
+    fromtimestamp = datetime.datetime.fromtimestamp
+
+    def parse_timestamp(value: typing.Any) -> datetime.datetime:
+        return fromtimestamp(parser(value) // 1000)
+
+    return parse_timestamp
+
+
+TRADE_ORDERS = RowConverter(
+    schema=schemas.TradeOrder(),
+    message_class=messages.TradeOrder,
+    message_fields={
+        "market_instrument_name": "symbol",
+        "order_id": "order_id",
+        "order_side": "side",
+        "order_quantity": "quantity",
+        "order_price": "order_price",
+        "average_order_price": "average_price",
+        "order_type": "order_type",
+        "order_status": "order_status",
+        "order_total_executed_value": "total_executed_value",
+        "order_total_executed_quantity": "total_executed_quantity",
+        "order_total_executed_fee": "total_executed_fee",
+        "created_at": "created_at",
+        "updated_at": "updated_at",
+    },
+    millisecond_timestamp_fields=["created_at", "updated_at"],
+)
+
+TRADE_EXECUTIONS = RowConverter(
+    schema=schemas.TradeExecution(),
+    message_class=messages.TradeExecution,
+    message_fields={
+        "market_instrument_name": "symbol",
+        "order_id": "order_id",
+        "execution_id": "execution_id",
+        "execution_side": "side",
+        "executed_fee": "executed_fee",
+        "execution_price": "execution_price",
+        "execution_quantity": "execution_quantity",
+        "execution_type": "execution_type",
+        "execution_value": "execution_value",
+        "is_maker": "is_maker",
+        "created_at": "created_at",
+    },
+    millisecond_timestamp_fields=["created_at"],
+)
+
+TRADE_PNL_POSITIONS = RowConverter(
+    schema=schemas.TradePnLPosition(),
+    message_class=messages.TradePnLPosition,
+    message_fields={
+        "market_instrument_name": "symbol",
+        "order_id": "order_id",
+        "position_side": "side",
+        "position_quantity": "quantity",
+        "order_price": "order_price",
+        "order_type": "order_type",
+        "position_closed_size": "closed_size",
+        "total_entry_value": "total_entry_value",
+        "average_entry_price": "average_entry_price",
+        "total_exit_value": "total_exit_value",
+        "average_exit_price": "average_exit_value",
+        "closed_pnl": "closed_pnl",
+        "created_at": "created_at",
+    },
+    millisecond_timestamp_fields=["created_at"],
+)
@@ -174,3 +174,93 @@ class WalletInternalTransfers(Schema):
     @pre_load
     def prepare_data(self, data: typing.List[dict], **kwargs: typing.Any) -> dict:
         return {"wallet_internal_transfers": data}
+
+
+class Transaction(Schema):
+    transaction_id = fields.Str(required=True, data_key="id")
+    symbol = fields.Str(required=True, allow_none=True, data_key="symbol")
+    side = fields.Str(required=True, allow_none=True, data_key="side")
+    type = fields.Str(required=True, data_key="type")
+    currency = fields.Str(required=True, data_key="currency")
+    quantity = fields.Decimal(required=True, allow_none=True, data_key="qty")
+    position_size = fields.Decimal(required=True, allow_none=True, data_key="size")
+    price = fields.Decimal(required=True, allow_none=True, data_key="tradePrice")
+    funding = fields.Decimal(required=True, allow_none=True, data_key="funding")
+    fee = fields.Decimal(required=True, allow_none=True, data_key="fee")
+    cash_flow = fields.Decimal(required=True, allow_none=True, data_key="cashFlow")
+    change = fields.Decimal(required=True, data_key="change")
+    wallet_balance = fields.Decimal(required=True, data_key="cashBalance")
+    fee_rate = fields.Decimal(required=True, allow_none=True, data_key="feeRate")
+    trade_id = fields.Str(required=True, allow_none=True, data_key="tradeId")
+    order_id = fields.Str(required=True, allow_none=True, data_key="orderId")
+    created_at = fields.Integer(required=True, data_key="transactionTime")
+
+    @pre_load
+    def clean_empty_values(self, data: dict, **kwargs: typing.Any) -> dict:
+        return {key: None if value in ["", "None"] else value for key, value in data.items()}
+
+
+class Transactions(Schema):
+    transactions = fields.Nested(Transaction, many=True)
+
+    @pre_load
+    def prepare_data(self, data: typing.List[dict], **kwargs: typing.Any) -> dict:
+        return {"transactions": data}
+
+
+class WalletDepositTransfer(Schema):
+    txid = fields.Str(required=True, data_key="txID")
+    currency = fields.Str(required=True, data_key="coin")
+    chain = fields.Str(required=True, data_key="chain")
+    amount = fields.Decimal(required=True, data_key="amount")
+    fee = fields.Decimal(required=True, allow_none=True, data_key="depositFee")
+    status = fields.Integer(required=True, data_key="status")
+    created_at = fields.Integer(required=True, data_key="successAt")
+
+    @pre_load
+    def clean_empty_values(self, data: dict, **kwargs: typing.Any) -> dict:
+        return {key: None if value == "" else value for key, value in data.items()}
+
+    @post_load
+    def prepare_data(self, data: dict, **kwargs: typing.Any) -> dict:
+        data["created_at"] = data["created_at"] // 1000
+
+        return data
+
+
+class WalletDepositTransfers(Schema):
+    wallet_deposit_transfers = fields.Nested(WalletDepositTransfer, many=True)
+
+    @pre_load
+    def prepare_data(self, data: typing.List[dict], **kwargs: typing.Any) -> dict:
+        return {"wallet_deposit_transfers": data}
+
+
+class WalletWithdrawalTransfer(Schema):
+    withdrawal_id = fields.Str(required=True, data_key="withdrawId")
+    txid = fields.Str(required=True, allow_none=True, data_key="txID")
+    currency = fields.Str(required=True, data_key="coin")
+    chain = fields.Str(required=True, data_key="chain")
+    amount = fields.Decimal(required=True, data_key="amount")
+    fee = fields.Decimal(required=True, allow_none=True, data_key="withdrawFee")
+    status = fields.Str(required=True, data_key="status")
+    to_address = fields.Str(required=True, allow_none=True, data_key="toAddress")
+    created_at = fields.Integer(required=True, data_key="createTime")
+
+    @pre_load
+    def clean_empty_values(self, data: dict, **kwargs: typing.Any) -> dict:
+        return {key: None if value == "" else value for key, value in data.items()}
+
+    @post_load
+    def prepare_data(self, data: dict, **kwargs: typing.Any) -> dict:
+        data["created_at"] = data["created_at"] // 1000
+
+        return data
+
+
+class WalletWithdrawalTransfers(Schema):
+    wallet_withdrawal_transfers = fields.Nested(WalletWithdrawalTransfer, many=True)
+
+    @pre_load
+    def prepare_data(self, data: typing.List[dict], **kwargs: typing.Any) -> dict:
+        return {"wallet_withdrawal_transfers": data}
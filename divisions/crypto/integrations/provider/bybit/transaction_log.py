@@ -0,0 +1,128 @@
+import csv
+import datetime
+import decimal
+import hashlib
+import typing
+
+from divisions.crypto.integrations.provider import exceptions as provider_exceptions
+from divisions.crypto.integrations.provider import messages as provider_messages
+
+_ZERO = decimal.Decimal("0")
+
+_REQUIRED_COLUMNS = [
+    "Time",
+    "Currency",
+    "Contract",
+    "Type",
+    "Direction",
+    "Quantity",
+    "Position",
+    "Filled Price",
+    "Funding",
+    "Fee Paid",
+    "Cash Flow",
+    "Change",
+    "Wallet Balance",
+    "Fee Rate",
+    "Trade ID",
+    "Order ID",
+]
+
+# Export direction is position oriented, executions are stored with order side.
+_DIRECTION_SIDE_MAP = {
+    "Open Long": "Buy",
+    "Close Short": "Buy",
+    "Buy": "Buy",
+    "Open Short": "Sell",
+    "Close Long": "Sell",
+    "Sell": "Sell",
+}
+
+
+def parse_transaction_log(
+    lines: typing.Iterable[str],
+) -> typing.Iterator[provider_messages.TransactionLogEntry]:
+    reader = csv.reader(lines)
+    try:
+        header = next(reader)
+    except StopIteration:
+        return
+
+    columns = {name.strip(): index for index, name in enumerate(header)}
+    missing_columns = [name for name in _REQUIRED_COLUMNS if name not in columns]
+    if missing_columns:
+        raise provider_exceptions.ProviderError(
+            "Transaction log is missing columns: {}".format(", ".join(missing_columns))
+        )
+
+    (
+        time_idx,
+        currency_idx,
+        contract_idx,
+        type_idx,
+        direction_idx,
+        quantity_idx,
+        position_idx,
+        price_idx,
+        funding_idx,
+        fee_idx,
+        cash_flow_idx,
+        change_idx,
+        wallet_balance_idx,
+        fee_rate_idx,
+        trade_id_idx,
+        order_id_idx,
+    ) = [columns[name] for name in _REQUIRED_COLUMNS]
+
+    for row in reader:
+        if not row:
+            continue
+
+        entry = provider_messages.TransactionLogEntry(
+            currency=row[currency_idx],
+            market_instrument_name=row[contract_idx] or None,
+            type=row[type_idx].upper(),
+            side=_DIRECTION_SIDE_MAP.get(row[direction_idx]),
+            quantity=_to_decimal(row[quantity_idx]),
+            position_size=_to_decimal(row[position_idx]),
+            price=_to_decimal(row[price_idx], default=None),
+            funding=_to_decimal(row[funding_idx]),
+            fee=_to_decimal(row[fee_idx]),
+            cash_flow=_to_decimal(row[cash_flow_idx]),
+            change=_to_decimal(row[change_idx]),
+            wallet_balance=_to_decimal(row[wallet_balance_idx]),
+            fee_rate=_to_decimal(row[fee_rate_idx], default=None),
+            trade_id=row[trade_id_idx] or None,
+            order_id=row[order_id_idx] or None,
+            created_at=datetime.datetime.fromisoformat(row[time_idx]).replace(
+                tzinfo=datetime.timezone.utc
+            ),
+        )
+        yield entry._replace(transaction_id=get_transaction_id(entry=entry))
+
+
+def get_transaction_id(entry: provider_messages.TransactionLogEntry) -> str:
+    # Same key for API and CSV export rows so both sources dedup against each other.
+    # Funding and balance change rows have no Trade ID, their content identifies them.
+    if entry.trade_id:
+        return entry.trade_id
+
+    return hashlib.sha1(
+        "|".join(
+            [
+                entry.type,
+                entry.currency,
+                entry.market_instrument_name or "",
+                str(int(entry.created_at.timestamp())),
+                "{:f}".format(entry.change.normalize()),
+                "{:f}".format(entry.wallet_balance.normalize()),
+            ]
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def _to_decimal(
+    value: str, default: typing.Optional[decimal.Decimal] = _ZERO
+) -> typing.Optional[decimal.Decimal]:
+    return decimal.Decimal(value) if value else default
+
@@ -0,0 +1,229 @@
+import datetime
+import decimal
+import functools
+import typing
+
+import numpy as np
+
+# Decimal columns are stored as int64 fixed point with the same number of decimal
+# places as model DecimalFields, so nothing is lost that database would keep.
+DECIMAL_PLACES = 8
+DECIMAL_SCALE = 10 ** DECIMAL_PLACES
+
+STRING = "string"
+DECIMAL = "decimal"
+TIMESTAMP = "timestamp"
+INTEGER = "integer"
+BOOLEAN = "boolean"
+
+_COLUMN_KINDS = {
+    str: STRING,
+    decimal.Decimal: DECIMAL,
+    datetime.datetime: TIMESTAMP,
+    int: INTEGER,
+    bool: BOOLEAN,
+}
+_NONE_TYPE = type(None)
+
+
+class ColumnarBatch(typing.NamedTuple):
+    """
+    Page of provider messages stored as one array per message field instead of one
+    NamedTuple per row. String columns are object arrays sharing repeated values,
+    decimal columns are int64 fixed point (DECIMAL_SCALE), or object arrays of
+    Python int fixed point when a value is out of int64 range (about 9.2e10),
+    timestamp columns are int64 epoch milliseconds. Null values of non string columns are kept in
+    null_masks, which only holds columns with at least one null.
+    """
+
+    message_class: typing.Type[typing.NamedTuple]
+    columns: typing.Dict[str, np.ndarray]
+    null_masks: typing.Dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    @classmethod
+    def from_columns(
+        cls,
+        message_class: typing.Type[typing.NamedTuple],
+        columns: typing.Dict[str, typing.Sequence[typing.Any]],
+    ) -> "ColumnarBatch":
+        # Decimal values are Decimals, timestamp values are epoch milliseconds.
+        column_kinds = get_column_kinds(message_class=message_class)
+        batch_columns = {}
+        null_masks = {}
+        for field_name in message_class._fields:
+            values = columns[field_name]
+            kind = column_kinds[field_name]
+            if kind == STRING:
+                batch_columns[field_name] = _get_string_column(values=values)
+                continue
+
+            null_mask = np.fromiter(
+                (value is None for value in values), dtype=bool, count=len(values)
+            )
+            if null_mask.any():
+                null_masks[field_name] = null_mask
+                values = [
+                    _get_null_placeholder(kind=kind) if value is None else value
+                    for value in values
+                ]
+
+            if kind == DECIMAL:
+                batch_columns[field_name] = _get_fixed_point_column(values=values)
+            elif kind == BOOLEAN:
+                batch_columns[field_name] = np.array(values, dtype=bool)
+            else:
+                batch_columns[field_name] = np.array(values, dtype=np.int64)
+
+        return cls(
+            message_class=message_class, columns=batch_columns, null_masks=null_masks
+        )
+
+    @classmethod
+    def from_messages(
+        cls,
+        message_class: typing.Type[typing.NamedTuple],
+        messages: typing.Sequence[typing.NamedTuple],
+    ) -> "ColumnarBatch":
+        column_kinds = get_column_kinds(message_class=message_class)
+        columns = {}
+        for field_index, field_name in enumerate(message_class._fields):
+            values = [message[field_index] for message in messages]
+            if column_kinds[field_name] == TIMESTAMP:
+                values = [
+                    None if value is None else int(value.timestamp() * 1000)
+                    for value in values
+                ]
+
+            columns[field_name] = values
+
+        return cls.from_columns(message_class=message_class, columns=columns)
+
+    def get_float_column(self, field_name: str) -> np.ndarray:
+        # Decimal column as float64 for NumPy analytics, nulls become NaN.
+        values = (self.columns[field_name] / DECIMAL_SCALE).astype(np.float64)
+        if field_name in self.null_masks:
+            values[self.null_masks[field_name]] = np.nan
+
+        return values
+
+    def get_timestamp_seconds_column(self, field_name: str) -> np.ndarray:
+        # Whole seconds, same precision as timestamps of provider messages.
+        return (self.columns[field_name] // 1000).astype(np.float64)
+
+    def get_database_column(self, field_name: str) -> typing.List[typing.Any]:
+        """
+        Returns column values ready for bulk_loader: decimals as exact strings,
+        timestamps as aware UTC datetimes truncated to seconds (as stored by message
+        based importers) and nulls as None.
+        """
+        values = self.columns[field_name]
+        kind = get_column_kinds(message_class=self.message_class)[field_name]
+        if kind == DECIMAL:
+            database_values = _get_decimal_strings(values=values)
+        elif kind == TIMESTAMP:
+            database_values = [
+                datetime.datetime.fromtimestamp(seconds, tz=datetime.timezone.utc)
+                for seconds in (values // 1000).tolist()
+            ]
+        else:
+            database_values = values.tolist()
+
+        if field_name in self.null_masks:
+            for index in np.flatnonzero(self.null_masks[field_name]).tolist():
+                database_values[index] = None
+
+        return database_values
+
+    def to_messages(self) -> typing.List[typing.NamedTuple]:
+        column_kinds = get_column_kinds(message_class=self.message_class)
+        message_columns = []
+        for field_name in self.message_class._fields:
+            values = self.columns[field_name]
+            kind = column_kinds[field_name]
+            if kind == DECIMAL:
+                message_values = [
+                    decimal.Decimal(value).scaleb(-DECIMAL_PLACES)
+                    for value in values.tolist()
+                ]
+            elif kind == TIMESTAMP:
+                message_values = [
+                    datetime.datetime.fromtimestamp(seconds)
+                    for seconds in (values // 1000).tolist()
+                ]
+            else:
+                message_values = values.tolist()
+
+            if field_name in self.null_masks:
+                for index in np.flatnonzero(self.null_masks[field_name]).tolist():
+                    message_values[index] = None
+
+            message_columns.append(message_values)
+
+        new_message = tuple.__new__
+        return [
+            new_message(self.message_class, row) for row in zip(*message_columns)
+        ]
+
+
+@functools.lru_cache(maxsize=None)
+def get_column_kinds(
+    message_class: typing.Type[typing.NamedTuple],
+) -> typing.Dict[str, str]:
+    column_kinds = {}
+    for field_name, field_type in typing.get_type_hints(message_class).items():
+        # Optional[X] is stored as X with a null mask.
+        field_types = [
+            argument
+            for argument in typing.get_args(field_type)
+            if argument is not _NONE_TYPE
+        ]
+        column_kinds[field_name] = _COLUMN_KINDS[
+            field_types[0] if field_types else field_type
+        ]
+
+    return column_kinds
+
+
+def to_fixed_point(value: decimal.Decimal) -> int:
+    # Rounded half even to DECIMAL_PLACES, same as DecimalField does on save.
+    return int(value.scaleb(DECIMAL_PLACES).to_integral_value())
+
+
+def _get_string_column(values: typing.Sequence[typing.Optional[str]]) -> np.ndarray:
+    # Symbols, sides and types repeat on every row, rows share one object per value.
+    shared_values = {}
+    column = np.empty(len(values), dtype=object)
+    column[:] = [shared_values.setdefault(value, value) for value in values]
+    return column
+
+
+def _get_fixed_point_column(values: typing.Sequence[decimal.Decimal]) -> np.ndarray:
+    fixed_point_values = [to_fixed_point(value=value) for value in values]
+    try:
+        return np.array(fixed_point_values, dtype=np.int64)
+    except OverflowError:
+        return np.array(fixed_point_values, dtype=object)
+
+
+def _get_null_placeholder(kind: str) -> typing.Any:
+    if kind == DECIMAL:
+        return decimal.Decimal(0)
+
+    if kind == BOOLEAN:
+        return False
+
+    return 0
+
+
+def _get_decimal_strings(values: np.ndarray) -> typing.List[str]:
+    absolute_values = np.abs(values)
+    whole, fraction = absolute_values // DECIMAL_SCALE, absolute_values % DECIMAL_SCALE
+    return [
+        "{}{}.{:0{}d}".format("-" if negative else "", w, f, DECIMAL_PLACES)
+        for negative, w, f in zip(
+            (values < 0).tolist(), whole.tolist(), fraction.tolist()
+        )
+    ]
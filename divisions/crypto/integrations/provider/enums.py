@@ -78,6 +78,7 @@ class WalletType(enum.Enum):
         return {
             crypto_enums.CryptoProvider.BYBIT: {
                 self.DERIVATIVE: bybit_enums.AccountType.CONTRACT,
+                self.GENERAL: bybit_enums.AccountType.UNIFIED,
             }
         }[provider][self]
 
@@ -102,12 +103,28 @@ class WalletTransferStatus(enum.Enum):
 
     @staticmethod
     def convert_from_internal(
-        status: typing.Union[bybit_enums.WalletInternalTransferStatus],
+        status: typing.Union[
+            bybit_enums.WalletInternalTransferStatus,
+            bybit_enums.DepositStatus,
+            bybit_enums.WithdrawalStatus,
+        ],
     ) -> "WalletTransferStatus":
         return {
             bybit_enums.WalletInternalTransferStatus.SUCCESS: WalletTransferStatus.SUCCESS,
             bybit_enums.WalletInternalTransferStatus.FAILED: WalletTransferStatus.FAILED,
             bybit_enums.WalletInternalTransferStatus.PENDING: WalletTransferStatus.PENDING,
+            bybit_enums.DepositStatus.UNKNOWN: WalletTransferStatus.PENDING,
+            bybit_enums.DepositStatus.TO_BE_CONFIRMED: WalletTransferStatus.PENDING,
+            bybit_enums.DepositStatus.PROCESSING: WalletTransferStatus.PENDING,
+            bybit_enums.DepositStatus.SUCCESS: WalletTransferStatus.SUCCESS,
+            bybit_enums.DepositStatus.FAILED: WalletTransferStatus.FAILED,
+            bybit_enums.WithdrawalStatus.SECURITY_CHECK: WalletTransferStatus.PENDING,
+            bybit_enums.WithdrawalStatus.PENDING: WalletTransferStatus.PENDING,
+            bybit_enums.WithdrawalStatus.SUCCESS: WalletTransferStatus.SUCCESS,
+            bybit_enums.WithdrawalStatus.CANCELLED_BY_USER: WalletTransferStatus.FAILED,
+            bybit_enums.WithdrawalStatus.REJECTED: WalletTransferStatus.FAILED,
+            bybit_enums.WithdrawalStatus.FAILED: WalletTransferStatus.FAILED,
+            bybit_enums.WithdrawalStatus.BLOCKCHAIN_CONFIRMED: WalletTransferStatus.PENDING,
         }[status]
 
 
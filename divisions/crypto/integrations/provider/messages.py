@@ -79,6 +79,11 @@ class TradePositionPerformance(
             ("week", typing.Optional[int]),
             ("day", typing.Optional[int]),
             ("pnl", decimal.Decimal),
+            ("period_start", typing.Optional[datetime.date]),
+            ("trade_count", typing.Optional[int]),
+            ("cumulative_pnl", typing.Optional[decimal.Decimal]),
+            ("rolling_pnl", typing.Optional[decimal.Decimal]),
+            ("rank", typing.Optional[int]),
         ],
     )
 ):
@@ -90,6 +95,58 @@ TradePositionPerformance.__new__.__defaults__ = (None,) * len(
 )
 
 
+class TradePerformanceMetrics(
+    typing.NamedTuple(
+        "TradePerformanceMetrics",
+        [
+            ("market_instrument_name", typing.Optional[str]),
+            ("provider", crypto_enums.CryptoProvider),
+            ("trading_category", enums.TradingCategory),
+            ("period_start", typing.Optional[datetime.date]),
+            ("trade_count", int),
+            ("pnl", float),
+            ("win_rate", typing.Optional[float]),
+            ("average_win", typing.Optional[float]),
+            ("average_loss", typing.Optional[float]),
+            ("profit_factor", typing.Optional[float]),
+            ("sharpe_ratio", typing.Optional[float]),
+            ("sortino_ratio", typing.Optional[float]),
+            ("max_drawdown", float),
+            ("max_drawdown_duration", int),
+            ("exposure", float),
+            ("exposure_share", typing.Optional[float]),
+        ],
+    )
+):
+    __slots__ = ()
+
+
+TradePerformanceMetrics.__new__.__defaults__ = (None,) * len(
+    TradePerformanceMetrics._fields
+)
+
+
+class PortfolioPerformanceReport(
+    typing.NamedTuple(
+        "PortfolioPerformanceReport",
+        [
+            ("provider", crypto_enums.CryptoProvider),
+            ("trading_category", enums.TradingCategory),
+            ("aggregation_period", crypto_enums.AggregationPeriod),
+            ("portfolio", typing.Optional[TradePerformanceMetrics]),
+            ("instruments", typing.List[TradePerformanceMetrics]),
+            ("periods", typing.List[TradePerformanceMetrics]),
+        ],
+    )
+):
+    __slots__ = ()
+
+
+PortfolioPerformanceReport.__new__.__defaults__ = (None,) * len(
+    PortfolioPerformanceReport._fields
+)
+
+
 class TradeOrder(
     typing.NamedTuple(
         "TradeOrder",
@@ -177,3 +234,98 @@ class WalletTransfer(
 
 
 WalletTransfer.__new__.__defaults__ = (None,) * len(WalletTransfer._fields)
+
+
+class PositionLedgerSnapshot(
+    typing.NamedTuple(
+        "PositionLedgerSnapshot",
+        [
+            ("market_instrument_name", str),
+            ("provider", crypto_enums.CryptoProvider),
+            ("cost_basis_method", crypto_enums.CostBasisMethod),
+            ("at_datetime", datetime.datetime),
+            ("position_quantity", decimal.Decimal),
+            ("average_entry_price", typing.Optional[decimal.Decimal]),
+            ("realised_pnl", decimal.Decimal),
+            ("fees", decimal.Decimal),
+            ("mark_price", typing.Optional[decimal.Decimal]),
+            ("unrealised_pnl", typing.Optional[decimal.Decimal]),
+        ],
+    )
+):
+    __slots__ = ()
+
+
+PositionLedgerSnapshot.__new__.__defaults__ = (None,) * len(
+    PositionLedgerSnapshot._fields
+)
+
+
+class PortfolioInvestorParticipation(
+    typing.NamedTuple(
+        "PortfolioInvestorParticipation",
+        [
+            ("portfolio_user_id", int),
+            ("provider", crypto_enums.CryptoProvider),
+            ("portfolio_type", enums.WalletType),
+            ("at_datetime", typing.Optional[datetime.datetime]),
+            ("units", decimal.Decimal),
+            ("portfolio_units", decimal.Decimal),
+            ("participation", decimal.Decimal),
+            ("unit_price", typing.Optional[decimal.Decimal]),
+            ("value", typing.Optional[decimal.Decimal]),
+        ],
+    )
+):
+    __slots__ = ()
+
+
+PortfolioInvestorParticipation.__new__.__defaults__ = (None,) * len(
+    PortfolioInvestorParticipation._fields
+)
+
+
+class TransactionLogEntry(
+    typing.NamedTuple(
+        "TransactionLogEntry",
+        [
+            ("transaction_id", str),
+            ("currency", str),
+            ("market_instrument_name", typing.Optional[str]),
+            ("type", str),
+            ("side", typing.Optional[str]),
+            ("quantity", decimal.Decimal),
+            ("position_size", decimal.Decimal),
+            ("price", typing.Optional[decimal.Decimal]),
+            ("funding", decimal.Decimal),
+            ("fee", decimal.Decimal),
+            ("cash_flow", decimal.Decimal),
+            ("change", decimal.Decimal),
+            ("wallet_balance", decimal.Decimal),
+            ("fee_rate", typing.Optional[decimal.Decimal]),
+            ("trade_id", typing.Optional[str]),
+            ("order_id", typing.Optional[str]),
+            ("created_at", datetime.datetime),
+        ],
+    )
+):
+    __slots__ = ()
+
+
+TransactionLogEntry.__new__.__defaults__ = (None,) * len(TransactionLogEntry._fields)
+
+
+class RejectedRow(
+    typing.NamedTuple(
+        "RejectedRow",
+        [
+            ("data_type", str),
+            ("row", dict),
+            ("errors", dict),
+        ],
+    )
+):
+    __slots__ = ()
+
+
+RejectedRow.__new__.__defaults__ = (None,) * len(RejectedRow._fields)
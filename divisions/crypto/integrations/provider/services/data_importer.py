@@ -1,9 +1,16 @@
+import collections
+import concurrent.futures
 import datetime
+import functools
 import logging
 import typing
 
+from django.db import transaction
+from django.utils import timezone
+
 from divisions.common import enums as common_enums
 from divisions.common import utils as common_utils
+from divisions.crypto import enums as crypto_enums
 from divisions.crypto.integrations.provider import base as base_provider_client
 from divisions.crypto.integrations.provider import enums as provider_enums
 from divisions.crypto.integrations.provider import (
@@ -11,16 +18,156 @@ from divisions.crypto.integrations.provider import (
 )
 from divisions.crypto.integrations.provider import messages as provider_messages
 from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider import columnar
+from divisions.crypto.integrations.provider.services import (
+    transaction_log_importer as transaction_log_importer_services,
+)
+from divisions.crypto.services import bulk_loader
+from divisions.crypto.services import import_runs as import_runs_services
+from divisions.crypto.services import import_watermark as import_watermark_services
+from divisions.crypto.services import pnl_rollup as pnl_rollup_services
+from divisions.crypto.services import position_ledger as position_ledger_services
+from divisions.crypto.services import rejected_rows as rejected_rows_services
 
 
 logger = logging.getLogger()
 
+# Transaction log API accepts at most 7 days between start and end time.
+TRANSACTIONS_WINDOW = datetime.timedelta(days=7)
+TRANSACTIONS_PAGE_LIMIT = 50
+# Window returning all pages is split in half until it is not shorter than this.
+TRANSACTIONS_MIN_WINDOW = datetime.timedelta(minutes=1)
+# Deposit and withdrawal records API accepts at most 30 days between start and end time.
+EXTERNAL_TRANSFERS_WINDOW = datetime.timedelta(days=30)
+# Row lines are debug and only every n-th row is logged, each page ends with summary.
+ROW_LOG_SAMPLE_RATE = 100
+
+
+def _recorded_stage(
+    stream: crypto_enums.ImportStream,
+) -> typing.Callable[[typing.Callable], typing.Callable]:
+    # Records importer call as import run stage when importer has run recorder.
+    def decorator(method: typing.Callable) -> typing.Callable:
+        @functools.wraps(method)
+        def wrapper(
+            self: "CryptoProviderImporter", *args: typing.Any, **kwargs: typing.Any
+        ) -> typing.Any:
+            if self._stage_counters is None:
+                self._page_counts = collections.Counter()
+
+            if self._run_recorder is None or self._stage_counters is not None:
+                return method(self, *args, **kwargs)
+
+            with self._run_recorder.stage(
+                stream=stream,
+                provider_client=self._provider_client,
+                symbol=kwargs.get("market_instrument_symbol"),
+            ) as stage_counters:
+                self._stage_counters = stage_counters
+                try:
+                    return method(self, *args, **kwargs)
+                finally:
+                    self._stage_counters = None
+
+        return wrapper
+
+    return decorator
+
 
 class CryptoProviderImporter(object):
-    def __init__(self, provider_client: base_provider_client.BaseProvider) -> None:
+    def __init__(
+        self,
+        provider_client: base_provider_client.BaseProvider,
+        tolerant_validation: bool = False,
+        use_columnar_batches: bool = False,
+        run_recorder: typing.Optional[import_runs_services.ImportRunRecorder] = None,
+    ) -> None:
         self._provider_client = provider_client
+        self._provider_client.tolerant_validation = tolerant_validation
+        # Executions are fetched as columnar batches and bulk inserted instead of
+        # being created one message at a time.
+        self._use_columnar_batches = use_columnar_batches
+        # Counters of import run stage in progress, None when run is not recorded.
+        self._run_recorder = run_recorder
+        self._stage_counters = None
+        self._page_counts = collections.Counter()
+        self._row_number = 0
         self.log_prefix = "[{}-IMPORTER]".format(self._provider_client.provider.name)
 
+    def _count(self, **counts: int) -> None:
+        self._page_counts.update(counts)
+        if self._stage_counters is None:
+            return None
+
+        for field_name, count in counts.items():
+            self._stage_counters[field_name] += count
+
+    def _is_row_logged(self) -> bool:
+        self._row_number += 1
+        return (self._row_number - 1) % ROW_LOG_SAMPLE_RATE == 0 and logger.isEnabledFor(
+            logging.DEBUG
+        )
+
+    def _log_page_summary(self, rows: str, **context: typing.Any) -> None:
+        page_counts, self._page_counts = self._page_counts, collections.Counter()
+        logger.info(
+            "{} Imported {} (fetched={}, created={}, skipped={}, errors={}{}).".format(
+                self.log_prefix,
+                rows,
+                page_counts["rows_fetched"],
+                page_counts["rows_inserted"],
+                page_counts["rows_skipped"],
+                page_counts["errors"],
+                "".join(
+                    ", {}={}".format(key, value) for key, value in context.items()
+                ),
+            )
+        )
+
+    def _mark_import_succeeded(
+        self,
+        stream: crypto_enums.ImportStream,
+        key: str,
+        records_created_at: typing.Iterable[typing.Optional[datetime.datetime]],
+        dry_run: bool,
+    ) -> None:
+        # Freshness gauges are kept with import watermarks, so lag checks do not
+        # have to scan imported tables.
+        if dry_run:
+            return None
+
+        try:
+            import_watermark_services.mark_import_succeeded(
+                provider=self._provider_client.provider,
+                stream=stream,
+                latest_record_at=max(
+                    (created_at for created_at in records_created_at if created_at),
+                    default=None,
+                ),
+                key=key,
+            )
+        except Exception as e:
+            msg = "Unable to update freshness (stream={}, key={}). Error: {}".format(
+                stream.value, key, common_utils.get_exception_message(exception=e)
+            )
+            self._count(errors=1)
+            logger.exception("{} {}. Continue.".format(self.log_prefix, msg))
+
+    def _store_rejected_rows(self) -> None:
+        # Rows rejected by tolerant validation are kept aside, the rest of page is imported.
+        try:
+            rejected_rows_services.store_rejected_rows(
+                provider=self._provider_client.provider,
+                rejected_rows=self._provider_client.pop_rejected_rows(),
+            )
+        except Exception as e:
+            msg = "Unable to store rejected rows. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            self._count(errors=1)
+            logger.exception("{} {}. Continue.".format(self.log_prefix, msg))
+
+    @_recorded_stage(stream=crypto_enums.ImportStream.MARKET_INSTRUMENTS)
     def import_market_instruments(
         self,
         trading_category: provider_enums.TradingCategory,
@@ -40,10 +187,12 @@ class CryptoProviderImporter(object):
                 trading_category.name,
                 common_utils.get_exception_message(exception=e),
             )
+            self._count(errors=1)
             logger.exception("{} {}.".format(self.log_prefix, msg))
             # TODO: Send mail to managers
             return None
 
+        self._store_rejected_rows()
         if not market_instruments:
             logger.info(
                 "{} No market instruments to import (trading_category={}). Exiting.".format(
@@ -53,6 +202,7 @@ class CryptoProviderImporter(object):
             )
             return None
 
+        self._count(rows_fetched=len(market_instruments))
         logger.info(
             "{} Fetched {} market instruments to import".format(
                 self.log_prefix, len(market_instruments)
@@ -72,9 +222,14 @@ class CryptoProviderImporter(object):
                         common_utils.get_exception_message(exception=e),
                     )
                 )
+                self._count(errors=1)
                 logger.exception("{} {}. Continue.".format(self.log_prefix, msg))
                 continue
 
+        self._log_page_summary(
+            rows="market instruments", trading_category=trading_category.name
+        )
+
     def _import_market_instrument(
         self, market_instrument: provider_messages.MarketInstrument, dry_run: bool
     ) -> None:
@@ -82,19 +237,23 @@ class CryptoProviderImporter(object):
             name=market_instrument.name,
             provider=self._provider_client.provider.to_integer_choice(),
         ).exists():
-            logger.info(
-                "{} Market instrument already exists (market_instrument_symbol={}). Continue.".format(
-                    self.log_prefix, market_instrument.name
+            self._count(rows_skipped=1)
+            if self._is_row_logged():
+                logger.debug(
+                    "{} Market instrument already exists (market_instrument_symbol={}). Continue.".format(
+                        self.log_prefix, market_instrument.name
+                    )
                 )
-            )
             return None
 
         if dry_run:
-            logger.info(
-                "{} [DRY-RUN] Would create market instrument (market_instrument_symbol={}). Continue.".format(
-                    self.log_prefix, market_instrument.name
+            self._count(rows_skipped=1)
+            if self._is_row_logged():
+                logger.debug(
+                    "{} [DRY-RUN] Would create market instrument (market_instrument_symbol={}). Continue.".format(
+                        self.log_prefix, market_instrument.name
+                    )
                 )
-            )
             return None
 
         crypto_models.MarketInstrument.objects.create(
@@ -102,12 +261,15 @@ class CryptoProviderImporter(object):
             status=market_instrument.status,
             provider=self._provider_client.provider.to_integer_choice(),
         )
-        logger.info(
-            "{} Created market instrument (market_instrument_symbol={}).".format(
-                self.log_prefix, market_instrument.name
+        self._count(rows_inserted=1)
+        if self._is_row_logged():
+            logger.debug(
+                "{} Created market instrument (market_instrument_symbol={}).".format(
+                    self.log_prefix, market_instrument.name
+                )
             )
-        )
 
+    @_recorded_stage(stream=crypto_enums.ImportStream.TRADE_ORDERS)
     def import_trade_orders(
         self,
         trading_category: provider_enums.TradingCategory,
@@ -135,11 +297,20 @@ class CryptoProviderImporter(object):
                     common_utils.get_exception_message(exception=e),
                 )
             )
+            self._count(errors=1)
             logger.exception("{} {}.".format(self.log_prefix, msg))
             # TODO: Send mail to managers
             return None
 
+        self._store_rejected_rows()
+        freshness_key = "{}:{}".format(trading_category.name, market_instrument_symbol)
         if not trade_orders:
+            self._mark_import_succeeded(
+                stream=crypto_enums.ImportStream.TRADE_ORDERS,
+                key=freshness_key,
+                records_created_at=[],
+                dry_run=dry_run,
+            )
             logger.info(
                 "{} No trade orders fetched (trading_category={}, market_instrument_symbol={}). Exiting.".format(
                     self.log_prefix, trading_category.name, market_instrument_symbol
@@ -147,6 +318,7 @@ class CryptoProviderImporter(object):
             )
             return None
 
+        self._count(rows_fetched=len(trade_orders))
         logger.info(
             "{} Fetched {} trade orders to import.".format(
                 self.log_prefix, len(trade_orders)
@@ -155,39 +327,69 @@ class CryptoProviderImporter(object):
 
         for trade_order in trade_orders:
             try:
-                self._import_trade_order(trade_order=trade_order, dry_run=dry_run)
+                self._import_trade_order(
+                    trade_order=trade_order,
+                    trading_category=trading_category,
+                    dry_run=dry_run,
+                )
             except Exception as e:
                 msg = "Unexpected exception occurred while importing trade order (market_instrument_symbol={}, order_id={}). Error: {}".format(
                     trade_order.market_instrument_name,
                     trade_order.order_id,
                     common_utils.get_exception_message(exception=e),
                 )
+                self._count(errors=1)
                 logger.exception("{} {}. Continue.".format(self.log_prefix, msg))
 
+        self._log_page_summary(
+            rows="trade orders",
+            trading_category=trading_category.name,
+            market_instrument_symbol=market_instrument_symbol,
+        )
+        self._mark_import_succeeded(
+            stream=crypto_enums.ImportStream.TRADE_ORDERS,
+            key=freshness_key,
+            records_created_at=[trade_order.created_at for trade_order in trade_orders],
+            dry_run=dry_run,
+        )
+
     def _import_trade_order(
-        self, trade_order: provider_messages.TradeOrder, dry_run: bool
+        self,
+        trade_order: provider_messages.TradeOrder,
+        trading_category: provider_enums.TradingCategory,
+        dry_run: bool,
     ) -> None:
-        if crypto_models.TradeOrder.objects.filter(
+        existing_trade_orders = crypto_models.TradeOrder.objects.filter(
             order_id=trade_order.order_id
-        ).exists():
-            logger.info(
-                "{} Trade order already exists (market_instrument_symbol={},"
-                " order_id={}). Exiting.".format(
-                    self.log_prefix,
-                    trade_order.market_instrument_name,
-                    trade_order.order_id,
+        )
+        if existing_trade_orders.exists():
+            if not dry_run:
+                # Re-import fills category of orders imported before it was stored.
+                existing_trade_orders.filter(trading_category__isnull=True).update(
+                    trading_category=trading_category.name
+                )
+            self._count(rows_skipped=1)
+            if self._is_row_logged():
+                logger.debug(
+                    "{} Trade order already exists (market_instrument_symbol={},"
+                    " order_id={}). Exiting.".format(
+                        self.log_prefix,
+                        trade_order.market_instrument_name,
+                        trade_order.order_id,
+                    )
                 )
-            )
             return None
 
         if dry_run:
-            logger.info(
-                "{} [DRY-RUN] Would create trade order (market_instrument_symbol={}, order_id={}). Exiting.".format(
-                    self.log_prefix,
-                    trade_order.market_instrument_name,
-                    trade_order.order_id,
+            self._count(rows_skipped=1)
+            if self._is_row_logged():
+                logger.debug(
+                    "{} [DRY-RUN] Would create trade order (market_instrument_symbol={}, order_id={}). Exiting.".format(
+                        self.log_prefix,
+                        trade_order.market_instrument_name,
+                        trade_order.order_id,
+                    )
                 )
-            )
             return None
 
         crypto_models.TradeOrder.objects.create(
@@ -205,16 +407,20 @@ class CryptoProviderImporter(object):
             created_at=trade_order.created_at,
             updated_at=trade_order.updated_at,
             provider=self._provider_client.provider.to_integer_choice(),
+            trading_category=trading_category.name,
         )
 
-        logger.info(
-            "{} Created trade order (market_instrument_symbol={}, order_id={}). Exiting.".format(
-                self.log_prefix,
-                trade_order.market_instrument_name,
-                trade_order.order_id,
+        self._count(rows_inserted=1)
+        if self._is_row_logged():
+            logger.debug(
+                "{} Created trade order (market_instrument_symbol={}, order_id={}). Exiting.".format(
+                    self.log_prefix,
+                    trade_order.market_instrument_name,
+                    trade_order.order_id,
+                )
             )
-        )
 
+    @_recorded_stage(stream=crypto_enums.ImportStream.TRADE_PNL)
     def import_trade_pnl_transactions(
         self,
         trading_category: provider_enums.TradingCategory,
@@ -273,11 +479,20 @@ class CryptoProviderImporter(object):
                     common_utils.get_exception_message(exception=e),
                 )
             )
+            self._count(errors=1)
             logger.exception("{} {}.".format(self.log_prefix, msg))
             # TODO: Send mail to managers
             return None
 
+        self._store_rejected_rows()
+        freshness_key = "{}:{}".format(trading_category.name, market_instrument_symbol)
         if not pnl_transactions:
+            self._mark_import_succeeded(
+                stream=crypto_enums.ImportStream.TRADE_PNL,
+                key=freshness_key,
+                records_created_at=[],
+                dry_run=dry_run,
+            )
             logger.info(
                 "{} No PnL closed transactions fetched (market_instrument_symbol={}, trading_category={}). Exiting.".format(
                     self.log_prefix,
@@ -287,15 +502,17 @@ class CryptoProviderImporter(object):
             )
             return None
 
+        self._count(rows_fetched=len(pnl_transactions))
         logger.info(
             "{} Fetched {} PnL transactions to import.".format(
                 self.log_prefix, len(pnl_transactions)
             )
         )
 
+        created_pnl_transactions = []
         for pnl_transaction in pnl_transactions:
             try:
-                self._import_pnl_transaction(
+                created_pnl_transaction = self._import_pnl_transaction(
                     pnl_transaction=pnl_transaction, dry_run=dry_run
                 )
             except Exception as e:
@@ -304,32 +521,75 @@ class CryptoProviderImporter(object):
                     trading_category.name,
                     common_utils.get_exception_message(exception=e),
                 )
+                self._count(errors=1)
                 logger.exception("{} {}. Continue.".format(self.log_prefix, msg))
                 continue
 
+            if created_pnl_transaction:
+                created_pnl_transactions.append(created_pnl_transaction)
+
+        self._log_page_summary(
+            rows="PnL transactions",
+            trading_category=trading_category.name,
+            market_instrument_symbol=market_instrument_symbol,
+        )
+        self._mark_import_succeeded(
+            stream=crypto_enums.ImportStream.TRADE_PNL,
+            key=freshness_key,
+            records_created_at=[
+                pnl_transaction.created_at for pnl_transaction in pnl_transactions
+            ],
+            dry_run=dry_run,
+        )
+        if not created_pnl_transactions:
+            return None
+
+        try:
+            pnl_rollup_services.apply_pnl_transactions(
+                provider=self._provider_client.provider,
+                trading_category=trading_category,
+                pnl_transactions=created_pnl_transactions,
+            )
+        except Exception as e:
+            msg = "Unable to update daily PnL rollup (market_instrument_symbol={}, trading_category={}). Error: {}".format(
+                market_instrument_symbol,
+                trading_category.name,
+                common_utils.get_exception_message(exception=e),
+            )
+            self._count(errors=1)
+            logger.exception(
+                "{} {}. Run rebuild_pnl_rollup to backfill.".format(
+                    self.log_prefix, msg
+                )
+            )
+
     def _import_pnl_transaction(
         self, pnl_transaction: provider_messages.TradePnLPosition, dry_run: bool
-    ) -> None:
+    ) -> typing.Optional[crypto_models.TradePnLTransaction]:
         if crypto_models.TradePnLTransaction.objects.filter(
             order__order_id=pnl_transaction.order_id,
         ).exists():
-            logger.info(
-                "{} PnL transaction already exists (market_instrument_symbol={}, order_id={}). Exiting.".format(
-                    self.log_prefix,
-                    pnl_transaction.market_instrument_name,
-                    pnl_transaction.order_id,
+            self._count(rows_skipped=1)
+            if self._is_row_logged():
+                logger.debug(
+                    "{} PnL transaction already exists (market_instrument_symbol={}, order_id={}). Exiting.".format(
+                        self.log_prefix,
+                        pnl_transaction.market_instrument_name,
+                        pnl_transaction.order_id,
+                    )
                 )
-            )
             return None
 
         if dry_run:
-            logger.info(
-                "{} [DRY-RUN] Would create PnL transaction (market_instrument_symbol={}, order_id={}). Exiting.".format(
-                    self.log_prefix,
-                    pnl_transaction.market_instrument_name,
-                    pnl_transaction.order_id,
+            self._count(rows_skipped=1)
+            if self._is_row_logged():
+                logger.debug(
+                    "{} [DRY-RUN] Would create PnL transaction (market_instrument_symbol={}, order_id={}). Exiting.".format(
+                        self.log_prefix,
+                        pnl_transaction.market_instrument_name,
+                        pnl_transaction.order_id,
+                    )
                 )
-            )
             return None
 
         trade_order = crypto_models.TradeOrder.objects.filter(
@@ -351,7 +611,7 @@ class CryptoProviderImporter(object):
             )
             return None
 
-        crypto_models.TradePnLTransaction.objects.create(
+        created_pnl_transaction = crypto_models.TradePnLTransaction.objects.create(
             position_closed_size=pnl_transaction.position_closed_size,
             total_entry_value=pnl_transaction.total_entry_value,
             average_entry_price=pnl_transaction.average_entry_price,
@@ -362,14 +622,19 @@ class CryptoProviderImporter(object):
             order=trade_order,
         )
 
-        logger.info(
-            "{} Created PnL transaction (market_instrument_symbol={}, order_id={}).".format(
-                self.log_prefix,
-                pnl_transaction.market_instrument_name,
-                pnl_transaction.order_id,
+        self._count(rows_inserted=1)
+        if self._is_row_logged():
+            logger.debug(
+                "{} Created PnL transaction (market_instrument_symbol={}, order_id={}).".format(
+                    self.log_prefix,
+                    pnl_transaction.market_instrument_name,
+                    pnl_transaction.order_id,
+                )
             )
-        )
 
+        return created_pnl_transaction
+
+    @_recorded_stage(stream=crypto_enums.ImportStream.TRADE_EXECUTIONS)
     def import_trade_execution_transactions(
         self,
         trading_category: provider_enums.TradingCategory,
@@ -417,8 +682,13 @@ class CryptoProviderImporter(object):
                 return None
 
             from_datetime = last_execution_transaction.created_at
+        get_trade_executions = (
+            self._provider_client.get_trade_executions_batch
+            if self._use_columnar_batches
+            else self._provider_client.get_trade_executions
+        )
         try:
-            execution_transactions = self._provider_client.get_trade_executions(
+            execution_transactions = get_trade_executions(
                 trading_category=trading_category,
                 market_instrument_symbol=market_instrument_symbol,
                 from_datetime=from_datetime,
@@ -437,11 +707,20 @@ class CryptoProviderImporter(object):
                     common_utils.get_exception_message(exception=e),
                 )
             )
+            self._count(errors=1)
             logger.exception("{} {}.".format(self.log_prefix, msg))
             # TODO: Send mail to managers
             return None
 
+        self._store_rejected_rows()
+        freshness_key = "{}:{}".format(trading_category.name, market_instrument_symbol)
         if not execution_transactions:
+            self._mark_import_succeeded(
+                stream=crypto_enums.ImportStream.TRADE_EXECUTIONS,
+                key=freshness_key,
+                records_created_at=[],
+                dry_run=dry_run,
+            )
             logger.info(
                 "{} No execution transactions fetched (market_instrument_symbol={}, trading_category={}). Exiting.".format(
                     self.log_prefix,
@@ -451,63 +730,119 @@ class CryptoProviderImporter(object):
             )
             return None
 
+        self._count(rows_fetched=len(execution_transactions))
         logger.info(
             "{} Fetched {} execution transactions to import.".format(
                 self.log_prefix, len(execution_transactions)
             )
         )
 
+        if self._use_columnar_batches:
+            try:
+                self._import_execution_transactions_batch(
+                    batch=execution_transactions, dry_run=dry_run
+                )
+                self._mark_import_succeeded(
+                    stream=crypto_enums.ImportStream.TRADE_EXECUTIONS,
+                    key=freshness_key,
+                    records_created_at=execution_transactions.get_database_column(
+                        "created_at"
+                    ),
+                    dry_run=dry_run,
+                )
+            except Exception as e:
+                msg = "Unexpected exception occurred while importing execution transactions batch (market_instrument_symbol={}). Error: {}".format(
+                    market_instrument_symbol,
+                    common_utils.get_exception_message(exception=e),
+                )
+                self._count(errors=1)
+                logger.exception("{} {}.".format(self.log_prefix, msg))
+
+            return None
+
+        created_execution_transactions = []
         for execution_transaction in execution_transactions:
             try:
-                self._import_execution_transaction(
+                created_execution_transaction = self._import_execution_transaction(
                     execution_transaction=execution_transaction, dry_run=dry_run
                 )
+                if created_execution_transaction:
+                    created_execution_transactions.append(created_execution_transaction)
             except Exception as e:
                 msg = "Unexpected exception occurred while importing execution transactions (market_instrument_symbol={}, execution_id={}). Error: {}".format(
                     execution_transaction.market_instrument_name,
                     execution_transaction.execution_id,
                     common_utils.get_exception_message(exception=e),
                 )
+                self._count(errors=1)
                 logger.exception("{} {}. Continue.".format(self.log_prefix, msg))
                 continue
 
+        self._invalidate_position_ledgers(
+            created_executions=[
+                (
+                    created_execution_transaction.instrument_name,
+                    created_execution_transaction.created_at,
+                )
+                for created_execution_transaction in created_execution_transactions
+            ]
+        )
+        self._log_page_summary(
+            rows="execution transactions",
+            trading_category=trading_category.name,
+            market_instrument_symbol=market_instrument_symbol,
+        )
+        self._mark_import_succeeded(
+            stream=crypto_enums.ImportStream.TRADE_EXECUTIONS,
+            key=freshness_key,
+            records_created_at=[
+                execution_transaction.created_at
+                for execution_transaction in execution_transactions
+            ],
+            dry_run=dry_run,
+        )
+
     def _import_execution_transaction(
         self, execution_transaction: provider_messages.TradeExecution, dry_run: bool
-    ) -> None:
+    ) -> typing.Optional[crypto_models.TradeExecutionTransaction]:
 
         if crypto_models.TradeExecutionTransaction.objects.filter(
             execution_id=execution_transaction.execution_id,
         ).exists():
-            logger.info(
-                "{} Execution transaction already exists (market_instrument_symbol={}, execution_id={}). Exiting.".format(
-                    self.log_prefix,
-                    execution_transaction.market_instrument_name,
-                    execution_transaction.execution_id,
+            self._count(rows_skipped=1)
+            if self._is_row_logged():
+                logger.debug(
+                    "{} Execution transaction already exists (market_instrument_symbol={}, execution_id={}). Exiting.".format(
+                        self.log_prefix,
+                        execution_transaction.market_instrument_name,
+                        execution_transaction.execution_id,
+                    )
                 )
-            )
             return None
 
         if dry_run:
-            logger.info(
-                "{} [DRY-RUN] Would create execution transaction (market_instrument_symbol={}, execution_id={}). Exiting.".format(
-                    self.log_prefix,
-                    execution_transaction.market_instrument_name,
-                    execution_transaction.order_id,
+            self._count(rows_skipped=1)
+            if self._is_row_logged():
+                logger.debug(
+                    "{} [DRY-RUN] Would create execution transaction (market_instrument_symbol={}, execution_id={}). Exiting.".format(
+                        self.log_prefix,
+                        execution_transaction.market_instrument_name,
+                        execution_transaction.order_id,
+                    )
                 )
-            )
             return None
 
         trade_order = crypto_models.TradeOrder.objects.filter(
             order_id=execution_transaction.order_id,
         ).first()
 
-        crypto_models.TradeExecutionTransaction.objects.create(
+        created_execution_transaction = crypto_models.TradeExecutionTransaction.objects.create(
             instrument_name=execution_transaction.market_instrument_name,
             execution_id=execution_transaction.execution_id,
             execution_side=execution_transaction.execution_side,
             execution_type=execution_transaction.execution_type,
             executed_fee=execution_transaction.executed_fee,
-            execution_price=execution_transaction.executed_fee,
+            execution_price=execution_transaction.execution_price,
             execution_quantity=execution_transaction.execution_quantity,
             execution_value=execution_transaction.execution_value,
             is_maker=execution_transaction.is_maker,
@@ -516,14 +851,103 @@ class CryptoProviderImporter(object):
             order=trade_order,
         )
 
+        self._count(rows_inserted=1)
+        if self._is_row_logged():
+            logger.debug(
+                "{} Created execution transaction (market_instrument_symbol={}, execution_id={}).".format(
+                    self.log_prefix,
+                    execution_transaction.market_instrument_name,
+                    execution_transaction.order_id,
+                )
+            )
+
+        return created_execution_transaction
+
+    def _import_execution_transactions_batch(
+        self, batch: columnar.ColumnarBatch, dry_run: bool
+    ) -> None:
+        if dry_run:
+            self._count(rows_skipped=len(batch))
+            logger.info(
+                "{} [DRY-RUN] Would create up to {} execution transactions. Exiting.".format(
+                    self.log_prefix, len(batch)
+                )
+            )
+            return None
+
+        execution_ids = batch.get_database_column("execution_id")
+        stored_execution_ids = set(
+            crypto_models.TradeExecutionTransaction.objects.filter(
+                execution_id__in=execution_ids
+            ).values_list("execution_id", flat=True)
+        )
+        order_ids = batch.get_database_column("order_id")
+        trade_order_ids = dict(
+            crypto_models.TradeOrder.objects.filter(
+                order_id__in={order_id for order_id in order_ids if order_id}
+            ).values_list("order_id", "id")
+        )
+        created_count = bulk_loader.bulk_insert_columns(
+            model=crypto_models.TradeExecutionTransaction,
+            columns={
+                "instrument_name": batch.get_database_column("market_instrument_name"),
+                "execution_id": execution_ids,
+                "execution_side": batch.get_database_column("execution_side"),
+                "execution_type": batch.get_database_column("execution_type"),
+                "executed_fee": batch.get_database_column("executed_fee"),
+                "execution_price": batch.get_database_column("execution_price"),
+                "execution_quantity": batch.get_database_column("execution_quantity"),
+                "execution_value": batch.get_database_column("execution_value"),
+                "is_maker": batch.get_database_column("is_maker"),
+                "provider": [self._provider_client.provider.to_integer_choice()]
+                * len(batch),
+                "created_at": batch.get_database_column("created_at"),
+                "order_id": [trade_order_ids.get(order_id) for order_id in order_ids],
+            },
+            conflict_field_names=["execution_id"],
+        )
+
+        # Rows conflicting with stored execution ids are skipped by insert.
+        self._count(rows_inserted=created_count, rows_skipped=len(batch) - created_count)
+        if created_count:
+            self._invalidate_position_ledgers(
+                created_executions=[
+                    (instrument_name, created_at)
+                    for instrument_name, execution_id, created_at in zip(
+                        batch.get_database_column("market_instrument_name"),
+                        execution_ids,
+                        batch.get_database_column("created_at"),
+                    )
+                    if execution_id not in stored_execution_ids
+                ]
+            )
         logger.info(
-            "{} Created execution transaction (market_instrument_symbol={}, execution_id={}).".format(
-                self.log_prefix,
-                execution_transaction.market_instrument_name,
-                execution_transaction.order_id,
+            "{} Created {} execution transactions ({} fetched).".format(
+                self.log_prefix, created_count, len(batch)
             )
         )
 
+    def _invalidate_position_ledgers(
+        self, created_executions: typing.Sequence[typing.Tuple[str, datetime.datetime]]
+    ) -> None:
+        # Backfilled executions older than a ledger checkpoint are not replayed from
+        # it, so checkpoints from the oldest created execution on are rebuilt.
+        first_created_at = {}
+        for instrument_name, created_at in created_executions:
+            if (
+                instrument_name not in first_created_at
+                or created_at < first_created_at[instrument_name]
+            ):
+                first_created_at[instrument_name] = created_at
+
+        for instrument_name, created_at in first_created_at.items():
+            position_ledger_services.invalidate_checkpoints(
+                provider=self._provider_client.provider,
+                instrument_name=instrument_name,
+                from_datetime=created_at,
+            )
+
+    @_recorded_stage(stream=crypto_enums.ImportStream.WALLET_BALANCES)
     def import_wallet_balances(
         self,
         wallet_type: provider_enums.WalletType,
@@ -540,6 +964,7 @@ class CryptoProviderImporter(object):
                 currency,
                 common_utils.get_exception_message(exception=e),
             )
+            self._count(errors=1)
             logger.exception("{} {}.".format(self.log_prefix, msg))
             # TODO: Send mail to managers
             return None
@@ -554,6 +979,7 @@ class CryptoProviderImporter(object):
             )
             return None
 
+        self._count(rows_fetched=len(wallet_balances))
         logger.info(
             "{} Fetched wallet balances for {} currencies to import.".format(
                 self.log_prefix, len(wallet_balances)
@@ -569,12 +995,27 @@ class CryptoProviderImporter(object):
                 created_at=datetime.datetime.now(),
             )
 
-            logger.info(
-                "{} Created wallet balance snapshot (currency={}, wallet_type={}).".format(
-                    self.log_prefix, wallet_balance.currency, wallet_type.name
+            self._count(rows_inserted=1)
+            if self._is_row_logged():
+                logger.debug(
+                    "{} Created wallet balance snapshot (currency={}, wallet_type={}).".format(
+                        self.log_prefix, wallet_balance.currency, wallet_type.name
+                    )
                 )
-            )
 
+        self._log_page_summary(
+            rows="wallet balances",
+            wallet_type=wallet_type.name,
+            currency=currency,
+        )
+        self._mark_import_succeeded(
+            stream=crypto_enums.ImportStream.WALLET_BALANCES,
+            key=wallet_type.name,
+            records_created_at=[timezone.now()],
+            dry_run=False,
+        )
+
+    @_recorded_stage(stream=crypto_enums.ImportStream.WALLET_INTERNAL_TRANSFERS)
     def import_wallet_internal_transfers(
         self,
         wallet_type: provider_enums.WalletType,
@@ -600,10 +1041,12 @@ class CryptoProviderImporter(object):
                 currency,
                 common_utils.get_exception_message(exception=e),
             )
+            self._count(errors=1)
             logger.exception("{} {}.".format(self.log_prefix, msg))
             # TODO: Send mail to managers
             return None
 
+        self._store_rejected_rows()
         if not wallet_internal_transfers:
             logger.info(
                 "{} No wallet internal transfers fetched (wallet_type={}, currency={}). Exiting.".format(
@@ -614,6 +1057,7 @@ class CryptoProviderImporter(object):
             )
             return None
 
+        self._count(rows_fetched=len(wallet_internal_transfers))
         logger.info(
             "{} Fetched {} wallet internal transfers for currencies to import.".format(
                 self.log_prefix, len(wallet_internal_transfers)
@@ -631,32 +1075,52 @@ class CryptoProviderImporter(object):
                     currency,
                     common_utils.get_exception_message(exception=e),
                 )
+                self._count(errors=1)
                 logger.exception("{} {}. Continue.".format(self.log_prefix, msg))
                 continue
 
+        self._log_page_summary(
+            rows="wallet internal transfers",
+            wallet_type=wallet_type.name,
+            currency=currency,
+        )
+        self._mark_import_succeeded(
+            stream=crypto_enums.ImportStream.WALLET_INTERNAL_TRANSFERS,
+            key=wallet_type.name,
+            records_created_at=[
+                wallet_internal_transfer.network_datetime
+                for wallet_internal_transfer in wallet_internal_transfers
+            ],
+            dry_run=dry_run,
+        )
+
     def _import_wallet_internal_transfer(
         self, wallet_internal_transfer: provider_messages.WalletTransfer, dry_run: bool
     ) -> None:
         if crypto_models.PortfolioTransfer.objects.filter(
             txid=wallet_internal_transfer.txid
         ).exists():
-            logger.info(
-                "{} Wallet internal transfer already exists (currency={}, transaction_id={}). Exiting.".format(
-                    self.log_prefix,
-                    wallet_internal_transfer.transaction_currency,
-                    wallet_internal_transfer.txid,
+            self._count(rows_skipped=1)
+            if self._is_row_logged():
+                logger.debug(
+                    "{} Wallet internal transfer already exists (currency={}, transaction_id={}). Exiting.".format(
+                        self.log_prefix,
+                        wallet_internal_transfer.transaction_currency,
+                        wallet_internal_transfer.txid,
+                    )
                 )
-            )
             return None
 
         if dry_run:
-            logger.info(
-                "{} [DRY-RUN] Would create wallet internal transfer (currency={}, transaction_id={}). Exiting.".format(
-                    self.log_prefix,
-                    wallet_internal_transfer.transaction_currency,
-                    wallet_internal_transfer.txid,
+            self._count(rows_skipped=1)
+            if self._is_row_logged():
+                logger.debug(
+                    "{} [DRY-RUN] Would create wallet internal transfer (currency={}, transaction_id={}). Exiting.".format(
+                        self.log_prefix,
+                        wallet_internal_transfer.transaction_currency,
+                        wallet_internal_transfer.txid,
+                    )
                 )
-            )
             return None
 
         crypto_models.PortfolioTransfer.objects.create(
@@ -673,14 +1137,195 @@ class CryptoProviderImporter(object):
             network_datetime=wallet_internal_transfer.network_datetime,
         )
 
+        self._count(rows_inserted=1)
+        if self._is_row_logged():
+            logger.debug(
+                "{} Created wallet internal transfer (currency={}, transaction_id={}).".format(
+                    self.log_prefix,
+                    wallet_internal_transfer.transaction_currency,
+                    wallet_internal_transfer.txid,
+                )
+            )
+
+    @_recorded_stage(stream=crypto_enums.ImportStream.WALLET_EXTERNAL_TRANSFERS)
+    def import_wallet_external_transfers(
+        self,
+        wallet_type: provider_enums.WalletType,
+        transfer_type: provider_enums.WalletTransferType,
+        depth: int = 1,
+        currency: typing.Optional[common_enums.Currency] = None,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+        max_workers: int = 4,
+        dry_run: bool = False,
+    ) -> None:
+        get_wallet_transfers = {
+            provider_enums.WalletTransferType.DEPOSIT: self._provider_client.get_wallet_deposit_transfers,
+            provider_enums.WalletTransferType.WITHDRAWAL: self._provider_client.get_wallet_withdrawal_transfers,
+        }[transfer_type]
+
+        if from_datetime:
+            to_datetime = to_datetime or datetime.datetime.now(
+                tz=from_datetime.tzinfo
+            )
+            time_windows = []
+            window_start = from_datetime
+            while window_start < to_datetime:
+                window_end = min(window_start + EXTERNAL_TRANSFERS_WINDOW, to_datetime)
+                time_windows.append((window_start, window_end))
+                window_start = window_end
+        else:
+            # API returns last window when no time range is given.
+            time_windows = [(None, to_datetime)]
+
         logger.info(
-            "{} Created wallet internal transfer (currency={}, transaction_id={}).".format(
+            "{} Fetching wallet {} transfers in {} time windows (wallet_type={}, currency={}, max_workers={}).".format(
                 self.log_prefix,
-                wallet_internal_transfer.transaction_currency,
-                wallet_internal_transfer.txid,
+                transfer_type.name.lower(),
+                len(time_windows),
+                wallet_type.name,
+                currency,
+                max_workers,
             )
         )
 
+        # Only API calls run concurrently, writes stay on the calling thread connection.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    get_wallet_transfers,
+                    wallet_type=wallet_type,
+                    depth=depth,
+                    currency=currency,
+                    from_datetime=window_start,
+                    to_datetime=window_end,
+                ): (window_start, window_end)
+                for window_start, window_end in time_windows
+            }
+            for future in concurrent.futures.as_completed(futures):
+                window_start, window_end = futures[future]
+                try:
+                    wallet_transfers = future.result()
+                except Exception as e:
+                    # Any failure of one window must not drop the windows after it.
+                    msg = "Unable to fetch wallet {} transfers (wallet_type={}, currency={}, from_datetime={}, to_datetime={}). Error: {}".format(
+                        transfer_type.name.lower(),
+                        wallet_type.name,
+                        currency,
+                        window_start,
+                        window_end,
+                        common_utils.get_exception_message(exception=e),
+                    )
+                    self._count(errors=1)
+                    logger.exception("{} {}. Continue.".format(self.log_prefix, msg))
+                    # TODO: Send mail to managers
+                    continue
+
+                self._store_rejected_rows()
+                try:
+                    created_count, updated_count = self._import_wallet_transfers(
+                        wallet_transfers=wallet_transfers, dry_run=dry_run
+                    )
+                except Exception as e:
+                    msg = "Unexpected exception occurred while importing wallet {} transfers (wallet_type={}, currency={}, from_datetime={}, to_datetime={}). Error: {}".format(
+                        transfer_type.name.lower(),
+                        wallet_type.name,
+                        currency,
+                        window_start,
+                        window_end,
+                        common_utils.get_exception_message(exception=e),
+                    )
+                    self._count(errors=1)
+                    logger.exception("{} {}. Continue.".format(self.log_prefix, msg))
+                    continue
+
+                self._mark_import_succeeded(
+                    stream=crypto_enums.ImportStream.WALLET_EXTERNAL_TRANSFERS,
+                    key="{}:{}".format(wallet_type.name, transfer_type.name),
+                    records_created_at=[
+                        wallet_transfer.network_datetime
+                        for wallet_transfer in wallet_transfers
+                    ],
+                    dry_run=dry_run,
+                )
+                if dry_run:
+                    self._count(
+                        rows_fetched=len(wallet_transfers),
+                        rows_skipped=created_count + updated_count,
+                    )
+                else:
+                    self._count(
+                        rows_fetched=len(wallet_transfers),
+                        rows_inserted=created_count,
+                        rows_updated=updated_count,
+                    )
+                logger.info(
+                    "{} {}Fetched {} wallet {} transfers, created {}, updated {} (from_datetime={}, to_datetime={}).".format(
+                        self.log_prefix,
+                        "[DRY-RUN] " if dry_run else "",
+                        len(wallet_transfers),
+                        transfer_type.name.lower(),
+                        created_count,
+                        updated_count,
+                        window_start,
+                        window_end,
+                    )
+                )
+
+    def _import_wallet_transfers(
+        self,
+        wallet_transfers: typing.List[provider_messages.WalletTransfer],
+        dry_run: bool,
+    ) -> typing.Tuple[int, int]:
+        if not wallet_transfers:
+            return 0, 0
+
+        existing_transfers = {
+            portfolio_transfer.txid: portfolio_transfer
+            for portfolio_transfer in crypto_models.PortfolioTransfer.objects.filter(
+                provider=self._provider_client.provider.to_integer_choice(),
+                txid__in={wallet_transfer.txid for wallet_transfer in wallet_transfers},
+            )
+        }
+        new_transfers = {}
+        updated_transfers = []
+        for wallet_transfer in wallet_transfers:
+            existing_transfer = existing_transfers.get(wallet_transfer.txid)
+            if existing_transfer is None:
+                new_transfers[wallet_transfer.txid] = crypto_models.PortfolioTransfer(
+                    provider=self._provider_client.provider.to_integer_choice(),
+                    transaction_currency=wallet_transfer.transaction_currency,
+                    chain_currency=wallet_transfer.chain_currency,
+                    type=wallet_transfer.type,
+                    status=wallet_transfer.status,
+                    txid=wallet_transfer.txid,
+                    from_recipient=wallet_transfer.from_recipient,
+                    to_recipient=wallet_transfer.to_recipient,
+                    portfolio_type=wallet_transfer.portfolio_type,
+                    amount=wallet_transfer.amount,
+                    fee=wallet_transfer.fee,
+                    network_datetime=wallet_transfer.network_datetime,
+                )
+            elif existing_transfer.status != wallet_transfer.status:
+                # Pending transfers settle later, status has to follow provider.
+                existing_transfer.status = wallet_transfer.status
+                existing_transfer.fee = wallet_transfer.fee
+                updated_transfers.append(existing_transfer)
+
+        if dry_run:
+            return len(new_transfers), len(updated_transfers)
+
+        with transaction.atomic():
+            crypto_models.PortfolioTransfer.objects.bulk_create(
+                new_transfers.values(), batch_size=500
+            )
+            crypto_models.PortfolioTransfer.objects.bulk_update(
+                updated_transfers, fields=["status", "fee"], batch_size=500
+            )
+
+        return len(new_transfers), len(updated_transfers)
+
+    @_recorded_stage(stream=crypto_enums.ImportStream.TRADE_POSITIONS)
     def import_trade_positions(
         self,
         trading_category: provider_enums.TradingCategory,
@@ -704,10 +1349,12 @@ class CryptoProviderImporter(object):
                 trading_category.name,
                 common_utils.get_exception_message(exception=e),
             )
+            self._count(errors=1)
             logger.exception("{} {}.".format(self.log_prefix, msg))
             # TODO: Send mail to managers
             return None
 
+        self._store_rejected_rows()
         if not trade_positions:
             logger.info(
                 "{} No trade positions to import (currency={}, trading_category={}). Exiting.".format(
@@ -718,6 +1365,7 @@ class CryptoProviderImporter(object):
             )
             return None
 
+        self._count(rows_fetched=len(trade_positions))
         logger.info(
             "{} Fetched {} trade positions to import".format(
                 self.log_prefix, len(trade_positions)
@@ -734,9 +1382,23 @@ class CryptoProviderImporter(object):
                     currency.name,
                     common_utils.get_exception_message(exception=e),
                 )
+                self._count(errors=1)
                 logger.exception("{} {}. Continue.".format(self.log_prefix, msg))
                 continue
 
+        self._log_page_summary(
+            rows="trade positions",
+            trading_category=trading_category.name,
+            currency=currency.name,
+        )
+        self._mark_import_succeeded(
+            stream=crypto_enums.ImportStream.TRADE_POSITIONS,
+            key=trading_category.name,
+            # Positions are a snapshot, it is as fresh as the import.
+            records_created_at=[timezone.now()],
+            dry_run=dry_run,
+        )
+
     def _import_trade_position(
         self, trade_position: provider_messages.TradePosition, dry_run: bool
     ) -> None:
@@ -746,19 +1408,23 @@ class CryptoProviderImporter(object):
             unrealised_pnl=trade_position.unrealised_pnl,
             created_at=trade_position.created_at,
         ).exists():
-            logger.info(
-                "{} Trade position already exists (market_instrument_symbol={}). Continue.".format(
-                    self.log_prefix, trade_position.market_instrument_name
+            self._count(rows_skipped=1)
+            if self._is_row_logged():
+                logger.debug(
+                    "{} Trade position already exists (market_instrument_symbol={}). Continue.".format(
+                        self.log_prefix, trade_position.market_instrument_name
+                    )
                 )
-            )
             return None
 
         if dry_run:
-            logger.info(
-                "{} [DRY-RUN] Would create trade position (market_instrument_symbol={}). Continue.".format(
-                    self.log_prefix, trade_position.market_instrument_name
+            self._count(rows_skipped=1)
+            if self._is_row_logged():
+                logger.debug(
+                    "{} [DRY-RUN] Would create trade position (market_instrument_symbol={}). Continue.".format(
+                        self.log_prefix, trade_position.market_instrument_name
+                    )
                 )
-            )
             return None
 
         crypto_models.TradePosition.objects.create(
@@ -767,8 +1433,178 @@ class CryptoProviderImporter(object):
             provider=self._provider_client.provider.to_integer_choice(),
             created_at=trade_position.created_at,
         )
+        self._count(rows_inserted=1)
+        if self._is_row_logged():
+            logger.debug(
+                "{} Created trade position (market_instrument_symbol={}).".format(
+                    self.log_prefix, trade_position.market_instrument_name
+                )
+            )
+
+    @_recorded_stage(stream=crypto_enums.ImportStream.TRANSACTION_LOG)
+    def import_transactions(
+        self,
+        wallet_type: provider_enums.WalletType,
+        depth: int = 50,
+        currency: typing.Optional[common_enums.Currency] = None,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+        batch_size: int = 1000,
+        dry_run: bool = False,
+    ) -> None:
+        watermark_key = "{}:{}".format(
+            wallet_type.name, currency.value if currency else "ALL"
+        )
+        if not from_datetime:
+            from_datetime = import_watermark_services.get_watermark(
+                provider=self._provider_client.provider,
+                stream=crypto_enums.ImportStream.TRANSACTION_LOG,
+                key=watermark_key,
+            )
+
+        if not from_datetime:
+            logger.info(
+                "{} No from datetime given and no watermark stored (wallet_type={}, currency={}). Exiting.".format(
+                    self.log_prefix, wallet_type.name, currency
+                )
+            )
+            return None
+
+        to_datetime = to_datetime or datetime.datetime.now(tz=datetime.timezone.utc)
+        window_start = from_datetime
+        window = TRANSACTIONS_WINDOW
+        while window_start < to_datetime:
+            window_end = min(window_start + window, to_datetime)
+            try:
+                transactions = self._provider_client.get_transactions(
+                    wallet_type=wallet_type,
+                    depth=depth,
+                    limit=TRANSACTIONS_PAGE_LIMIT,
+                    currency=currency,
+                    from_datetime=window_start,
+                    to_datetime=window_end,
+                )
+            except provider_exceptions.ProviderError as e:
+                msg = "Unable to fetch transactions (wallet_type={}, currency={}, from_datetime={}, to_datetime={}). Error: {}".format(
+                    wallet_type.name,
+                    currency,
+                    window_start,
+                    window_end,
+                    common_utils.get_exception_message(exception=e),
+                )
+                self._count(errors=1)
+                logger.exception("{} {}.".format(self.log_prefix, msg))
+                # TODO: Send mail to managers
+                return None
+
+            self._store_rejected_rows()
+            if len(transactions) >= depth * TRANSACTIONS_PAGE_LIMIT:
+                # Pages come newest first, so a truncated window may miss older rows.
+                if window_end - window_start < TRANSACTIONS_MIN_WINDOW * 2:
+                    self._count(errors=1)
+                    logger.warning(
+                        "{} Transactions window is truncated at {} rows and can not be split, watermark is not advanced (from_datetime={}, to_datetime={}). Increase number of pages.".format(
+                            self.log_prefix, len(transactions), window_start, window_end
+                        )
+                    )
+                    return None
+
+                window = (window_end - window_start) / 2
+                logger.info(
+                    "{} Transactions window is truncated at {} rows, retrying with half window (from_datetime={}, window={}).".format(
+                        self.log_prefix, len(transactions), window_start, window
+                    )
+                )
+                continue
+
+            self._load_transactions(
+                transactions=transactions,
+                wallet_type=wallet_type,
+                currency=currency,
+                from_datetime=window_start,
+                to_datetime=window_end,
+                batch_size=batch_size,
+                dry_run=dry_run,
+            )
+
+            if not dry_run:
+                # Whole window is imported, so next run starts at its end even when
+                # newest rows are older (or window was empty).
+                import_watermark_services.advance_watermark(
+                    provider=self._provider_client.provider,
+                    stream=crypto_enums.ImportStream.TRANSACTION_LOG,
+                    watermark=window_end,
+                    key=watermark_key,
+                )
+
+            window_start = window_end
+            window = min(window * 2, TRANSACTIONS_WINDOW)
+
+    @_recorded_stage(stream=crypto_enums.ImportStream.TRANSACTION_LOG)
+    def import_transactions_page(
+        self,
+        wallet_type: provider_enums.WalletType,
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        depth: int = 1,
+        currency: typing.Optional[common_enums.Currency] = None,
+        batch_size: int = 1000,
+        dry_run: bool = False,
+    ) -> int:
+        # Loads fetched pages of one window as they are, without window splitting
+        # and watermark. Used by archive replay, where every page is replayed once.
+        transactions = self._provider_client.get_transactions(
+            wallet_type=wallet_type,
+            depth=depth,
+            limit=TRANSACTIONS_PAGE_LIMIT,
+            currency=currency,
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+        )
+        self._store_rejected_rows()
+        return self._load_transactions(
+            transactions=transactions,
+            wallet_type=wallet_type,
+            currency=currency,
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+            batch_size=batch_size,
+            dry_run=dry_run,
+        )
+
+    def _load_transactions(
+        self,
+        transactions: typing.List[provider_messages.TransactionLogEntry],
+        wallet_type: provider_enums.WalletType,
+        currency: typing.Optional[common_enums.Currency],
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        batch_size: int,
+        dry_run: bool,
+    ) -> int:
+        created_count = 0
+        if transactions and not dry_run:
+            for i in range(0, len(transactions), batch_size):
+                created_count += transaction_log_importer_services.load_transaction_log_entries(
+                    provider=self._provider_client.provider,
+                    entries=transactions[i : i + batch_size],
+                )
+
+        self._count(
+            rows_fetched=len(transactions),
+            rows_inserted=created_count,
+            rows_skipped=len(transactions) - created_count,
+        )
         logger.info(
-            "{} Created trade position (market_instrument_symbol={}).".format(
-                self.log_prefix, trade_position.market_instrument_name
+            "{} {}Fetched {} transactions, created {} (wallet_type={}, currency={}, from_datetime={}, to_datetime={}).".format(
+                self.log_prefix,
+                "[DRY-RUN] " if dry_run else "",
+                len(transactions),
+                created_count,
+                wallet_type.name,
+                currency,
+                from_datetime,
+                to_datetime,
             )
         )
+        return created_count
@@ -4,6 +4,9 @@
     3. Create enum - time period
     4.
 """
+import collections
+import datetime
+import decimal
 import typing
 
 from django.db import models as django_db_models
@@ -14,16 +17,38 @@ from divisions.crypto.integrations.provider import messages as provider_messages
 from divisions.crypto.integrations.provider import factory
 from divisions.crypto import models as crypto_models
 
+DEFAULT_ROLLING_WINDOW = 7
+
+_AGGREGATION_PERIOD_TRUNC_MAP = {
+    crypto_enums.AggregationPeriod.DAY: django_db_models.functions.TruncDay,
+    crypto_enums.AggregationPeriod.WEEK: django_db_models.functions.TruncWeek,
+    crypto_enums.AggregationPeriod.MONTH: django_db_models.functions.TruncMonth,
+    crypto_enums.AggregationPeriod.YEAR: django_db_models.functions.TruncYear,
+}
+
+
+class _WindowSum(django_db_models.Func):
+    # Django refuses Sum(Sum(...)), but SUM(SUM(x)) OVER (...) is exactly what is
+    # needed to run a window over already grouped buckets.
+    function = "SUM"
+    window_compatible = True
+
 
 def get_trade_position_performance(
     provider: crypto_enums.CryptoProvider,
     trading_category: provider_enums.TradingCategory,
     aggregation_period: crypto_enums.AggregationPeriod,
     symbol: typing.Optional[str] = None,
+    from_date: typing.Optional[datetime.date] = None,
+    to_date: typing.Optional[datetime.date] = None,
+    rolling_window: int = DEFAULT_ROLLING_WINDOW,
 ) -> typing.List[provider_messages.TradePositionPerformance]:
-    aggregation_values = []
-    aggregated_pnl_positions_qs = crypto_models.TradePnLTransaction.objects.filter(
+    if rolling_window < 1:
+        raise ValueError("Rolling window must be at least 1 bucket")
+
+    aggregated_pnl_positions_qs = crypto_models.TradePnLDailyRollup.objects.filter(
         provider=provider.to_integer_choice(),
+        trading_category=trading_category.name,
     )
 
     if symbol:
@@ -31,53 +56,139 @@ def get_trade_position_performance(
             instrument_name=symbol
         )
 
-    if aggregation_period == crypto_enums.AggregationPeriod.YEAR:
-        aggregated_pnl_positions_qs = aggregated_pnl_positions_qs.annotate(
-            year=django_db_models.functions.ExtractYear("created_at")
+    if from_date:
+        aggregated_pnl_positions_qs = aggregated_pnl_positions_qs.filter(
+            day__gte=from_date
         )
-        aggregation_values.extend(["year"])
 
-    elif aggregation_period == crypto_enums.AggregationPeriod.MONTH:
-        aggregated_pnl_positions_qs = aggregated_pnl_positions_qs.annotate(
-            year=django_db_models.functions.ExtractYear("created_at"),
-            month=django_db_models.functions.ExtractMonth("created_at"),
+    if to_date:
+        aggregated_pnl_positions_qs = aggregated_pnl_positions_qs.filter(
+            day__lte=to_date
         )
-        aggregation_values.extend(["year", "month"])
 
-    elif aggregation_period == crypto_enums.AggregationPeriod.WEEK:
-        aggregated_pnl_positions_qs = aggregated_pnl_positions_qs.annotate(
-            year=django_db_models.functions.ExtractYear("created_at"),
-            month=django_db_models.functions.ExtractMonth("created_at"),
-            week=django_db_models.functions.ExtractWeek("created_at"),
+    instrument_partition = [django_db_models.F("instrument_name")]
+    bucket_ordering = django_db_models.F("bucket").asc()
+    aggregated_pnl_positions = (
+        aggregated_pnl_positions_qs.annotate(
+            bucket=_AGGREGATION_PERIOD_TRUNC_MAP[aggregation_period]("day")
         )
-        aggregation_values.extend(["year", "month", "week"])
-
-    elif aggregation_period == crypto_enums.AggregationPeriod.DAY:
-        aggregated_pnl_positions_qs = aggregated_pnl_positions_qs.annotate(
-            year=django_db_models.functions.ExtractYear("created_at"),
-            month=django_db_models.functions.ExtractMonth("created_at"),
-            week=django_db_models.functions.ExtractWeek("created_at"),
-            day=django_db_models.functions.ExtractDay("created_at"),
+        .values("bucket", "instrument_name")
+        .annotate(
+            pnl=django_db_models.Sum("closed_pnl"),
+            trades=django_db_models.Sum("trade_count"),
         )
-        aggregation_values.extend(["year", "month", "week", "day"])
-
-    aggregated_pnl_positions = (
-        aggregated_pnl_positions_qs.values(*aggregation_values)
-        .annotate(pnl=django_db_models.Sum("closed_pnl"))
-        .order_by("instrument_name")
-        .values(*(aggregation_values + ["instrument_name", "pnl"]))
+        .annotate(
+            cumulative_pnl=django_db_models.Window(
+                expression=_WindowSum(django_db_models.F("pnl")),
+                partition_by=instrument_partition,
+                order_by=bucket_ordering,
+            ),
+            bucket_rank=django_db_models.Window(
+                expression=django_db_models.functions.Rank(),
+                partition_by=[django_db_models.F("bucket")],
+                # Decimal ordering would be wrapped in CAST on SQLite, inside OVER clause.
+                order_by=django_db_models.ExpressionWrapper(
+                    django_db_models.F("pnl"),
+                    output_field=django_db_models.FloatField(),
+                ).desc(),
+            ),
+        )
+        .order_by("bucket", "bucket_rank", "instrument_name")
     )
 
-    return [
-        provider_messages.TradePositionPerformance(
-            market_instrument_name=pnl_position["instrument_name"],
-            pnl=pnl_position["pnl"],
-            trading_category=trading_category,
-            provider=provider,
-            year=pnl_position.get("year"),
-            month=pnl_position.get("month"),
-            week=pnl_position.get("week"),
-            day=pnl_position.get("day"),
+    # Rolling PnL covers calendar buckets, not rows, buckets without PnL still count
+    # into the window. Rows come ordered by bucket.
+    rolling_buckets = collections.defaultdict(collections.deque)
+    rolling_pnls = collections.defaultdict(decimal.Decimal)
+    trade_position_performances = []
+    for pnl_position in aggregated_pnl_positions:
+        instrument_name = pnl_position["instrument_name"]
+        instrument_buckets = rolling_buckets[instrument_name]
+        instrument_buckets.append((pnl_position["bucket"], pnl_position["pnl"]))
+        rolling_pnls[instrument_name] += pnl_position["pnl"]
+
+        window_start = _get_rolling_window_start(
+            bucket=pnl_position["bucket"],
+            aggregation_period=aggregation_period,
+            rolling_window=rolling_window,
         )
-        for pnl_position in aggregated_pnl_positions
-    ]
+        while instrument_buckets[0][0] < window_start:
+            _, pnl = instrument_buckets.popleft()
+            rolling_pnls[instrument_name] -= pnl
+
+        trade_position_performances.append(
+            _build_trade_position_performance(
+                pnl_position=pnl_position,
+                rolling_pnl=rolling_pnls[instrument_name],
+                provider=provider,
+                trading_category=trading_category,
+                aggregation_period=aggregation_period,
+            )
+        )
+
+    return trade_position_performances
+
+
+def _get_rolling_window_start(
+    bucket: datetime.date,
+    aggregation_period: crypto_enums.AggregationPeriod,
+    rolling_window: int,
+) -> datetime.date:
+    if aggregation_period in [
+        crypto_enums.AggregationPeriod.DAY,
+        crypto_enums.AggregationPeriod.WEEK,
+    ]:
+        days = rolling_window - 1
+        if aggregation_period == crypto_enums.AggregationPeriod.WEEK:
+            days *= 7
+
+        if days >= (bucket - datetime.date.min).days:
+            return datetime.date.min
+
+        return bucket - datetime.timedelta(days=days)
+
+    if aggregation_period == crypto_enums.AggregationPeriod.MONTH:
+        months = bucket.year * 12 + bucket.month - 1 - (rolling_window - 1)
+        if months < 12:
+            return datetime.date.min
+
+        return datetime.date(months // 12, months % 12 + 1, 1)
+
+    return datetime.date(max(bucket.year - (rolling_window - 1), 1), 1, 1)
+
+
+def _build_trade_position_performance(
+    pnl_position: dict,
+    rolling_pnl: decimal.Decimal,
+    provider: crypto_enums.CryptoProvider,
+    trading_category: provider_enums.TradingCategory,
+    aggregation_period: crypto_enums.AggregationPeriod,
+) -> provider_messages.TradePositionPerformance:
+    period_start = pnl_position["bucket"]
+    iso_year, iso_week, _ = period_start.isocalendar()
+    period_fields = {
+        crypto_enums.AggregationPeriod.YEAR: dict(year=period_start.year),
+        crypto_enums.AggregationPeriod.MONTH: dict(
+            year=period_start.year, month=period_start.month
+        ),
+        crypto_enums.AggregationPeriod.WEEK: dict(year=iso_year, week=iso_week),
+        crypto_enums.AggregationPeriod.DAY: dict(
+            year=period_start.year,
+            month=period_start.month,
+            week=iso_week,
+            day=period_start.day,
+        ),
+    }[aggregation_period]
+
+    return provider_messages.TradePositionPerformance(
+        market_instrument_name=pnl_position["instrument_name"],
+        pnl=pnl_position["pnl"],
+        trading_category=trading_category,
+        provider=provider,
+        period_start=period_start,
+        trade_count=pnl_position["trades"],
+        cumulative_pnl=pnl_position["cumulative_pnl"],
+        rolling_pnl=rolling_pnl,
+        rank=pnl_position["bucket_rank"],
+        **period_fields,
+    )
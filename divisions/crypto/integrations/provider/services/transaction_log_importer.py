@@ -0,0 +1,230 @@
+import decimal
+import gzip
+import itertools
+import logging
+import time
+import typing
+
+from django.db import transaction
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider import exceptions as provider_exceptions
+from divisions.crypto.integrations.provider import messages as provider_messages
+from divisions.crypto.integrations.provider.bybit import (
+    transaction_log as bybit_transaction_log,
+)
+from divisions.crypto.services import bulk_loader
+from divisions.crypto.services import position_ledger as position_ledger_services
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 20000
+
+_TRANSACTION_LOG_PARSERS = {
+    crypto_enums.CryptoProvider.BYBIT: bybit_transaction_log.parse_transaction_log,
+}
+_TRADE_TRANSACTION_TYPE = "TRADE"
+_ZERO = decimal.Decimal("0")
+
+_EXECUTION_FIELD_NAMES = [
+    "instrument_name",
+    "execution_id",
+    "execution_side",
+    "execution_type",
+    "executed_fee",
+    "execution_price",
+    "execution_quantity",
+    "execution_value",
+    "is_maker",
+    "provider",
+    "created_at",
+    "order_id",
+]
+_LOG_ENTRY_FIELD_NAMES = [
+    "provider",
+    "transaction_id",
+    "currency",
+    "instrument_name",
+    "type",
+    "side",
+    "quantity",
+    "position_size",
+    "price",
+    "funding",
+    "fee",
+    "cash_flow",
+    "change",
+    "wallet_balance",
+    "fee_rate",
+    "trade_id",
+    "order_id",
+    "created_at",
+]
+
+
+def load_transaction_log_entries(
+    provider: crypto_enums.CryptoProvider,
+    entries: typing.List[provider_messages.TransactionLogEntry],
+) -> int:
+    return bulk_loader.bulk_insert(
+        model=crypto_models.PortfolioTransactionLogEntry,
+        field_names=_LOG_ENTRY_FIELD_NAMES,
+        rows=[
+            (
+                provider.to_integer_choice(),
+                entry.transaction_id,
+                entry.currency,
+                entry.market_instrument_name,
+                entry.type,
+                entry.side,
+                entry.quantity,
+                entry.position_size,
+                entry.price,
+                entry.funding,
+                entry.fee,
+                entry.cash_flow,
+                entry.change,
+                entry.wallet_balance,
+                entry.fee_rate,
+                entry.trade_id,
+                entry.order_id,
+                entry.created_at,
+            )
+            for entry in entries
+        ],
+        conflict_field_names=["provider", "transaction_id"],
+    )
+
+
+class TransactionLogImporter(object):
+    def __init__(self, provider: crypto_enums.CryptoProvider) -> None:
+        if provider not in _TRANSACTION_LOG_PARSERS:
+            raise provider_exceptions.NoEligibleProviderFoundError(
+                "Transaction log import is not supported for provider {}".format(
+                    provider.name
+                )
+            )
+
+        self._provider = provider
+        self._parse_transaction_log = _TRANSACTION_LOG_PARSERS[provider]
+        self.log_prefix = "[{}-TRANSACTION-LOG-IMPORTER]".format(provider.name)
+
+    def import_file(
+        self,
+        file_path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        dry_run: bool = False,
+    ) -> typing.Dict[str, int]:
+        stats = {"rows": 0, "executions": 0, "entries": 0}
+        started_at = time.monotonic()
+
+        open_file = gzip.open if file_path.endswith(".gz") else open
+        with open_file(file_path, "rt", newline="", encoding="utf-8-sig") as f:
+            entries = self._parse_transaction_log(f)
+            while True:
+                batch = list(itertools.islice(entries, batch_size))
+                if not batch:
+                    break
+
+                stats["rows"] += len(batch)
+                if not dry_run:
+                    executions_count, entries_count = self._load_batch(batch=batch)
+                    stats["executions"] += executions_count
+                    stats["entries"] += entries_count
+
+                elapsed = time.monotonic() - started_at
+                logger.info(
+                    "{} {}Processed {} rows ({:.0f} rows/sec, executions={}, entries={}).".format(
+                        self.log_prefix,
+                        "[DRY-RUN] " if dry_run else "",
+                        stats["rows"],
+                        stats["rows"] / elapsed if elapsed else 0,
+                        stats["executions"],
+                        stats["entries"],
+                    )
+                )
+
+        return stats
+
+    def _load_batch(
+        self, batch: typing.List[provider_messages.TransactionLogEntry]
+    ) -> typing.Tuple[int, int]:
+        provider = self._provider.to_integer_choice()
+        trade_entries = [
+            entry
+            for entry in batch
+            if entry.type == _TRADE_TRANSACTION_TYPE and entry.trade_id
+        ]
+        trade_order_ids = dict(
+            crypto_models.TradeOrder.objects.filter(
+                order_id__in={entry.order_id for entry in trade_entries if entry.order_id}
+            ).values_list("order_id", "id")
+        )
+
+        execution_rows = [
+            (
+                entry.market_instrument_name,
+                entry.trade_id,
+                entry.side,
+                "Trade",
+                entry.fee,
+                entry.price or _ZERO,
+                entry.quantity,
+                entry.quantity * (entry.price or _ZERO),
+                # Export does not carry liquidity flag.
+                False,
+                provider,
+                entry.created_at,
+                trade_order_ids.get(entry.order_id),
+            )
+            for entry in trade_entries
+        ]
+        stored_execution_ids = set(
+            crypto_models.TradeExecutionTransaction.objects.filter(
+                execution_id__in={entry.trade_id for entry in trade_entries}
+            ).values_list("execution_id", flat=True)
+        )
+
+        with transaction.atomic():
+            executions_count = bulk_loader.bulk_insert(
+                model=crypto_models.TradeExecutionTransaction,
+                field_names=_EXECUTION_FIELD_NAMES,
+                rows=execution_rows,
+                conflict_field_names=["execution_id"],
+            )
+            entries_count = load_transaction_log_entries(
+                provider=self._provider, entries=batch
+            )
+
+        if executions_count:
+            self._invalidate_position_ledgers(
+                created_entries=[
+                    entry
+                    for entry in trade_entries
+                    if entry.trade_id not in stored_execution_ids
+                ]
+            )
+
+        return executions_count, entries_count
+
+    def _invalidate_position_ledgers(
+        self, created_entries: typing.List[provider_messages.TransactionLogEntry]
+    ) -> None:
+        # Backfilled executions older than a ledger checkpoint are not replayed from
+        # it, so checkpoints from the oldest created execution on are rebuilt.
+        first_created_at = {}
+        for entry in created_entries:
+            instrument_name = entry.market_instrument_name
+            if (
+                instrument_name not in first_created_at
+                or entry.created_at < first_created_at[instrument_name]
+            ):
+                first_created_at[instrument_name] = entry.created_at
+
+        for instrument_name, created_at in first_created_at.items():
+            position_ledger_services.invalidate_checkpoints(
+                provider=self._provider,
+                instrument_name=instrument_name,
+                from_datetime=created_at,
+            )
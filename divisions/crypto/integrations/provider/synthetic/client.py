@@ -0,0 +1,322 @@
+import datetime
+import decimal
+import random
+import typing
+
+from divisions.common import enums as common_enums
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto.integrations.provider import base
+from divisions.crypto.integrations.provider import enums
+from divisions.crypto.integrations.provider import messages
+
+_QUANTUM = decimal.Decimal("0.00000001")
+
+
+class SyntheticProvider(base.BaseProvider):
+    # Serves deterministic generated data instead of calling provider API, so import
+    # path can be benchmarked without network and with any number of rows. Rows are
+    # stored as BYBIT rows, it must only be used against disposable databases.
+    INSTRUMENT_NAME_PREFIX = "SYN"
+
+    def __init__(
+        self,
+        rows_count: int,
+        instruments_count: int = 20,
+        transfers_count: typing.Optional[int] = None,
+        start_datetime: datetime.datetime = datetime.datetime(
+            2023, 1, 1, tzinfo=datetime.timezone.utc
+        ),
+        period: datetime.timedelta = datetime.timedelta(days=365),
+        seed: int = 0,
+    ):
+        super(SyntheticProvider, self).__init__()
+        self.rows_count = rows_count
+        self.instruments_count = instruments_count
+        self.transfers_count = (
+            transfers_count if transfers_count is not None else max(1, rows_count // 100)
+        )
+        self.start_datetime = start_datetime
+        self.period = period
+        self.seed = seed
+        self.request_count = 0
+
+    @property
+    def provider(self) -> crypto_enums.CryptoProvider:
+        return crypto_enums.CryptoProvider.BYBIT
+
+    @property
+    def rest_api_client_class(self) -> typing.Callable:
+        return type(None)
+
+    def get_rest_api_client(self) -> None:
+        return None
+
+    @property
+    def instrument_names(self) -> typing.List[str]:
+        return [
+            "{}{}USDT".format(self.INSTRUMENT_NAME_PREFIX, instrument_index)
+            for instrument_index in range(self.instruments_count)
+        ]
+
+    def get_market_instruments(
+        self,
+        trading_category: enums.TradingCategory,
+        depth: int = 1,
+        limit: int = 50,
+        market_instrument_symbol: typing.Optional[str] = None,
+    ) -> typing.List[messages.MarketInstrument]:
+        self.request_count += 1
+        return [
+            messages.MarketInstrument(name=instrument_name, status="Trading")
+            for instrument_name in self.instrument_names
+            if market_instrument_symbol in (None, instrument_name)
+        ]
+
+    def get_trade_positions(
+        self,
+        trading_category: enums.TradingCategory,
+        currency: common_enums.Currency,
+        depth: int = 1,
+        limit: int = 50,
+    ) -> typing.List[messages.TradePosition]:
+        self.request_count += 1
+        rng = random.Random(self.seed)
+        return [
+            messages.TradePosition(
+                market_instrument_name=instrument_name,
+                position_side="Buy",
+                position_size=self._get_decimal(rng=rng, low=1, high=10),
+                position_value=self._get_decimal(rng=rng, low=100, high=10000),
+                unrealised_pnl=self._get_decimal(rng=rng, low=-100, high=100),
+                created_at=self.start_datetime,
+                updated_at=self.start_datetime + self.period,
+            )
+            for instrument_name in self.instrument_names
+        ]
+
+    def get_trade_positions_profit_and_loss(
+        self,
+        trading_category: enums.TradingCategory,
+        market_instrument_symbol: str,
+        depth: int = 1,
+        limit: int = 50,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> typing.List[messages.TradePnLPosition]:
+        self.request_count += 1
+        return [
+            messages.TradePnLPosition(
+                market_instrument_name=trade_order.market_instrument_name,
+                order_id=trade_order.order_id,
+                position_side=trade_order.order_side,
+                position_quantity=trade_order.order_quantity,
+                order_price=trade_order.order_price,
+                order_type=trade_order.order_type,
+                position_closed_size=trade_order.order_quantity,
+                total_entry_value=trade_order.order_total_executed_value,
+                average_entry_price=trade_order.order_price,
+                total_exit_value=trade_order.order_total_executed_value,
+                average_exit_price=trade_order.average_order_price,
+                closed_pnl=(
+                    (trade_order.average_order_price - trade_order.order_price)
+                    * trade_order.order_quantity
+                ).quantize(_QUANTUM),
+                created_at=trade_order.updated_at,
+            )
+            for trade_order in self._generate_trade_orders(
+                instrument_name=market_instrument_symbol,
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+            )
+        ]
+
+    def get_trade_orders(
+        self,
+        trading_category: enums.TradingCategory,
+        depth: int = 1,
+        limit: int = 50,
+        market_instrument_symbol: typing.Optional[str] = None,
+        order_id: typing.Optional[str] = None,
+        order_status: typing.Optional[enums.TradeOrderStatus] = None,
+        order_filter: typing.Optional[str] = None,
+    ) -> typing.List[messages.TradeOrder]:
+        self.request_count += 1
+        trade_orders = []
+        for instrument_name in self.instrument_names:
+            if market_instrument_symbol in (None, instrument_name):
+                trade_orders.extend(
+                    self._generate_trade_orders(instrument_name=instrument_name)
+                )
+
+        return trade_orders
+
+    def get_trade_executions(
+        self,
+        trading_category: enums.TradingCategory,
+        market_instrument_symbol: str,
+        depth: int = 1,
+        limit: int = 50,
+        execution_type: typing.Optional[enums.TradeExecutionType] = None,
+        order_id: typing.Optional[str] = None,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> typing.List[messages.TradeExecution]:
+        self.request_count += 1
+        return [
+            messages.TradeExecution(
+                market_instrument_name=trade_order.market_instrument_name,
+                order_id=trade_order.order_id,
+                execution_id="{}-execution".format(trade_order.order_id),
+                execution_side=trade_order.order_side,
+                executed_fee=trade_order.order_total_executed_fee,
+                execution_price=trade_order.average_order_price,
+                execution_quantity=trade_order.order_total_executed_quantity,
+                execution_type="Trade",
+                execution_value=trade_order.order_total_executed_value,
+                is_maker=False,
+                created_at=trade_order.updated_at,
+            )
+            for trade_order in self._generate_trade_orders(
+                instrument_name=market_instrument_symbol,
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+            )
+        ]
+
+    def get_wallet_balances(
+        self,
+        wallet_type: enums.WalletType,
+        currency: typing.Optional[common_enums.Currency],
+    ) -> typing.List[messages.WalletBalance]:
+        self.request_count += 1
+        return [
+            messages.WalletBalance(
+                currency=common_enums.Currency.USDT.value,
+                amount=decimal.Decimal("100000"),
+            )
+        ]
+
+    def get_wallet_internal_transfers(
+        self,
+        wallet_type: enums.WalletType,
+        depth: int = 1,
+        limit: int = 50,
+        currency: typing.Optional[common_enums.Currency] = None,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> typing.List[messages.WalletTransfer]:
+        self.request_count += 1
+        return []
+
+    def get_wallet_deposit_transfers(
+        self,
+        wallet_type: enums.WalletType,
+        depth: int = 1,
+        limit: int = 50,
+        currency: typing.Optional[common_enums.Currency] = None,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> typing.List[messages.WalletTransfer]:
+        self.request_count += 1
+        rng = random.Random(self.seed)
+        step = self.period / self.transfers_count
+        wallet_transfers = []
+        for transfer_index in range(self.transfers_count):
+            amount = self._get_decimal(rng=rng, low=100, high=50000)
+            network_datetime = self.start_datetime + step * transfer_index
+            if from_datetime and network_datetime < from_datetime:
+                continue
+
+            if to_datetime and network_datetime >= to_datetime:
+                continue
+
+            wallet_transfers.append(
+                messages.WalletTransfer(
+                    transaction_currency=common_enums.Currency.USDT.value,
+                    chain_currency=common_enums.Currency.USDT.value,
+                    type=enums.WalletTransferType.DEPOSIT.value,
+                    status=enums.WalletTransferStatus.SUCCESS.value,
+                    txid="synthetic-deposit-{}".format(transfer_index),
+                    from_recipient=None,
+                    to_recipient=wallet_type.name,
+                    portfolio_type=wallet_type.name,
+                    amount=amount,
+                    fee=decimal.Decimal("0"),
+                    network_datetime=network_datetime,
+                )
+            )
+
+        return wallet_transfers
+
+    def get_wallet_withdrawal_transfers(
+        self,
+        wallet_type: enums.WalletType,
+        depth: int = 1,
+        limit: int = 50,
+        currency: typing.Optional[common_enums.Currency] = None,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> typing.List[messages.WalletTransfer]:
+        self.request_count += 1
+        return []
+
+    def get_transactions(
+        self,
+        wallet_type: enums.WalletType,
+        depth: int = 1,
+        limit: int = 50,
+        trading_category: typing.Optional[enums.TradingCategory] = None,
+        currency: typing.Optional[common_enums.Currency] = None,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> typing.List[messages.TransactionLogEntry]:
+        self.request_count += 1
+        return []
+
+    def _generate_trade_orders(
+        self,
+        instrument_name: str,
+        from_datetime: typing.Optional[datetime.datetime] = None,
+        to_datetime: typing.Optional[datetime.datetime] = None,
+    ) -> typing.Iterator[messages.TradeOrder]:
+        # Orders are spread evenly over period and dealt round robin between
+        # instruments, same instrument always gets same orders.
+        instrument_index = self.instrument_names.index(instrument_name)
+        rng = random.Random("{}:{}".format(self.seed, instrument_name))
+        step = self.period / max(1, self.rows_count)
+        for order_index in range(instrument_index, self.rows_count, self.instruments_count):
+            order_quantity = self._get_decimal(rng=rng, low=1, high=100)
+            order_price = self._get_decimal(rng=rng, low=10, high=1000)
+            average_order_price = (
+                order_price * decimal.Decimal(rng.uniform(0.95, 1.05))
+            ).quantize(_QUANTUM)
+            created_at = self.start_datetime + step * order_index
+            if from_datetime and created_at < from_datetime:
+                continue
+
+            if to_datetime and created_at >= to_datetime:
+                continue
+
+            yield messages.TradeOrder(
+                market_instrument_name=instrument_name,
+                order_id="synthetic-order-{}".format(order_index),
+                order_side="Buy" if order_index % 2 else "Sell",
+                order_quantity=order_quantity,
+                order_price=order_price,
+                average_order_price=average_order_price,
+                order_type="Limit",
+                order_status="Filled",
+                order_total_executed_value=(
+                    order_quantity * average_order_price
+                ).quantize(_QUANTUM),
+                order_total_executed_quantity=order_quantity,
+                order_total_executed_fee=(
+                    order_quantity * average_order_price * decimal.Decimal("0.0006")
+                ).quantize(_QUANTUM),
+                created_at=created_at,
+                updated_at=created_at,
+            )
+
+    @staticmethod
+    def _get_decimal(rng: random.Random, low: float, high: float) -> decimal.Decimal:
+        return decimal.Decimal(rng.uniform(low, high)).quantize(_QUANTUM)
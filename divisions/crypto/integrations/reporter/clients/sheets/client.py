@@ -1,4 +1,86 @@
-'''
+import logging
+import random
+import time
+import typing
 
+import gspread
 
-'''
\ No newline at end of file
+from django.conf import settings
+
+from divisions.common import utils as common_utils
+from divisions.crypto.integrations.reporter.clients.sheets import exceptions
+
+logger = logging.getLogger(__name__)
+
+
+class GspreadBackend(object):
+    QUOTA_EXCEEDED_STATUS_CODE = 429
+
+    def __init__(self, credentials_file: typing.Optional[str] = None):
+        self._credentials_file = (
+            credentials_file or settings.GOOGLE_SHEETS_CREDENTIALS_FILE
+        )
+        self._client = None
+
+    def batch_update_values(self, spreadsheet_id: str, data: typing.List[dict]) -> None:
+        if self._client is None:
+            self._client = gspread.service_account(filename=self._credentials_file)
+
+        try:
+            # Spreadsheet handle is built locally, open_by_key() would spend one
+            # more quota request on fetching metadata.
+            gspread.Spreadsheet(
+                self._client, {"id": spreadsheet_id}
+            ).values_batch_update(
+                params={"valueInputOption": "USER_ENTERED"},
+                body={"data": data},
+            )
+        except gspread.exceptions.APIError as e:
+            if e.response.status_code == self.QUOTA_EXCEEDED_STATUS_CODE:
+                raise exceptions.QuotaExceededError(
+                    common_utils.get_exception_message(exception=e)
+                )
+
+            raise exceptions.SheetsClientError(
+                common_utils.get_exception_message(exception=e)
+            )
+
+
+class SheetsClient(object):
+    MAX_RETRIES = 5
+    BACKOFF_BASE = 2  # value in seconds
+    BACKOFF_MAX = 64  # value in seconds
+
+    LOG_PREFIX = "[SHEETS-CLIENT]"
+
+    def __init__(self, backend: typing.Optional[typing.Any] = None):
+        self.backend = backend or GspreadBackend()
+
+    def batch_update(self, spreadsheet_id: str, data: typing.List[dict]) -> None:
+        if not data:
+            return
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                self.backend.batch_update_values(
+                    spreadsheet_id=spreadsheet_id, data=data
+                )
+                return
+            except exceptions.QuotaExceededError as e:
+                if attempt == self.MAX_RETRIES:
+                    raise
+
+                # Full jitter keeps concurrent reporters from retrying in lockstep.
+                backoff = random.uniform(
+                    0, min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** attempt)
+                )
+                logger.warning(
+                    "{} Quota exceeded, retrying batch update (spreadsheet_id={}, attempt={}, backoff={:.1f}s). Error: {}.".format(
+                        self.LOG_PREFIX,
+                        spreadsheet_id,
+                        attempt + 1,
+                        backoff,
+                        common_utils.get_exception_message(exception=e),
+                    )
+                )
+                time.sleep(backoff)
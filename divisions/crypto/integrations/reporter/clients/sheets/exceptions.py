@@ -0,0 +1,6 @@
+class SheetsClientError(Exception):
+    pass
+
+
+class QuotaExceededError(SheetsClientError):
+    pass
@@ -0,0 +1,70 @@
+import os
+import re
+import typing
+
+import simplejson
+
+from divisions.crypto.integrations.reporter.clients.sheets import exceptions
+
+_A1_RANGE_RE = re.compile(r"^'?(?P<worksheet>.+?)'?!(?P<column>[A-Z]+)(?P<row>\d+)")
+
+
+# Stand-in for Sheets API keeping every spreadsheet as JSON file in local directory.
+# It counts requests and can fail first N of them with quota error, so publishing
+# can be exercised without Google credentials.
+class LocalSheetsBackend(object):
+    def __init__(self, directory: str, quota_errors: int = 0):
+        self.directory = directory
+        self.quota_errors = quota_errors
+        self.request_count = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def batch_update_values(self, spreadsheet_id: str, data: typing.List[dict]) -> None:
+        self.request_count += 1
+        if self.quota_errors > 0:
+            self.quota_errors -= 1
+            raise exceptions.QuotaExceededError("Quota exceeded for quota metric")
+
+        spreadsheet = self.get_spreadsheet(spreadsheet_id=spreadsheet_id)
+        for value_range in data:
+            match = _A1_RANGE_RE.match(value_range["range"])
+            if not match:
+                raise exceptions.SheetsClientError(
+                    "Unable to parse range {}".format(value_range["range"])
+                )
+
+            grid = spreadsheet.setdefault(match.group("worksheet"), [])
+            start_row = int(match.group("row")) - 1
+            start_column = _column_to_index(column=match.group("column"))
+            for row_offset, row in enumerate(value_range["values"]):
+                while len(grid) <= start_row + row_offset:
+                    grid.append([])
+
+                grid_row = grid[start_row + row_offset]
+                for column_offset, value in enumerate(row):
+                    while len(grid_row) <= start_column + column_offset:
+                        grid_row.append("")
+
+                    grid_row[start_column + column_offset] = value
+
+        with open(self._get_path(spreadsheet_id=spreadsheet_id), "w") as f:
+            simplejson.dump(spreadsheet, f)
+
+    def get_spreadsheet(self, spreadsheet_id: str) -> typing.Dict[str, list]:
+        path = self._get_path(spreadsheet_id=spreadsheet_id)
+        if not os.path.exists(path):
+            return {}
+
+        with open(path) as f:
+            return simplejson.load(f)
+
+    def _get_path(self, spreadsheet_id: str) -> str:
+        return os.path.join(self.directory, "{}.json".format(spreadsheet_id))
+
+
+def _column_to_index(column: str) -> int:
+    index = 0
+    for letter in column:
+        index = index * 26 + ord(letter) - ord("A") + 1
+
+    return index - 1
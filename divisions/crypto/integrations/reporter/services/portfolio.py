@@ -1,12 +1,159 @@
+import datetime
 import decimal
+import typing
 
+from django.utils import timezone
+
+from divisions.common import enums as common_enums
 from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
 from divisions.crypto.integrations.provider import enums as provider_enums
+from divisions.crypto.integrations.provider.services import (
+    provider as provider_services,
+)
+from divisions.crypto.services import portfolio_overview as portfolio_overview_services
+from divisions.crypto.services import portfolio_units as portfolio_units_services
+
+_QUANTUM = decimal.Decimal("0.00000001")
 
 
 def calculate_portfolio_investor_participation(
     portfolio_user_id: int,
     portfolio_type: provider_enums.WalletType,
     provider: crypto_enums.CryptoProvider,
+    at_datetime: typing.Optional[datetime.datetime] = None,
 ) -> decimal.Decimal:
-    pass
+    return portfolio_units_services.get_investor_participation(
+        portfolio_user_id=portfolio_user_id,
+        provider=provider,
+        wallet_type=portfolio_type,
+        at_datetime=at_datetime,
+        with_value=False,
+    ).participation
+
+
+def get_portfolio_table(
+    provider: crypto_enums.CryptoProvider,
+    wallet_type: provider_enums.WalletType,
+    currency: common_enums.Currency = common_enums.Currency.USDT,
+) -> typing.List[list]:
+    net_asset_value = portfolio_units_services.get_net_asset_value(
+        provider=provider,
+        wallet_type=wallet_type,
+        at_datetime=timezone.now(),
+        currency=currency,
+    )
+    portfolio_units = _get_portfolio_units(provider=provider, wallet_type=wallet_type)
+
+    return [
+        ["Net asset value ({})".format(currency.value), net_asset_value],
+        ["Total units", portfolio_units],
+        [
+            "Unit price",
+            _get_unit_price(
+                net_asset_value=net_asset_value, portfolio_units=portfolio_units
+            ),
+        ],
+        [],
+        ["Currency", "Amount", "Updated at"],
+    ] + [
+        [
+            wallet_balance["currency"],
+            wallet_balance["amount"],
+            wallet_balance["created_at"],
+        ]
+        for wallet_balance in portfolio_overview_services.get_latest_wallet_balances(
+            provider=provider, wallet_type=wallet_type
+        )
+    ]
+
+
+def get_investors_table(
+    provider: crypto_enums.CryptoProvider,
+    wallet_type: provider_enums.WalletType,
+    currency: common_enums.Currency = common_enums.Currency.USDT,
+) -> typing.List[list]:
+    # Net asset value is shared by all investors, it is computed once instead of
+    # per investor as get_investor_participation() would.
+    portfolio_units = _get_portfolio_units(provider=provider, wallet_type=wallet_type)
+    unit_price = _get_unit_price(
+        net_asset_value=portfolio_units_services.get_net_asset_value(
+            provider=provider,
+            wallet_type=wallet_type,
+            at_datetime=timezone.now(),
+            currency=currency,
+        ),
+        portfolio_units=portfolio_units,
+    )
+
+    rows = [["Investor", "Email", "Units", "Participation", "Value"]]
+    for investor_unit_balance in (
+        crypto_models.PortfolioInvestorUnitBalance.objects.filter(
+            provider=provider.to_integer_choice(),
+            portfolio_type=wallet_type.name,
+        )
+        .select_related("portfolio_user")
+        .order_by("portfolio_user__last_name", "portfolio_user__name")
+    ):
+        rows.append(
+            [
+                "{} {}".format(
+                    investor_unit_balance.portfolio_user.name,
+                    investor_unit_balance.portfolio_user.last_name,
+                ),
+                investor_unit_balance.portfolio_user.email,
+                investor_unit_balance.units,
+                (investor_unit_balance.units / portfolio_units).quantize(_QUANTUM)
+                if portfolio_units > 0
+                else decimal.Decimal("0"),
+                (investor_unit_balance.units * unit_price).quantize(_QUANTUM)
+                if unit_price is not None
+                else None,
+            ]
+        )
+
+    return rows
+
+
+def get_performance_table(
+    provider: crypto_enums.CryptoProvider,
+    trading_category: provider_enums.TradingCategory,
+    aggregation_period: crypto_enums.AggregationPeriod = crypto_enums.AggregationPeriod.MONTH,
+) -> typing.List[list]:
+    return [["Instrument", "Period start", "PnL", "Trade count", "Cumulative PnL"]] + [
+        [
+            trade_position_performance.market_instrument_name,
+            trade_position_performance.period_start,
+            trade_position_performance.pnl,
+            trade_position_performance.trade_count,
+            trade_position_performance.cumulative_pnl,
+        ]
+        for trade_position_performance in provider_services.get_trade_position_performance(
+            provider=provider,
+            trading_category=trading_category,
+            aggregation_period=aggregation_period,
+        )
+    ]
+
+
+def _get_portfolio_units(
+    provider: crypto_enums.CryptoProvider,
+    wallet_type: provider_enums.WalletType,
+) -> decimal.Decimal:
+    return (
+        crypto_models.PortfolioUnitBalance.objects.filter(
+            provider=provider.to_integer_choice(),
+            portfolio_type=wallet_type.name,
+        )
+        .values_list("total_units", flat=True)
+        .first()
+    ) or decimal.Decimal("0")
+
+
+def _get_unit_price(
+    net_asset_value: decimal.Decimal, portfolio_units: decimal.Decimal
+) -> typing.Optional[decimal.Decimal]:
+    if portfolio_units <= 0:
+        return None
+
+    return (net_asset_value / portfolio_units).quantize(_QUANTUM)
@@ -0,0 +1,194 @@
+import datetime
+import decimal
+import enum
+import logging
+import os
+import typing
+
+import simplejson
+
+from divisions.crypto.integrations.reporter.clients.sheets import (
+    client as sheets_client,
+)
+
+logger = logging.getLogger(__name__)
+
+_LOG_PREFIX = "[SHEETS-PUBLISHER]"
+
+
+def publish_tables(
+    client: sheets_client.SheetsClient,
+    spreadsheet_id: str,
+    tables: typing.Dict[str, typing.List[list]],
+    snapshot_dir: str,
+    force_full: bool = False,
+) -> int:
+    tables = {
+        worksheet: [[_normalize_value(value=value) for value in row] for row in rows]
+        for worksheet, rows in tables.items()
+    }
+    snapshot = (
+        {}
+        if force_full
+        else _load_snapshot(snapshot_dir=snapshot_dir, spreadsheet_id=spreadsheet_id)
+    )
+
+    data = []
+    for worksheet, rows in tables.items():
+        data.extend(
+            get_changed_ranges(
+                worksheet=worksheet,
+                previous_rows=snapshot.get(worksheet, []),
+                rows=rows,
+            )
+        )
+
+    logger.info(
+        "{} Publishing changed ranges (spreadsheet_id={}, worksheets={}, ranges={}, cells={}).".format(
+            _LOG_PREFIX,
+            spreadsheet_id,
+            len(tables),
+            len(data),
+            sum(
+                len(row)
+                for value_range in data
+                for row in value_range["values"]
+            ),
+        )
+    )
+    # Every changed range of every worksheet goes out in one request, so a report
+    # costs one quota unit per spreadsheet however many cells changed.
+    client.batch_update(spreadsheet_id=spreadsheet_id, data=data)
+
+    # Snapshot is only moved forward once the spreadsheet accepted the update.
+    snapshot.update(tables)
+    _save_snapshot(
+        snapshot_dir=snapshot_dir, spreadsheet_id=spreadsheet_id, snapshot=snapshot
+    )
+
+    return len(data)
+
+
+def get_changed_ranges(
+    worksheet: str,
+    previous_rows: typing.List[list],
+    rows: typing.List[list],
+) -> typing.List[dict]:
+    # Changed cells are grouped into horizontal runs per row, runs spanning same
+    # columns on consecutive rows are merged into one rectangle.
+    changed_runs = []
+    for row_index in range(max(len(previous_rows), len(rows))):
+        previous_row = previous_rows[row_index] if row_index < len(previous_rows) else []
+        row = rows[row_index] if row_index < len(rows) else []
+        # Cells that disappeared from table are cleared with empty value.
+        row = row + [""] * (len(previous_row) - len(row))
+
+        run_start = None
+        for column_index in range(len(row) + 1):
+            is_changed = column_index < len(row) and (
+                column_index >= len(previous_row)
+                or previous_row[column_index] != row[column_index]
+            )
+            if is_changed and run_start is None:
+                run_start = column_index
+            elif not is_changed and run_start is not None:
+                changed_runs.append(
+                    (row_index, run_start, column_index, row[run_start:column_index])
+                )
+                run_start = None
+
+    rectangles = []
+    for row_index, column_start, column_end, values in changed_runs:
+        if rectangles:
+            last_rectangle = rectangles[-1]
+            if (
+                last_rectangle["row_end"] == row_index
+                and last_rectangle["column_start"] == column_start
+                and last_rectangle["column_end"] == column_end
+            ):
+                last_rectangle["row_end"] = row_index + 1
+                last_rectangle["values"].append(values)
+                continue
+
+        rectangles.append(
+            {
+                "row_start": row_index,
+                "row_end": row_index + 1,
+                "column_start": column_start,
+                "column_end": column_end,
+                "values": [values],
+            }
+        )
+
+    return [
+        {
+            "range": "'{}'!{}{}:{}{}".format(
+                worksheet.replace("'", "''"),
+                _get_column_letter(column_index=rectangle["column_start"]),
+                rectangle["row_start"] + 1,
+                _get_column_letter(column_index=rectangle["column_end"] - 1),
+                rectangle["row_end"],
+            ),
+            "values": rectangle["values"],
+        }
+        for rectangle in rectangles
+    ]
+
+
+def _normalize_value(value: typing.Any) -> typing.Union[str, int, bool]:
+    # Values are kept JSON native so they compare equal to snapshot loaded from disk.
+    if value is None:
+        return ""
+
+    if isinstance(value, decimal.Decimal):
+        return format(value.normalize(), "f")
+
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+
+    if isinstance(value, enum.Enum):
+        return value.value
+
+    if isinstance(value, (str, int, bool)):
+        return value
+
+    return str(value)
+
+
+def _get_column_letter(column_index: int) -> str:
+    letters = ""
+    column_number = column_index + 1
+    while column_number:
+        column_number, remainder = divmod(column_number - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+
+    return letters
+
+
+def _get_snapshot_path(snapshot_dir: str, spreadsheet_id: str) -> str:
+    return os.path.join(snapshot_dir, "{}.json".format(spreadsheet_id))
+
+
+def _load_snapshot(
+    snapshot_dir: str, spreadsheet_id: str
+) -> typing.Dict[str, typing.List[list]]:
+    path = _get_snapshot_path(snapshot_dir=snapshot_dir, spreadsheet_id=spreadsheet_id)
+    if not os.path.exists(path):
+        return {}
+
+    with open(path) as f:
+        return simplejson.load(f)
+
+
+def _save_snapshot(
+    snapshot_dir: str,
+    spreadsheet_id: str,
+    snapshot: typing.Dict[str, typing.List[list]],
+) -> None:
+    os.makedirs(snapshot_dir, exist_ok=True)
+    path = _get_snapshot_path(snapshot_dir=snapshot_dir, spreadsheet_id=spreadsheet_id)
+    # Written next to target and renamed, interrupted run never leaves half a snapshot.
+    with open("{}.tmp".format(path), "w") as f:
+        simplejson.dump(snapshot, f)
+
+    os.replace("{}.tmp".format(path), path)
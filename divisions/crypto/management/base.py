@@ -0,0 +1,238 @@
+import collections
+import contextlib
+import cProfile
+import heapq
+import io
+import logging
+import pstats
+import time
+import tracemalloc
+import typing
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_LOG_PREFIX = "[COMMAND-PROFILE]"
+
+
+class ProfiledCommand(BaseCommand):
+    """
+    Base of crypto management commands. Adds --profile (cProfile stats dump and
+    top functions), --trace-sql (query count, DB time, slowest and repeated queries)
+    and --trace-memory (tracemalloc peak and top allocation sites). Every run ends
+    with timing breakdown of wall, CPU and DB time.
+    """
+
+    profile_top_count = 20
+    slowest_queries_count = 10
+    # Same query template executed this many times in one run is reported, usually
+    # a query per row (N+1) that could be batched.
+    repeated_query_threshold = 10
+    memory_top_count = 10
+
+    def create_parser(
+        self, prog_name: str, subcommand: str, **kwargs: typing.Any
+    ) -> typing.Any:
+        parser = super().create_parser(prog_name, subcommand, **kwargs)
+        parser.add_argument(
+            "--profile",
+            help="Profiles run with cProfile, stats are dumped to given path (defaults to <command>.prof).",
+            required=False,
+            nargs="?",
+            const="",
+            type=str,
+        )
+        parser.add_argument(
+            "--trace-sql",
+            help="Reports query count, DB time, slowest and repeated queries.",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--trace-memory",
+            help="Reports peak traced memory and top allocation sites.",
+            action="store_true",
+            default=False,
+        )
+        return parser
+
+    def execute(self, *args: typing.Any, **options: typing.Any) -> typing.Any:
+        profile_path = options.pop("profile", None)
+        trace_sql = options.pop("trace_sql", False)
+        trace_memory = options.pop("trace_memory", False)
+        command_name = self.__module__.split(".")[-1]
+        if profile_path == "":
+            profile_path = "{}.prof".format(command_name)
+
+        query_tracer = _QueryTracer(
+            keep_queries=trace_sql, slowest_count=self.slowest_queries_count
+        )
+        profiler = cProfile.Profile() if profile_path is not None else None
+        if trace_memory:
+            tracemalloc.start()
+
+        started_at = time.perf_counter()
+        cpu_started_at = time.process_time()
+        try:
+            with query_tracer.trace():
+                if profiler:
+                    profiler.enable()
+
+                try:
+                    return super().execute(*args, **options)
+                finally:
+                    if profiler:
+                        profiler.disable()
+        finally:
+            wall_time = time.perf_counter() - started_at
+            cpu_time = time.process_time() - cpu_started_at
+            # Memory is reported first so allocations of other reports are not in it.
+            if trace_memory:
+                self._report_memory()
+                tracemalloc.stop()
+
+            if profiler:
+                self._report_profile(profiler=profiler, profile_path=profile_path)
+
+            if trace_sql:
+                self._report_queries(query_tracer=query_tracer)
+
+            # DB time is time spent waiting for queries, with in process databases it
+            # is part of CPU time too. Wall time not covered by either is mostly
+            # network and sleeps.
+            logger.info(
+                "{} Finished '{}' (wall_time={:.3f}s, cpu_time={:.3f}s, db_time={:.3f}s, queries={}).".format(
+                    _LOG_PREFIX,
+                    command_name,
+                    wall_time,
+                    cpu_time,
+                    query_tracer.total_time,
+                    query_tracer.count,
+                )
+            )
+
+    def _report_profile(self, profiler: cProfile.Profile, profile_path: str) -> None:
+        profiler.dump_stats(profile_path)
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats(
+            pstats.SortKey.CUMULATIVE
+        ).print_stats(self.profile_top_count)
+        self.stdout.write(
+            "Profile stats dumped to {}, top {} functions by cumulative time:".format(
+                profile_path, self.profile_top_count
+            )
+        )
+        self.stdout.write(stream.getvalue())
+
+    def _report_queries(self, query_tracer: "_QueryTracer") -> None:
+        self.stdout.write(
+            "SQL: {} queries, {:.3f}s total.".format(
+                query_tracer.count, query_tracer.total_time
+            )
+        )
+        slowest_queries = query_tracer.get_slowest_queries()
+        if slowest_queries:
+            self.stdout.write("Slowest queries:")
+            for duration, sql in slowest_queries:
+                self.stdout.write("  {:.4f}s {}".format(duration, _shorten(sql=sql)))
+
+        repeated_queries = query_tracer.get_repeated_queries(
+            threshold=self.repeated_query_threshold
+        )
+        if repeated_queries:
+            self.stdout.write("Repeated queries (possible N+1):")
+            for sql, (count, duration) in repeated_queries:
+                self.stdout.write(
+                    "  {}x {:.3f}s {}".format(count, duration, _shorten(sql=sql))
+                )
+
+    def _report_memory(self) -> None:
+        _, peak_size = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            ]
+        )
+        self.stdout.write(
+            "Memory: peak {:.1f} MiB, top {} allocation sites still held:".format(
+                peak_size / 2 ** 20, self.memory_top_count
+            )
+        )
+        for statistic in snapshot.statistics("lineno")[: self.memory_top_count]:
+            self.stdout.write(
+                "  {:.1f} KiB {} blocks {}".format(
+                    statistic.size / 2 ** 10,
+                    statistic.count,
+                    statistic.traceback[0],
+                )
+            )
+
+
+class _QueryTracer(object):
+    # Times every query of database connections of current thread. Query texts are
+    # kept only when keep_queries, counts and total time are always collected.
+    def __init__(self, keep_queries: bool, slowest_count: int):
+        self.keep_queries = keep_queries
+        self.count = 0
+        self.total_time = 0.0
+        self._slowest_count = slowest_count
+        # Min heap of (duration, sql), holds only slowest queries of long runs.
+        self._slowest_queries = []
+        self._templates = collections.defaultdict(lambda: [0, 0.0])
+
+    @contextlib.contextmanager
+    def trace(self) -> typing.Iterator[None]:
+        with contextlib.ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(self._execute))
+
+            yield
+
+    def _execute(
+        self,
+        execute: typing.Callable,
+        sql: str,
+        params: typing.Any,
+        many: bool,
+        context: dict,
+    ) -> typing.Any:
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started_at
+            self.count += 1
+            self.total_time += duration
+            if self.keep_queries:
+                if len(self._slowest_queries) < self._slowest_count:
+                    heapq.heappush(self._slowest_queries, (duration, sql))
+                else:
+                    heapq.heappushpop(self._slowest_queries, (duration, sql))
+
+                # Params are not part of sql, same template means same query shape.
+                template = self._templates[sql]
+                template[0] += 1
+                template[1] += duration
+
+    def get_slowest_queries(self) -> typing.List[typing.Tuple[float, str]]:
+        return sorted(self._slowest_queries, reverse=True)
+
+    def get_repeated_queries(
+        self, threshold: int
+    ) -> typing.List[typing.Tuple[str, typing.Tuple[int, float]]]:
+        return sorted(
+            (
+                (sql, (count, duration))
+                for sql, (count, duration) in self._templates.items()
+                if count >= threshold
+            ),
+            key=lambda query: query[1][0],
+            reverse=True,
+        )
+
+
+def _shorten(sql: str, length: int = 200) -> str:
+    return sql if len(sql) <= length else "{}...".format(sql[:length])
@@ -0,0 +1,166 @@
+import logging
+import typing
+
+import simplejson
+
+from django.db import connection
+from django.core.management.base import CommandError
+
+from divisions.common import utils as common_utils
+from divisions.crypto.management import base as management_base
+from divisions.crypto.services import importer_benchmark as importer_benchmark_services
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(management_base.ProfiledCommand):
+    help = """
+            Benchmarks provider importer against synthetic provider data at several scales. Every scale runs in
+            freshly created and afterwards destroyed test database (test_<name>), configured database is never written.
+            Results (rows/sec, queries, peak RSS and wall time per stage) are appended as one JSON line to output file.
+            ex. python manage.py benchmark_importer --output=benchmarks/importer.jsonl [--scales=10000,100000,1000000] [--stage=orders] [--instruments=20] [--label=baseline]
+            """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            help="Path of JSON lines file results are appended to.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--scales",
+            help="Comma separated numbers of rows generated per stage.",
+            required=False,
+            type=str,
+            default="10000,100000,1000000",
+        )
+        parser.add_argument(
+            "--stage",
+            help="Stage to be benchmarked. Can be repeated. All stages if omitted. One of: {}.".format(
+                ", ".join(importer_benchmark_services.STAGES)
+            ),
+            required=False,
+            action="append",
+        )
+        parser.add_argument(
+            "--instruments",
+            help="Number of synthetic instruments rows are spread over.",
+            required=False,
+            type=int,
+            default=20,
+        )
+        parser.add_argument(
+            "--seed",
+            help="Seed of synthetic data.",
+            required=False,
+            type=int,
+            default=0,
+        )
+        parser.add_argument(
+            "--label",
+            help="Free text stored with results, ex. branch or change being measured.",
+            required=False,
+            type=str,
+            default="",
+        )
+
+    output = None
+    scales = None
+    stages = None
+    instruments_count = None
+    seed = None
+    label = None
+
+    log_prefix = "[BENCHMARK-IMPORTER]"
+
+    def handle(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self._setup_config_variables(kwargs=kwargs)
+        logger.info(
+            "{} Started command '{}' (scales={}, stages={}, instruments={}, label={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.scales,
+                self.stages,
+                self.instruments_count,
+                self.label,
+            )
+        )
+
+        benchmark_result = importer_benchmark_services.get_benchmark_environment()
+        benchmark_result.update(
+            {
+                "label": self.label,
+                "instruments_count": self.instruments_count,
+                "seed": self.seed,
+                "runs": [],
+            }
+        )
+        for rows_count in self.scales:
+            # Importer deletes and overwrites rows (ex. trade positions), every scale
+            # gets its own empty database so runs do not see each other's data.
+            old_database_name = connection.settings_dict["NAME"]
+            connection.creation.create_test_db(
+                verbosity=0, autoclobber=True, serialize=False
+            )
+            try:
+                benchmark_result["runs"].append(
+                    {
+                        "rows_count": rows_count,
+                        "stages": importer_benchmark_services.run_importer_benchmark(
+                            rows_count=rows_count,
+                            instruments_count=self.instruments_count,
+                            stages=self.stages,
+                            seed=self.seed,
+                        ),
+                    }
+                )
+            except Exception as e:
+                msg = "Unexpected exception occurred while benchmarking importer (rows_count={}). Error: {}".format(
+                    rows_count, common_utils.get_exception_message(exception=e)
+                )
+                logger.exception("{} {}.".format(self.log_prefix, msg))
+                raise CommandError(msg)
+            finally:
+                connection.creation.destroy_test_db(old_database_name, verbosity=0)
+
+        with open(self.output, "a") as f:
+            f.write(simplejson.dumps(benchmark_result) + "\n")
+
+        for run in benchmark_result["runs"]:
+            for stage_result in run["stages"]:
+                self.stdout.write(
+                    "rows_count={rows_count} stage={stage} rows={rows} wall_time={wall_time}s rows_per_second={rows_per_second} queries={queries} peak_rss_mb={peak_rss_mb}".format(
+                        rows_count=run["rows_count"], **stage_result
+                    )
+                )
+
+        logger.info(
+            "{} Finished command '{}' (scales={}, stages={}, output={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.scales,
+                self.stages,
+                self.output,
+            )
+        )
+
+    def _setup_config_variables(self, kwargs: typing.Dict) -> None:
+        try:
+            self.output = kwargs["output"]
+            self.scales = [int(scale) for scale in kwargs["scales"].split(",")]
+            self.stages = kwargs["stage"] or importer_benchmark_services.STAGES
+            unknown_stages = set(self.stages) - set(importer_benchmark_services.STAGES)
+            if unknown_stages:
+                raise ValueError("Unknown stages {}".format(sorted(unknown_stages)))
+
+            self.instruments_count = kwargs["instruments"]
+            self.seed = kwargs["seed"]
+            self.label = kwargs["label"]
+        except Exception as e:
+            msg = "Unable to setup config variables. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}. Exiting.".format(self.log_prefix, msg))
+            raise CommandError(msg)
@@ -0,0 +1,135 @@
+import logging
+import typing
+
+import simplejson
+
+from django.core.management.base import CommandError
+
+from divisions.common import utils as common_utils
+from divisions.crypto.management import base as management_base
+from divisions.crypto.services import conversion_benchmark as conversion_benchmark_services
+from divisions.crypto.services import importer_benchmark as importer_benchmark_services
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(management_base.ProfiledCommand):
+    help = """
+            Measures rows/sec of provider page conversion to messages (marshmallow schemas against fast path
+            converters) and of response decoding (simplejson with Decimal floats against selective decoding)
+            on orders, executions and PnL pages. Pages are synthetic or recorded. Database is not used.
+            ex. python manage.py benchmark_page_conversion [--rows=50000] [--repeat=3] [--pages-file=pages.ndjson.gz] [--output=benchmarks/conversion.jsonl]
+            """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            help="Number of rows per page.",
+            required=False,
+            type=int,
+            default=50000,
+        )
+        parser.add_argument(
+            "--repeat",
+            help="Number of conversions per page and path, best one is reported.",
+            required=False,
+            type=int,
+            default=3,
+        )
+        parser.add_argument(
+            "--seed",
+            help="Seed of synthetic data.",
+            required=False,
+            type=int,
+            default=0,
+        )
+        parser.add_argument(
+            "--pages-file",
+            help="JSON lines file of recorded API pages ({endpoint, response}) used instead of synthetic pages.",
+            required=False,
+            type=str,
+        )
+        parser.add_argument(
+            "--output",
+            help="Path of JSON lines file results are appended to.",
+            required=False,
+            type=str,
+        )
+
+    rows_count = None
+    repeat = None
+    seed = None
+    pages_file = None
+    output = None
+
+    log_prefix = "[BENCHMARK-PAGE-CONVERSION]"
+
+    def handle(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self._setup_config_variables(kwargs=kwargs)
+        logger.info(
+            "{} Started command '{}' (rows={}, repeat={}).".format(
+                self.log_prefix, __name__.split(".")[-1], self.rows_count, self.repeat
+            )
+        )
+
+        try:
+            if self.pages_file:
+                pages = conversion_benchmark_services.get_recorded_pages(
+                    path=self.pages_file, rows_count=self.rows_count
+                )
+            else:
+                pages = conversion_benchmark_services.get_synthetic_pages(
+                    rows_count=self.rows_count, seed=self.seed
+                )
+
+            results = conversion_benchmark_services.run_decoding_benchmark(
+                pages=pages, repeat=self.repeat
+            ) + conversion_benchmark_services.run_conversion_benchmark(
+                pages=pages, repeat=self.repeat
+            )
+        except Exception as e:
+            msg = "Unexpected exception occurred while benchmarking page conversion. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}.".format(self.log_prefix, msg))
+            raise CommandError(msg)
+
+        if self.output:
+            benchmark_result = importer_benchmark_services.get_benchmark_environment()
+            benchmark_result.update(
+                {"seed": self.seed, "pages_file": self.pages_file, "results": results}
+            )
+            with open(self.output, "a") as f:
+                f.write(simplejson.dumps(benchmark_result) + "\n")
+
+        for result in results:
+            self.stdout.write(
+                "benchmark={benchmark} page={page} path={path} rows={rows} wall_time={wall_time}s rows_per_second={rows_per_second}".format(
+                    **result
+                )
+            )
+
+        logger.info(
+            "{} Finished command '{}' (rows={}, repeat={}, output={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.rows_count,
+                self.repeat,
+                self.output,
+            )
+        )
+
+    def _setup_config_variables(self, kwargs: typing.Dict) -> None:
+        try:
+            self.rows_count = kwargs["rows"]
+            self.repeat = kwargs["repeat"]
+            self.seed = kwargs["seed"]
+            self.pages_file = kwargs["pages_file"]
+            self.output = kwargs["output"]
+        except Exception as e:
+            msg = "Unable to setup config variables. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}. Exiting.".format(self.log_prefix, msg))
+            raise CommandError(msg)
@@ -0,0 +1,145 @@
+import logging
+import typing
+
+import simplejson
+
+from django.core.management.base import CommandError
+
+from divisions.common import utils as common_utils
+from divisions.crypto.management import base as management_base
+from divisions.crypto.services import analytics_benchmark as analytics_benchmark_services
+from divisions.crypto.services import importer_benchmark as importer_benchmark_services
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(management_base.ProfiledCommand):
+    help = """
+            Measures wall time of portfolio performance report (Sharpe/Sortino, drawdown, win rate, profit factor)
+            for every aggregation period on synthetic closed PnL series. Database is not used.
+            ex. python manage.py benchmark_performance_report [--years=3] [--symbols=300] [--trades=1000000] [--repeat=3] [--output=benchmarks/analytics.jsonl]
+            """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--years",
+            help="Number of years covered by series.",
+            required=False,
+            type=int,
+            default=3,
+        )
+        parser.add_argument(
+            "--symbols",
+            help="Number of traded symbols.",
+            required=False,
+            type=int,
+            default=300,
+        )
+        parser.add_argument(
+            "--trades",
+            help="Number of closed trades.",
+            required=False,
+            type=int,
+            default=1000000,
+        )
+        parser.add_argument(
+            "--repeat",
+            help="Number of reports per aggregation period, best one is reported.",
+            required=False,
+            type=int,
+            default=3,
+        )
+        parser.add_argument(
+            "--seed",
+            help="Seed of synthetic data.",
+            required=False,
+            type=int,
+            default=0,
+        )
+        parser.add_argument(
+            "--output",
+            help="Path of JSON lines file results are appended to.",
+            required=False,
+            type=str,
+        )
+
+    years = None
+    symbols_count = None
+    trades_count = None
+    repeat = None
+    seed = None
+    output = None
+
+    log_prefix = "[BENCHMARK-PERFORMANCE-REPORT]"
+
+    def handle(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self._setup_config_variables(kwargs=kwargs)
+        logger.info(
+            "{} Started command '{}' (years={}, symbols={}, trades={}, repeat={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.years,
+                self.symbols_count,
+                self.trades_count,
+                self.repeat,
+            )
+        )
+
+        try:
+            pnl_series, balance_series = analytics_benchmark_services.get_synthetic_series(
+                years=self.years,
+                symbols_count=self.symbols_count,
+                trades_count=self.trades_count,
+                seed=self.seed,
+            )
+            results = analytics_benchmark_services.run_performance_report_benchmark(
+                pnl_series=pnl_series, balance_series=balance_series, repeat=self.repeat
+            )
+        except Exception as e:
+            msg = "Unexpected exception occurred while benchmarking performance report. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}.".format(self.log_prefix, msg))
+            raise CommandError(msg)
+
+        if self.output:
+            benchmark_result = importer_benchmark_services.get_benchmark_environment()
+            benchmark_result.update({"seed": self.seed, "results": results})
+            with open(self.output, "a") as f:
+                f.write(simplejson.dumps(benchmark_result) + "\n")
+
+        for result in results:
+            self.stdout.write(
+                "aggregation_period={aggregation_period} trades={trades} symbols={symbols} days={days} wall_time={wall_time}s trades_per_second={trades_per_second}".format(
+                    **result
+                )
+            )
+
+        logger.info(
+            "{} Finished command '{}' (years={}, symbols={}, trades={}, output={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.years,
+                self.symbols_count,
+                self.trades_count,
+                self.output,
+            )
+        )
+
+    def _setup_config_variables(self, kwargs: typing.Dict) -> None:
+        try:
+            self.years = kwargs["years"]
+            self.symbols_count = kwargs["symbols"]
+            self.trades_count = kwargs["trades"]
+            self.repeat = kwargs["repeat"]
+            self.seed = kwargs["seed"]
+            self.output = kwargs["output"]
+            if min(self.years, self.symbols_count, self.trades_count, self.repeat) <= 0:
+                raise ValueError("Years, symbols, trades and repeat must be positive")
+        except Exception as e:
+            msg = "Unable to setup config variables. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}. Exiting.".format(self.log_prefix, msg))
+            raise CommandError(msg)
@@ -0,0 +1,112 @@
+import logging
+import typing
+
+from django.core.management.base import CommandError
+
+from divisions.common import utils as common_utils
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto.management import base as management_base
+from divisions.crypto.services import import_watermark as import_watermark_services
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(management_base.ProfiledCommand):
+    help = """
+            Prints newest imported record and last completed import per stream and key (symbol, wallet type)
+            from import watermarks, without scanning imported tables. Fails when any row is stale, so it can
+            be used by alert checks.
+            ex. python manage.py check_data_freshness --provider=BYBIT [--stream=TRADE_EXECUTIONS] [--max-lag-seconds=86400] [--max-success-age-seconds=3600]
+            """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--provider",
+            help="Provider for which freshness is checked. One of CryptoProvider enum choices.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--stream",
+            help="Only checks given stream. One of ImportStream enum choices.",
+            required=False,
+            type=str,
+        )
+        parser.add_argument(
+            "--max-lag-seconds",
+            help="Row is stale when its newest record is older than this.",
+            required=False,
+            type=int,
+        )
+        parser.add_argument(
+            "--max-success-age-seconds",
+            help="Row is stale when its last completed import is older than this.",
+            required=False,
+            type=int,
+        )
+
+    provider = None
+    stream = None
+    max_lag_seconds = None
+    max_success_age_seconds = None
+
+    log_prefix = "[CHECK-DATA-FRESHNESS]"
+
+    def handle(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self._setup_config_variables(kwargs=kwargs)
+        try:
+            freshness = import_watermark_services.get_freshness(
+                provider=self.provider,
+                stream=self.stream,
+                max_lag_seconds=self.max_lag_seconds,
+                max_success_age_seconds=self.max_success_age_seconds,
+            )
+        except Exception as e:
+            msg = "Unexpected exception occurred while reading data freshness. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}.".format(self.log_prefix, msg))
+            raise CommandError(msg)
+
+        for row in freshness:
+            self.stdout.write(
+                "{}{} {} lag_seconds={} success_age_seconds={} latest_record_at={} last_success_at={}".format(
+                    "STALE " if row["stale"] else "",
+                    row["stream"],
+                    row["key"] or "-",
+                    row["lag_seconds"],
+                    row["success_age_seconds"],
+                    row["latest_record_at"].isoformat()
+                    if row["latest_record_at"]
+                    else None,
+                    row["last_success_at"].isoformat()
+                    if row["last_success_at"]
+                    else None,
+                )
+            )
+
+        stale_count = sum(row["stale"] for row in freshness)
+        if stale_count:
+            msg = "{} of {} streams are stale (provider={})".format(
+                stale_count, len(freshness), self.provider.name
+            )
+            logger.warning("{} {}.".format(self.log_prefix, msg))
+            raise CommandError(msg)
+
+    def _setup_config_variables(self, kwargs: typing.Dict) -> None:
+        try:
+            self.provider = crypto_enums.CryptoProvider(kwargs["provider"])
+            self.stream = (
+                crypto_enums.ImportStream(kwargs["stream"])
+                if kwargs["stream"]
+                else None
+            )
+            self.max_lag_seconds = kwargs["max_lag_seconds"]
+            self.max_success_age_seconds = kwargs["max_success_age_seconds"]
+        except Exception as e:
+            msg = "Unable to setup config variables. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}. Exiting.".format(self.log_prefix, msg))
+            raise CommandError(msg)
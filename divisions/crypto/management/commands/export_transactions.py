@@ -0,0 +1,176 @@
+import datetime
+import logging
+import time
+import typing
+
+from django.core.management.base import CommandError
+
+from divisions.common import utils as common_utils
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto.management import base as management_base
+from divisions.crypto.services import (
+    transaction_export as transaction_export_services,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(management_base.ProfiledCommand):
+    help = """
+            Exports trade executions or PnL transactions to CSV or NDJSON file. Rows are streamed from database
+            cursor so memory usage does not depend on number of exported rows.
+            ex. python manage.py export_transactions --dataset=PNL --output=/tmp/pnl_2023.csv.gz --from-datetime=2023-01-01 --to-datetime=2024-01-01 [--provider=BYBIT] [--instrument=BTCUSDT] [--format=csv] [--gzip]
+            """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dataset",
+            help="Dataset to be exported. One of ExportDataset enum choices.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--output",
+            help="Path of output file.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--format",
+            help="Output format. One of ExportFormat enum choices.",
+            required=False,
+            type=str,
+            default=crypto_enums.ExportFormat.CSV.value,
+        )
+        parser.add_argument(
+            "--provider",
+            help="Provider for which rows are to be exported. One of CryptoProvider enum choices. All providers if omitted.",
+            required=False,
+            type=str,
+        )
+        parser.add_argument(
+            "--instrument",
+            help="Instrument name for which rows are to be exported. Can be repeated. All instruments if omitted.",
+            required=False,
+            action="append",
+        )
+        parser.add_argument(
+            "--from-datetime",
+            help="From which datetime (inclusive) rows are to be exported.",
+            required=False,
+            type=str,
+        )
+        parser.add_argument(
+            "--to-datetime",
+            help="To which datetime (exclusive) rows are to be exported.",
+            required=False,
+            type=str,
+        )
+        parser.add_argument(
+            "--gzip",
+            help="Compresses output with gzip.",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--chunk-size",
+            help="Number of rows fetched from database cursor at once.",
+            required=False,
+            type=int,
+            default=transaction_export_services.DEFAULT_CHUNK_SIZE,
+        )
+
+    dataset = None
+    output = None
+    export_format = None
+    provider = None
+    instrument_names = None
+    from_datetime = None
+    to_datetime = None
+    compress = None
+    chunk_size = None
+
+    log_prefix = "[EXPORT-TRANSACTIONS]"
+
+    def handle(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self._setup_config_variables(kwargs=kwargs)
+        logger.info(
+            "{} Started command '{}' (dataset={}, format={}, output={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.dataset.name,
+                self.export_format.name,
+                self.output,
+            )
+        )
+
+        started_at = time.perf_counter()
+        written_bytes = 0
+        try:
+            with open(self.output, "wb") as output_file:
+                for chunk in transaction_export_services.iter_export(
+                    dataset=self.dataset,
+                    export_format=self.export_format,
+                    provider=self.provider,
+                    instrument_names=self.instrument_names,
+                    from_datetime=self.from_datetime,
+                    to_datetime=self.to_datetime,
+                    compress=self.compress,
+                    chunk_size=self.chunk_size,
+                ):
+                    output_file.write(chunk)
+                    written_bytes += len(chunk)
+        except Exception as e:
+            msg = "Unexpected exception occurred while exporting transactions. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}.".format(self.log_prefix, msg))
+            raise CommandError(msg)
+
+        logger.info(
+            "{} Finished command '{}' (dataset={}, format={}, output={}, bytes={}, elapsed={:.2f}s).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.dataset.name,
+                self.export_format.name,
+                self.output,
+                written_bytes,
+                time.perf_counter() - started_at,
+            )
+        )
+
+    def _setup_config_variables(self, kwargs: typing.Dict) -> None:
+        try:
+            self.dataset = crypto_enums.ExportDataset(kwargs["dataset"])
+            self.output = kwargs["output"]
+            self.export_format = crypto_enums.ExportFormat(kwargs["format"])
+            self.provider = (
+                crypto_enums.CryptoProvider(kwargs["provider"])
+                if kwargs["provider"]
+                else None
+            )
+            self.instrument_names = kwargs["instrument"] or []
+            self.from_datetime = self._parse_datetime(value=kwargs["from_datetime"])
+            self.to_datetime = self._parse_datetime(value=kwargs["to_datetime"])
+            self.compress = kwargs["gzip"]
+            self.chunk_size = kwargs["chunk_size"]
+            if self.chunk_size <= 0:
+                raise ValueError("Chunk size must be positive")
+        except Exception as e:
+            msg = "Unable to setup config variables. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}. Exiting.".format(self.log_prefix, msg))
+            raise CommandError(msg)
+
+    @staticmethod
+    def _parse_datetime(value: typing.Optional[str]) -> typing.Optional[datetime.datetime]:
+        if not value:
+            return None
+
+        parsed_datetime = datetime.datetime.fromisoformat(value)
+        if parsed_datetime.tzinfo is None:
+            parsed_datetime = parsed_datetime.replace(tzinfo=datetime.timezone.utc)
+
+        return parsed_datetime
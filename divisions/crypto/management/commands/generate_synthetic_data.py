@@ -0,0 +1,196 @@
+import gzip
+import logging
+import typing
+
+import simplejson
+
+from django.core.management.base import CommandError
+
+from divisions.common import utils as common_utils
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto.integrations.provider import enums as crypto_provider_enums
+from divisions.crypto.management import base as management_base
+from divisions.crypto.services import synthetic_data as synthetic_data_services
+
+
+logger = logging.getLogger(__name__)
+
+_FORMATS = ["ndjson", "api-pages", "db"]
+
+
+class Command(management_base.ProfiledCommand):
+    help = """
+            Generates seeded, realistic synthetic trading history (orders with partial fills, closed PnL,
+            funding settlements, transfers and daily balance snapshots) for load testing. Same seed always
+            produces same data. Output is NDJSON of messages, NDJSON of provider shaped API pages or rows
+            loaded directly into database (only use against disposable databases).
+            ex. python manage.py generate_synthetic_data --executions=1000000 --format=ndjson --output=synthetic.ndjson.gz [--instruments=300] [--seed=0]
+            ex. python manage.py generate_synthetic_data --executions=1000000 --format=db --provider=BYBIT [--batch-size=20000]
+            """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--executions",
+            help="Number of trade executions to generate, other events scale with it.",
+            required=True,
+            type=int,
+        )
+        parser.add_argument(
+            "--format",
+            help="Output format. One of: {}.".format(", ".join(_FORMATS)),
+            required=False,
+            type=str,
+            default="ndjson",
+        )
+        parser.add_argument(
+            "--output",
+            help="Output file path for ndjson and api-pages formats, gzipped when ending with .gz.",
+            required=False,
+            type=str,
+        )
+        parser.add_argument(
+            "--provider",
+            help="Provider rows are stored as in db format. One of CryptoProvider enum choices.",
+            required=False,
+            type=str,
+            default=crypto_enums.CryptoProvider.BYBIT.value,
+        )
+        parser.add_argument(
+            "--wallet-type",
+            help="Wallet type balance snapshots are stored as in db format. One of WalletType enum choices.",
+            required=False,
+            type=str,
+            default=crypto_provider_enums.WalletType.DERIVATIVE.value,
+        )
+        parser.add_argument(
+            "--instruments",
+            help="Number of synthetic instruments, activity is Zipf distributed over them.",
+            required=False,
+            type=int,
+            default=300,
+        )
+        parser.add_argument(
+            "--seed",
+            help="Seed of synthetic data.",
+            required=False,
+            type=int,
+            default=0,
+        )
+        parser.add_argument(
+            "--page-size",
+            help="Number of records per API page in api-pages format.",
+            required=False,
+            type=int,
+            default=50,
+        )
+        parser.add_argument(
+            "--batch-size",
+            help="Number of events inserted per transaction in db format.",
+            required=False,
+            type=int,
+            default=20000,
+        )
+
+    executions_count = None
+    output_format = None
+    output = None
+    provider = None
+    wallet_type = None
+    instruments_count = None
+    seed = None
+    page_size = None
+    batch_size = None
+
+    log_prefix = "[GENERATE-SYNTHETIC-DATA]"
+
+    def handle(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self._setup_config_variables(kwargs=kwargs)
+        logger.info(
+            "{} Started command '{}' (executions={}, format={}, instruments={}, seed={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.executions_count,
+                self.output_format,
+                self.instruments_count,
+                self.seed,
+            )
+        )
+
+        events = synthetic_data_services.SyntheticTradingDataGenerator(
+            seed=self.seed, instruments_count=self.instruments_count
+        ).iter_events(executions_count=self.executions_count)
+        try:
+            if self.output_format == "db":
+                written_counts = synthetic_data_services.load_events(
+                    events=events,
+                    provider=self.provider,
+                    wallet_type=self.wallet_type,
+                    batch_size=self.batch_size,
+                )
+            else:
+                written_counts = self._write_output(events=events)
+        except Exception as e:
+            msg = "Unexpected exception occurred while generating synthetic data. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}.".format(self.log_prefix, msg))
+            raise CommandError(msg)
+
+        logger.info(
+            "{} Finished command '{}' (executions={}, format={}, output={}, written={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.executions_count,
+                self.output_format,
+                self.output,
+                written_counts,
+            )
+        )
+
+    def _write_output(
+        self, events: typing.Iterator[synthetic_data_services.Event]
+    ) -> typing.Dict[str, int]:
+        open_output = gzip.open if self.output.endswith(".gz") else open
+        lines_count = 0
+        with open_output(self.output, "wt") as f:
+            if self.output_format == "ndjson":
+                for event_datetime, message in events:
+                    f.write(
+                        synthetic_data_services.serialize_event(
+                            event_datetime=event_datetime, message=message
+                        )
+                        + "\n"
+                    )
+                    lines_count += 1
+            else:
+                for api_page in synthetic_data_services.iter_api_pages(
+                    events=events, page_size=self.page_size
+                ):
+                    f.write(simplejson.dumps(api_page) + "\n")
+                    lines_count += 1
+
+        return {"lines": lines_count}
+
+    def _setup_config_variables(self, kwargs: typing.Dict) -> None:
+        try:
+            self.executions_count = kwargs["executions"]
+            self.output_format = kwargs["format"]
+            if self.output_format not in _FORMATS:
+                raise ValueError("Unknown format {}".format(self.output_format))
+
+            self.output = kwargs["output"]
+            if self.output_format != "db" and not self.output:
+                raise ValueError("Output is required for {} format".format(self.output_format))
+
+            self.provider = crypto_enums.CryptoProvider(kwargs["provider"])
+            self.wallet_type = crypto_provider_enums.WalletType(kwargs["wallet_type"])
+            self.instruments_count = kwargs["instruments"]
+            self.seed = kwargs["seed"]
+            self.page_size = kwargs["page_size"]
+            self.batch_size = kwargs["batch_size"]
+        except Exception as e:
+            msg = "Unable to setup config variables. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}. Exiting.".format(self.log_prefix, msg))
+            raise CommandError(msg)
@@ -2,7 +2,6 @@ import datetime
 import logging
 import typing
 
-from django.core.management.base import BaseCommand
 from django.core.management.base import CommandError
 
 from divisions.common import enums as common_enums
@@ -16,15 +15,17 @@ from divisions.crypto.integrations.provider import enums as crypto_provider_enum
 from divisions.crypto.integrations.provider.services import (
     data_importer as data_importer_services,
 )
+from divisions.crypto.management import base as management_base
+from divisions.crypto.services import import_runs as import_runs_services
 
 
 logger = logging.getLogger(__name__)
 
 
-class Command(BaseCommand):
+class Command(management_base.ProfiledCommand):
     help = """
             Imports account transfer data.
-            ex. python manage.py import_account_transfers --provider=BYBIT --wallet-type=DERIVATIVE --currency=USDT --from-datetime=2023-01-01 --to-datetime=2023-02-01 [--dry-run]
+            ex. python manage.py import_account_transfers --provider=BYBIT --wallet-type=DERIVATIVE --currency=USDT --from-datetime=2023-01-01 --to-datetime=2023-02-01 [--external-transfers] [--number-of-pages=10] [--max-workers=4] [--dry-run] [--tolerant]
             """
 
     def add_arguments(self, parser):
@@ -58,19 +59,49 @@ class Command(BaseCommand):
             required=False,
             type=str,
         )
+        parser.add_argument(
+            "--external-transfers",
+            help="Imports on-chain deposits and withdrawals in addition to internal transfers.",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--number-of-pages",
+            help="Maximum number of pages fetched from API per time window for external transfers.",
+            required=False,
+            type=int,
+            default=10,
+        )
+        parser.add_argument(
+            "--max-workers",
+            help="Number of time windows fetched concurrently for external transfers.",
+            required=False,
+            type=int,
+            default=4,
+        )
         parser.add_argument(
             "--dry-run",
             help="Runs command in dry run mode",
             action="store_true",
             default=False,
         )
+        parser.add_argument(
+            "--tolerant",
+            help="Imports valid rows of pages with invalid ones, invalid rows are stored as rejected rows.",
+            action="store_true",
+            default=False,
+        )
 
     provider = None
     wallet_type = None
     currency = None
     from_datetime = None
     to_datetime = None
+    external_transfers = None
+    number_of_pages = None
+    max_workers = None
     dry_run = None
+    tolerant = None
 
     log_prefix = "[IMPORT-ACCOUNT-TRANSFERS]"
 
@@ -86,17 +117,43 @@ class Command(BaseCommand):
             )
         )
 
+        run_recorder = import_runs_services.ImportRunRecorder(
+            provider=self.provider, command=__name__.split(".")[-1]
+        )
+        run_recorder.start()
+        failed = True
         try:
-            data_importer_services.CryptoProviderImporter(
+            importer_service = data_importer_services.CryptoProviderImporter(
                 provider_client=crypto_provider_factory.Factory(
                     provider=self.provider
-                ).create()
-            ).import_wallet_internal_transfers(
+                ).create(),
+                tolerant_validation=self.tolerant,
+                run_recorder=run_recorder,
+            )
+            importer_service.import_wallet_internal_transfers(
                 wallet_type=self.wallet_type,
                 currency=self.currency,
                 from_datetime=self.from_datetime,
                 to_datetime=self.to_datetime,
+                dry_run=self.dry_run,
             )
+
+            if self.external_transfers:
+                for transfer_type in [
+                    crypto_provider_enums.WalletTransferType.DEPOSIT,
+                    crypto_provider_enums.WalletTransferType.WITHDRAWAL,
+                ]:
+                    importer_service.import_wallet_external_transfers(
+                        wallet_type=self.wallet_type,
+                        transfer_type=transfer_type,
+                        depth=self.number_of_pages,
+                        currency=self.currency,
+                        from_datetime=self.from_datetime,
+                        to_datetime=self.to_datetime,
+                        max_workers=self.max_workers,
+                        dry_run=self.dry_run,
+                    )
+            failed = False
         except crypto_provider_exceptions.ProviderError as e:
             msg = "Unable to import wallet transfers (currency={}, wallet_type={}). Error: {}".format(
                 self.currency.name,
@@ -111,6 +168,8 @@ class Command(BaseCommand):
             )
             logger.exception("{} {}.".format(self.log_prefix, msg))
             raise CommandError(msg)
+        finally:
+            run_recorder.finish(failed=failed)
 
         logger.info(
             "{} Finished command '{}' (provider={}, currency={}, wallet_type={}).".format(
@@ -137,7 +196,11 @@ class Command(BaseCommand):
                 if kwargs["to_datetime"]
                 else None
             )
+            self.external_transfers = kwargs["external_transfers"]
+            self.number_of_pages = kwargs["number_of_pages"]
+            self.max_workers = kwargs["max_workers"]
             self.dry_run = kwargs["dry_run"]
+            self.tolerant = kwargs["tolerant"]
         except Exception as e:
             msg = "Unable to setup config variables. Error: {}".format(
                 common_utils.get_exception_message(exception=e)
@@ -3,7 +3,6 @@ import logging
 import time
 import typing
 
-from django.core.management.base import BaseCommand
 from django.core.management.base import CommandError
 
 from divisions.common import enums as common_enums
@@ -15,15 +14,17 @@ from divisions.crypto.integrations.provider import enums as crypto_provider_enum
 from divisions.crypto.integrations.provider.services import (
     data_importer as data_importer_services,
 )
+from divisions.crypto.management import base as management_base
+from divisions.crypto.services import import_runs as import_runs_services
 
 
 logger = logging.getLogger(__name__)
 
 
-class Command(BaseCommand):
+class Command(management_base.ProfiledCommand):
     help = """
             Imports trading data. More specifically it imports trade order, pnl and execution transactions.
-            ex. python manage.py import_wallet_balances --provider=BYBIT --trading-category=LINEAR --number-of-pages=1 --from-datetime=2022-01-01 --to-datetime=2023-01-01 [--dry-run]
+            ex. python manage.py import_wallet_balances --provider=BYBIT --trading-category=LINEAR --number-of-pages=1 --from-datetime=2022-01-01 --to-datetime=2023-01-01 [--dry-run] [--tolerant] [--columnar]
             """
 
     def add_arguments(self, parser):
@@ -63,6 +64,18 @@ class Command(BaseCommand):
             action="store_true",
             default=False,
         )
+        parser.add_argument(
+            "--tolerant",
+            help="Imports valid rows of pages with invalid ones, invalid rows are stored as rejected rows.",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--columnar",
+            help="Fetches executions as columnar batches and bulk inserts them.",
+            action="store_true",
+            default=False,
+        )
 
     provider = None
     trading_category = None
@@ -70,6 +83,8 @@ class Command(BaseCommand):
     from_datetime = None
     to_datetime = None
     dry_run = None
+    tolerant = None
+    columnar = None
     time_to_sleep = 0.2
 
     log_prefix = "[IMPORT-TRADING-DATA]"
@@ -86,10 +101,44 @@ class Command(BaseCommand):
             )
         )
 
+        run_recorder = import_runs_services.ImportRunRecorder(
+            provider=self.provider, command=__name__.split(".")[-1]
+        )
+        run_recorder.start()
+        failed = True
+        try:
+            self._import_trading_data(run_recorder=run_recorder)
+            failed = False
+        except Exception as e:
+            msg = "Unexpected exception occurred while importing trading data. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}.".format(self.log_prefix, msg))
+            raise CommandError(msg)
+        finally:
+            # Run is closed also when command is interrupted (e.g. scheduler stop).
+            run_recorder.finish(failed=failed)
+
+        logger.info(
+            "{} Finished command '{}' (provider={}, trading_category={}, number_of_pages={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.provider.name,
+                self.trading_category.name,
+                self.number_of_pages,
+            )
+        )
+
+    def _import_trading_data(
+        self, run_recorder: import_runs_services.ImportRunRecorder
+    ) -> None:
         importer_service = data_importer_services.CryptoProviderImporter(
             provider_client=crypto_provider_factory.Factory(
                 provider=self.provider
-            ).create()
+            ).create(),
+            tolerant_validation=self.tolerant,
+            use_columnar_batches=self.columnar,
+            run_recorder=run_recorder,
         )
         logger.info(
             "{} Importing unrealised PnL (currency={}).".format(
@@ -160,16 +209,6 @@ class Command(BaseCommand):
                 )
                 logger.exception("{} {}. Continue.".format(self.log_prefix, msg))
 
-        logger.info(
-            "{} Finished command '{}' (provider={}, trading_category={}, number_of_pages={}).".format(
-                self.log_prefix,
-                __name__.split(".")[-1],
-                self.provider.name,
-                self.trading_category.name,
-                self.number_of_pages,
-            )
-        )
-
     def _setup_config_variables(self, kwargs: typing.Dict) -> None:
         try:
             self.provider = crypto_enums.CryptoProvider(kwargs["provider"])
@@ -188,6 +227,8 @@ class Command(BaseCommand):
                 else None
             )
             self.dry_run = kwargs["dry_run"]
+            self.tolerant = kwargs["tolerant"]
+            self.columnar = kwargs["columnar"]
         except Exception as e:
             msg = "Unable to setup config variables. Error: {}".format(
                 common_utils.get_exception_message(exception=e)
@@ -0,0 +1,110 @@
+import logging
+import typing
+
+from django.core.management.base import CommandError
+
+from divisions.common import utils as common_utils
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto.integrations.provider.services import (
+    transaction_log_importer as transaction_log_importer_services,
+)
+from divisions.crypto.management import base as management_base
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(management_base.ProfiledCommand):
+    help = """
+            Streams provider transaction log CSV export (plain or .gz) into execution transactions and transaction log entries.
+            ex. python manage.py import_transaction_log_csv --provider=BYBIT --file=/data/bybit_2022.csv [--batch-size=20000] [--dry-run]
+            """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--provider",
+            help="Provider that produced the export. One of CryptoProvider enum choices.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--file",
+            help="Path to transaction log CSV export.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--batch-size",
+            help="Number of rows loaded per batch.",
+            required=False,
+            type=int,
+            default=transaction_log_importer_services.DEFAULT_BATCH_SIZE,
+        )
+        parser.add_argument(
+            "--dry-run",
+            help="Only parse the file without writing to database.",
+            action="store_true",
+        )
+
+    provider = None
+    file_path = None
+    batch_size = None
+    dry_run = None
+
+    log_prefix = "[IMPORT-TRANSACTION-LOG-CSV]"
+
+    def handle(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self._setup_config_variables(kwargs=kwargs)
+        logger.info(
+            "{} Started command '{}' (provider={}, file={}, batch_size={}, dry_run={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.provider.name,
+                self.file_path,
+                self.batch_size,
+                self.dry_run,
+            )
+        )
+
+        try:
+            stats = transaction_log_importer_services.TransactionLogImporter(
+                provider=self.provider
+            ).import_file(
+                file_path=self.file_path,
+                batch_size=self.batch_size,
+                dry_run=self.dry_run,
+            )
+        except Exception as e:
+            msg = "Unexpected exception occurred while importing transaction log (file={}). Error: {}".format(
+                self.file_path,
+                common_utils.get_exception_message(exception=e),
+            )
+            logger.exception("{} {}.".format(self.log_prefix, msg))
+            raise CommandError(msg)
+
+        logger.info(
+            "{} Finished command '{}' (provider={}, file={}, rows={}, executions={}, entries={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.provider.name,
+                self.file_path,
+                stats["rows"],
+                stats["executions"],
+                stats["entries"],
+            )
+        )
+
+    def _setup_config_variables(self, kwargs: typing.Dict) -> None:
+        try:
+            self.provider = crypto_enums.CryptoProvider(kwargs["provider"])
+            self.file_path = kwargs["file"]
+            self.batch_size = kwargs["batch_size"]
+            self.dry_run = kwargs["dry_run"]
+            if self.batch_size <= 0:
+                raise ValueError("Batch size must be positive")
+        except Exception as e:
+            msg = "Unable to setup config variables. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}. Exiting.".format(self.log_prefix, msg))
+            raise CommandError(msg)
@@ -0,0 +1,173 @@
+import datetime
+import logging
+import typing
+
+from django.core.management.base import CommandError
+
+from divisions.common import enums as common_enums
+from divisions.common import utils as common_utils
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto.integrations.provider import factory as crypto_provider_factory
+from divisions.crypto.integrations.provider import enums as crypto_provider_enums
+from divisions.crypto.integrations.provider.services import (
+    data_importer as data_importer_services,
+)
+from divisions.crypto.management import base as management_base
+from divisions.crypto.services import import_runs as import_runs_services
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(management_base.ProfiledCommand):
+    help = """
+            Imports account transaction log (trades, fees, funding, transfers and wallet balance after each change).
+            Continues from last stored watermark unless --from-datetime is given.
+            ex. python manage.py import_transactions --provider=BYBIT --wallet-type=GENERAL [--currency=USDT] [--number-of-pages=50] [--from-datetime=2023-01-01] [--to-datetime=2023-02-01] [--dry-run] [--tolerant]
+            """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--provider",
+            help="Provider for which transactions are to be imported. One of CryptoProvider enum choices.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--wallet-type",
+            help="Wallet type for which transactions are to be imported. One of WalletType enum choices.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--currency",
+            help="Currency for which transactions are to be imported. One of Currency enum choices. All currencies if omitted.",
+            required=False,
+            type=str,
+        )
+        parser.add_argument(
+            "--number-of-pages",
+            help="Maximum number of pages fetched from API per time window.",
+            required=False,
+            type=int,
+            default=50,
+        )
+        parser.add_argument(
+            "--from-datetime",
+            help="From which datetime transactions are to be imported. Stored watermark if omitted.",
+            required=False,
+            type=str,
+        )
+        parser.add_argument(
+            "--to-datetime",
+            help="To which datetime transactions are to be imported. Now if omitted.",
+            required=False,
+            type=str,
+        )
+        parser.add_argument(
+            "--dry-run",
+            help="Runs command in dry run mode",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--tolerant",
+            help="Imports valid rows of pages with invalid ones, invalid rows are stored as rejected rows.",
+            action="store_true",
+            default=False,
+        )
+
+    provider = None
+    wallet_type = None
+    currency = None
+    number_of_pages = None
+    from_datetime = None
+    to_datetime = None
+    dry_run = None
+    tolerant = None
+
+    log_prefix = "[IMPORT-TRANSACTIONS]"
+
+    def handle(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self._setup_config_variables(kwargs=kwargs)
+        logger.info(
+            "{} Started command '{}' (provider={}, wallet_type={}, currency={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.provider.name,
+                self.wallet_type.name,
+                self.currency,
+            )
+        )
+
+        run_recorder = import_runs_services.ImportRunRecorder(
+            provider=self.provider, command=__name__.split(".")[-1]
+        )
+        run_recorder.start()
+        failed = True
+        try:
+            data_importer_services.CryptoProviderImporter(
+                provider_client=crypto_provider_factory.Factory(
+                    provider=self.provider
+                ).create(),
+                tolerant_validation=self.tolerant,
+                run_recorder=run_recorder,
+            ).import_transactions(
+                wallet_type=self.wallet_type,
+                depth=self.number_of_pages,
+                currency=self.currency,
+                from_datetime=self.from_datetime,
+                to_datetime=self.to_datetime,
+                dry_run=self.dry_run,
+            )
+            failed = False
+        except Exception as e:
+            msg = "Unexpected exception occurred while importing transactions. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}.".format(self.log_prefix, msg))
+            raise CommandError(msg)
+        finally:
+            run_recorder.finish(failed=failed)
+
+        logger.info(
+            "{} Finished command '{}' (provider={}, wallet_type={}, currency={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.provider.name,
+                self.wallet_type.name,
+                self.currency,
+            )
+        )
+
+    def _setup_config_variables(self, kwargs: typing.Dict) -> None:
+        try:
+            self.provider = crypto_enums.CryptoProvider(kwargs["provider"])
+            self.wallet_type = crypto_provider_enums.WalletType(kwargs["wallet_type"])
+            self.currency = (
+                common_enums.Currency(kwargs["currency"])
+                if kwargs["currency"]
+                else None
+            )
+            self.number_of_pages = kwargs["number_of_pages"]
+            self.from_datetime = self._parse_datetime(value=kwargs["from_datetime"])
+            self.to_datetime = self._parse_datetime(value=kwargs["to_datetime"])
+            self.dry_run = kwargs["dry_run"]
+            self.tolerant = kwargs["tolerant"]
+        except Exception as e:
+            msg = "Unable to setup config variables. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}. Exiting.".format(self.log_prefix, msg))
+            raise CommandError(msg)
+
+    @staticmethod
+    def _parse_datetime(value: typing.Optional[str]) -> typing.Optional[datetime.datetime]:
+        if not value:
+            return None
+
+        parsed_datetime = datetime.datetime.fromisoformat(value)
+        if parsed_datetime.tzinfo is None:
+            parsed_datetime = parsed_datetime.replace(tzinfo=datetime.timezone.utc)
+
+        return parsed_datetime
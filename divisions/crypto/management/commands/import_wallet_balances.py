@@ -1,7 +1,6 @@
 import logging
 import typing
 
-from django.core.management.base import BaseCommand
 from django.core.management.base import CommandError
 
 from divisions.common import enums as common_enums
@@ -15,12 +14,14 @@ from divisions.crypto.integrations.provider import enums as crypto_provider_enum
 from divisions.crypto.integrations.provider.services import (
     data_importer as data_importer_services,
 )
+from divisions.crypto.management import base as management_base
+from divisions.crypto.services import import_runs as import_runs_services
 
 
 logger = logging.getLogger(__name__)
 
 
-class Command(BaseCommand):
+class Command(management_base.ProfiledCommand):
     help = """
             Imports wallet balances data.
             ex. python manage.py import_wallet_balances --provider=BYBIT --wallet-type=DERIVATIVE --currency=USDT
@@ -64,14 +65,21 @@ class Command(BaseCommand):
             )
         )
 
+        run_recorder = import_runs_services.ImportRunRecorder(
+            provider=self.provider, command=__name__.split(".")[-1]
+        )
+        run_recorder.start()
+        failed = True
         try:
             data_importer_services.CryptoProviderImporter(
                 provider_client=crypto_provider_factory.Factory(
                     provider=self.provider
-                ).create()
+                ).create(),
+                run_recorder=run_recorder,
             ).import_wallet_balances(
                 wallet_type=self.wallet_type, currency=self.currency
             )
+            failed = False
         except crypto_provider_exceptions.ProviderError as e:
             msg = "Unable to import wallet balances (currency={}, wallet_type={}). Error: {}".format(
                 self.currency.name,
@@ -86,6 +94,8 @@ class Command(BaseCommand):
             )
             logger.exception("{} {}.".format(self.log_prefix, msg))
             raise CommandError(msg)
+        finally:
+            run_recorder.finish(failed=failed)
 
         logger.info(
             "{} Finished command '{}' (provider={}, currency={}, wallet_type={}).".format(
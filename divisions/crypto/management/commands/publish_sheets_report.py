@@ -0,0 +1,153 @@
+import logging
+import typing
+
+from django.conf import settings
+from django.core.management.base import CommandError
+
+from divisions.common import utils as common_utils
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto.integrations.provider import enums as crypto_provider_enums
+from divisions.crypto.integrations.reporter.clients.sheets import (
+    client as sheets_client,
+)
+from divisions.crypto.integrations.reporter.clients.sheets import (
+    local as sheets_local_backend,
+)
+from divisions.crypto.integrations.reporter.services import (
+    portfolio as portfolio_reporter_services,
+)
+from divisions.crypto.integrations.reporter.services import (
+    sheets as sheets_reporter_services,
+)
+from divisions.crypto.management import base as management_base
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(management_base.ProfiledCommand):
+    help = """
+            Publishes portfolio, investors and performance tables to Google Sheets spreadsheet.
+            Only cells changed since last publish are sent, in one batch update request.
+            ex. python manage.py publish_sheets_report --provider=BYBIT --wallet-type=DERIVATIVE --trading-category=linear --spreadsheet-id=<ID> [--force-full] [--local-backend-dir=/tmp/sheets]
+            """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--provider",
+            help="Provider for which report is to be published. One of CryptoProvider enum choices.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--wallet-type",
+            help="Wallet type for which report is to be published. One of WalletType enum choices.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--trading-category",
+            help="Trading category of performance table. One of TradingCategory enum choices.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--spreadsheet-id",
+            help="Id of spreadsheet report is published to.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--force-full",
+            help="Ignores last published snapshot and rewrites all tables.",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--local-backend-dir",
+            help="Publishes to JSON files in given directory instead of Google Sheets API.",
+            required=False,
+            type=str,
+        )
+
+    provider = None
+    wallet_type = None
+    trading_category = None
+    spreadsheet_id = None
+    force_full = None
+    local_backend_dir = None
+
+    log_prefix = "[PUBLISH-SHEETS-REPORT]"
+
+    def handle(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self._setup_config_variables(kwargs=kwargs)
+        logger.info(
+            "{} Started command '{}' (provider={}, wallet_type={}, trading_category={}, spreadsheet_id={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.provider.name,
+                self.wallet_type.name,
+                self.trading_category.name,
+                self.spreadsheet_id,
+            )
+        )
+
+        try:
+            ranges_count = sheets_reporter_services.publish_tables(
+                client=sheets_client.SheetsClient(
+                    backend=sheets_local_backend.LocalSheetsBackend(
+                        directory=self.local_backend_dir
+                    )
+                    if self.local_backend_dir
+                    else None
+                ),
+                spreadsheet_id=self.spreadsheet_id,
+                tables={
+                    "Portfolio": portfolio_reporter_services.get_portfolio_table(
+                        provider=self.provider, wallet_type=self.wallet_type
+                    ),
+                    "Investors": portfolio_reporter_services.get_investors_table(
+                        provider=self.provider, wallet_type=self.wallet_type
+                    ),
+                    "Performance": portfolio_reporter_services.get_performance_table(
+                        provider=self.provider, trading_category=self.trading_category
+                    ),
+                },
+                snapshot_dir=settings.SHEETS_REPORT_SNAPSHOT_DIR,
+                force_full=self.force_full,
+            )
+        except Exception as e:
+            msg = "Unexpected exception occurred while publishing sheets report. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}.".format(self.log_prefix, msg))
+            raise CommandError(msg)
+
+        logger.info(
+            "{} Finished command '{}' (provider={}, wallet_type={}, trading_category={}, spreadsheet_id={}, ranges={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.provider.name,
+                self.wallet_type.name,
+                self.trading_category.name,
+                self.spreadsheet_id,
+                ranges_count,
+            )
+        )
+
+    def _setup_config_variables(self, kwargs: typing.Dict) -> None:
+        try:
+            self.provider = crypto_enums.CryptoProvider(kwargs["provider"])
+            self.wallet_type = crypto_provider_enums.WalletType(kwargs["wallet_type"])
+            self.trading_category = crypto_provider_enums.TradingCategory(
+                kwargs["trading_category"]
+            )
+            self.spreadsheet_id = kwargs["spreadsheet_id"]
+            self.force_full = kwargs["force_full"]
+            self.local_backend_dir = kwargs["local_backend_dir"]
+        except Exception as e:
+            msg = "Unable to setup config variables. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}. Exiting.".format(self.log_prefix, msg))
+            raise CommandError(msg)
@@ -0,0 +1,117 @@
+import datetime
+import logging
+import typing
+
+from django.core.management.base import CommandError
+
+from divisions.common import utils as common_utils
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto.integrations.provider import enums as crypto_provider_enums
+from divisions.crypto.management import base as management_base
+from divisions.crypto.services import pnl_rollup as pnl_rollup_services
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(management_base.ProfiledCommand):
+    help = """
+            Rebuilds daily PnL rollup from raw PnL transactions. Used for backfills or after manual data fixes.
+            Only PnL transactions of orders of given trading category are counted, orders imported before category
+            was stored get it on next import_trade_orders run.
+            ex. python manage.py rebuild_pnl_rollup --provider=BYBIT --trading-category=linear --from-date=2023-01-01 --to-date=2023-02-01
+            """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--provider",
+            help="Provider for which rollup is to be rebuilt. One of CryptoProvider enum choices.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--trading-category",
+            help="Trading category rollup rows are rebuilt for. One of TradingCategory enum choices.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--from-date",
+            help="From which date (inclusive) rollup is to be rebuilt. Whole history if omitted.",
+            required=False,
+            type=str,
+        )
+        parser.add_argument(
+            "--to-date",
+            help="To which date (inclusive) rollup is to be rebuilt. Whole history if omitted.",
+            required=False,
+            type=str,
+        )
+
+    provider = None
+    trading_category = None
+    from_date = None
+    to_date = None
+
+    log_prefix = "[REBUILD-PNL-ROLLUP]"
+
+    def handle(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self._setup_config_variables(kwargs=kwargs)
+        logger.info(
+            "{} Started command '{}' (provider={}, trading_category={}, from_date={}, to_date={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.provider.name,
+                self.trading_category.name,
+                self.from_date,
+                self.to_date,
+            )
+        )
+
+        try:
+            pnl_rollup_services.rebuild_pnl_rollup(
+                provider=self.provider,
+                trading_category=self.trading_category,
+                from_date=self.from_date,
+                to_date=self.to_date,
+            )
+        except Exception as e:
+            msg = "Unexpected exception occurred while rebuilding PnL rollup. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}.".format(self.log_prefix, msg))
+            raise CommandError(msg)
+
+        logger.info(
+            "{} Finished command '{}' (provider={}, trading_category={}, from_date={}, to_date={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.provider.name,
+                self.trading_category.name,
+                self.from_date,
+                self.to_date,
+            )
+        )
+
+    def _setup_config_variables(self, kwargs: typing.Dict) -> None:
+        try:
+            self.provider = crypto_enums.CryptoProvider(kwargs["provider"])
+            self.trading_category = crypto_provider_enums.TradingCategory(
+                kwargs["trading_category"]
+            )
+            self.from_date = (
+                datetime.date.fromisoformat(kwargs["from_date"])
+                if kwargs["from_date"]
+                else None
+            )
+            self.to_date = (
+                datetime.date.fromisoformat(kwargs["to_date"])
+                if kwargs["to_date"]
+                else None
+            )
+        except Exception as e:
+            msg = "Unable to setup config variables. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}. Exiting.".format(self.log_prefix, msg))
+            raise CommandError(msg)
@@ -0,0 +1,150 @@
+import datetime
+import logging
+import typing
+
+from django.conf import settings
+from django.core.management.base import CommandError
+
+from divisions.common import utils as common_utils
+from divisions.crypto.management import base as management_base
+from divisions.crypto.services import archive_replay as archive_replay_services
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(management_base.ProfiledCommand):
+    help = """
+            Replays archived raw Bybit API pages (orders, executions, closed PnL and transaction log) into
+            importer without network, in parallel processes. Orders are replayed before the rest. Pages are
+            archived by REST API client when BYBIT_RESPONSE_ARCHIVE_DIR is set.
+            ex. python manage.py replay_response_archive [--archive-dir=archive] [--processes=4] [--from-datetime=2023-01-01] [--to-datetime=2024-01-01] [--dry-run] [--tolerant]
+            """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--archive-dir",
+            help="Archive directory, defaults to BYBIT_RESPONSE_ARCHIVE_DIR setting.",
+            required=False,
+            type=str,
+        )
+        parser.add_argument(
+            "--processes",
+            help="Number of worker processes.",
+            required=False,
+            type=int,
+            default=4,
+        )
+        parser.add_argument(
+            "--pages-per-task",
+            help="Number of archived pages replayed by worker in one task.",
+            required=False,
+            type=int,
+            default=50,
+        )
+        parser.add_argument(
+            "--from-datetime",
+            help="Replays pages fetched from this datetime (UTC).",
+            required=False,
+            type=str,
+        )
+        parser.add_argument(
+            "--to-datetime",
+            help="Replays pages fetched before this datetime (UTC).",
+            required=False,
+            type=str,
+        )
+        parser.add_argument(
+            "--dry-run",
+            help="Runs command in dry run mode",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--tolerant",
+            help="Imports valid rows of pages with invalid ones, invalid rows are stored as rejected rows.",
+            action="store_true",
+            default=False,
+        )
+
+    archive_dir = None
+    processes = None
+    pages_per_task = None
+    from_datetime = None
+    to_datetime = None
+    dry_run = None
+    tolerant = None
+
+    log_prefix = "[REPLAY-RESPONSE-ARCHIVE]"
+
+    def handle(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self._setup_config_variables(kwargs=kwargs)
+        logger.info(
+            "{} Started command '{}' (archive_dir={}, processes={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.archive_dir,
+                self.processes,
+            )
+        )
+
+        try:
+            replay_counts = archive_replay_services.replay_archive(
+                archive_dir=self.archive_dir,
+                processes=self.processes,
+                pages_per_task=self.pages_per_task,
+                from_datetime=self.from_datetime,
+                to_datetime=self.to_datetime,
+                tolerant_validation=self.tolerant,
+                dry_run=self.dry_run,
+            )
+        except Exception as e:
+            msg = "Unexpected exception occurred while replaying response archive. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}.".format(self.log_prefix, msg))
+            raise CommandError(msg)
+
+        logger.info(
+            "{} Finished command '{}' (archive_dir={}, replayed={}, failed={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.archive_dir,
+                replay_counts["replayed"],
+                replay_counts["failed"],
+            )
+        )
+
+    def _setup_config_variables(self, kwargs: typing.Dict) -> None:
+        try:
+            self.archive_dir = (
+                kwargs["archive_dir"] or settings.BYBIT_RESPONSE_ARCHIVE_DIR
+            )
+            if not self.archive_dir:
+                raise ValueError(
+                    "Archive directory is not given and BYBIT_RESPONSE_ARCHIVE_DIR is not set"
+                )
+
+            self.processes = kwargs["processes"]
+            self.pages_per_task = kwargs["pages_per_task"]
+            self.from_datetime = self._parse_datetime(value=kwargs["from_datetime"])
+            self.to_datetime = self._parse_datetime(value=kwargs["to_datetime"])
+            self.dry_run = kwargs["dry_run"]
+            self.tolerant = kwargs["tolerant"]
+        except Exception as e:
+            msg = "Unable to setup config variables. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}. Exiting.".format(self.log_prefix, msg))
+            raise CommandError(msg)
+
+    @staticmethod
+    def _parse_datetime(value: typing.Optional[str]) -> typing.Optional[datetime.datetime]:
+        if not value:
+            return None
+
+        parsed_datetime = datetime.datetime.fromisoformat(value)
+        if parsed_datetime.tzinfo is None:
+            parsed_datetime = parsed_datetime.replace(tzinfo=datetime.timezone.utc)
+
+        return parsed_datetime
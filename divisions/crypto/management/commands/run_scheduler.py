@@ -0,0 +1,102 @@
+import logging
+import signal
+import typing
+
+from django.conf import settings
+from django.core.management.base import CommandError
+
+from divisions.common import utils as common_utils
+from divisions.crypto.management import base as management_base
+from divisions.crypto.services import scheduler as scheduler_services
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(management_base.ProfiledCommand):
+    help = """
+            Long running process running import commands on schedule of SCHEDULER_JOBS setting (interval or cron).
+            Runs share HTTP and database connections and process caches. Job still running when due again is
+            skipped. SIGTERM or SIGINT stops scheduling and waits for running jobs.
+            ex. python manage.py run_scheduler [--job=wallet_balances --job=trading_data] [--max-workers=4]
+            """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--job",
+            help="Runs only given jobs of SCHEDULER_JOBS, all jobs if omitted.",
+            required=False,
+            action="append",
+            type=str,
+        )
+        parser.add_argument(
+            "--max-workers",
+            help="Number of jobs running at the same time.",
+            required=False,
+            type=int,
+            default=4,
+        )
+
+    jobs = None
+    max_workers = None
+
+    log_prefix = "[RUN-SCHEDULER]"
+
+    def handle(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self._setup_config_variables(kwargs=kwargs)
+        logger.info(
+            "{} Started command '{}' (jobs={}, max_workers={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                [job.name for job in self.jobs],
+                self.max_workers,
+            )
+        )
+
+        scheduler = scheduler_services.Scheduler(
+            jobs=self.jobs, max_workers=self.max_workers
+        )
+
+        def stop(signal_number: int, frame: typing.Any) -> None:
+            logger.info(
+                "{} Received signal {}, stopping scheduler.".format(
+                    self.log_prefix, signal.Signals(signal_number).name
+                )
+            )
+            scheduler.stop()
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+
+        try:
+            scheduler.run()
+        except Exception as e:
+            msg = "Unexpected exception occurred while running scheduler. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}.".format(self.log_prefix, msg))
+            raise CommandError(msg)
+
+        logger.info(
+            "{} Finished command '{}'.".format(
+                self.log_prefix, __name__.split(".")[-1]
+            )
+        )
+
+    def _setup_config_variables(self, kwargs: typing.Dict) -> None:
+        try:
+            self.jobs = [
+                scheduler_services.ScheduledJob.from_settings(job_settings=job_settings)
+                for job_settings in settings.SCHEDULER_JOBS
+                if not kwargs["job"] or job_settings["name"] in kwargs["job"]
+            ]
+            if not self.jobs:
+                raise ValueError("No jobs to schedule")
+
+            self.max_workers = kwargs["max_workers"]
+        except Exception as e:
+            msg = "Unable to setup config variables. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}. Exiting.".format(self.log_prefix, msg))
+            raise CommandError(msg)
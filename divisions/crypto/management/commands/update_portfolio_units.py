@@ -0,0 +1,94 @@
+import logging
+import typing
+
+from django.core.management.base import CommandError
+
+from divisions.common import enums as common_enums
+from divisions.common import utils as common_utils
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto.integrations.provider import enums as crypto_provider_enums
+from divisions.crypto.management import base as management_base
+from divisions.crypto.services import portfolio_units as portfolio_units_services
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(management_base.ProfiledCommand):
+    help = """
+            Issues and redeems portfolio units for new investor transfers at NAV of transfer moment.
+            ex. python manage.py update_portfolio_units --provider=BYBIT --wallet-type=DERIVATIVE --currency=USDT
+            """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--provider",
+            help="Provider for which portfolio units are to be updated. One of CryptoProvider enum choices.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--wallet-type",
+            help="Wallet type for which portfolio units are to be updated. One of WalletType enum choices.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--currency",
+            help="Currency in which portfolio NAV is measured. One of Currency enum choices.",
+            required=True,
+            type=str,
+        )
+
+    provider = None
+    wallet_type = None
+    currency = None
+
+    log_prefix = "[UPDATE-PORTFOLIO-UNITS]"
+
+    def handle(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self._setup_config_variables(kwargs=kwargs)
+        logger.info(
+            "{} Started command '{}' (provider={}, currency={}, wallet_type={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.provider.name,
+                self.currency.name,
+                self.wallet_type.name,
+            )
+        )
+
+        try:
+            portfolio_units_services.update_portfolio_units(
+                provider=self.provider,
+                wallet_type=self.wallet_type,
+                currency=self.currency,
+            )
+        except Exception as e:
+            msg = "Unexpected exception occurred while updating portfolio units. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}.".format(self.log_prefix, msg))
+            raise CommandError(msg)
+
+        logger.info(
+            "{} Finished command '{}' (provider={}, currency={}, wallet_type={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.provider.name,
+                self.currency.name,
+                self.wallet_type.name,
+            )
+        )
+
+    def _setup_config_variables(self, kwargs: typing.Dict) -> None:
+        try:
+            self.provider = crypto_enums.CryptoProvider(kwargs["provider"])
+            self.wallet_type = crypto_provider_enums.WalletType(kwargs["wallet_type"])
+            self.currency = common_enums.Currency(kwargs["currency"])
+        except Exception as e:
+            msg = "Unable to setup config variables. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}. Exiting.".format(self.log_prefix, msg))
+            raise CommandError(msg)
@@ -0,0 +1,105 @@
+import logging
+import typing
+
+from django.core.management.base import CommandError
+
+from divisions.common import utils as common_utils
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.management import base as management_base
+from divisions.crypto.services import position_ledger as position_ledger_services
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(management_base.ProfiledCommand):
+    help = """
+            Replays new trade executions into per instrument position ledger checkpoints.
+            ex. python manage.py update_position_ledger --provider=BYBIT --cost-basis-method=FIFO [--market-instrument=BTCUSDT]
+            """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--provider",
+            help="Provider for which position ledger is to be updated. One of CryptoProvider enum choices.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--cost-basis-method",
+            help="Cost basis method used for ledger. One of CostBasisMethod enum choices.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--market-instrument",
+            help="Market instrument for which ledger is to be updated. All provider market instruments if omitted.",
+            required=False,
+            type=str,
+        )
+
+    provider = None
+    cost_basis_method = None
+    market_instrument = None
+
+    log_prefix = "[UPDATE-POSITION-LEDGER]"
+
+    def handle(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self._setup_config_variables(kwargs=kwargs)
+        logger.info(
+            "{} Started command '{}' (provider={}, cost_basis_method={}, market_instrument={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.provider.name,
+                self.cost_basis_method.name,
+                self.market_instrument,
+            )
+        )
+
+        market_instruments = (
+            [self.market_instrument]
+            if self.market_instrument
+            else crypto_models.MarketInstrument.objects.filter(
+                provider=self.provider.to_integer_choice(),
+            )
+            .values_list("name", flat=True)
+            .iterator()
+        )
+        for market_instrument in market_instruments:
+            try:
+                position_ledger_services.update_position_ledger(
+                    provider=self.provider,
+                    instrument_name=market_instrument,
+                    cost_basis_method=self.cost_basis_method,
+                )
+            except Exception as e:
+                msg = "Unexpected exception occurred while updating position ledger (market_instrument_name={}). Error: {}".format(
+                    market_instrument,
+                    common_utils.get_exception_message(exception=e),
+                )
+                logger.exception("{} {}. Continue.".format(self.log_prefix, msg))
+
+        logger.info(
+            "{} Finished command '{}' (provider={}, cost_basis_method={}, market_instrument={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.provider.name,
+                self.cost_basis_method.name,
+                self.market_instrument,
+            )
+        )
+
+    def _setup_config_variables(self, kwargs: typing.Dict) -> None:
+        try:
+            self.provider = crypto_enums.CryptoProvider(kwargs["provider"])
+            self.cost_basis_method = crypto_enums.CostBasisMethod(
+                kwargs["cost_basis_method"]
+            )
+            self.market_instrument = kwargs["market_instrument"]
+        except Exception as e:
+            msg = "Unable to setup config variables. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}. Exiting.".format(self.log_prefix, msg))
+            raise CommandError(msg)
@@ -1,4 +1,5 @@
 import decimal
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 
 
@@ -70,10 +71,18 @@ class TradeOrder(models.Model):
     created_at = models.DateTimeField()
     updated_at = models.DateTimeField()
     provider = models.PositiveSmallIntegerField()
+    # Empty for orders imported before category was stored.
+    trading_category = models.CharField(max_length=255, null=True)
 
     class Meta:
         app_label = "crypto"
         db_table = "crypto_tradeordertransaction"
+        indexes = [
+            models.Index(
+                fields=["created_at", "id"],
+                name="crypto_order_keyset_idx",
+            )
+        ]
 
 
 class TradePnLTransaction(models.Model):
@@ -136,6 +145,12 @@ class TradeExecutionTransaction(models.Model):
     class Meta:
         app_label = "crypto"
         db_table = "crypto_tradeexecutiontransaction"
+        indexes = [
+            models.Index(
+                fields=["provider", "instrument_name", "created_at", "id"],
+                name="crypto_execution_replay_idx",
+            )
+        ]
 
 
 class PortfolioAccountProfile(models.Model):
@@ -218,3 +233,273 @@ class PortfolioWalletBalanceSnapshot(models.Model):
     class Meta:
         app_label = "crypto"
         db_table = "crypto_portfoliowalletbalance"
+
+
+class TradePnLDailyRollup(models.Model):
+    provider = models.PositiveSmallIntegerField()
+    trading_category = models.CharField(max_length=255)
+    instrument_name = models.CharField(max_length=255)
+    day = models.DateField()
+    closed_pnl = models.DecimalField(
+        decimal_places=8, max_digits=21, default=decimal.Decimal("0")
+    )
+    fees = models.DecimalField(
+        decimal_places=8, max_digits=21, default=decimal.Decimal("0")
+    )
+    volume = models.DecimalField(
+        decimal_places=8, max_digits=21, default=decimal.Decimal("0")
+    )
+    trade_count = models.PositiveIntegerField(default=0)
+    win_count = models.PositiveIntegerField(default=0)
+    loss_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "crypto"
+        db_table = "crypto_tradepnldailyrollup"
+        unique_together = ["provider", "trading_category", "instrument_name", "day"]
+
+
+class TradePositionLedgerCheckpoint(models.Model):
+    provider = models.PositiveSmallIntegerField()
+    instrument_name = models.CharField(max_length=255)
+    cost_basis_method = models.CharField(max_length=255)
+    position_quantity = models.DecimalField(
+        decimal_places=8, max_digits=21, default=decimal.Decimal("0")
+    )
+    position_cost = models.DecimalField(
+        decimal_places=8, max_digits=21, default=decimal.Decimal("0")
+    )
+    realised_pnl = models.DecimalField(
+        decimal_places=8, max_digits=21, default=decimal.Decimal("0")
+    )
+    fees = models.DecimalField(
+        decimal_places=8, max_digits=21, default=decimal.Decimal("0")
+    )
+    open_lots = models.JSONField(default=list)
+    executions_count = models.PositiveBigIntegerField(default=0)
+    last_execution_created_at = models.DateTimeField()
+    last_execution_id = models.BigIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = "crypto"
+        db_table = "crypto_tradepositionledgercheckpoint"
+        indexes = [
+            models.Index(
+                fields=[
+                    "provider",
+                    "instrument_name",
+                    "cost_basis_method",
+                    "last_execution_created_at",
+                ],
+                name="crypto_ledger_checkpoint_idx",
+            )
+        ]
+
+
+class PortfolioUnitTransaction(models.Model):
+    provider = models.PositiveSmallIntegerField()
+    portfolio_type = models.CharField(max_length=255)
+    portfolio_user = models.ForeignKey(
+        PortfolioAccountProfile,
+        on_delete=models.PROTECT,
+        related_name="portfolio_unit_transaction",
+    )
+    transfer = models.OneToOneField(
+        PortfolioTransfer,
+        on_delete=models.PROTECT,
+        related_name="portfolio_unit_transaction",
+    )
+    net_asset_value = models.DecimalField(decimal_places=8, max_digits=21)
+    unit_price = models.DecimalField(decimal_places=8, max_digits=21)
+    units = models.DecimalField(decimal_places=8, max_digits=21)
+    investor_units = models.DecimalField(decimal_places=8, max_digits=21)
+    portfolio_units = models.DecimalField(decimal_places=8, max_digits=21)
+    datetime = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = "crypto"
+        db_table = "crypto_portfoliounittransaction"
+        indexes = [
+            models.Index(
+                fields=["provider", "portfolio_type", "datetime"],
+                name="crypto_unit_tx_portfolio_idx",
+            ),
+            models.Index(
+                fields=["provider", "portfolio_type", "portfolio_user", "datetime"],
+                name="crypto_unit_tx_investor_idx",
+            ),
+        ]
+
+
+class PortfolioUnitBalance(models.Model):
+    provider = models.PositiveSmallIntegerField()
+    portfolio_type = models.CharField(max_length=255)
+    total_units = models.DecimalField(
+        decimal_places=8, max_digits=21, default=decimal.Decimal("0")
+    )
+    last_transaction_datetime = models.DateTimeField(null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "crypto"
+        db_table = "crypto_portfoliounitbalance"
+        unique_together = ["provider", "portfolio_type"]
+
+
+class PortfolioInvestorUnitBalance(models.Model):
+    provider = models.PositiveSmallIntegerField()
+    portfolio_type = models.CharField(max_length=255)
+    portfolio_user = models.ForeignKey(
+        PortfolioAccountProfile,
+        on_delete=models.PROTECT,
+        related_name="portfolio_unit_balance",
+    )
+    units = models.DecimalField(
+        decimal_places=8, max_digits=21, default=decimal.Decimal("0")
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "crypto"
+        db_table = "crypto_portfolioinvestorunitbalance"
+        unique_together = ["provider", "portfolio_type", "portfolio_user"]
+
+
+class PortfolioTransactionLogEntry(models.Model):
+    provider = models.PositiveSmallIntegerField()
+    transaction_id = models.CharField(max_length=255)
+    currency = models.CharField(max_length=255)
+    instrument_name = models.CharField(max_length=255, null=True)
+    type = models.CharField(max_length=255)
+    side = models.CharField(max_length=255, null=True)
+    quantity = models.DecimalField(
+        decimal_places=8, max_digits=21, default=decimal.Decimal("0")
+    )
+    position_size = models.DecimalField(
+        decimal_places=8, max_digits=21, default=decimal.Decimal("0")
+    )
+    price = models.DecimalField(decimal_places=8, max_digits=21, null=True)
+    funding = models.DecimalField(
+        decimal_places=8, max_digits=21, default=decimal.Decimal("0")
+    )
+    fee = models.DecimalField(
+        decimal_places=8, max_digits=21, default=decimal.Decimal("0")
+    )
+    cash_flow = models.DecimalField(
+        decimal_places=8, max_digits=21, default=decimal.Decimal("0")
+    )
+    change = models.DecimalField(
+        decimal_places=8, max_digits=21, default=decimal.Decimal("0")
+    )
+    wallet_balance = models.DecimalField(
+        decimal_places=8, max_digits=21, default=decimal.Decimal("0")
+    )
+    fee_rate = models.DecimalField(decimal_places=8, max_digits=21, null=True)
+    trade_id = models.CharField(max_length=255, null=True)
+    order_id = models.CharField(max_length=255, null=True)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        app_label = "crypto"
+        db_table = "crypto_portfoliotransactionlogentry"
+        unique_together = ["provider", "transaction_id"]
+        indexes = [
+            models.Index(
+                fields=["provider", "currency", "created_at"],
+                name="crypto_transaction_log_idx",
+            )
+        ]
+
+
+class ImportWatermark(models.Model):
+    provider = models.PositiveSmallIntegerField()
+    stream = models.CharField(max_length=255)
+    key = models.CharField(max_length=255, default="")
+    # Empty until stream brings its first record.
+    watermark = models.DateTimeField(null=True)
+    # Last import of stream that completed, also when it brought no new records.
+    last_success_at = models.DateTimeField(null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "crypto"
+        db_table = "crypto_importwatermark"
+        unique_together = ["provider", "stream", "key"]
+
+
+class ProviderRejectedRow(models.Model):
+    provider = models.PositiveSmallIntegerField()
+    data_type = models.CharField(max_length=255)
+    row_hash = models.CharField(max_length=64)
+    # Raw rows may hold Decimal values, they are stored as strings.
+    row = models.JSONField(encoder=DjangoJSONEncoder)
+    errors = models.JSONField(encoder=DjangoJSONEncoder)
+    occurrences = models.PositiveIntegerField(default=1)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_seen_at = models.DateTimeField()
+
+    class Meta:
+        app_label = "crypto"
+        db_table = "crypto_providerrejectedrow"
+        unique_together = ["provider", "data_type", "row_hash"]
+
+
+class ImportRun(models.Model):
+    provider = models.PositiveSmallIntegerField()
+    command = models.CharField(max_length=255)
+    status = models.CharField(max_length=255)
+    started_at = models.DateTimeField()
+    finished_at = models.DateTimeField(null=True)
+    # Seconds.
+    duration = models.FloatField(null=True)
+    api_calls = models.PositiveIntegerField(default=0)
+    pages = models.PositiveIntegerField(default=0)
+    rows_fetched = models.PositiveIntegerField(default=0)
+    rows_inserted = models.PositiveIntegerField(default=0)
+    rows_updated = models.PositiveIntegerField(default=0)
+    rows_skipped = models.PositiveIntegerField(default=0)
+    errors = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        app_label = "crypto"
+        db_table = "crypto_importrun"
+        indexes = [
+            models.Index(
+                fields=["provider", "command", "started_at"],
+                name="crypto_import_run_idx",
+            )
+        ]
+
+
+class ImportRunStage(models.Model):
+    run = models.ForeignKey(
+        ImportRun,
+        on_delete=models.CASCADE,
+        related_name="stages",
+    )
+    stream = models.CharField(max_length=255)
+    symbol = models.CharField(max_length=255, null=True)
+    started_at = models.DateTimeField()
+    finished_at = models.DateTimeField()
+    # Seconds.
+    duration = models.FloatField()
+    api_calls = models.PositiveIntegerField(default=0)
+    pages = models.PositiveIntegerField(default=0)
+    rows_fetched = models.PositiveIntegerField(default=0)
+    rows_inserted = models.PositiveIntegerField(default=0)
+    rows_updated = models.PositiveIntegerField(default=0)
+    rows_skipped = models.PositiveIntegerField(default=0)
+    errors = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        app_label = "crypto"
+        db_table = "crypto_importrunstage"
+        indexes = [
+            models.Index(
+                fields=["stream", "symbol", "started_at"],
+                name="crypto_import_run_stage_idx",
+            )
+        ]
@@ -0,0 +1,532 @@
+import datetime
+import typing
+
+import numpy as np
+from django.db import models as django_db_models
+
+from divisions.common import enums as common_enums
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider import columnar
+from divisions.crypto.integrations.provider import enums as provider_enums
+from divisions.crypto.integrations.provider import messages as provider_messages
+
+_SECONDS_IN_DAY = 86400
+_TRADING_DAYS_IN_YEAR = 365
+
+
+class PnLSeries(typing.NamedTuple):
+    instrument_names: np.ndarray
+    instrument_codes: np.ndarray
+    timestamps: np.ndarray
+    closed_pnl: np.ndarray
+    entry_value: np.ndarray
+
+
+class BalanceSeries(typing.NamedTuple):
+    timestamps: np.ndarray
+    amounts: np.ndarray
+
+
+def get_pnl_series(
+    provider: crypto_enums.CryptoProvider,
+    trading_category: typing.Optional[provider_enums.TradingCategory] = None,
+    symbol: typing.Optional[str] = None,
+    from_datetime: typing.Optional[datetime.datetime] = None,
+    to_datetime: typing.Optional[datetime.datetime] = None,
+) -> PnLSeries:
+    pnl_transactions_qs = crypto_models.TradePnLTransaction.objects.filter(
+        order__provider=provider.to_integer_choice(),
+    )
+
+    if trading_category:
+        pnl_transactions_qs = pnl_transactions_qs.filter(
+            order__trading_category=trading_category.name
+        )
+
+    if symbol:
+        pnl_transactions_qs = pnl_transactions_qs.filter(
+            order__instrument_name=symbol
+        )
+
+    if from_datetime:
+        pnl_transactions_qs = pnl_transactions_qs.filter(created_at__gte=from_datetime)
+
+    if to_datetime:
+        pnl_transactions_qs = pnl_transactions_qs.filter(created_at__lt=to_datetime)
+
+    pnl_rows = list(
+        pnl_transactions_qs.order_by("created_at").values_list(
+            "order__instrument_name",
+            "created_at",
+            django_db_models.functions.Cast(
+                "closed_pnl", output_field=django_db_models.FloatField()
+            ),
+            django_db_models.functions.Cast(
+                "total_entry_value", output_field=django_db_models.FloatField()
+            ),
+        )
+    )
+    if not pnl_rows:
+        return PnLSeries(
+            instrument_names=np.array([], dtype=object),
+            instrument_codes=np.array([], dtype=np.int64),
+            timestamps=np.array([], dtype=np.float64),
+            closed_pnl=np.array([], dtype=np.float64),
+            entry_value=np.array([], dtype=np.float64),
+        )
+
+    instrument_names, created_ats, closed_pnl, entry_value = zip(*pnl_rows)
+    unique_instrument_names, instrument_codes = _encode_instrument_names(
+        instrument_names=instrument_names
+    )
+    return PnLSeries(
+        instrument_names=unique_instrument_names,
+        instrument_codes=instrument_codes,
+        timestamps=np.fromiter(
+            (created_at.timestamp() for created_at in created_ats),
+            dtype=np.float64,
+            count=len(created_ats),
+        ),
+        closed_pnl=np.array(closed_pnl, dtype=np.float64),
+        entry_value=np.array(entry_value, dtype=np.float64),
+    )
+
+
+def get_pnl_series_from_batch(batch: columnar.ColumnarBatch) -> PnLSeries:
+    # Closed PnL page fetched as columnar batch, analysed without touching database.
+    timestamps = batch.get_timestamp_seconds_column("created_at")
+    sorted_order = np.argsort(timestamps, kind="stable")
+    unique_instrument_names, instrument_codes = _encode_instrument_names(
+        instrument_names=batch.columns["market_instrument_name"][sorted_order]
+    )
+    return PnLSeries(
+        instrument_names=unique_instrument_names,
+        instrument_codes=instrument_codes,
+        timestamps=timestamps[sorted_order],
+        closed_pnl=batch.get_float_column("closed_pnl")[sorted_order],
+        entry_value=batch.get_float_column("total_entry_value")[sorted_order],
+    )
+
+
+def get_balance_series(
+    provider: crypto_enums.CryptoProvider,
+    wallet_type: provider_enums.WalletType = provider_enums.WalletType.DERIVATIVE,
+    currency: common_enums.Currency = common_enums.Currency.USDT,
+    to_datetime: typing.Optional[datetime.datetime] = None,
+) -> BalanceSeries:
+    balance_snapshots_qs = crypto_models.PortfolioWalletBalanceSnapshot.objects.filter(
+        provider=provider.to_integer_choice(),
+        portfolio_type=wallet_type.name,
+        currency=currency.value,
+    )
+
+    if to_datetime:
+        balance_snapshots_qs = balance_snapshots_qs.filter(created_at__lt=to_datetime)
+
+    balance_rows = list(
+        balance_snapshots_qs.order_by("created_at").values_list(
+            "created_at",
+            django_db_models.functions.Cast(
+                "amount", output_field=django_db_models.FloatField()
+            ),
+        )
+    )
+    if not balance_rows:
+        return BalanceSeries(
+            timestamps=np.array([], dtype=np.float64),
+            amounts=np.array([], dtype=np.float64),
+        )
+
+    created_ats, amounts = zip(*balance_rows)
+    return BalanceSeries(
+        timestamps=np.fromiter(
+            (created_at.timestamp() for created_at in created_ats),
+            dtype=np.float64,
+            count=len(created_ats),
+        ),
+        amounts=np.array(amounts, dtype=np.float64),
+    )
+
+
+def get_portfolio_performance_report(
+    provider: crypto_enums.CryptoProvider,
+    trading_category: provider_enums.TradingCategory,
+    aggregation_period: crypto_enums.AggregationPeriod,
+    symbol: typing.Optional[str] = None,
+    from_datetime: typing.Optional[datetime.datetime] = None,
+    to_datetime: typing.Optional[datetime.datetime] = None,
+    wallet_type: provider_enums.WalletType = provider_enums.WalletType.DERIVATIVE,
+    currency: common_enums.Currency = common_enums.Currency.USDT,
+) -> provider_messages.PortfolioPerformanceReport:
+    return calculate_performance_report(
+        pnl_series=get_pnl_series(
+            provider=provider,
+            trading_category=trading_category,
+            symbol=symbol,
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+        ),
+        balance_series=get_balance_series(
+            provider=provider,
+            wallet_type=wallet_type,
+            currency=currency,
+            to_datetime=to_datetime,
+        ),
+        provider=provider,
+        trading_category=trading_category,
+        aggregation_period=aggregation_period,
+    )
+
+
+def calculate_performance_report(
+    pnl_series: PnLSeries,
+    balance_series: BalanceSeries,
+    provider: crypto_enums.CryptoProvider,
+    trading_category: provider_enums.TradingCategory,
+    aggregation_period: crypto_enums.AggregationPeriod,
+) -> provider_messages.PortfolioPerformanceReport:
+    if not pnl_series.closed_pnl.size:
+        return provider_messages.PortfolioPerformanceReport(
+            provider=provider,
+            trading_category=trading_category,
+            aggregation_period=aggregation_period,
+            portfolio=None,
+            instruments=[],
+            periods=[],
+        )
+
+    trade_days = np.floor(pnl_series.timestamps / _SECONDS_IN_DAY).astype(np.int64)
+    first_day = trade_days[0]
+    days = np.arange(first_day, trade_days[-1] + 1)
+    trade_day_indexes = trade_days - first_day
+    instruments_count = pnl_series.instrument_names.size
+
+    # Instrument x day matrix of closed PnL, days without closed trades stay 0.
+    daily_pnl = np.bincount(
+        pnl_series.instrument_codes * days.size + trade_day_indexes,
+        weights=pnl_series.closed_pnl,
+        minlength=instruments_count * days.size,
+    ).reshape(instruments_count, days.size)
+    portfolio_daily_pnl = daily_pnl.sum(axis=0)
+
+    daily_capital = _get_daily_capital(days=days, balance_series=balance_series)
+    daily_returns = daily_pnl / daily_capital
+    portfolio_daily_returns = portfolio_daily_pnl / daily_capital
+
+    period_keys = _get_period_keys(days=days, aggregation_period=aggregation_period)
+    unique_period_keys, day_period_indexes = np.unique(period_keys, return_inverse=True)
+    period_starts = _get_period_starts(
+        period_keys=unique_period_keys, aggregation_period=aggregation_period
+    )
+    trade_period_indexes = day_period_indexes[trade_day_indexes]
+
+    portfolio_trade_stats = _get_trade_stats(
+        closed_pnl=pnl_series.closed_pnl,
+        entry_value=pnl_series.entry_value,
+        group_indexes=np.zeros(pnl_series.closed_pnl.size, dtype=np.int64),
+        groups_count=1,
+    )
+    instrument_trade_stats = _get_trade_stats(
+        closed_pnl=pnl_series.closed_pnl,
+        entry_value=pnl_series.entry_value,
+        group_indexes=pnl_series.instrument_codes,
+        groups_count=instruments_count,
+    )
+    period_trade_stats = _get_trade_stats(
+        closed_pnl=pnl_series.closed_pnl,
+        entry_value=pnl_series.entry_value,
+        group_indexes=trade_period_indexes,
+        groups_count=unique_period_keys.size,
+    )
+
+    single_segment = np.zeros(days.size, dtype=np.int64)
+    portfolio_risk_stats = _get_risk_stats(
+        daily_pnl=portfolio_daily_pnl[np.newaxis, :],
+        daily_returns=portfolio_daily_returns[np.newaxis, :],
+        segment_indexes=single_segment,
+        segments_count=1,
+    )
+    instrument_risk_stats = _get_risk_stats(
+        daily_pnl=daily_pnl,
+        daily_returns=daily_returns,
+        segment_indexes=single_segment,
+        segments_count=1,
+    )
+    period_risk_stats = _get_risk_stats(
+        daily_pnl=portfolio_daily_pnl[np.newaxis, :],
+        daily_returns=portfolio_daily_returns[np.newaxis, :],
+        segment_indexes=day_period_indexes,
+        segments_count=unique_period_keys.size,
+    )
+
+    total_exposure = portfolio_trade_stats["exposure"][0]
+    return provider_messages.PortfolioPerformanceReport(
+        provider=provider,
+        trading_category=trading_category,
+        aggregation_period=aggregation_period,
+        portfolio=_build_performance_metrics(
+            trade_stats=portfolio_trade_stats,
+            risk_stats=portfolio_risk_stats,
+            index=0,
+            total_exposure=total_exposure,
+            provider=provider,
+            trading_category=trading_category,
+        ),
+        instruments=[
+            _build_performance_metrics(
+                trade_stats=instrument_trade_stats,
+                risk_stats=instrument_risk_stats,
+                index=index,
+                total_exposure=total_exposure,
+                provider=provider,
+                trading_category=trading_category,
+                market_instrument_name=instrument_name,
+            )
+            for index, instrument_name in enumerate(pnl_series.instrument_names)
+        ],
+        periods=[
+            _build_performance_metrics(
+                trade_stats=period_trade_stats,
+                risk_stats=period_risk_stats,
+                index=index,
+                total_exposure=total_exposure,
+                provider=provider,
+                trading_category=trading_category,
+                period_start=period_start,
+            )
+            for index, period_start in enumerate(period_starts)
+        ],
+    )
+
+
+def _encode_instrument_names(
+    instrument_names: typing.Sequence[str],
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    # Dict lookups are much cheaper than np.unique sorting millions of Python strings.
+    instrument_codes_map = {}
+    instrument_codes = np.fromiter(
+        (
+            instrument_codes_map.setdefault(instrument_name, len(instrument_codes_map))
+            for instrument_name in instrument_names
+        ),
+        dtype=np.int64,
+        count=len(instrument_names),
+    )
+    unique_instrument_names = np.array(list(instrument_codes_map), dtype=object)
+    sorted_order = np.argsort(unique_instrument_names)
+    sorted_codes = np.empty_like(sorted_order)
+    sorted_codes[sorted_order] = np.arange(sorted_order.size)
+    return unique_instrument_names[sorted_order], sorted_codes[instrument_codes]
+
+
+def _get_daily_capital(days: np.ndarray, balance_series: BalanceSeries) -> np.ndarray:
+    # Returns are PnL relative to the last known balance before the day started.
+    # Without balances the capital is 1 and ratios are computed on raw PnL.
+    if not balance_series.amounts.size:
+        return np.ones(days.size, dtype=np.float64)
+
+    balance_indexes = (
+        np.searchsorted(
+            balance_series.timestamps, days * _SECONDS_IN_DAY, side="right"
+        )
+        - 1
+    )
+    daily_capital = balance_series.amounts[np.clip(balance_indexes, 0, None)]
+    return np.where(daily_capital > 0, daily_capital, np.nan)
+
+
+def _get_period_keys(
+    days: np.ndarray, aggregation_period: crypto_enums.AggregationPeriod
+) -> np.ndarray:
+    if aggregation_period == crypto_enums.AggregationPeriod.DAY:
+        return days
+
+    if aggregation_period == crypto_enums.AggregationPeriod.WEEK:
+        # 1970-01-01 was a Thursday, shift so weeks start on Monday.
+        return days - (days + 3) % 7
+
+    calendar_unit = {
+        crypto_enums.AggregationPeriod.MONTH: "M",
+        crypto_enums.AggregationPeriod.YEAR: "Y",
+    }[aggregation_period]
+    return (
+        days.astype("datetime64[D]")
+        .astype("datetime64[{}]".format(calendar_unit))
+        .astype(np.int64)
+    )
+
+
+def _get_period_starts(
+    period_keys: np.ndarray, aggregation_period: crypto_enums.AggregationPeriod
+) -> typing.List[datetime.date]:
+    calendar_unit = {
+        crypto_enums.AggregationPeriod.DAY: "D",
+        crypto_enums.AggregationPeriod.WEEK: "D",
+        crypto_enums.AggregationPeriod.MONTH: "M",
+        crypto_enums.AggregationPeriod.YEAR: "Y",
+    }[aggregation_period]
+    return (
+        period_keys.astype("datetime64[{}]".format(calendar_unit))
+        .astype("datetime64[D]")
+        .tolist()
+    )
+
+
+def _get_trade_stats(
+    closed_pnl: np.ndarray,
+    entry_value: np.ndarray,
+    group_indexes: np.ndarray,
+    groups_count: int,
+) -> typing.Dict[str, np.ndarray]:
+    wins = closed_pnl > 0
+    losses = closed_pnl < 0
+    trade_count = np.bincount(group_indexes, minlength=groups_count)
+    win_count = np.bincount(group_indexes, weights=wins, minlength=groups_count)
+    loss_count = np.bincount(group_indexes, weights=losses, minlength=groups_count)
+    gross_profit = np.bincount(
+        group_indexes, weights=np.where(wins, closed_pnl, 0), minlength=groups_count
+    )
+    gross_loss = -np.bincount(
+        group_indexes, weights=np.where(losses, closed_pnl, 0), minlength=groups_count
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {
+            "trade_count": trade_count,
+            "pnl": gross_profit - gross_loss,
+            "win_rate": np.where(trade_count > 0, win_count / trade_count, np.nan),
+            "average_win": np.where(win_count > 0, gross_profit / win_count, np.nan),
+            "average_loss": np.where(
+                loss_count > 0, -gross_loss / loss_count, np.nan
+            ),
+            "profit_factor": np.where(
+                gross_loss > 0, gross_profit / gross_loss, np.nan
+            ),
+            "exposure": np.bincount(
+                group_indexes, weights=np.abs(entry_value), minlength=groups_count
+            ),
+        }
+
+
+def _get_risk_stats(
+    daily_pnl: np.ndarray,
+    daily_returns: np.ndarray,
+    segment_indexes: np.ndarray,
+    segments_count: int,
+) -> typing.Dict[str, np.ndarray]:
+    # Every row of daily_pnl/daily_returns is a series, segment_indexes splits the
+    # (sorted) days into consecutive segments which are evaluated independently.
+    rows_count, days_count = daily_pnl.shape
+    segment_starts = np.searchsorted(segment_indexes, np.arange(segments_count))
+    returns = np.nan_to_num(daily_returns)
+
+    def segment_sum(values: np.ndarray) -> np.ndarray:
+        return np.add.reduceat(values, segment_starts, axis=1)
+
+    days_in_segment = np.diff(np.append(segment_starts, days_count))
+    returns_sum = segment_sum(returns)
+    returns_mean = returns_sum / days_in_segment
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns_variance = (
+            segment_sum(returns ** 2) - days_in_segment * returns_mean ** 2
+        ) / (days_in_segment - 1)
+        returns_std = np.sqrt(np.clip(returns_variance, 0, None))
+        downside_deviation = np.sqrt(
+            segment_sum(np.minimum(returns, 0) ** 2) / days_in_segment
+        )
+        annualization = np.sqrt(_TRADING_DAYS_IN_YEAR)
+        sharpe_ratio = np.where(
+            (returns_std > 0) & (days_in_segment > 1),
+            returns_mean / returns_std * annualization,
+            np.nan,
+        )
+        sortino_ratio = np.where(
+            downside_deviation > 0,
+            returns_mean / downside_deviation * annualization,
+            np.nan,
+        )
+
+    # Equity curve restarts at 0 in every segment. Shifting each segment by a
+    # constant larger than the whole PnL range keeps np.maximum.accumulate from
+    # carrying peaks over segment borders, so one pass serves all segments.
+    cumulative_pnl = np.cumsum(daily_pnl, axis=1)
+    segment_offsets = np.concatenate(
+        [np.zeros((rows_count, 1)), cumulative_pnl[:, :-1]], axis=1
+    )[:, segment_starts][:, segment_indexes]
+    segment_equity = cumulative_pnl - segment_offsets
+    segment_shift = (
+        2 * (max(segment_equity.max(), 0) - min(segment_equity.min(), 0)) + 1
+    ) * segment_indexes
+    shifted_equity = segment_equity + segment_shift
+    running_peak = np.maximum.accumulate(
+        np.maximum(shifted_equity, segment_shift), axis=1
+    )
+    drawdown = shifted_equity - running_peak
+
+    underwater = drawdown < 0
+    day_indexes = np.arange(days_count)
+    is_segment_start = np.zeros(days_count, dtype=bool)
+    is_segment_start[segment_starts] = True
+    last_peak_indexes = np.maximum.accumulate(
+        np.where(
+            ~underwater,
+            day_indexes,
+            np.where(is_segment_start, day_indexes - 1, -1),
+        ),
+        axis=1,
+    )
+    drawdown_duration = np.where(underwater, day_indexes - last_peak_indexes, 0)
+
+    return {
+        "sharpe_ratio": sharpe_ratio,
+        "sortino_ratio": sortino_ratio,
+        "max_drawdown": np.minimum.reduceat(drawdown, segment_starts, axis=1),
+        "max_drawdown_duration": np.maximum.reduceat(
+            drawdown_duration, segment_starts, axis=1
+        ),
+    }
+
+
+def _build_performance_metrics(
+    trade_stats: typing.Dict[str, np.ndarray],
+    risk_stats: typing.Dict[str, np.ndarray],
+    index: int,
+    total_exposure: float,
+    provider: crypto_enums.CryptoProvider,
+    trading_category: provider_enums.TradingCategory,
+    market_instrument_name: typing.Optional[str] = None,
+    period_start: typing.Optional[datetime.date] = None,
+) -> provider_messages.TradePerformanceMetrics:
+    # Instrument stats are single segment rows, period stats are segments of one row.
+    risk_row, risk_column = (index, 0) if market_instrument_name else (0, index)
+
+    def to_optional_float(value: float) -> typing.Optional[float]:
+        return None if np.isnan(value) else float(value)
+
+    return provider_messages.TradePerformanceMetrics(
+        market_instrument_name=market_instrument_name,
+        provider=provider,
+        trading_category=trading_category,
+        period_start=period_start,
+        trade_count=int(trade_stats["trade_count"][index]),
+        pnl=float(trade_stats["pnl"][index]),
+        win_rate=to_optional_float(trade_stats["win_rate"][index]),
+        average_win=to_optional_float(trade_stats["average_win"][index]),
+        average_loss=to_optional_float(trade_stats["average_loss"][index]),
+        profit_factor=to_optional_float(trade_stats["profit_factor"][index]),
+        sharpe_ratio=to_optional_float(
+            risk_stats["sharpe_ratio"][risk_row, risk_column]
+        ),
+        sortino_ratio=to_optional_float(
+            risk_stats["sortino_ratio"][risk_row, risk_column]
+        ),
+        max_drawdown=float(risk_stats["max_drawdown"][risk_row, risk_column]),
+        max_drawdown_duration=int(
+            risk_stats["max_drawdown_duration"][risk_row, risk_column]
+        ),
+        exposure=float(trade_stats["exposure"][index]),
+        exposure_share=float(trade_stats["exposure"][index] / total_exposure)
+        if total_exposure
+        else None,
+    )
@@ -0,0 +1,89 @@
+import datetime
+import logging
+import time
+import typing
+
+import numpy as np
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto.integrations.provider import enums as provider_enums
+from divisions.crypto.services import analytics as analytics_services
+
+logger = logging.getLogger(__name__)
+
+_LOG_PREFIX = "[ANALYTICS-BENCHMARK]"
+
+_STARTED_AT = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+_SECONDS_IN_DAY = 86400
+
+
+def get_synthetic_series(
+    years: int, symbols_count: int, trades_count: int, seed: int = 0
+) -> typing.Tuple[analytics_services.PnLSeries, analytics_services.BalanceSeries]:
+    # Closed trades spread uniformly over days and symbols, balance snapshot every day.
+    random_generator = np.random.default_rng(seed)
+    days_count = years * 365
+    first_timestamp = _STARTED_AT.timestamp()
+    pnl_series = analytics_services.PnLSeries(
+        instrument_names=np.array(
+            ["SYN{}USDT".format(index) for index in range(symbols_count)], dtype=object
+        ),
+        instrument_codes=random_generator.integers(0, symbols_count, trades_count),
+        timestamps=np.sort(
+            random_generator.uniform(
+                first_timestamp,
+                first_timestamp + days_count * _SECONDS_IN_DAY,
+                trades_count,
+            )
+        ),
+        closed_pnl=random_generator.normal(0, 10, trades_count),
+        entry_value=random_generator.uniform(10, 1000, trades_count),
+    )
+    balance_series = analytics_services.BalanceSeries(
+        timestamps=first_timestamp
+        + np.arange(days_count, dtype=np.float64) * _SECONDS_IN_DAY,
+        amounts=np.full(days_count, 100000.0),
+    )
+    return pnl_series, balance_series
+
+
+def run_performance_report_benchmark(
+    pnl_series: analytics_services.PnLSeries,
+    balance_series: analytics_services.BalanceSeries,
+    repeat: int = 3,
+) -> typing.List[dict]:
+    results = []
+    for aggregation_period in crypto_enums.AggregationPeriod:
+        wall_times = []
+        for _ in range(repeat):
+            started_at = time.perf_counter()
+            analytics_services.calculate_performance_report(
+                pnl_series=pnl_series,
+                balance_series=balance_series,
+                provider=crypto_enums.CryptoProvider.BYBIT,
+                trading_category=provider_enums.TradingCategory.LINEAR,
+                aggregation_period=aggregation_period,
+            )
+            wall_times.append(time.perf_counter() - started_at)
+
+        # Best of repeats, least disturbed by GC and other processes.
+        wall_time = min(wall_times)
+        result = {
+            "aggregation_period": aggregation_period.name,
+            "trades": int(pnl_series.closed_pnl.size),
+            "symbols": int(pnl_series.instrument_names.size),
+            "days": int(balance_series.amounts.size),
+            "wall_time": round(wall_time, 3),
+            "trades_per_second": round(pnl_series.closed_pnl.size / wall_time, 1),
+        }
+        logger.info(
+            "{} Finished (aggregation_period={}, trades={}, wall_time={}s).".format(
+                _LOG_PREFIX,
+                aggregation_period.name,
+                result["trades"],
+                result["wall_time"],
+            )
+        )
+        results.append(result)
+
+    return results
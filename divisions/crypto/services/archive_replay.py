@@ -0,0 +1,256 @@
+import collections
+import concurrent.futures
+import datetime
+import logging
+import typing
+
+import simplejson
+
+from django import db
+
+from divisions.blockchain.integrations.clients.bybit import archive as response_archive
+from divisions.blockchain.integrations.clients.bybit import (
+    client as rest_api_client,
+)
+from divisions.blockchain.integrations.clients.bybit import enums as bybit_enums
+from divisions.blockchain.integrations.clients.bybit import (
+    exceptions as rest_api_client_exceptions,
+)
+from divisions.common import enums as common_enums
+from divisions.common import utils as common_utils
+from divisions.crypto.integrations.provider import enums as provider_enums
+from divisions.crypto.integrations.provider.bybit import client as bybit_client
+from divisions.crypto.integrations.provider.services import (
+    data_importer as data_importer_services,
+)
+
+logger = logging.getLogger(__name__)
+
+_LOG_PREFIX = "[ARCHIVE-REPLAY]"
+
+_ORDERS_ENDPOINT = "/v5/order/history"
+_EXECUTIONS_ENDPOINT = "/v5/execution/list"
+_PNL_ENDPOINT = "/v5/position/closed-pnl"
+_TRANSACTIONS_ENDPOINT = "/v5/account/transaction-log"
+
+# Orders are replayed before anything else, executions and PnL rows are linked to
+# orders already stored.
+REPLAY_PHASES = [
+    [_ORDERS_ENDPOINT],
+    [_EXECUTIONS_ENDPOINT, _PNL_ENDPOINT, _TRANSACTIONS_ENDPOINT],
+]
+
+_EMPTY_PAGE = simplejson.dumps(
+    {"retCode": 0, "retMsg": "OK", "result": {"list": [], "nextPageCursor": ""}}
+).encode("utf-8")
+
+
+class _ArchivedResponse(object):
+    # Only response attributes REST API client reads once request succeeded.
+    status_code = 200
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+
+class ArchiveReplayClient(rest_api_client.ByBitClient):
+    """
+    REST API client serving archived pages instead of requesting API. Every request
+    returns next of given archived pages, once they run out an empty page.
+    """
+
+    def __init__(
+        self,
+        archive: response_archive.ResponseArchive,
+        entries: typing.Sequence[response_archive.ArchiveEntry],
+    ):
+        super().__init__()
+        # Replayed pages are not archived again.
+        self.archive = None
+        self._replay_archive = archive
+        self._entries = collections.deque(entries)
+
+    def _request(
+        self,
+        endpoint: str,
+        method: common_enums.HttpMethod,
+        params: typing.Optional[dict] = None,
+        payload: typing.Optional[dict] = None,
+    ) -> _ArchivedResponse:
+        with self._counts_lock:
+            self.request_count += 1
+        if not self._entries:
+            return _ArchivedResponse(content=_EMPTY_PAGE)
+
+        entry = self._entries.popleft()
+        if entry.endpoint != endpoint:
+            msg = "Archived page endpoint does not match request (archived_endpoint={}, endpoint={})".format(
+                entry.endpoint, endpoint
+            )
+            logger.error("{} {}.".format(_LOG_PREFIX, msg))
+            raise rest_api_client_exceptions.ByBitClientError(msg)
+
+        return _ArchivedResponse(content=self._replay_archive.read(entry=entry))
+
+
+def replay_archive(
+    archive_dir: str,
+    processes: int = 4,
+    pages_per_task: int = 50,
+    from_datetime: typing.Optional[datetime.datetime] = None,
+    to_datetime: typing.Optional[datetime.datetime] = None,
+    tolerant_validation: bool = False,
+    dry_run: bool = False,
+) -> typing.Dict[str, int]:
+    """
+    Replays archived pages fetched between from_datetime and to_datetime into
+    importer, phase by phase, spread over worker processes. Returns number of
+    replayed and failed pages.
+    """
+    archive = response_archive.ResponseArchive(directory=archive_dir)
+    replay_counts = {"replayed": 0, "failed": 0}
+    for endpoints in REPLAY_PHASES:
+        entries = sorted(
+            (
+                entry
+                for entry in archive.iter_entries(endpoints=endpoints)
+                if _is_fetched_between(
+                    entry=entry, from_datetime=from_datetime, to_datetime=to_datetime
+                )
+            ),
+            key=lambda entry: entry.fetched_at,
+        )
+        if not entries:
+            continue
+
+        logger.info(
+            "{} Replaying {} archived pages (endpoints={}, processes={}).".format(
+                _LOG_PREFIX, len(entries), endpoints, processes
+            )
+        )
+        tasks = [
+            entries[i : i + pages_per_task]
+            for i in range(0, len(entries), pages_per_task)
+        ]
+        # Forked workers must not share parent database connections.
+        db.connections.close_all()
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=processes, initializer=db.connections.close_all
+        ) as executor:
+            for task_counts in executor.map(
+                replay_entries,
+                [archive_dir] * len(tasks),
+                tasks,
+                [tolerant_validation] * len(tasks),
+                [dry_run] * len(tasks),
+            ):
+                for key, count in task_counts.items():
+                    replay_counts[key] += count
+
+    return replay_counts
+
+
+def replay_entries(
+    archive_dir: str,
+    entries: typing.Sequence[response_archive.ArchiveEntry],
+    tolerant_validation: bool = False,
+    dry_run: bool = False,
+) -> typing.Dict[str, int]:
+    archive = response_archive.ResponseArchive(directory=archive_dir)
+    replay_counts = {"replayed": 0, "failed": 0}
+    for entry in entries:
+        provider_client = bybit_client.ByBitProvider()
+        provider_client._rest_api_client = ArchiveReplayClient(
+            archive=archive, entries=[entry]
+        )
+        importer = data_importer_services.CryptoProviderImporter(
+            provider_client=provider_client,
+            tolerant_validation=tolerant_validation,
+        )
+        try:
+            _replay_entry(importer=importer, entry=entry, dry_run=dry_run)
+        except Exception as e:
+            msg = "Unable to replay archived page (endpoint={}, path={}). Error: {}".format(
+                entry.endpoint,
+                entry.path,
+                common_utils.get_exception_message(exception=e),
+            )
+            logger.exception("{} {}. Continue.".format(_LOG_PREFIX, msg))
+            replay_counts["failed"] += 1
+            continue
+
+        replay_counts["replayed"] += 1
+
+    return replay_counts
+
+
+def _replay_entry(
+    importer: data_importer_services.CryptoProviderImporter,
+    entry: response_archive.ArchiveEntry,
+    dry_run: bool,
+) -> None:
+    # Importer is called with arguments archived request was made with, one page
+    # at a time. Pages without window are replayed from epoch to fetch time.
+    params = entry.params
+    from_datetime = _from_milliseconds(milliseconds=entry.window_start or 0)
+    to_datetime = _from_milliseconds(milliseconds=entry.window_end or entry.fetched_at)
+    if entry.endpoint == _ORDERS_ENDPOINT:
+        importer.import_trade_orders(
+            trading_category=provider_enums.TradingCategory(params["category"]),
+            market_instrument_symbol=params.get("symbol"),
+            dry_run=dry_run,
+        )
+    elif entry.endpoint == _EXECUTIONS_ENDPOINT:
+        importer.import_trade_execution_transactions(
+            trading_category=provider_enums.TradingCategory(params["category"]),
+            market_instrument_symbol=params["symbol"],
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+            dry_run=dry_run,
+        )
+    elif entry.endpoint == _PNL_ENDPOINT:
+        importer.import_trade_pnl_transactions(
+            trading_category=provider_enums.TradingCategory(params["category"]),
+            market_instrument_symbol=params["symbol"],
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+            dry_run=dry_run,
+        )
+    elif entry.endpoint == _TRANSACTIONS_ENDPOINT:
+        # Archived page is loaded as it is, a full page would otherwise be taken
+        # for a truncated window and refetched (empty) in halves.
+        importer.import_transactions_page(
+            wallet_type=provider_enums.WalletType.convert_from_internal(
+                wallet_type=bybit_enums.AccountType(params["accountType"])
+            ),
+            depth=1,
+            currency=common_enums.Currency(params["currency"])
+            if params.get("currency")
+            else None,
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+            dry_run=dry_run,
+        )
+    else:
+        raise ValueError("Endpoint {} can not be replayed".format(entry.endpoint))
+
+
+def _is_fetched_between(
+    entry: response_archive.ArchiveEntry,
+    from_datetime: typing.Optional[datetime.datetime],
+    to_datetime: typing.Optional[datetime.datetime],
+) -> bool:
+    fetched_at = _from_milliseconds(milliseconds=entry.fetched_at)
+    if from_datetime and fetched_at < from_datetime:
+        return False
+
+    if to_datetime and fetched_at >= to_datetime:
+        return False
+
+    return True
+
+
+def _from_milliseconds(milliseconds: int) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(
+        milliseconds / 1000, tz=datetime.timezone.utc
+    )
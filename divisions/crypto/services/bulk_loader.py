@@ -0,0 +1,133 @@
+import csv
+import io
+import logging
+import typing
+
+from django.db import connection
+from django.db import models as django_db_models
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+_LOG_PREFIX = "[BULK-LOADER]"
+_COPY_NULL = "\\N"
+
+
+def bulk_insert(
+    model: typing.Type[django_db_models.Model],
+    field_names: typing.Sequence[str],
+    rows: typing.Sequence[typing.Sequence[typing.Any]],
+    conflict_field_names: typing.Optional[typing.Sequence[str]] = None,
+) -> int:
+    """
+    Inserts rows skipping the ones conflicting on conflict_field_names, all rows
+    are inserted when no conflict_field_names are given.
+    On PostgreSQL rows are streamed with COPY into a temporary table and moved
+    with INSERT .. ON CONFLICT DO NOTHING, returning the number of inserted rows.
+    Other backends fall back to bulk_create, inserted rows are counted from table
+    row count before and after it (test and local databases, not for concurrent
+    writers).
+    """
+    if not rows:
+        return 0
+
+    if connection.vendor == "postgresql":
+        return _copy_insert(
+            model=model,
+            field_names=field_names,
+            rows=rows,
+            conflict_field_names=conflict_field_names,
+        )
+
+    with transaction.atomic():
+        # bulk_create reports every row sent, also the ones skipped by conflicts.
+        count_before = model.objects.count()
+        model.objects.bulk_create(
+            [model(**dict(zip(field_names, row))) for row in rows],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+        return model.objects.count() - count_before
+
+
+def bulk_insert_columns(
+    model: typing.Type[django_db_models.Model],
+    columns: typing.Dict[str, typing.Sequence[typing.Any]],
+    conflict_field_names: typing.Optional[typing.Sequence[str]] = None,
+) -> int:
+    """
+    Same as bulk_insert for data held by column (field name -> values), e.g.
+    columnar batch database columns. Columns are zipped into rows while writing,
+    no intermediate messages are built.
+    """
+    return bulk_insert(
+        model=model,
+        field_names=list(columns),
+        rows=list(zip(*columns.values())),
+        conflict_field_names=conflict_field_names,
+    )
+
+
+def _copy_insert(
+    model: typing.Type[django_db_models.Model],
+    field_names: typing.Sequence[str],
+    rows: typing.Sequence[typing.Sequence[typing.Any]],
+    conflict_field_names: typing.Optional[typing.Sequence[str]],
+) -> int:
+    table_name = model._meta.db_table
+    staging_table_name = "{}_staging".format(table_name)
+    columns = [model._meta.get_field(field_name).column for field_name in field_names]
+    quoted_columns = ", ".join(connection.ops.quote_name(column) for column in columns)
+    on_conflict = ""
+    if conflict_field_names:
+        on_conflict = " ON CONFLICT ({}) DO NOTHING".format(
+            ", ".join(
+                connection.ops.quote_name(model._meta.get_field(field_name).column)
+                for field_name in conflict_field_names
+            )
+        )
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_COPY_NULL if value is None else value for value in row])
+    buffer.seek(0)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE TEMPORARY TABLE {staging} ON COMMIT DROP AS"
+            " SELECT {columns} FROM {table} WITH NO DATA".format(
+                staging=connection.ops.quote_name(staging_table_name),
+                columns=quoted_columns,
+                table=connection.ops.quote_name(table_name),
+            )
+        )
+        cursor.copy_expert(
+            "COPY {staging} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{null}')".format(
+                staging=connection.ops.quote_name(staging_table_name),
+                columns=quoted_columns,
+                null=_COPY_NULL,
+            ),
+            buffer,
+        )
+        cursor.execute(
+            "INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging}{on_conflict}".format(
+                table=connection.ops.quote_name(table_name),
+                columns=quoted_columns,
+                staging=connection.ops.quote_name(staging_table_name),
+                on_conflict=on_conflict,
+            )
+        )
+        inserted_count = cursor.rowcount
+        cursor.execute(
+            "DROP TABLE {staging}".format(
+                staging=connection.ops.quote_name(staging_table_name)
+            )
+        )
+
+    logger.debug(
+        "{} Copied {} rows into {} ({} inserted).".format(
+            _LOG_PREFIX, len(rows), table_name, inserted_count
+        )
+    )
+    return inserted_count
@@ -0,0 +1,236 @@
+import collections
+import gzip
+import itertools
+import logging
+import time
+import typing
+
+import simplejson
+
+from divisions.blockchain.integrations.clients.bybit import (
+    client as rest_api_client,
+)
+from divisions.crypto.integrations.provider import enums as provider_enums
+from divisions.crypto.integrations.provider.bybit import client as bybit_client
+from divisions.crypto.integrations.provider.bybit import converters
+from divisions.crypto.services import synthetic_data as synthetic_data_services
+
+logger = logging.getLogger(__name__)
+
+_LOG_PREFIX = "[CONVERSION-BENCHMARK]"
+
+# Page name -> (API endpoint, provider method, provider method arguments, converter).
+_PAGES = {
+    "orders": (
+        "/v5/order/history",
+        "get_trade_orders",
+        {"trading_category": provider_enums.TradingCategory.LINEAR},
+        converters.TRADE_ORDERS,
+    ),
+    "executions": (
+        "/v5/execution/list",
+        "get_trade_executions",
+        {
+            "trading_category": provider_enums.TradingCategory.LINEAR,
+            "market_instrument_symbol": "SYN0USDT",
+        },
+        converters.TRADE_EXECUTIONS,
+    ),
+    "pnl": (
+        "/v5/position/closed-pnl",
+        "get_trade_positions_profit_and_loss",
+        {
+            "trading_category": provider_enums.TradingCategory.LINEAR,
+            "market_instrument_symbol": "SYN0USDT",
+        },
+        converters.TRADE_PNL_POSITIONS,
+    ),
+}
+
+
+class _PageReplayClient(object):
+    # Stands in for REST API client, every request returns the same recorded page.
+    def __init__(self, page: typing.List[dict]):
+        self.page = page
+
+    def get_trade_orders(self, **kwargs: typing.Any) -> typing.List[dict]:
+        return self.page
+
+    def get_trade_executions(self, **kwargs: typing.Any) -> typing.List[dict]:
+        return self.page
+
+    def get_trade_positions_profit_and_loss(
+        self, **kwargs: typing.Any
+    ) -> typing.List[dict]:
+        return self.page
+
+
+class _RecordedResponse(object):
+    # Only response attribute REST API client reads when decoding.
+    def __init__(self, content: bytes):
+        self.content = content
+
+
+def get_synthetic_pages(
+    rows_count: int, seed: int = 0
+) -> typing.Dict[str, typing.List[dict]]:
+    generator = synthetic_data_services.SyntheticTradingDataGenerator(seed=seed)
+    return _get_pages(
+        api_pages=synthetic_data_services.iter_api_pages(
+            events=generator.iter_events(executions_count=rows_count),
+            page_size=rows_count,
+        ),
+        rows_count=rows_count,
+    )
+
+
+def get_recorded_pages(
+    path: str, rows_count: int
+) -> typing.Dict[str, typing.List[dict]]:
+    # Pages recorded as JSON lines of {"endpoint": ..., "response": ...}, same as
+    # generate_synthetic_data api-pages output.
+    open_pages = gzip.open if path.endswith(".gz") else open
+    with open_pages(path, "rt") as f:
+        return _get_pages(
+            api_pages=(simplejson.loads(line) for line in f), rows_count=rows_count
+        )
+
+
+def _get_pages(
+    api_pages: typing.Iterable[dict], rows_count: int
+) -> typing.Dict[str, typing.List[dict]]:
+    endpoints = [endpoint for endpoint, _, _, _ in _PAGES.values()]
+    records = collections.defaultdict(list)
+    for api_page in api_pages:
+        if api_page["endpoint"] in endpoints:
+            records[api_page["endpoint"]].extend(
+                api_page["response"]["result"]["list"]
+            )
+
+    # Orders and PnL rows are less frequent than executions, they are repeated so
+    # every page has exactly rows_count rows.
+    return {
+        page_name: list(
+            itertools.islice(itertools.cycle(records[endpoint]), rows_count)
+        )
+        for page_name, (endpoint, _, _, _) in _PAGES.items()
+        if records[endpoint]
+    }
+
+
+def run_conversion_benchmark(
+    pages: typing.Dict[str, typing.List[dict]], repeat: int = 3
+) -> typing.List[dict]:
+    results = []
+    for page_name, page in pages.items():
+        _, method_name, method_kwargs, _ = _PAGES[page_name]
+        page_messages = {}
+        for path, use_fast_converters in (("marshmallow", False), ("fast", True)):
+            provider_client = bybit_client.ByBitProvider(
+                use_fast_converters=use_fast_converters
+            )
+            provider_client._rest_api_client = _PageReplayClient(page=page)
+            page_messages[path], wall_time = _measure(
+                function=lambda: getattr(provider_client, method_name)(
+                    **method_kwargs
+                ),
+                repeat=repeat,
+            )
+            results.append(
+                _get_result(
+                    benchmark="conversion",
+                    page_name=page_name,
+                    path=path,
+                    rows=len(page),
+                    wall_time=wall_time,
+                )
+            )
+
+        if page_messages["fast"] != page_messages["marshmallow"]:
+            raise ValueError(
+                "Fast path messages differ from marshmallow ones (page={})".format(
+                    page_name
+                )
+            )
+
+    return results
+
+
+def run_decoding_benchmark(
+    pages: typing.Dict[str, typing.List[dict]], repeat: int = 3
+) -> typing.List[dict]:
+    client = rest_api_client.ByBitClient()
+    results = []
+    for page_name, page in pages.items():
+        converter = _PAGES[page_name][3]
+        response = _RecordedResponse(
+            content=simplejson.dumps(
+                {
+                    "retCode": 0,
+                    "retMsg": "OK",
+                    "result": {"list": page, "nextPageCursor": ""},
+                }
+            ).encode("utf-8")
+        )
+        page_messages = {}
+        for path, decimal_fields in (
+            ("simplejson", None),
+            ("selective", converter.decimal_data_keys),
+        ):
+            content, wall_time = _measure(
+                function=lambda: client._get_response_content(
+                    response=response, data_field="list", decimal_fields=decimal_fields
+                ),
+                repeat=repeat,
+            )
+            page_messages[path] = converter.convert(rows=content["list"])
+            results.append(
+                _get_result(
+                    benchmark="decoding",
+                    page_name=page_name,
+                    path=path,
+                    rows=len(page),
+                    wall_time=wall_time,
+                )
+            )
+
+        if page_messages["selective"] != page_messages["simplejson"]:
+            raise ValueError(
+                "Selectively decoded messages differ from simplejson ones (page={})".format(
+                    page_name
+                )
+            )
+
+    return results
+
+
+def _measure(
+    function: typing.Callable, repeat: int
+) -> typing.Tuple[typing.Any, float]:
+    wall_times = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        result = function()
+        wall_times.append(time.perf_counter() - started_at)
+
+    # Best of repeats, least disturbed by GC and other processes.
+    return result, min(wall_times)
+
+
+def _get_result(
+    benchmark: str, page_name: str, path: str, rows: int, wall_time: float
+) -> dict:
+    result = {
+        "benchmark": benchmark,
+        "page": page_name,
+        "path": path,
+        "rows": rows,
+        "wall_time": round(wall_time, 3),
+        "rows_per_second": round(rows / wall_time, 1),
+    }
+    logger.info(
+        "{} Finished (benchmark={}, page={}, path={}, rows={}, rows_per_second={}).".format(
+            _LOG_PREFIX, benchmark, page_name, path, rows, result["rows_per_second"]
+        )
+    )
+    return result
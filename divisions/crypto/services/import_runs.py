@@ -0,0 +1,203 @@
+import contextlib
+import datetime
+import logging
+import time
+import typing
+
+from django.db import models as django_db_models
+from django.utils import timezone
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider import base as base_provider_client
+
+logger = logging.getLogger(__name__)
+
+_LOG_PREFIX = "[IMPORT-RUNS]"
+
+COUNTER_FIELDS = [
+    "api_calls",
+    "pages",
+    "rows_fetched",
+    "rows_inserted",
+    "rows_updated",
+    "rows_skipped",
+    "errors",
+]
+
+
+class ImportRunRecorder(object):
+    """
+    Records import run of a command as ImportRun with one ImportRunStage per
+    importer call (stream and symbol). Stages are kept in memory and written in
+    batches of flush_size, run totals are written when run finishes.
+    """
+
+    def __init__(
+        self,
+        provider: crypto_enums.CryptoProvider,
+        command: str,
+        flush_size: int = 100,
+    ):
+        self.provider = provider
+        self.command = command
+        self.flush_size = flush_size
+        self.import_run = None
+        self._started_at = None
+        self._pending_stages = []
+        self._totals = dict.fromkeys(COUNTER_FIELDS, 0)
+
+    def start(self) -> crypto_models.ImportRun:
+        self._started_at = time.perf_counter()
+        self.import_run = crypto_models.ImportRun.objects.create(
+            provider=self.provider.to_integer_choice(),
+            command=self.command,
+            status=crypto_enums.ImportRunStatus.RUNNING.value,
+            started_at=timezone.now(),
+        )
+        return self.import_run
+
+    @contextlib.contextmanager
+    def stage(
+        self,
+        stream: crypto_enums.ImportStream,
+        provider_client: base_provider_client.BaseProvider,
+        symbol: typing.Optional[str] = None,
+    ) -> typing.Iterator[typing.Dict[str, int]]:
+        # Yields counters importer increments, API calls and pages are taken from
+        # provider client.
+        counters = dict.fromkeys(COUNTER_FIELDS, 0)
+        api_calls, pages = provider_client.get_api_call_counts()
+        started_at = timezone.now()
+        stage_started_at = time.perf_counter()
+        try:
+            yield counters
+        except Exception:
+            counters["errors"] += 1
+            raise
+        finally:
+            finished_api_calls, finished_pages = provider_client.get_api_call_counts()
+            counters["api_calls"] = finished_api_calls - api_calls
+            counters["pages"] = finished_pages - pages
+            self._add_stage(
+                stage=crypto_models.ImportRunStage(
+                    run=self.import_run,
+                    stream=stream.value,
+                    symbol=symbol,
+                    started_at=started_at,
+                    finished_at=timezone.now(),
+                    duration=time.perf_counter() - stage_started_at,
+                    **counters,
+                )
+            )
+
+    def finish(self, failed: bool = False) -> crypto_models.ImportRun:
+        self._flush_stages()
+        for field_name, count in self._totals.items():
+            setattr(self.import_run, field_name, count)
+
+        self.import_run.status = (
+            crypto_enums.ImportRunStatus.FAILED
+            if failed
+            else crypto_enums.ImportRunStatus.SUCCEEDED
+        ).value
+        self.import_run.finished_at = timezone.now()
+        self.import_run.duration = time.perf_counter() - self._started_at
+        self.import_run.save()
+        logger.info(
+            "{} Finished import run (id={}, command={}, duration={:.3f}s, rows_fetched={}, rows_inserted={}, errors={}).".format(
+                _LOG_PREFIX,
+                self.import_run.id,
+                self.command,
+                self.import_run.duration,
+                self.import_run.rows_fetched,
+                self.import_run.rows_inserted,
+                self.import_run.errors,
+            )
+        )
+        return self.import_run
+
+    def _add_stage(self, stage: crypto_models.ImportRunStage) -> None:
+        for field_name in COUNTER_FIELDS:
+            self._totals[field_name] += getattr(stage, field_name)
+
+        self._pending_stages.append(stage)
+        if len(self._pending_stages) >= self.flush_size:
+            self._flush_stages()
+
+    def _flush_stages(self) -> None:
+        if not self._pending_stages:
+            return None
+
+        try:
+            crypto_models.ImportRunStage.objects.bulk_create(self._pending_stages)
+        except Exception:
+            # Run ledger must never fail an import.
+            logger.exception(
+                "{} Unable to store {} import run stages (id={}). Continue.".format(
+                    _LOG_PREFIX, len(self._pending_stages), self.import_run.id
+                )
+            )
+
+        self._pending_stages = []
+
+
+def get_import_runs(
+    provider: crypto_enums.CryptoProvider,
+    command: typing.Optional[str] = None,
+    from_datetime: typing.Optional[datetime.datetime] = None,
+    limit: int = 50,
+) -> typing.List[dict]:
+    import_runs_qs = crypto_models.ImportRun.objects.filter(
+        provider=provider.to_integer_choice()
+    )
+    if command:
+        import_runs_qs = import_runs_qs.filter(command=command)
+
+    if from_datetime:
+        import_runs_qs = import_runs_qs.filter(started_at__gte=from_datetime)
+
+    return [
+        dict(import_run, rows_per_second=_get_rows_per_second(**import_run))
+        for import_run in import_runs_qs.order_by("-started_at").values(
+            "id", "command", "status", "started_at", "finished_at", "duration",
+            *COUNTER_FIELDS
+        )[:limit]
+    ]
+
+
+def get_import_stage_summary(
+    provider: crypto_enums.CryptoProvider,
+    stream: typing.Optional[crypto_enums.ImportStream] = None,
+    from_datetime: typing.Optional[datetime.datetime] = None,
+    limit: int = 50,
+) -> typing.List[dict]:
+    # Stream and symbol pairs taking most import time, with their throughput.
+    stages_qs = crypto_models.ImportRunStage.objects.filter(
+        run__provider=provider.to_integer_choice()
+    )
+    if stream:
+        stages_qs = stages_qs.filter(stream=stream.value)
+
+    if from_datetime:
+        stages_qs = stages_qs.filter(started_at__gte=from_datetime)
+
+    return [
+        dict(stage_summary, rows_per_second=_get_rows_per_second(**stage_summary))
+        for stage_summary in stages_qs.values("stream", "symbol")
+        .annotate(
+            stages=django_db_models.Count("id"),
+            duration=django_db_models.Sum("duration"),
+            **{
+                field_name: django_db_models.Sum(field_name)
+                for field_name in COUNTER_FIELDS
+            }
+        )
+        .order_by("-duration")[:limit]
+    ]
+
+
+def _get_rows_per_second(
+    rows_fetched: int, duration: typing.Optional[float], **kwargs: typing.Any
+) -> typing.Optional[float]:
+    return round(rows_fetched / duration, 1) if duration else None
@@ -0,0 +1,170 @@
+import datetime
+import logging
+import typing
+
+from django.db import models as django_db_models
+from django.db import transaction
+from django.utils import timezone
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+
+logger = logging.getLogger(__name__)
+
+_LOG_PREFIX = "[IMPORT-WATERMARK]"
+
+
+def get_watermark(
+    provider: crypto_enums.CryptoProvider,
+    stream: crypto_enums.ImportStream,
+    key: str = "",
+) -> typing.Optional[datetime.datetime]:
+    return (
+        crypto_models.ImportWatermark.objects.filter(
+            provider=provider.to_integer_choice(),
+            stream=stream.value,
+            key=key,
+        )
+        .values_list("watermark", flat=True)
+        .first()
+    )
+
+
+def advance_watermark(
+    provider: crypto_enums.CryptoProvider,
+    stream: crypto_enums.ImportStream,
+    watermark: datetime.datetime,
+    key: str = "",
+) -> datetime.datetime:
+    # Watermark only moves forward, reruns over older ranges must not rewind it.
+    # updated_at is touched on every call and marks the last committed import.
+    watermark = _make_aware(value=watermark)
+    with transaction.atomic():
+        import_watermark, created = crypto_models.ImportWatermark.objects.select_for_update().get_or_create(
+            provider=provider.to_integer_choice(),
+            stream=stream.value,
+            key=key,
+            defaults={"watermark": watermark, "last_success_at": timezone.now()},
+        )
+        if not created:
+            import_watermark.watermark = (
+                max(import_watermark.watermark, watermark)
+                if import_watermark.watermark
+                else watermark
+            )
+            import_watermark.last_success_at = timezone.now()
+            import_watermark.save(
+                update_fields=["watermark", "last_success_at", "updated_at"]
+            )
+
+    logger.debug(
+        "{} Watermark (provider={}, stream={}, key={}) is {}.".format(
+            _LOG_PREFIX, provider.name, stream.value, key, import_watermark.watermark
+        )
+    )
+    return import_watermark.watermark
+
+
+def get_watermark_version(
+    provider: crypto_enums.CryptoProvider,
+    stream: crypto_enums.ImportStream,
+    key: str = "",
+) -> str:
+    # Covers key and its per-symbol keys ("<key>:<symbol>"), these are updated
+    # whenever imported rows commit, even if work derived from them later fails.
+    updated_at = crypto_models.ImportWatermark.objects.filter(
+        django_db_models.Q(key=key)
+        | django_db_models.Q(key__startswith="{}:".format(key)),
+        provider=provider.to_integer_choice(),
+        stream=stream.value,
+    ).aggregate(updated_at=django_db_models.Max("updated_at"))["updated_at"]
+    return updated_at.isoformat() if updated_at else "0"
+
+
+def mark_import_succeeded(
+    provider: crypto_enums.CryptoProvider,
+    stream: crypto_enums.ImportStream,
+    latest_record_at: typing.Optional[datetime.datetime] = None,
+    key: str = "",
+) -> None:
+    """
+    Keeps freshness gauges of stream, watermark is the newest imported record and
+    last_success_at the last completed import. Import that brought no records only
+    moves last_success_at, stream seen first time is stored without watermark so
+    it is still reported by freshness checks.
+    """
+    if latest_record_at:
+        advance_watermark(
+            provider=provider, stream=stream, watermark=latest_record_at, key=key
+        )
+        return None
+
+    crypto_models.ImportWatermark.objects.update_or_create(
+        provider=provider.to_integer_choice(),
+        stream=stream.value,
+        key=key,
+        defaults={"last_success_at": timezone.now()},
+    )
+
+
+def get_freshness(
+    provider: crypto_enums.CryptoProvider,
+    stream: typing.Optional[crypto_enums.ImportStream] = None,
+    max_lag_seconds: typing.Optional[int] = None,
+    max_success_age_seconds: typing.Optional[int] = None,
+) -> typing.List[dict]:
+    # Reads only watermark rows, no scans of imported tables. Row is stale when its
+    # newest record or last completed import is older than given limits, or missing.
+    import_watermarks_qs = crypto_models.ImportWatermark.objects.filter(
+        provider=provider.to_integer_choice()
+    )
+    if stream:
+        import_watermarks_qs = import_watermarks_qs.filter(stream=stream.value)
+
+    now = timezone.now()
+    freshness = []
+    for import_watermark in import_watermarks_qs.order_by("stream", "key").values(
+        "stream", "key", "watermark", "last_success_at"
+    ):
+        lag_seconds = (
+            round((now - import_watermark["watermark"]).total_seconds())
+            if import_watermark["watermark"]
+            else None
+        )
+        success_age_seconds = (
+            round((now - import_watermark["last_success_at"]).total_seconds())
+            if import_watermark["last_success_at"]
+            else None
+        )
+        freshness.append(
+            {
+                "stream": import_watermark["stream"],
+                "key": import_watermark["key"],
+                "latest_record_at": import_watermark["watermark"],
+                "last_success_at": import_watermark["last_success_at"],
+                "lag_seconds": lag_seconds,
+                "success_age_seconds": success_age_seconds,
+                "stale": bool(
+                    (
+                        max_lag_seconds is not None
+                        and (lag_seconds is None or lag_seconds > max_lag_seconds)
+                    )
+                    or (
+                        max_success_age_seconds is not None
+                        and (
+                            success_age_seconds is None
+                            or success_age_seconds > max_success_age_seconds
+                        )
+                    )
+                ),
+            }
+        )
+
+    return freshness
+
+
+def _make_aware(value: datetime.datetime) -> datetime.datetime:
+    if timezone.is_naive(value):
+        return timezone.make_aware(value)
+
+    return value
@@ -0,0 +1,185 @@
+import contextlib
+import datetime
+import logging
+import platform
+import resource
+import time
+import typing
+
+from django.db import connection
+
+from divisions.common import enums as common_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider import enums as provider_enums
+from divisions.crypto.integrations.provider.services import (
+    data_importer as data_importer_services,
+)
+from divisions.crypto.integrations.provider.synthetic import (
+    client as synthetic_provider_client,
+)
+
+logger = logging.getLogger(__name__)
+
+_LOG_PREFIX = "[IMPORTER-BENCHMARK]"
+
+STAGES = ["orders", "pnl", "executions", "transfers", "positions"]
+
+
+class _QueryCounter(object):
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+@contextlib.contextmanager
+def measure_stage(stage: str, results: typing.List[dict]) -> typing.Iterator[dict]:
+    stage_result = {"stage": stage}
+    query_counter = _QueryCounter()
+    started_at = time.perf_counter()
+    with connection.execute_wrapper(query_counter):
+        yield stage_result
+
+    stage_result.update(
+        {
+            "wall_time": round(time.perf_counter() - started_at, 3),
+            "queries": query_counter.count,
+            # ru_maxrss is process high-water mark in kilobytes on Linux.
+            "peak_rss_mb": round(
+                resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1
+            ),
+        }
+    )
+    results.append(stage_result)
+
+
+def _set_stage_rows(stage_result: dict, rows: int) -> None:
+    # Rows are counted after stage is measured, so counting query is not part of it.
+    stage_result["rows"] = rows
+    stage_result["rows_per_second"] = (
+        round(rows / stage_result["wall_time"], 1) if stage_result["wall_time"] else None
+    )
+    logger.info(
+        "{} Finished stage (stage={}, rows={}, wall_time={}s, rows_per_second={}, queries={}, peak_rss_mb={}).".format(
+            _LOG_PREFIX,
+            stage_result["stage"],
+            stage_result["rows"],
+            stage_result["wall_time"],
+            stage_result["rows_per_second"],
+            stage_result["queries"],
+            stage_result["peak_rss_mb"],
+        )
+    )
+
+
+def run_importer_benchmark(
+    rows_count: int,
+    instruments_count: int = 20,
+    stages: typing.Optional[typing.List[str]] = None,
+    seed: int = 0,
+) -> typing.List[dict]:
+    provider_client = synthetic_provider_client.SyntheticProvider(
+        rows_count=rows_count, instruments_count=instruments_count, seed=seed
+    )
+    importer = data_importer_services.CryptoProviderImporter(
+        provider_client=provider_client
+    )
+    trading_category = provider_enums.TradingCategory.LINEAR
+    from_datetime = provider_client.start_datetime
+    to_datetime = provider_client.start_datetime + provider_client.period
+
+    def import_trade_orders() -> None:
+        for instrument_name in provider_client.instrument_names:
+            importer.import_trade_orders(
+                trading_category=trading_category,
+                market_instrument_symbol=instrument_name,
+            )
+
+    def import_trade_pnl_transactions() -> None:
+        for instrument_name in provider_client.instrument_names:
+            importer.import_trade_pnl_transactions(
+                trading_category=trading_category,
+                market_instrument_symbol=instrument_name,
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+            )
+
+    def import_trade_execution_transactions() -> None:
+        for instrument_name in provider_client.instrument_names:
+            importer.import_trade_execution_transactions(
+                trading_category=trading_category,
+                market_instrument_symbol=instrument_name,
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+            )
+
+    def import_wallet_deposit_transfers() -> None:
+        importer.import_wallet_external_transfers(
+            wallet_type=provider_enums.WalletType.FUND,
+            transfer_type=provider_enums.WalletTransferType.DEPOSIT,
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+        )
+
+    def import_trade_positions() -> None:
+        importer.import_trade_positions(
+            trading_category=trading_category, currency=common_enums.Currency.USDT
+        )
+
+    # Stage name -> (import call, queryset counting rows it stored). Stages depend on
+    # each other in this order, PnL and executions are linked to imported orders.
+    stage_runners = {
+        "orders": (
+            import_trade_orders,
+            crypto_models.TradeOrder.objects.filter(
+                instrument_name__startswith=provider_client.INSTRUMENT_NAME_PREFIX
+            ),
+        ),
+        "pnl": (
+            import_trade_pnl_transactions,
+            crypto_models.TradePnLTransaction.objects.filter(
+                order__instrument_name__startswith=provider_client.INSTRUMENT_NAME_PREFIX
+            ),
+        ),
+        "executions": (
+            import_trade_execution_transactions,
+            crypto_models.TradeExecutionTransaction.objects.filter(
+                instrument_name__startswith=provider_client.INSTRUMENT_NAME_PREFIX
+            ),
+        ),
+        "transfers": (
+            import_wallet_deposit_transfers,
+            crypto_models.PortfolioTransfer.objects.filter(
+                txid__startswith="synthetic-"
+            ),
+        ),
+        "positions": (
+            import_trade_positions,
+            crypto_models.TradePosition.objects.filter(
+                instrument_name__startswith=provider_client.INSTRUMENT_NAME_PREFIX
+            ),
+        ),
+    }
+
+    results = []
+    for stage in STAGES:
+        if stages and stage not in stages:
+            continue
+
+        run_stage, stored_rows_qs = stage_runners[stage]
+        with measure_stage(stage=stage, results=results) as stage_result:
+            run_stage()
+
+        _set_stage_rows(stage_result=stage_result, rows=stored_rows_qs.count())
+
+    return results
+
+
+def get_benchmark_environment() -> dict:
+    return {
+        "started_at": datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+        "python_version": platform.python_version(),
+        "database_vendor": connection.vendor,
+    }
@@ -0,0 +1,204 @@
+import collections
+import datetime
+import decimal
+import logging
+import typing
+
+from django.db import IntegrityError
+from django.db import models as django_db_models
+from django.db import transaction
+from django.db.models import functions as django_db_functions
+from django.utils import timezone
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider import enums as provider_enums
+from divisions.crypto.services import import_watermark as import_watermark_services
+
+logger = logging.getLogger(__name__)
+
+_LOG_PREFIX = "[PNL-ROLLUP]"
+_ROLLUP_COUNTERS = (
+    "closed_pnl",
+    "fees",
+    "volume",
+    "trade_count",
+    "win_count",
+    "loss_count",
+)
+
+
+def apply_pnl_transactions(
+    provider: crypto_enums.CryptoProvider,
+    trading_category: provider_enums.TradingCategory,
+    pnl_transactions: typing.Iterable[crypto_models.TradePnLTransaction],
+) -> int:
+    rollup_deltas = collections.defaultdict(
+        lambda: dict.fromkeys(_ROLLUP_COUNTERS, 0)
+    )
+    last_created_at = None
+    for pnl_transaction in pnl_transactions:
+        rollup_delta = rollup_deltas[
+            (
+                pnl_transaction.order.instrument_name,
+                _get_rollup_day(created_at=pnl_transaction.created_at),
+            )
+        ]
+        rollup_delta["closed_pnl"] += pnl_transaction.closed_pnl
+        rollup_delta["fees"] += pnl_transaction.order.order_total_executed_fee
+        rollup_delta["volume"] += pnl_transaction.total_exit_value
+        rollup_delta["trade_count"] += 1
+        rollup_delta["win_count"] += int(pnl_transaction.closed_pnl > 0)
+        rollup_delta["loss_count"] += int(pnl_transaction.closed_pnl < 0)
+        created_at = _make_aware(created_at=pnl_transaction.created_at)
+        if last_created_at is None or created_at > last_created_at:
+            last_created_at = created_at
+
+    with transaction.atomic():
+        for (instrument_name, day), rollup_delta in rollup_deltas.items():
+            _apply_rollup_delta(
+                rollup_key=dict(
+                    provider=provider.to_integer_choice(),
+                    trading_category=trading_category.name,
+                    instrument_name=instrument_name,
+                    day=day,
+                ),
+                rollup_delta=rollup_delta,
+            )
+
+        if last_created_at:
+            import_watermark_services.advance_watermark(
+                provider=provider,
+                stream=crypto_enums.ImportStream.TRADE_PNL,
+                watermark=last_created_at,
+                key=trading_category.name,
+            )
+
+    logger.info(
+        "{} Applied {} daily rollup updates (provider={}, trading_category={}).".format(
+            _LOG_PREFIX, len(rollup_deltas), provider.name, trading_category.name
+        )
+    )
+    return len(rollup_deltas)
+
+
+def rebuild_pnl_rollup(
+    provider: crypto_enums.CryptoProvider,
+    trading_category: provider_enums.TradingCategory,
+    from_date: typing.Optional[datetime.date] = None,
+    to_date: typing.Optional[datetime.date] = None,
+    batch_size: int = 1000,
+) -> int:
+    pnl_transactions_qs = crypto_models.TradePnLTransaction.objects.filter(
+        order__provider=provider.to_integer_choice(),
+        order__trading_category=trading_category.name,
+    ).annotate(day=django_db_functions.TruncDate("created_at"))
+    rollup_qs = crypto_models.TradePnLDailyRollup.objects.filter(
+        provider=provider.to_integer_choice(),
+        trading_category=trading_category.name,
+    )
+
+    if from_date:
+        pnl_transactions_qs = pnl_transactions_qs.filter(day__gte=from_date)
+        rollup_qs = rollup_qs.filter(day__gte=from_date)
+
+    if to_date:
+        pnl_transactions_qs = pnl_transactions_qs.filter(day__lte=to_date)
+        rollup_qs = rollup_qs.filter(day__lte=to_date)
+
+    aggregated_rows = (
+        pnl_transactions_qs.values("order__instrument_name", "day")
+        .annotate(
+            closed_pnl_sum=django_db_models.Sum("closed_pnl"),
+            fees_sum=django_db_models.Sum("order__order_total_executed_fee"),
+            volume_sum=django_db_models.Sum("total_exit_value"),
+            trades=django_db_models.Count("id"),
+            wins=django_db_models.Count(
+                "id", filter=django_db_models.Q(closed_pnl__gt=0)
+            ),
+            losses=django_db_models.Count(
+                "id", filter=django_db_models.Q(closed_pnl__lt=0)
+            ),
+        )
+        .order_by()
+    )
+
+    with transaction.atomic():
+        deleted_count, _ = rollup_qs.delete()
+        created_count = len(
+            crypto_models.TradePnLDailyRollup.objects.bulk_create(
+                (
+                    crypto_models.TradePnLDailyRollup(
+                        provider=provider.to_integer_choice(),
+                        trading_category=trading_category.name,
+                        instrument_name=aggregated_row["order__instrument_name"],
+                        day=aggregated_row["day"],
+                        closed_pnl=aggregated_row["closed_pnl_sum"]
+                        or decimal.Decimal("0"),
+                        fees=aggregated_row["fees_sum"] or decimal.Decimal("0"),
+                        volume=aggregated_row["volume_sum"] or decimal.Decimal("0"),
+                        trade_count=aggregated_row["trades"],
+                        win_count=aggregated_row["wins"],
+                        loss_count=aggregated_row["losses"],
+                    )
+                    for aggregated_row in aggregated_rows.iterator()
+                ),
+                batch_size=batch_size,
+            )
+        )
+        last_created_at = pnl_transactions_qs.aggregate(
+            last_created_at=django_db_models.Max("created_at")
+        )["last_created_at"]
+        if last_created_at:
+            import_watermark_services.advance_watermark(
+                provider=provider,
+                stream=crypto_enums.ImportStream.TRADE_PNL,
+                watermark=last_created_at,
+                key=trading_category.name,
+            )
+
+    logger.info(
+        "{} Rebuilt daily rollup (provider={}, trading_category={}, from_date={}, to_date={}, deleted={}, created={}).".format(
+            _LOG_PREFIX,
+            provider.name,
+            trading_category.name,
+            from_date,
+            to_date,
+            deleted_count,
+            created_count,
+        )
+    )
+    return created_count
+
+
+def _apply_rollup_delta(rollup_key: dict, rollup_delta: dict) -> None:
+    rollup_update = {
+        counter: django_db_models.F(counter) + value
+        for counter, value in rollup_delta.items()
+    }
+    if crypto_models.TradePnLDailyRollup.objects.filter(**rollup_key).update(
+        **rollup_update
+    ):
+        return None
+
+    try:
+        with transaction.atomic():
+            crypto_models.TradePnLDailyRollup.objects.create(
+                **rollup_key, **rollup_delta
+            )
+    except IntegrityError:
+        # Row was created concurrently by another importer, increment it instead.
+        crypto_models.TradePnLDailyRollup.objects.filter(**rollup_key).update(
+            **rollup_update
+        )
+
+
+def _get_rollup_day(created_at: datetime.datetime) -> datetime.date:
+    return timezone.localtime(_make_aware(created_at=created_at)).date()
+
+
+def _make_aware(created_at: datetime.datetime) -> datetime.datetime:
+    if timezone.is_naive(created_at):
+        return timezone.make_aware(created_at)
+
+    return created_at
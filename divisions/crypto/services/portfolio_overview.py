@@ -0,0 +1,67 @@
+import datetime
+import typing
+
+from django.db import models as django_db_models
+from django.utils import timezone
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider import enums as provider_enums
+
+
+def get_trade_positions(
+    provider: crypto_enums.CryptoProvider,
+) -> django_db_models.QuerySet:
+    return (
+        crypto_models.TradePosition.objects.filter(
+            provider=provider.to_integer_choice()
+        )
+        .order_by("instrument_name")
+        .values("instrument_name", "unrealised_pnl", "created_at")
+    )
+
+
+def get_latest_wallet_balances(
+    provider: crypto_enums.CryptoProvider,
+    wallet_type: provider_enums.WalletType,
+) -> django_db_models.QuerySet:
+    wallet_balances_qs = crypto_models.PortfolioWalletBalanceSnapshot.objects.filter(
+        provider=provider.to_integer_choice(),
+        portfolio_type=wallet_type.name,
+    )
+    return (
+        wallet_balances_qs.filter(
+            created_at=django_db_models.Subquery(
+                wallet_balances_qs.filter(
+                    currency=django_db_models.OuterRef("currency")
+                )
+                .order_by("-created_at")
+                .values("created_at")[:1]
+            )
+        )
+        .order_by("currency")
+        .values("currency", "amount", "created_at")
+    )
+
+
+def get_day_pnl(
+    provider: crypto_enums.CryptoProvider,
+    trading_category: typing.Optional[provider_enums.TradingCategory] = None,
+    day: typing.Optional[datetime.date] = None,
+) -> django_db_models.QuerySet:
+    rollup_qs = crypto_models.TradePnLDailyRollup.objects.filter(
+        provider=provider.to_integer_choice(),
+        day=day or timezone.localdate(),
+    )
+    if trading_category:
+        rollup_qs = rollup_qs.filter(trading_category=trading_category.name)
+
+    return (
+        rollup_qs.values("instrument_name")
+        .annotate(
+            closed_pnl=django_db_models.Sum("closed_pnl"),
+            fees=django_db_models.Sum("fees"),
+            trade_count=django_db_models.Sum("trade_count"),
+        )
+        .order_by("instrument_name")
+    )
@@ -0,0 +1,346 @@
+import datetime
+import decimal
+import logging
+import typing
+
+from django.db import models as django_db_models
+from django.db import transaction
+from django.utils import timezone
+
+from divisions.common import enums as common_enums
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider import enums as provider_enums
+from divisions.crypto.integrations.provider import messages as provider_messages
+
+logger = logging.getLogger(__name__)
+
+_LOG_PREFIX = "[PORTFOLIO-UNITS]"
+_ZERO = decimal.Decimal("0")
+_QUANTUM = decimal.Decimal("0.00000001")
+INITIAL_UNIT_PRICE = decimal.Decimal("1")
+
+_INFLOW_TRANSFER_TYPES = [
+    provider_enums.WalletTransferType.DEPOSIT.value,
+    provider_enums.WalletTransferType.INTERNAL_DEPOSIT.value,
+]
+_OUTFLOW_TRANSFER_TYPES = [
+    provider_enums.WalletTransferType.WITHDRAWAL.value,
+    provider_enums.WalletTransferType.INTERNAL_WITHDRAWAL.value,
+]
+
+
+def update_portfolio_units(
+    provider: crypto_enums.CryptoProvider,
+    wallet_type: provider_enums.WalletType,
+    currency: common_enums.Currency = common_enums.Currency.USDT,
+) -> int:
+    with transaction.atomic():
+        unit_balance, _ = crypto_models.PortfolioUnitBalance.objects.select_for_update().get_or_create(
+            provider=provider.to_integer_choice(),
+            portfolio_type=wallet_type.name,
+        )
+        pending_transfers = list(
+            _get_pending_investor_transfers(
+                provider=provider, wallet_type=wallet_type, currency=currency
+            )
+        )
+        if not pending_transfers:
+            logger.info(
+                "{} No new investor transfers (provider={}, wallet_type={}). Exiting.".format(
+                    _LOG_PREFIX, provider.name, wallet_type.name
+                )
+            )
+            return 0
+
+        if (
+            unit_balance.last_transaction_datetime
+            and pending_transfers[0].network_datetime
+            < unit_balance.last_transaction_datetime
+        ):
+            # Late arriving transfer, units issued after it were priced on a wrong NAV.
+            _rewind_portfolio_units(
+                unit_balance=unit_balance,
+                to_datetime=pending_transfers[0].network_datetime,
+            )
+            pending_transfers = list(
+                _get_pending_investor_transfers(
+                    provider=provider, wallet_type=wallet_type, currency=currency
+                )
+            )
+
+        investor_unit_balances = {}
+        for transfer in pending_transfers:
+            investor_unit_balance = investor_unit_balances.get(transfer.portfolio_user_id)
+            if investor_unit_balance is None:
+                investor_unit_balance, _ = crypto_models.PortfolioInvestorUnitBalance.objects.get_or_create(
+                    provider=provider.to_integer_choice(),
+                    portfolio_type=wallet_type.name,
+                    portfolio_user_id=transfer.portfolio_user_id,
+                )
+                investor_unit_balances[transfer.portfolio_user_id] = investor_unit_balance
+
+            _issue_transfer_units(
+                transfer=transfer,
+                unit_balance=unit_balance,
+                investor_unit_balance=investor_unit_balance,
+                provider=provider,
+                wallet_type=wallet_type,
+                currency=currency,
+            )
+
+        for investor_unit_balance in investor_unit_balances.values():
+            investor_unit_balance.save(update_fields=["units", "updated_at"])
+
+        unit_balance.save(
+            update_fields=["total_units", "last_transaction_datetime", "updated_at"]
+        )
+
+    logger.info(
+        "{} Processed {} investor transfers (provider={}, wallet_type={}, total_units={}).".format(
+            _LOG_PREFIX,
+            len(pending_transfers),
+            provider.name,
+            wallet_type.name,
+            unit_balance.total_units,
+        )
+    )
+    return len(pending_transfers)
+
+
+def get_net_asset_value(
+    provider: crypto_enums.CryptoProvider,
+    wallet_type: provider_enums.WalletType,
+    at_datetime: datetime.datetime,
+    currency: common_enums.Currency = common_enums.Currency.USDT,
+) -> decimal.Decimal:
+    # Last wallet snapshot before the moment, rolled forward by closed PnL and
+    # external flows that happened after it was taken.
+    balance_snapshot = (
+        crypto_models.PortfolioWalletBalanceSnapshot.objects.filter(
+            provider=provider.to_integer_choice(),
+            portfolio_type=wallet_type.name,
+            currency=currency.value,
+            created_at__lt=at_datetime,
+        )
+        .order_by("-created_at")
+        .first()
+    )
+    net_asset_value = balance_snapshot.amount if balance_snapshot else _ZERO
+
+    pnl_transactions_qs = crypto_models.TradePnLTransaction.objects.filter(
+        order__provider=provider.to_integer_choice(),
+        created_at__lt=at_datetime,
+    )
+    transfers_qs = crypto_models.PortfolioTransfer.objects.filter(
+        provider=provider.to_integer_choice(),
+        portfolio_type=wallet_type.name,
+        transaction_currency=currency.value,
+        status=provider_enums.WalletTransferStatus.SUCCESS.value,
+        network_datetime__lt=at_datetime,
+    )
+    if balance_snapshot:
+        pnl_transactions_qs = pnl_transactions_qs.filter(
+            created_at__gte=balance_snapshot.created_at
+        )
+        transfers_qs = transfers_qs.filter(
+            network_datetime__gte=balance_snapshot.created_at
+        )
+
+    net_flows = transfers_qs.aggregate(
+        inflow=django_db_models.Sum(
+            "amount",
+            filter=django_db_models.Q(type__in=_INFLOW_TRANSFER_TYPES),
+        ),
+        outflow=django_db_models.Sum(
+            "amount",
+            filter=django_db_models.Q(type__in=_OUTFLOW_TRANSFER_TYPES),
+        ),
+    )
+    closed_pnl = pnl_transactions_qs.aggregate(
+        closed_pnl=django_db_models.Sum("closed_pnl")
+    )["closed_pnl"]
+
+    return (
+        net_asset_value
+        + (closed_pnl or _ZERO)
+        + (net_flows["inflow"] or _ZERO)
+        - (net_flows["outflow"] or _ZERO)
+    )
+
+
+def get_investor_participation(
+    portfolio_user_id: int,
+    provider: crypto_enums.CryptoProvider,
+    wallet_type: provider_enums.WalletType,
+    at_datetime: typing.Optional[datetime.datetime] = None,
+    currency: common_enums.Currency = common_enums.Currency.USDT,
+    with_value: bool = True,
+) -> provider_messages.PortfolioInvestorParticipation:
+    if at_datetime is None:
+        investor_units = (
+            crypto_models.PortfolioInvestorUnitBalance.objects.filter(
+                provider=provider.to_integer_choice(),
+                portfolio_type=wallet_type.name,
+                portfolio_user_id=portfolio_user_id,
+            )
+            .values_list("units", flat=True)
+            .first()
+        )
+        portfolio_units = (
+            crypto_models.PortfolioUnitBalance.objects.filter(
+                provider=provider.to_integer_choice(),
+                portfolio_type=wallet_type.name,
+            )
+            .values_list("total_units", flat=True)
+            .first()
+        )
+    else:
+        unit_transactions_qs = crypto_models.PortfolioUnitTransaction.objects.filter(
+            provider=provider.to_integer_choice(),
+            portfolio_type=wallet_type.name,
+            datetime__lte=at_datetime,
+        ).order_by("-datetime", "-id")
+        investor_units = (
+            unit_transactions_qs.filter(portfolio_user_id=portfolio_user_id)
+            .values_list("investor_units", flat=True)
+            .first()
+        )
+        portfolio_units = unit_transactions_qs.values_list(
+            "portfolio_units", flat=True
+        ).first()
+
+    investor_units = investor_units or _ZERO
+    portfolio_units = portfolio_units or _ZERO
+    unit_price = None
+    if with_value and portfolio_units > 0:
+        unit_price = (
+            get_net_asset_value(
+                provider=provider,
+                wallet_type=wallet_type,
+                at_datetime=at_datetime or timezone.now(),
+                currency=currency,
+            )
+            / portfolio_units
+        ).quantize(_QUANTUM)
+
+    return provider_messages.PortfolioInvestorParticipation(
+        portfolio_user_id=portfolio_user_id,
+        provider=provider,
+        portfolio_type=wallet_type,
+        at_datetime=at_datetime,
+        units=investor_units,
+        portfolio_units=portfolio_units,
+        participation=(investor_units / portfolio_units).quantize(_QUANTUM)
+        if portfolio_units > 0
+        else _ZERO,
+        unit_price=unit_price,
+        value=(investor_units * unit_price).quantize(_QUANTUM)
+        if unit_price is not None
+        else None,
+    )
+
+
+def _get_pending_investor_transfers(
+    provider: crypto_enums.CryptoProvider,
+    wallet_type: provider_enums.WalletType,
+    currency: common_enums.Currency,
+) -> django_db_models.QuerySet:
+    return crypto_models.PortfolioTransfer.objects.filter(
+        provider=provider.to_integer_choice(),
+        portfolio_type=wallet_type.name,
+        transaction_currency=currency.value,
+        status=provider_enums.WalletTransferStatus.SUCCESS.value,
+        type__in=_INFLOW_TRANSFER_TYPES + _OUTFLOW_TRANSFER_TYPES,
+        portfolio_user__isnull=False,
+        network_datetime__isnull=False,
+        portfolio_unit_transaction__isnull=True,
+    ).order_by("network_datetime", "id")
+
+
+def _issue_transfer_units(
+    transfer: crypto_models.PortfolioTransfer,
+    unit_balance: crypto_models.PortfolioUnitBalance,
+    investor_unit_balance: crypto_models.PortfolioInvestorUnitBalance,
+    provider: crypto_enums.CryptoProvider,
+    wallet_type: provider_enums.WalletType,
+    currency: common_enums.Currency,
+) -> crypto_models.PortfolioUnitTransaction:
+    net_asset_value = get_net_asset_value(
+        provider=provider,
+        wallet_type=wallet_type,
+        at_datetime=transfer.network_datetime,
+        currency=currency,
+    )
+    unit_price = (
+        (net_asset_value / unit_balance.total_units).quantize(_QUANTUM)
+        if unit_balance.total_units > 0 and net_asset_value > 0
+        else INITIAL_UNIT_PRICE
+    )
+    units = (transfer.amount / unit_price).quantize(_QUANTUM)
+    if transfer.type in _OUTFLOW_TRANSFER_TYPES:
+        units = -min(units, investor_unit_balance.units)
+
+    investor_unit_balance.units += units
+    unit_balance.total_units += units
+    unit_balance.last_transaction_datetime = transfer.network_datetime
+
+    return crypto_models.PortfolioUnitTransaction.objects.create(
+        provider=provider.to_integer_choice(),
+        portfolio_type=wallet_type.name,
+        portfolio_user_id=transfer.portfolio_user_id,
+        transfer=transfer,
+        net_asset_value=net_asset_value,
+        unit_price=unit_price,
+        units=units,
+        investor_units=investor_unit_balance.units,
+        portfolio_units=unit_balance.total_units,
+        datetime=transfer.network_datetime,
+    )
+
+
+def _rewind_portfolio_units(
+    unit_balance: crypto_models.PortfolioUnitBalance,
+    to_datetime: datetime.datetime,
+) -> None:
+    unit_transactions_qs = crypto_models.PortfolioUnitTransaction.objects.filter(
+        provider=unit_balance.provider,
+        portfolio_type=unit_balance.portfolio_type,
+    )
+    rewound_unit_transactions_qs = unit_transactions_qs.filter(
+        datetime__gte=to_datetime
+    )
+    affected_portfolio_user_ids = set(
+        rewound_unit_transactions_qs.values_list("portfolio_user_id", flat=True)
+    )
+    deleted_count, _ = rewound_unit_transactions_qs.delete()
+
+    for portfolio_user_id in affected_portfolio_user_ids:
+        crypto_models.PortfolioInvestorUnitBalance.objects.filter(
+            provider=unit_balance.provider,
+            portfolio_type=unit_balance.portfolio_type,
+            portfolio_user_id=portfolio_user_id,
+        ).update(
+            units=unit_transactions_qs.filter(portfolio_user_id=portfolio_user_id)
+            .order_by("-datetime", "-id")
+            .values_list("investor_units", flat=True)
+            .first()
+            or _ZERO
+        )
+
+    last_unit_transaction = unit_transactions_qs.order_by("-datetime", "-id").first()
+    unit_balance.total_units = (
+        last_unit_transaction.portfolio_units if last_unit_transaction else _ZERO
+    )
+    unit_balance.last_transaction_datetime = (
+        last_unit_transaction.datetime if last_unit_transaction else None
+    )
+    logger.warning(
+        "{} Rewound {} unit transactions from {} because of late transfer (provider={}, portfolio_type={}).".format(
+            _LOG_PREFIX,
+            deleted_count,
+            to_datetime,
+            unit_balance.provider,
+            unit_balance.portfolio_type,
+        )
+    )
@@ -0,0 +1,399 @@
+import collections
+import datetime
+import decimal
+import logging
+import typing
+
+from django.db import models as django_db_models
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider import messages as provider_messages
+
+logger = logging.getLogger(__name__)
+
+_LOG_PREFIX = "[POSITION-LEDGER]"
+_ZERO = decimal.Decimal("0")
+
+# Raw execution types as stored from provider API.
+_FILL_EXECUTION_TYPES = {"Trade", "AdlTrade", "BustTrade"}
+_FUNDING_EXECUTION_TYPES = {"Funding"}
+_BUY_EXECUTION_SIDE = "buy"
+
+_EXECUTION_FIELDS = (
+    "id",
+    "created_at",
+    "execution_side",
+    "execution_type",
+    "execution_quantity",
+    "execution_price",
+    "executed_fee",
+)
+
+
+class PositionLedgerState(object):
+    def __init__(
+        self,
+        cost_basis_method: crypto_enums.CostBasisMethod,
+        position_quantity: decimal.Decimal = _ZERO,
+        position_cost: decimal.Decimal = _ZERO,
+        realised_pnl: decimal.Decimal = _ZERO,
+        fees: decimal.Decimal = _ZERO,
+        open_lots: typing.Optional[typing.List[typing.List[str]]] = None,
+        executions_count: int = 0,
+        last_execution_created_at: typing.Optional[datetime.datetime] = None,
+        last_execution_id: int = 0,
+        last_execution_price: typing.Optional[decimal.Decimal] = None,
+    ) -> None:
+        self.cost_basis_method = cost_basis_method
+        self.position_quantity = position_quantity
+        self.position_cost = position_cost
+        self.realised_pnl = realised_pnl
+        self.fees = fees
+        # Signed (quantity, price) lots, only maintained for FIFO.
+        self.open_lots = collections.deque(
+            [decimal.Decimal(quantity), decimal.Decimal(price)]
+            for quantity, price in (open_lots or [])
+        )
+        self.executions_count = executions_count
+        self.last_execution_created_at = last_execution_created_at
+        self.last_execution_id = last_execution_id
+        self.last_execution_price = last_execution_price
+
+    @classmethod
+    def from_checkpoint(
+        cls, checkpoint: crypto_models.TradePositionLedgerCheckpoint
+    ) -> "PositionLedgerState":
+        return cls(
+            cost_basis_method=crypto_enums.CostBasisMethod(
+                checkpoint.cost_basis_method
+            ),
+            position_quantity=checkpoint.position_quantity,
+            position_cost=checkpoint.position_cost,
+            realised_pnl=checkpoint.realised_pnl,
+            fees=checkpoint.fees,
+            open_lots=checkpoint.open_lots,
+            executions_count=checkpoint.executions_count,
+            last_execution_created_at=checkpoint.last_execution_created_at,
+            last_execution_id=checkpoint.last_execution_id,
+        )
+
+    @property
+    def average_entry_price(self) -> typing.Optional[decimal.Decimal]:
+        if not self.position_quantity:
+            return None
+
+        return self.position_cost / self.position_quantity
+
+    def get_unrealised_pnl(self, mark_price: decimal.Decimal) -> decimal.Decimal:
+        return self.position_quantity * mark_price - self.position_cost
+
+    def apply_execution(
+        self,
+        execution_id: int,
+        created_at: datetime.datetime,
+        execution_side: str,
+        execution_type: str,
+        execution_quantity: decimal.Decimal,
+        execution_price: decimal.Decimal,
+        executed_fee: decimal.Decimal,
+    ) -> None:
+        self.executions_count += 1
+        self.last_execution_created_at = created_at
+        self.last_execution_id = execution_id
+
+        if execution_type in _FUNDING_EXECUTION_TYPES:
+            self.fees += executed_fee
+            return None
+
+        if execution_type not in _FILL_EXECUTION_TYPES or not execution_quantity:
+            return None
+
+        self.fees += executed_fee
+        self.last_execution_price = execution_price
+        signed_quantity = (
+            execution_quantity
+            if execution_side.lower() == _BUY_EXECUTION_SIDE
+            else -execution_quantity
+        )
+
+        if self.cost_basis_method == crypto_enums.CostBasisMethod.FIFO:
+            self._apply_fifo_fill(quantity=signed_quantity, price=execution_price)
+        else:
+            self._apply_average_cost_fill(
+                quantity=signed_quantity, price=execution_price
+            )
+
+    def to_checkpoint_fields(self) -> dict:
+        return dict(
+            position_quantity=self.position_quantity,
+            position_cost=self.position_cost,
+            realised_pnl=self.realised_pnl,
+            fees=self.fees,
+            open_lots=[[str(quantity), str(price)] for quantity, price in self.open_lots],
+            executions_count=self.executions_count,
+            last_execution_created_at=self.last_execution_created_at,
+            last_execution_id=self.last_execution_id,
+        )
+
+    def _apply_fifo_fill(self, quantity: decimal.Decimal, price: decimal.Decimal) -> None:
+        while quantity and self.open_lots and _is_opposite(quantity, self.open_lots[0][0]):
+            lot = self.open_lots[0]
+            closed_quantity = lot[0] if abs(lot[0]) <= abs(quantity) else -quantity
+            self._close(closed_quantity=closed_quantity, entry_price=lot[1], price=price)
+            quantity += closed_quantity
+            lot[0] -= closed_quantity
+            if not lot[0]:
+                self.open_lots.popleft()
+
+        if quantity:
+            self.open_lots.append([quantity, price])
+            self.position_quantity += quantity
+            self.position_cost += quantity * price
+
+    def _apply_average_cost_fill(
+        self, quantity: decimal.Decimal, price: decimal.Decimal
+    ) -> None:
+        if self.position_quantity and _is_opposite(quantity, self.position_quantity):
+            closed_quantity = (
+                self.position_quantity
+                if abs(self.position_quantity) <= abs(quantity)
+                else -quantity
+            )
+            self._close(
+                closed_quantity=closed_quantity,
+                entry_price=self.average_entry_price,
+                price=price,
+            )
+            quantity += closed_quantity
+
+        if quantity:
+            self.position_quantity += quantity
+            self.position_cost += quantity * price
+
+    def _close(
+        self,
+        closed_quantity: decimal.Decimal,
+        entry_price: decimal.Decimal,
+        price: decimal.Decimal,
+    ) -> None:
+        # closed_quantity carries the sign of the position being reduced.
+        self.realised_pnl += closed_quantity * (price - entry_price)
+        self.position_quantity -= closed_quantity
+        self.position_cost -= closed_quantity * entry_price
+        if not self.position_quantity:
+            self.position_cost = _ZERO
+
+
+def update_position_ledger(
+    provider: crypto_enums.CryptoProvider,
+    instrument_name: str,
+    cost_basis_method: crypto_enums.CostBasisMethod,
+    chunk_size: int = 2000,
+) -> typing.Optional[crypto_models.TradePositionLedgerCheckpoint]:
+    last_checkpoint = _get_last_checkpoint(
+        provider=provider,
+        instrument_name=instrument_name,
+        cost_basis_method=cost_basis_method,
+    )
+    ledger_state = (
+        PositionLedgerState.from_checkpoint(checkpoint=last_checkpoint)
+        if last_checkpoint
+        else PositionLedgerState(cost_basis_method=cost_basis_method)
+    )
+    executions_count = ledger_state.executions_count
+
+    _replay_executions(
+        ledger_state=ledger_state,
+        provider=provider,
+        instrument_name=instrument_name,
+        chunk_size=chunk_size,
+    )
+
+    if ledger_state.executions_count == executions_count:
+        logger.info(
+            "{} No new executions (instrument_name={}, cost_basis_method={}). Exiting.".format(
+                _LOG_PREFIX, instrument_name, cost_basis_method.name
+            )
+        )
+        return last_checkpoint
+
+    checkpoint = crypto_models.TradePositionLedgerCheckpoint.objects.create(
+        provider=provider.to_integer_choice(),
+        instrument_name=instrument_name,
+        cost_basis_method=cost_basis_method.value,
+        **ledger_state.to_checkpoint_fields()
+    )
+    logger.info(
+        "{} Created ledger checkpoint (instrument_name={}, cost_basis_method={}, new_executions={}, position_quantity={}, realised_pnl={}).".format(
+            _LOG_PREFIX,
+            instrument_name,
+            cost_basis_method.name,
+            ledger_state.executions_count - executions_count,
+            ledger_state.position_quantity,
+            ledger_state.realised_pnl,
+        )
+    )
+    return checkpoint
+
+
+def invalidate_checkpoints(
+    provider: crypto_enums.CryptoProvider,
+    instrument_name: str,
+    from_datetime: datetime.datetime,
+) -> int:
+    deleted_count, _ = crypto_models.TradePositionLedgerCheckpoint.objects.filter(
+        provider=provider.to_integer_choice(),
+        instrument_name=instrument_name,
+        last_execution_created_at__gte=from_datetime,
+    ).delete()
+    if deleted_count:
+        logger.info(
+            "{} Deleted {} ledger checkpoints after backfilled executions (instrument_name={}, from_datetime={}).".format(
+                _LOG_PREFIX, deleted_count, instrument_name, from_datetime
+            )
+        )
+
+    return deleted_count
+
+
+def get_position_ledger_snapshot(
+    provider: crypto_enums.CryptoProvider,
+    instrument_name: str,
+    cost_basis_method: crypto_enums.CostBasisMethod,
+    at_datetime: datetime.datetime,
+    mark_price: typing.Optional[decimal.Decimal] = None,
+) -> provider_messages.PositionLedgerSnapshot:
+    checkpoint = _get_last_checkpoint(
+        provider=provider,
+        instrument_name=instrument_name,
+        cost_basis_method=cost_basis_method,
+        at_datetime=at_datetime,
+    )
+    ledger_state = (
+        PositionLedgerState.from_checkpoint(checkpoint=checkpoint)
+        if checkpoint
+        else PositionLedgerState(cost_basis_method=cost_basis_method)
+    )
+    _replay_executions(
+        ledger_state=ledger_state,
+        provider=provider,
+        instrument_name=instrument_name,
+        to_datetime=at_datetime,
+    )
+
+    if mark_price is None:
+        mark_price = ledger_state.last_execution_price or _get_last_execution_price(
+            provider=provider,
+            instrument_name=instrument_name,
+            at_datetime=at_datetime,
+        )
+
+    return provider_messages.PositionLedgerSnapshot(
+        market_instrument_name=instrument_name,
+        provider=provider,
+        cost_basis_method=cost_basis_method,
+        at_datetime=at_datetime,
+        position_quantity=ledger_state.position_quantity,
+        average_entry_price=ledger_state.average_entry_price,
+        realised_pnl=ledger_state.realised_pnl,
+        fees=ledger_state.fees,
+        mark_price=mark_price,
+        unrealised_pnl=ledger_state.get_unrealised_pnl(mark_price=mark_price)
+        if mark_price is not None
+        else None,
+    )
+
+
+def _replay_executions(
+    ledger_state: PositionLedgerState,
+    provider: crypto_enums.CryptoProvider,
+    instrument_name: str,
+    to_datetime: typing.Optional[datetime.datetime] = None,
+    chunk_size: int = 2000,
+) -> None:
+    executions_qs = crypto_models.TradeExecutionTransaction.objects.filter(
+        provider=provider.to_integer_choice(),
+        instrument_name=instrument_name,
+    )
+
+    # Keyset on (created_at, id) so only executions after the checkpoint are read.
+    # Checkpoints after backfilled executions are removed by invalidate_checkpoints.
+    if ledger_state.last_execution_created_at:
+        executions_qs = executions_qs.filter(
+            django_db_models.Q(created_at__gt=ledger_state.last_execution_created_at)
+            | django_db_models.Q(
+                created_at=ledger_state.last_execution_created_at,
+                id__gt=ledger_state.last_execution_id,
+            )
+        )
+
+    if to_datetime:
+        executions_qs = executions_qs.filter(created_at__lte=to_datetime)
+
+    for (
+        execution_id,
+        created_at,
+        execution_side,
+        execution_type,
+        execution_quantity,
+        execution_price,
+        executed_fee,
+    ) in (
+        executions_qs.order_by("created_at", "id")
+        .values_list(*_EXECUTION_FIELDS)
+        .iterator(chunk_size=chunk_size)
+    ):
+        ledger_state.apply_execution(
+            execution_id=execution_id,
+            created_at=created_at,
+            execution_side=execution_side,
+            execution_type=execution_type,
+            execution_quantity=execution_quantity,
+            execution_price=execution_price,
+            executed_fee=executed_fee,
+        )
+
+
+def _get_last_checkpoint(
+    provider: crypto_enums.CryptoProvider,
+    instrument_name: str,
+    cost_basis_method: crypto_enums.CostBasisMethod,
+    at_datetime: typing.Optional[datetime.datetime] = None,
+) -> typing.Optional[crypto_models.TradePositionLedgerCheckpoint]:
+    checkpoints_qs = crypto_models.TradePositionLedgerCheckpoint.objects.filter(
+        provider=provider.to_integer_choice(),
+        instrument_name=instrument_name,
+        cost_basis_method=cost_basis_method.value,
+    )
+
+    if at_datetime:
+        checkpoints_qs = checkpoints_qs.filter(
+            last_execution_created_at__lte=at_datetime
+        )
+
+    return checkpoints_qs.order_by(
+        "-last_execution_created_at", "-last_execution_id"
+    ).first()
+
+
+def _get_last_execution_price(
+    provider: crypto_enums.CryptoProvider,
+    instrument_name: str,
+    at_datetime: datetime.datetime,
+) -> typing.Optional[decimal.Decimal]:
+    return (
+        crypto_models.TradeExecutionTransaction.objects.filter(
+            provider=provider.to_integer_choice(),
+            instrument_name=instrument_name,
+            execution_type__in=_FILL_EXECUTION_TYPES,
+            created_at__lte=at_datetime,
+        )
+        .order_by("-created_at", "-id")
+        .values_list("execution_price", flat=True)
+        .first()
+    )
+
+
+def _is_opposite(quantity: decimal.Decimal, other_quantity: decimal.Decimal) -> bool:
+    return (quantity > 0) != (other_quantity > 0)
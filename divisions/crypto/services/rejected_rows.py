@@ -0,0 +1,66 @@
+import hashlib
+import logging
+import typing
+
+import simplejson
+
+from django.db import models as django_db_models
+from django.db import transaction
+from django.utils import timezone
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider import messages as provider_messages
+
+logger = logging.getLogger(__name__)
+
+_LOG_PREFIX = "[REJECTED-ROWS]"
+
+
+def store_rejected_rows(
+    provider: crypto_enums.CryptoProvider,
+    rejected_rows: typing.List[provider_messages.RejectedRow],
+) -> int:
+    # Same raw row rejected again on later runs only bumps its occurrences, so table
+    # holds one row per distinct poison row.
+    now = timezone.now()
+    created_count = 0
+    for rejected_row in rejected_rows:
+        row_hash = get_row_hash(row=rejected_row.row)
+        with transaction.atomic():
+            updated_count = crypto_models.ProviderRejectedRow.objects.filter(
+                provider=provider.to_integer_choice(),
+                data_type=rejected_row.data_type,
+                row_hash=row_hash,
+            ).update(
+                errors=rejected_row.errors,
+                occurrences=django_db_models.F("occurrences") + 1,
+                last_seen_at=now,
+            )
+            if updated_count:
+                continue
+
+            crypto_models.ProviderRejectedRow.objects.create(
+                provider=provider.to_integer_choice(),
+                data_type=rejected_row.data_type,
+                row_hash=row_hash,
+                row=rejected_row.row,
+                errors=rejected_row.errors,
+                last_seen_at=now,
+            )
+            created_count += 1
+
+    if rejected_rows:
+        logger.info(
+            "{} Stored {} rejected rows, {} of them new (provider={}).".format(
+                _LOG_PREFIX, len(rejected_rows), created_count, provider.name
+            )
+        )
+
+    return created_count
+
+
+def get_row_hash(row: dict) -> str:
+    return hashlib.sha256(
+        simplejson.dumps(row, sort_keys=True).encode("utf-8")
+    ).hexdigest()
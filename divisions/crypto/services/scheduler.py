@@ -0,0 +1,222 @@
+import concurrent.futures
+import datetime
+import logging
+import threading
+import time
+import typing
+
+from django import db
+from django.core import management
+
+from divisions.common import utils as common_utils
+
+logger = logging.getLogger(__name__)
+
+_LOG_PREFIX = "[SCHEDULER]"
+
+# Minute, hour, day of month, month and day of week (0 is Sunday) value ranges.
+_CRON_FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 6)]
+# Cron schedule that never matches (e.g. 31st of February) is not searched forever.
+_CRON_SEARCH_LIMIT = datetime.timedelta(days=366 * 4)
+
+
+class CronSchedule(typing.NamedTuple):
+    minutes: typing.FrozenSet[int]
+    hours: typing.FrozenSet[int]
+    days: typing.FrozenSet[int]
+    months: typing.FrozenSet[int]
+    weekdays: typing.FrozenSet[int]
+
+    @classmethod
+    def parse(cls, expression: str) -> "CronSchedule":
+        # Five field cron expression, fields accept *, values, ranges, lists and steps
+        # (e.g. "*/5 * * * *" or "0 8-18 * * 1-5").
+        fields = expression.split()
+        if len(fields) != len(_CRON_FIELD_RANGES):
+            raise ValueError(
+                "Cron expression '{}' must have {} fields".format(
+                    expression, len(_CRON_FIELD_RANGES)
+                )
+            )
+
+        return cls(
+            *(
+                _parse_cron_field(field=field, min_value=min_value, max_value=max_value)
+                for field, (min_value, max_value) in zip(fields, _CRON_FIELD_RANGES)
+            )
+        )
+
+    def get_next_run(self, after: datetime.datetime) -> datetime.datetime:
+        run_at = after.replace(second=0, microsecond=0) + datetime.timedelta(minutes=1)
+        search_end = after + _CRON_SEARCH_LIMIT
+        while run_at < search_end:
+            if run_at.month not in self.months:
+                run_at = (run_at.replace(day=1) + datetime.timedelta(days=32)).replace(
+                    day=1, hour=0, minute=0
+                )
+            elif not self._is_day_matching(run_at=run_at):
+                run_at = run_at.replace(hour=0, minute=0) + datetime.timedelta(days=1)
+            elif run_at.hour not in self.hours:
+                run_at = run_at.replace(minute=0) + datetime.timedelta(hours=1)
+            elif run_at.minute not in self.minutes:
+                run_at += datetime.timedelta(minutes=1)
+            else:
+                return run_at
+
+        raise ValueError("Cron schedule never matches")
+
+    def _is_day_matching(self, run_at: datetime.datetime) -> bool:
+        # As in cron, when both day of month and day of week are restricted either
+        # one has to match.
+        day_matches = run_at.day in self.days
+        weekday_matches = run_at.isoweekday() % 7 in self.weekdays
+        if len(self.days) < 31 and len(self.weekdays) < 7:
+            return day_matches or weekday_matches
+
+        return day_matches and weekday_matches
+
+
+class ScheduledJob(typing.NamedTuple):
+    name: str
+    command: str
+    options: dict
+    interval: typing.Optional[datetime.timedelta] = None
+    cron: typing.Optional[CronSchedule] = None
+
+    @classmethod
+    def from_settings(cls, job_settings: dict) -> "ScheduledJob":
+        if bool(job_settings.get("interval_seconds")) == bool(job_settings.get("cron")):
+            raise ValueError(
+                "Job '{}' needs either interval_seconds or cron".format(
+                    job_settings.get("name")
+                )
+            )
+
+        return cls(
+            name=job_settings["name"],
+            command=job_settings["command"],
+            options=dict(job_settings.get("options") or {}),
+            interval=datetime.timedelta(seconds=job_settings["interval_seconds"])
+            if job_settings.get("interval_seconds")
+            else None,
+            cron=CronSchedule.parse(expression=job_settings["cron"])
+            if job_settings.get("cron")
+            else None,
+        )
+
+    def get_next_run(self, after: datetime.datetime) -> datetime.datetime:
+        if self.interval:
+            return after + self.interval
+
+        return self.cron.get_next_run(after=after)
+
+
+class Scheduler(object):
+    """
+    Runs management commands of jobs in this process on their schedule, so runs do
+    not pay Django startup, new connections and cold caches. Job still running when
+    it is due again is skipped. stop() lets running jobs finish.
+    """
+
+    def __init__(self, jobs: typing.Sequence[ScheduledJob], max_workers: int = 4):
+        self.jobs = list(jobs)
+        self.max_workers = max_workers
+        self._stop_event = threading.Event()
+        self._running_jobs = {}
+
+    def run(self) -> None:
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        # Interval jobs run right away, cron jobs on their next matching minute.
+        next_runs = {
+            job.name: now if job.interval else job.get_next_run(after=now)
+            for job in self.jobs
+        }
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="scheduler"
+        ) as executor:
+            while not self._stop_event.is_set():
+                now = datetime.datetime.now(tz=datetime.timezone.utc)
+                for job in self.jobs:
+                    if next_runs[job.name] > now:
+                        continue
+
+                    next_runs[job.name] = job.get_next_run(after=now)
+                    running_job = self._running_jobs.get(job.name)
+                    if running_job is not None and not running_job.done():
+                        logger.warning(
+                            "{} Job is still running, run is skipped (job={}, next_run={}).".format(
+                                _LOG_PREFIX, job.name, next_runs[job.name]
+                            )
+                        )
+                        continue
+
+                    self._running_jobs[job.name] = executor.submit(self._run_job, job=job)
+
+                wait_seconds = (
+                    min(next_runs.values())
+                    - datetime.datetime.now(tz=datetime.timezone.utc)
+                ).total_seconds()
+                self._stop_event.wait(timeout=max(wait_seconds, 0))
+
+            logger.info(
+                "{} Stopping, waiting for {} running jobs.".format(
+                    _LOG_PREFIX,
+                    sum(not future.done() for future in self._running_jobs.values()),
+                )
+            )
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def _run_job(self, job: ScheduledJob) -> None:
+        _drop_unusable_connections()
+        started_at = time.perf_counter()
+        logger.info("{} Started job (job={}).".format(_LOG_PREFIX, job.name))
+        try:
+            management.call_command(job.command, **job.options)
+        except BaseException as e:
+            # CommandError and SystemExit of one run must not stop the scheduler.
+            msg = "Job failed (job={}, duration={:.3f}s). Error: {}".format(
+                job.name,
+                time.perf_counter() - started_at,
+                common_utils.get_exception_message(exception=e),
+            )
+            logger.exception("{} {}. Continue.".format(_LOG_PREFIX, msg))
+            return None
+
+        logger.info(
+            "{} Finished job (job={}, duration={:.3f}s).".format(
+                _LOG_PREFIX, job.name, time.perf_counter() - started_at
+            )
+        )
+
+
+def _drop_unusable_connections() -> None:
+    # Worker thread keeps its database connections between runs, only connections
+    # broken since last run are closed and reopened on next query.
+    for connection in db.connections.all():
+        if connection.connection is not None and not connection.is_usable():
+            connection.close()
+
+
+def _parse_cron_field(field: str, min_value: int, max_value: int) -> typing.FrozenSet[int]:
+    values = set()
+    for part in field.split(","):
+        value_range, _, step = part.partition("/")
+        if value_range == "*":
+            start, end = min_value, max_value
+        elif "-" in value_range:
+            start, end = (int(value) for value in value_range.split("-"))
+        else:
+            start = end = int(value_range)
+            if step:
+                end = max_value
+
+        if not min_value <= start <= end <= max_value:
+            raise ValueError(
+                "Cron field '{}' is out of range {}-{}".format(field, min_value, max_value)
+            )
+
+        values.update(range(start, end + 1, int(step) if step else 1))
+
+    return frozenset(values)
@@ -0,0 +1,824 @@
+import bisect
+import collections
+import datetime
+import decimal
+import itertools
+import logging
+import math
+import random
+import typing
+
+import simplejson
+
+from django.db import transaction
+from django.utils import timezone
+
+from divisions.common import enums as common_enums
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider import enums as provider_enums
+from divisions.crypto.integrations.provider import messages as provider_messages
+from divisions.crypto.services import bulk_loader
+
+logger = logging.getLogger(__name__)
+
+_LOG_PREFIX = "[SYNTHETIC-DATA]"
+_FUNDING_INTERVAL = datetime.timedelta(hours=8)
+_MAKER_FEE_RATE = 0.0001
+_TAKER_FEE_RATE = 0.0006
+
+Event = typing.Tuple[datetime.datetime, typing.NamedTuple]
+
+
+class _InstrumentState(object):
+    __slots__ = ("name", "price", "lot_size", "position_quantity", "entry_price")
+
+    def __init__(self, name: str, price: float, lot_size: float):
+        self.name = name
+        self.price = price
+        self.lot_size = lot_size
+        # Signed, long positions are positive.
+        self.position_quantity = 0.0
+        self.entry_price = 0.0
+
+
+class SyntheticTradingDataGenerator(object):
+    # Generates reproducible account history shaped like ours: activity skewed to
+    # few instruments (Zipf), orders filled in several executions, PnL on closing
+    # orders, funding settlements of open positions, external transfers and daily
+    # balance snapshots. Events are yielded roughly in time order, never held in memory.
+    INSTRUMENT_NAME_PREFIX = "SYN"
+
+    def __init__(
+        self,
+        seed: int = 0,
+        instruments_count: int = 300,
+        start_datetime: datetime.datetime = datetime.datetime(
+            2023, 1, 1, tzinfo=datetime.timezone.utc
+        ),
+        period: datetime.timedelta = datetime.timedelta(days=365),
+        activity_skew: float = 1.1,
+        max_fills_per_order: int = 6,
+        close_probability: float = 0.45,
+        max_open_positions: int = 10,
+        transfer_probability: float = 0.1,
+        initial_balance: decimal.Decimal = decimal.Decimal("1000000"),
+    ):
+        self.seed = seed
+        self.instruments_count = instruments_count
+        self.start_datetime = start_datetime
+        self.period = period
+        self.activity_skew = activity_skew
+        self.max_fills_per_order = max_fills_per_order
+        self.close_probability = close_probability
+        self.max_open_positions = max_open_positions
+        self.transfer_probability = transfer_probability
+        self.initial_balance = initial_balance
+
+    @property
+    def instrument_names(self) -> typing.List[str]:
+        return [
+            "{}{}USDT".format(self.INSTRUMENT_NAME_PREFIX, instrument_index)
+            for instrument_index in range(self.instruments_count)
+        ]
+
+    def iter_events(self, executions_count: int) -> typing.Iterator[Event]:
+        rng = random.Random(self.seed)
+        instruments = [
+            _InstrumentState(
+                name=instrument_name,
+                price=10 ** rng.uniform(-2, 4.5),
+                lot_size=0,
+            )
+            for instrument_name in self.instrument_names
+        ]
+        for instrument in instruments:
+            # Roughly 10 USDT minimum order value, like exchange lot sizes.
+            instrument.lot_size = 10 ** math.floor(math.log10(10 / instrument.price))
+
+        cumulative_weights = list(
+            itertools.accumulate(
+                1 / (rank + 1) ** self.activity_skew for rank in range(len(instruments))
+            )
+        )
+        # Average order is filled by (1 + max_fills) / 2 executions.
+        orders_count = max(1, executions_count * 2 // (self.max_fills_per_order + 1))
+        mean_order_interval = self.period.total_seconds() / orders_count
+
+        open_positions = []
+        wallet_balance = self.initial_balance
+        current_datetime = self.start_datetime
+        next_funding_datetime = self.start_datetime + _FUNDING_INTERVAL
+        next_day_datetime = self.start_datetime
+        order_number = 0
+        execution_number = 0
+        funding_number = 0
+        transfer_number = 0
+
+        while execution_number < executions_count:
+            current_datetime += datetime.timedelta(
+                seconds=rng.expovariate(1 / mean_order_interval)
+            )
+
+            while next_day_datetime <= current_datetime:
+                if rng.random() < self.transfer_probability:
+                    transfer_number += 1
+                    wallet_transfer = self._get_wallet_transfer(
+                        rng=rng,
+                        transfer_number=transfer_number,
+                        wallet_balance=wallet_balance,
+                        network_datetime=next_day_datetime
+                        + datetime.timedelta(seconds=rng.uniform(0, 3600)),
+                    )
+                    wallet_balance += (
+                        wallet_transfer.amount
+                        if wallet_transfer.type
+                        == provider_enums.WalletTransferType.DEPOSIT.value
+                        else -wallet_transfer.amount
+                    )
+                    yield wallet_transfer.network_datetime, wallet_transfer
+
+                yield next_day_datetime, provider_messages.WalletBalance(
+                    currency=common_enums.Currency.USDT.value, amount=wallet_balance
+                )
+                next_day_datetime += datetime.timedelta(days=1)
+
+            while next_funding_datetime <= current_datetime:
+                for instrument in open_positions:
+                    funding_number += 1
+                    # Longs pay positive funding rate, shorts receive it.
+                    funding = _to_decimal(
+                        value=instrument.position_quantity
+                        * instrument.price
+                        * rng.gauss(0.0001, 0.0002)
+                    )
+                    wallet_balance -= funding
+                    yield next_funding_datetime, provider_messages.TransactionLogEntry(
+                        transaction_id="synthetic-funding-{}".format(funding_number),
+                        currency=common_enums.Currency.USDT.value,
+                        market_instrument_name=instrument.name,
+                        type="SETTLEMENT",
+                        side="Buy" if instrument.position_quantity > 0 else "Sell",
+                        quantity=decimal.Decimal("0"),
+                        position_size=_to_decimal(value=instrument.position_quantity),
+                        price=_to_decimal(value=instrument.price),
+                        funding=funding,
+                        fee=decimal.Decimal("0"),
+                        cash_flow=decimal.Decimal("0"),
+                        change=-funding,
+                        wallet_balance=wallet_balance,
+                        fee_rate=None,
+                        trade_id=None,
+                        order_id=None,
+                        created_at=next_funding_datetime,
+                    )
+                next_funding_datetime += _FUNDING_INTERVAL
+
+            # Account holds few positions at once, closing orders go to open ones so
+            # rarely traded instruments do not stay open (and pay funding) for months.
+            if open_positions and (
+                len(open_positions) >= self.max_open_positions
+                or rng.random() < self.close_probability
+            ):
+                instrument = rng.choice(open_positions)
+                side = "Sell" if instrument.position_quantity > 0 else "Buy"
+                quantity = abs(instrument.position_quantity) * rng.choice(
+                    (1, 1, 1, 0.5)
+                )
+            else:
+                instrument = instruments[
+                    bisect.bisect(
+                        cumulative_weights, rng.random() * cumulative_weights[-1]
+                    )
+                ]
+                if instrument.position_quantity:
+                    side = "Buy" if instrument.position_quantity > 0 else "Sell"
+                else:
+                    side = rng.choice(("Buy", "Sell"))
+                quantity = instrument.lot_size * rng.randint(1, 200)
+            instrument.price *= math.exp(rng.gauss(0, 0.004))
+            order_number += 1
+            order_id = "synthetic-order-{}".format(order_number)
+            quantity = max(
+                instrument.lot_size,
+                round(quantity / instrument.lot_size) * instrument.lot_size,
+            )
+            is_market = rng.random() < 0.6
+            order_price = instrument.price * (
+                1 if is_market else (0.999 if side == "Buy" else 1.001)
+            )
+
+            fills_count = min(
+                rng.randint(1, self.max_fills_per_order),
+                max(1, int(round(quantity / instrument.lot_size))),
+            )
+            fill_quantities = self._split_quantity(
+                rng=rng,
+                quantity=quantity,
+                lot_size=instrument.lot_size,
+                parts=fills_count,
+            )
+            executions = []
+            execution_datetime = current_datetime
+            for fill_quantity in fill_quantities:
+                execution_number += 1
+                execution_datetime += datetime.timedelta(
+                    milliseconds=rng.randint(1, 1500)
+                )
+                execution_price = order_price * (1 + rng.gauss(0, 0.0003))
+                is_maker = not is_market and rng.random() < 0.8
+                executions.append(
+                    provider_messages.TradeExecution(
+                        market_instrument_name=instrument.name,
+                        order_id=order_id,
+                        execution_id="synthetic-execution-{}".format(execution_number),
+                        execution_side=side,
+                        executed_fee=_to_decimal(
+                            value=fill_quantity
+                            * execution_price
+                            * (_MAKER_FEE_RATE if is_maker else _TAKER_FEE_RATE)
+                        ),
+                        execution_price=_to_decimal(value=execution_price),
+                        execution_quantity=_to_decimal(value=fill_quantity),
+                        execution_type="Trade",
+                        execution_value=_to_decimal(
+                            value=fill_quantity * execution_price
+                        ),
+                        is_maker=is_maker,
+                        created_at=execution_datetime,
+                    )
+                )
+
+            executed_value = sum(
+                execution.execution_value for execution in executions
+            )
+            executed_fee = sum(execution.executed_fee for execution in executions)
+            average_price = float(executed_value) / quantity
+            trade_order = provider_messages.TradeOrder(
+                market_instrument_name=instrument.name,
+                order_id=order_id,
+                order_side=side,
+                order_quantity=_to_decimal(value=quantity),
+                order_price=_to_decimal(value=order_price),
+                average_order_price=_to_decimal(value=average_price),
+                order_type="Market" if is_market else "Limit",
+                order_status="Filled",
+                order_total_executed_value=executed_value,
+                order_total_executed_quantity=_to_decimal(value=quantity),
+                order_total_executed_fee=executed_fee,
+                created_at=current_datetime,
+                updated_at=execution_datetime,
+            )
+            yield current_datetime, trade_order
+            for execution in executions:
+                yield execution.created_at, execution
+
+            wallet_balance -= executed_fee
+            signed_quantity = quantity if side == "Buy" else -quantity
+            if instrument.position_quantity * signed_quantity < 0:
+                closed_quantity = min(quantity, abs(instrument.position_quantity))
+                closed_pnl = _to_decimal(
+                    value=(average_price - instrument.entry_price)
+                    * closed_quantity
+                    * (1 if instrument.position_quantity > 0 else -1)
+                )
+                wallet_balance += closed_pnl
+                yield execution_datetime, provider_messages.TradePnLPosition(
+                    market_instrument_name=instrument.name,
+                    order_id=order_id,
+                    position_side=side,
+                    position_quantity=trade_order.order_quantity,
+                    order_price=trade_order.order_price,
+                    order_type=trade_order.order_type,
+                    position_closed_size=_to_decimal(value=closed_quantity),
+                    total_entry_value=_to_decimal(
+                        value=instrument.entry_price * closed_quantity
+                    ),
+                    average_entry_price=_to_decimal(value=instrument.entry_price),
+                    total_exit_value=_to_decimal(value=average_price * closed_quantity),
+                    average_exit_price=trade_order.average_order_price,
+                    closed_pnl=closed_pnl,
+                    created_at=execution_datetime,
+                )
+
+                remaining_quantity = instrument.position_quantity + signed_quantity
+                if abs(remaining_quantity) < instrument.lot_size / 2:
+                    instrument.position_quantity = 0.0
+                    instrument.entry_price = 0.0
+                    open_positions.remove(instrument)
+                elif remaining_quantity * instrument.position_quantity < 0:
+                    # Order flipped position, rest of it opened new one.
+                    instrument.position_quantity = remaining_quantity
+                    instrument.entry_price = average_price
+                else:
+                    instrument.position_quantity = remaining_quantity
+            else:
+                if not instrument.position_quantity:
+                    open_positions.append(instrument)
+                new_quantity = instrument.position_quantity + signed_quantity
+                instrument.entry_price = (
+                    abs(instrument.position_quantity) * instrument.entry_price
+                    + quantity * average_price
+                ) / abs(new_quantity)
+                instrument.position_quantity = new_quantity
+
+    def _get_wallet_transfer(
+        self,
+        rng: random.Random,
+        transfer_number: int,
+        wallet_balance: decimal.Decimal,
+        network_datetime: datetime.datetime,
+    ) -> provider_messages.WalletTransfer:
+        is_deposit = rng.random() < 0.7
+        amount = _to_decimal(
+            value=float(wallet_balance) * rng.uniform(0.005, 0.05)
+        )
+        return provider_messages.WalletTransfer(
+            transaction_currency=common_enums.Currency.USDT.value,
+            chain_currency=common_enums.Currency.USDT.value,
+            type=provider_enums.WalletTransferType.DEPOSIT.value
+            if is_deposit
+            else provider_enums.WalletTransferType.WITHDRAWAL.value,
+            status=provider_enums.WalletTransferStatus.SUCCESS.value,
+            txid="synthetic-transfer-{}".format(transfer_number),
+            from_recipient=None,
+            to_recipient=provider_enums.WalletType.FUND.name if is_deposit else None,
+            portfolio_type=provider_enums.WalletType.FUND.name,
+            amount=amount,
+            fee=decimal.Decimal("0") if is_deposit else decimal.Decimal("1"),
+            network_datetime=network_datetime,
+        )
+
+    @staticmethod
+    def _split_quantity(
+        rng: random.Random, quantity: float, lot_size: float, parts: int
+    ) -> typing.List[float]:
+        lots = int(round(quantity / lot_size))
+        cuts = sorted(rng.sample(range(1, lots), parts - 1)) if parts > 1 else []
+        return [
+            (end - start) * lot_size
+            for start, end in zip([0] + cuts, cuts + [lots])
+        ]
+
+
+def serialize_event(event_datetime: datetime.datetime, message: typing.NamedTuple) -> str:
+    record = {"type": type(message).__name__, "event_datetime": event_datetime}
+    record.update(message._asdict())
+    return simplejson.dumps(record, default=_serialize_value)
+
+
+def iter_api_pages(
+    events: typing.Iterable[Event], page_size: int = 50
+) -> typing.Iterator[dict]:
+    # Buffers at most one page per endpoint, pages are shaped like provider v5 API
+    # responses so they can be replayed through client parsing and schemas.
+    pages = collections.defaultdict(list)
+    page_numbers = collections.Counter()
+    for _, message in events:
+        endpoint_mapping = _API_ENDPOINTS.get(type(message))
+        if not endpoint_mapping:
+            continue
+
+        endpoint, data_field, to_api_record = endpoint_mapping
+        pages[endpoint].append(to_api_record(message))
+        if len(pages[endpoint]) == page_size:
+            page_numbers[endpoint] += 1
+            yield _get_api_page(
+                endpoint=endpoint,
+                data_field=data_field,
+                records=pages.pop(endpoint),
+                page_number=page_numbers[endpoint],
+                is_last=False,
+            )
+
+    for endpoint, records in pages.items():
+        page_numbers[endpoint] += 1
+        yield _get_api_page(
+            endpoint=endpoint,
+            data_field=[
+                data_field
+                for mapped_endpoint, data_field, _ in _API_ENDPOINTS.values()
+                if mapped_endpoint == endpoint
+            ][0],
+            records=records,
+            page_number=page_numbers[endpoint],
+            is_last=True,
+        )
+
+
+def load_events(
+    events: typing.Iterable[Event],
+    provider: crypto_enums.CryptoProvider,
+    wallet_type: provider_enums.WalletType = provider_enums.WalletType.DERIVATIVE,
+    batch_size: int = 20000,
+) -> typing.Dict[str, int]:
+    loaded_counts = collections.Counter()
+    batch = collections.defaultdict(list)
+    batch_events_count = 0
+    for event_datetime, message in events:
+        batch[type(message)].append((event_datetime, message))
+        batch_events_count += 1
+        if batch_events_count >= batch_size:
+            with transaction.atomic():
+                _load_batch(
+                    batch=batch,
+                    provider=provider,
+                    wallet_type=wallet_type,
+                    loaded_counts=loaded_counts,
+                )
+            batch = collections.defaultdict(list)
+            batch_events_count = 0
+
+    with transaction.atomic():
+        _load_batch(
+            batch=batch,
+            provider=provider,
+            wallet_type=wallet_type,
+            loaded_counts=loaded_counts,
+        )
+    return dict(loaded_counts)
+
+
+def _load_batch(
+    batch: typing.Dict[type, typing.List[Event]],
+    provider: crypto_enums.CryptoProvider,
+    wallet_type: provider_enums.WalletType,
+    loaded_counts: collections.Counter,
+) -> None:
+    provider_choice = provider.to_integer_choice()
+    now = timezone.now()
+
+    # Orders go first, executions and PnL rows reference them by primary key.
+    trade_orders = [message for _, message in batch[provider_messages.TradeOrder]]
+    loaded_counts["orders"] += bulk_loader.bulk_insert(
+        model=crypto_models.TradeOrder,
+        field_names=[
+            "instrument_name",
+            "order_id",
+            "order_side",
+            "order_quantity",
+            "order_price",
+            "average_order_price",
+            "order_type",
+            "order_status",
+            "order_total_executed_value",
+            "order_total_executed_quantity",
+            "order_total_executed_fee",
+            "created_at",
+            "updated_at",
+            "provider",
+        ],
+        rows=[
+            (
+                trade_order.market_instrument_name,
+                trade_order.order_id,
+                trade_order.order_side,
+                trade_order.order_quantity,
+                trade_order.order_price,
+                trade_order.average_order_price,
+                trade_order.order_type,
+                trade_order.order_status,
+                trade_order.order_total_executed_value,
+                trade_order.order_total_executed_quantity,
+                trade_order.order_total_executed_fee,
+                trade_order.created_at,
+                trade_order.updated_at,
+                provider_choice,
+            )
+            for trade_order in trade_orders
+        ],
+        conflict_field_names=["order_id"],
+    )
+    # Batch may start in the middle of an order, its executions are then linked to
+    # order stored by previous batch.
+    referenced_order_ids = {
+        message.order_id
+        for message_type in (
+            provider_messages.TradeExecution,
+            provider_messages.TradePnLPosition,
+        )
+        for _, message in batch[message_type]
+    }
+    trade_order_ids = {}
+    for trade_order_id, order_id in crypto_models.TradeOrder.objects.filter(
+        order_id__in=referenced_order_ids
+    ).values_list("id", "order_id"):
+        trade_order_ids[order_id] = trade_order_id
+
+    loaded_counts["executions"] += bulk_loader.bulk_insert(
+        model=crypto_models.TradeExecutionTransaction,
+        field_names=[
+            "instrument_name",
+            "execution_id",
+            "execution_side",
+            "execution_type",
+            "executed_fee",
+            "execution_price",
+            "execution_quantity",
+            "execution_value",
+            "is_maker",
+            "provider",
+            "created_at",
+            "order_id",
+        ],
+        rows=[
+            (
+                execution.market_instrument_name,
+                execution.execution_id,
+                execution.execution_side,
+                execution.execution_type,
+                execution.executed_fee,
+                execution.execution_price,
+                execution.execution_quantity,
+                execution.execution_value,
+                execution.is_maker,
+                provider_choice,
+                execution.created_at,
+                trade_order_ids.get(execution.order_id),
+            )
+            for _, execution in batch[provider_messages.TradeExecution]
+        ],
+        conflict_field_names=["execution_id"],
+    )
+    loaded_counts["pnl"] += bulk_loader.bulk_insert(
+        model=crypto_models.TradePnLTransaction,
+        field_names=[
+            "position_closed_size",
+            "total_entry_value",
+            "average_entry_price",
+            "total_exit_value",
+            "average_exit_price",
+            "closed_pnl",
+            "created_at",
+            "order_id",
+        ],
+        rows=[
+            (
+                pnl_position.position_closed_size,
+                pnl_position.total_entry_value,
+                pnl_position.average_entry_price,
+                pnl_position.total_exit_value,
+                pnl_position.average_exit_price,
+                pnl_position.closed_pnl,
+                pnl_position.created_at,
+                trade_order_ids.get(pnl_position.order_id),
+            )
+            for _, pnl_position in batch[provider_messages.TradePnLPosition]
+        ],
+    )
+    loaded_counts["funding"] += bulk_loader.bulk_insert(
+        model=crypto_models.PortfolioTransactionLogEntry,
+        field_names=[
+            "provider",
+            "transaction_id",
+            "currency",
+            "instrument_name",
+            "type",
+            "side",
+            "quantity",
+            "position_size",
+            "price",
+            "funding",
+            "fee",
+            "cash_flow",
+            "change",
+            "wallet_balance",
+            "fee_rate",
+            "trade_id",
+            "order_id",
+            "created_at",
+        ],
+        rows=[
+            (
+                provider_choice,
+                entry.transaction_id,
+                entry.currency,
+                entry.market_instrument_name,
+                entry.type,
+                entry.side,
+                entry.quantity,
+                entry.position_size,
+                entry.price,
+                entry.funding,
+                entry.fee,
+                entry.cash_flow,
+                entry.change,
+                entry.wallet_balance,
+                entry.fee_rate,
+                entry.trade_id,
+                entry.order_id,
+                entry.created_at,
+            )
+            for _, entry in batch[provider_messages.TransactionLogEntry]
+        ],
+        conflict_field_names=["provider", "transaction_id"],
+    )
+    loaded_counts["transfers"] += bulk_loader.bulk_insert(
+        model=crypto_models.PortfolioTransfer,
+        field_names=[
+            "provider",
+            "transaction_currency",
+            "chain_currency",
+            "type",
+            "status",
+            "txid",
+            "from_recipient",
+            "to_recipient",
+            "portfolio_type",
+            "amount",
+            "fee",
+            "network_datetime",
+            "created_at",
+            "updated_at",
+        ],
+        rows=[
+            (
+                provider_choice,
+                wallet_transfer.transaction_currency,
+                wallet_transfer.chain_currency,
+                wallet_transfer.type,
+                wallet_transfer.status,
+                wallet_transfer.txid,
+                wallet_transfer.from_recipient,
+                wallet_transfer.to_recipient,
+                wallet_transfer.portfolio_type,
+                wallet_transfer.amount,
+                wallet_transfer.fee,
+                wallet_transfer.network_datetime,
+                now,
+                now,
+            )
+            for _, wallet_transfer in batch[provider_messages.WalletTransfer]
+        ],
+    )
+    loaded_counts["balance_snapshots"] += bulk_loader.bulk_insert(
+        model=crypto_models.PortfolioWalletBalanceSnapshot,
+        field_names=["provider", "portfolio_type", "currency", "amount", "created_at"],
+        rows=[
+            (
+                provider_choice,
+                wallet_type.name,
+                wallet_balance.currency,
+                wallet_balance.amount,
+                event_datetime,
+            )
+            for event_datetime, wallet_balance in batch[provider_messages.WalletBalance]
+        ],
+    )
+    logger.info(
+        "{} Loaded batch ({}).".format(
+            _LOG_PREFIX,
+            ", ".join(
+                "{}={}".format(name, count) for name, count in sorted(loaded_counts.items())
+            ),
+        )
+    )
+
+
+def _to_decimal(value: float) -> decimal.Decimal:
+    return decimal.Decimal("{:.8f}".format(value))
+
+
+def _to_milliseconds(value: datetime.datetime) -> str:
+    return str(int(value.timestamp() * 1000))
+
+
+def _serialize_value(value: typing.Any) -> typing.Any:
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+
+    raise TypeError("Object of type {} is not JSON serializable".format(type(value)))
+
+
+def _get_api_page(
+    endpoint: str,
+    data_field: str,
+    records: typing.List[dict],
+    page_number: int,
+    is_last: bool,
+) -> dict:
+    return {
+        "endpoint": endpoint,
+        "response": {
+            "retCode": 0,
+            "retMsg": "OK",
+            "result": {
+                data_field: records,
+                "nextPageCursor": "" if is_last else "page-{}".format(page_number + 1),
+            },
+        },
+    }
+
+
+def _to_api_trade_order(trade_order: provider_messages.TradeOrder) -> dict:
+    return {
+        "symbol": trade_order.market_instrument_name,
+        "orderId": trade_order.order_id,
+        "side": trade_order.order_side,
+        "qty": str(trade_order.order_quantity),
+        "price": str(trade_order.order_price),
+        "avgPrice": str(trade_order.average_order_price),
+        "orderType": trade_order.order_type,
+        "orderStatus": trade_order.order_status,
+        "cumExecValue": str(trade_order.order_total_executed_value),
+        "cumExecQty": str(trade_order.order_total_executed_quantity),
+        "cumExecFee": str(trade_order.order_total_executed_fee),
+        "createdTime": _to_milliseconds(value=trade_order.created_at),
+        "updatedTime": _to_milliseconds(value=trade_order.updated_at),
+    }
+
+
+def _to_api_trade_execution(execution: provider_messages.TradeExecution) -> dict:
+    return {
+        "symbol": execution.market_instrument_name,
+        "orderId": execution.order_id,
+        "execId": execution.execution_id,
+        "side": execution.execution_side,
+        "execFee": str(execution.executed_fee),
+        "execPrice": str(execution.execution_price),
+        "execQty": str(execution.execution_quantity),
+        "execType": execution.execution_type,
+        "execValue": str(execution.execution_value),
+        "isMaker": execution.is_maker,
+        "execTime": _to_milliseconds(value=execution.created_at),
+    }
+
+
+def _to_api_trade_pnl_position(
+    pnl_position: provider_messages.TradePnLPosition,
+) -> dict:
+    return {
+        "symbol": pnl_position.market_instrument_name,
+        "orderId": pnl_position.order_id,
+        "side": pnl_position.position_side,
+        "qty": str(pnl_position.position_quantity),
+        "orderPrice": str(pnl_position.order_price),
+        "orderType": pnl_position.order_type,
+        "closedSize": str(pnl_position.position_closed_size),
+        "cumEntryValue": str(pnl_position.total_entry_value),
+        "avgEntryPrice": str(pnl_position.average_entry_price),
+        "cumExitValue": str(pnl_position.total_exit_value),
+        "avgExitPrice": str(pnl_position.average_exit_price),
+        "closedPnl": str(pnl_position.closed_pnl),
+        "createdTime": _to_milliseconds(value=pnl_position.created_at),
+    }
+
+
+def _to_api_transaction(entry: provider_messages.TransactionLogEntry) -> dict:
+    return {
+        "id": entry.transaction_id,
+        "symbol": entry.market_instrument_name,
+        "side": entry.side,
+        "type": entry.type,
+        "currency": entry.currency,
+        "qty": str(entry.quantity),
+        "size": str(entry.position_size),
+        "tradePrice": str(entry.price) if entry.price is not None else "",
+        "funding": str(entry.funding),
+        "fee": str(entry.fee),
+        "cashFlow": str(entry.cash_flow),
+        "change": str(entry.change),
+        "cashBalance": str(entry.wallet_balance),
+        "feeRate": "",
+        "tradeId": "",
+        "orderId": "",
+        "transactionTime": _to_milliseconds(value=entry.created_at),
+    }
+
+
+def _to_api_wallet_transfer(wallet_transfer: provider_messages.WalletTransfer) -> dict:
+    return {
+        "txID": wallet_transfer.txid,
+        "coin": wallet_transfer.transaction_currency,
+        "chain": wallet_transfer.chain_currency,
+        "amount": str(wallet_transfer.amount),
+        "depositFee": str(wallet_transfer.fee),
+        "status": 3,
+        "successAt": _to_milliseconds(value=wallet_transfer.network_datetime),
+    }
+
+
+# Message type -> (API endpoint, response list field, record converter).
+_API_ENDPOINTS = {
+    provider_messages.TradeOrder: ("/v5/order/history", "list", _to_api_trade_order),
+    provider_messages.TradeExecution: (
+        "/v5/execution/list",
+        "list",
+        _to_api_trade_execution,
+    ),
+    provider_messages.TradePnLPosition: (
+        "/v5/position/closed-pnl",
+        "list",
+        _to_api_trade_pnl_position,
+    ),
+    provider_messages.TransactionLogEntry: (
+        "/v5/account/transaction-log",
+        "list",
+        _to_api_transaction,
+    ),
+    provider_messages.WalletTransfer: (
+        "/v5/asset/deposit/query-record",
+        "rows",
+        _to_api_wallet_transfer,
+    ),
+}
@@ -0,0 +1,61 @@
+import datetime
+import typing
+
+from django.db import models as django_db_models
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+
+TRADE_ORDER_FIELDS = [
+    "id",
+    "provider",
+    "instrument_name",
+    "order_id",
+    "order_side",
+    "order_type",
+    "order_status",
+    "order_quantity",
+    "order_price",
+    "average_order_price",
+    "order_total_executed_value",
+    "order_total_executed_quantity",
+    "order_total_executed_fee",
+    "created_at",
+    "updated_at",
+]
+
+
+def get_trade_orders(
+    provider: typing.Optional[crypto_enums.CryptoProvider] = None,
+    instrument_names: typing.Optional[typing.List[str]] = None,
+    order_statuses: typing.Optional[typing.List[str]] = None,
+    from_datetime: typing.Optional[datetime.datetime] = None,
+    to_datetime: typing.Optional[datetime.datetime] = None,
+    after: typing.Optional[typing.Tuple[datetime.datetime, int]] = None,
+) -> django_db_models.QuerySet:
+    trade_orders_qs = crypto_models.TradeOrder.objects.all()
+
+    if provider:
+        trade_orders_qs = trade_orders_qs.filter(provider=provider.to_integer_choice())
+
+    if instrument_names:
+        trade_orders_qs = trade_orders_qs.filter(instrument_name__in=instrument_names)
+
+    if order_statuses:
+        trade_orders_qs = trade_orders_qs.filter(order_status__in=order_statuses)
+
+    if from_datetime:
+        trade_orders_qs = trade_orders_qs.filter(created_at__gte=from_datetime)
+
+    if to_datetime:
+        trade_orders_qs = trade_orders_qs.filter(created_at__lt=to_datetime)
+
+    if after:
+        # Keyset pagination, seeks past last seen row instead of OFFSET scanning.
+        after_created_at, after_id = after
+        trade_orders_qs = trade_orders_qs.filter(
+            django_db_models.Q(created_at__gt=after_created_at)
+            | django_db_models.Q(created_at=after_created_at, id__gt=after_id)
+        )
+
+    return trade_orders_qs.order_by("created_at", "id").values(*TRADE_ORDER_FIELDS)
@@ -0,0 +1,181 @@
+import csv
+import datetime
+import decimal
+import io
+import typing
+import zlib
+
+import simplejson
+
+from django.db import models as django_db_models
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+
+DEFAULT_CHUNK_SIZE = 2000
+# Encoded rows are buffered up to this size before being handed to the caller.
+_OUTPUT_BUFFER_SIZE = 64 * 1024
+
+# Export column name -> model field lookup.
+_EXPORT_COLUMNS = {
+    crypto_enums.ExportDataset.EXECUTIONS: [
+        ("id", "id"),
+        ("provider", "provider"),
+        ("instrument_name", "instrument_name"),
+        ("execution_id", "execution_id"),
+        ("order_id", "order__order_id"),
+        ("execution_side", "execution_side"),
+        ("execution_type", "execution_type"),
+        ("execution_price", "execution_price"),
+        ("execution_quantity", "execution_quantity"),
+        ("execution_value", "execution_value"),
+        ("executed_fee", "executed_fee"),
+        ("is_maker", "is_maker"),
+        ("created_at", "created_at"),
+    ],
+    crypto_enums.ExportDataset.PNL: [
+        ("id", "id"),
+        ("provider", "order__provider"),
+        ("instrument_name", "order__instrument_name"),
+        ("order_id", "order__order_id"),
+        ("position_closed_size", "position_closed_size"),
+        ("total_entry_value", "total_entry_value"),
+        ("average_entry_price", "average_entry_price"),
+        ("total_exit_value", "total_exit_value"),
+        ("average_exit_price", "average_exit_price"),
+        ("closed_pnl", "closed_pnl"),
+        ("created_at", "created_at"),
+    ],
+}
+
+
+def get_export_columns(dataset: crypto_enums.ExportDataset) -> typing.List[str]:
+    return [column for column, _ in _EXPORT_COLUMNS[dataset]]
+
+
+def get_export_rows(
+    dataset: crypto_enums.ExportDataset,
+    provider: typing.Optional[crypto_enums.CryptoProvider] = None,
+    instrument_names: typing.Optional[typing.List[str]] = None,
+    from_datetime: typing.Optional[datetime.datetime] = None,
+    to_datetime: typing.Optional[datetime.datetime] = None,
+) -> django_db_models.QuerySet:
+    if dataset == crypto_enums.ExportDataset.EXECUTIONS:
+        export_qs = crypto_models.TradeExecutionTransaction.objects.all()
+        provider_lookup = "provider"
+        instrument_name_lookup = "instrument_name"
+    else:
+        export_qs = crypto_models.TradePnLTransaction.objects.all()
+        provider_lookup = "order__provider"
+        instrument_name_lookup = "order__instrument_name"
+
+    if provider:
+        export_qs = export_qs.filter(**{provider_lookup: provider.to_integer_choice()})
+
+    if instrument_names:
+        export_qs = export_qs.filter(
+            **{"{}__in".format(instrument_name_lookup): instrument_names}
+        )
+
+    if from_datetime:
+        export_qs = export_qs.filter(created_at__gte=from_datetime)
+
+    if to_datetime:
+        export_qs = export_qs.filter(created_at__lt=to_datetime)
+
+    return export_qs.order_by("created_at", "id").values_list(
+        *[lookup for _, lookup in _EXPORT_COLUMNS[dataset]]
+    )
+
+
+def iter_export(
+    dataset: crypto_enums.ExportDataset,
+    export_format: crypto_enums.ExportFormat,
+    provider: typing.Optional[crypto_enums.CryptoProvider] = None,
+    instrument_names: typing.Optional[typing.List[str]] = None,
+    from_datetime: typing.Optional[datetime.datetime] = None,
+    to_datetime: typing.Optional[datetime.datetime] = None,
+    compress: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> typing.Iterator[bytes]:
+    # iterator() keeps a server-side cursor open on Postgres, so only one chunk of
+    # rows and one output buffer are held in memory regardless of export size.
+    rows = get_export_rows(
+        dataset=dataset,
+        provider=provider,
+        instrument_names=instrument_names,
+        from_datetime=from_datetime,
+        to_datetime=to_datetime,
+    ).iterator(chunk_size=chunk_size)
+    encoded_chunks = _encode_rows(
+        columns=get_export_columns(dataset=dataset),
+        rows=rows,
+        export_format=export_format,
+    )
+    if not compress:
+        return encoded_chunks
+
+    return _compress_chunks(chunks=encoded_chunks)
+
+
+def _encode_rows(
+    columns: typing.List[str],
+    rows: typing.Iterator[tuple],
+    export_format: crypto_enums.ExportFormat,
+) -> typing.Iterator[bytes]:
+    provider_column_index = columns.index("provider")
+    buffer = io.StringIO()
+    csv_writer = csv.writer(buffer, lineterminator="\n")
+    if export_format == crypto_enums.ExportFormat.CSV:
+        csv_writer.writerow(columns)
+
+    for row in rows:
+        row = [
+            _serialize_value(value=value, export_format=export_format) for value in row
+        ]
+        if row[provider_column_index] is not None:
+            row[provider_column_index] = crypto_enums.CryptoProvider.from_integer_choice(
+                row[provider_column_index]
+            ).value
+
+        if export_format == crypto_enums.ExportFormat.CSV:
+            csv_writer.writerow(row)
+        else:
+            buffer.write(simplejson.dumps(dict(zip(columns, row))))
+            buffer.write("\n")
+
+        if buffer.tell() >= _OUTPUT_BUFFER_SIZE:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _serialize_value(
+    value: typing.Any, export_format: crypto_enums.ExportFormat
+) -> typing.Any:
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+
+    if isinstance(value, decimal.Decimal):
+        # Fixed point notation, str() would render zero with 8 places as 0E-8.
+        # JSON gets exact number literal instead of going through float.
+        if export_format == crypto_enums.ExportFormat.NDJSON:
+            return simplejson.RawJSON(format(value, "f"))
+
+        return format(value, "f")
+
+    return value
+
+
+def _compress_chunks(chunks: typing.Iterator[bytes]) -> typing.Iterator[bytes]:
+    # wbits=31 writes gzip container so output can be saved directly as .gz file.
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed_chunk = compressor.compress(chunk)
+        if compressed_chunk:
+            yield compressed_chunk
+
+    yield compressor.flush()
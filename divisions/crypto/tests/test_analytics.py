@@ -0,0 +1,130 @@
+import datetime
+import math
+import statistics
+
+import numpy as np
+
+from django.test import SimpleTestCase
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto.integrations.provider import enums as provider_enums
+from divisions.crypto.services import analytics as analytics_services
+from divisions.crypto.services import analytics_benchmark as analytics_benchmark_services
+
+_STARTED_AT = datetime.datetime(2023, 4, 29, 12, tzinfo=datetime.timezone.utc)
+_NO_BALANCES = analytics_services.BalanceSeries(
+    timestamps=np.array([], dtype=np.float64), amounts=np.array([], dtype=np.float64)
+)
+
+
+def _get_pnl_series(trades: list) -> analytics_services.PnLSeries:
+    # Trades are (instrument name, day offset, closed PnL), every one with entry value 100.
+    instrument_names = sorted({instrument_name for instrument_name, _, _ in trades})
+    return analytics_services.PnLSeries(
+        instrument_names=np.array(instrument_names, dtype=object),
+        instrument_codes=np.array(
+            [instrument_names.index(instrument_name) for instrument_name, _, _ in trades]
+        ),
+        timestamps=np.array(
+            [
+                (_STARTED_AT + datetime.timedelta(days=days)).timestamp()
+                for _, days, _ in trades
+            ]
+        ),
+        closed_pnl=np.array([closed_pnl for _, _, closed_pnl in trades], dtype=np.float64),
+        entry_value=np.full(len(trades), 100.0),
+    )
+
+
+def _calculate_performance_report(
+    trades: list, aggregation_period: crypto_enums.AggregationPeriod
+):
+    return analytics_services.calculate_performance_report(
+        pnl_series=_get_pnl_series(trades=trades),
+        balance_series=_NO_BALANCES,
+        provider=crypto_enums.CryptoProvider.BYBIT,
+        trading_category=provider_enums.TradingCategory.LINEAR,
+        aggregation_period=aggregation_period,
+    )
+
+
+class PerformanceReportTestCase(SimpleTestCase):
+    def test_portfolio_metrics(self):
+        daily_pnl = [10, -4, -6, 3, 8, -1]
+        report = _calculate_performance_report(
+            trades=[("BTCUSDT", days, pnl) for days, pnl in enumerate(daily_pnl)],
+            aggregation_period=crypto_enums.AggregationPeriod.YEAR,
+        )
+
+        portfolio = report.portfolio
+        # Equity 10, 6, 0, 3, 11, 10: peak 10 on first day is regained on fifth.
+        self.assertEqual(portfolio.max_drawdown, -10)
+        self.assertEqual(portfolio.max_drawdown_duration, 3)
+        self.assertEqual(portfolio.trade_count, 6)
+        self.assertEqual(portfolio.pnl, 10)
+        self.assertEqual(portfolio.win_rate, 0.5)
+        self.assertEqual(portfolio.average_win, 7)
+        self.assertAlmostEqual(portfolio.average_loss, -11 / 3)
+        self.assertAlmostEqual(portfolio.profit_factor, 21 / 11)
+        self.assertEqual(portfolio.exposure, 600)
+        # Without balances returns are raw daily PnL.
+        self.assertAlmostEqual(
+            portfolio.sharpe_ratio,
+            statistics.mean(daily_pnl) / statistics.stdev(daily_pnl) * math.sqrt(365),
+        )
+        self.assertAlmostEqual(
+            portfolio.sortino_ratio,
+            statistics.mean(daily_pnl) / math.sqrt((16 + 36 + 1) / 6) * math.sqrt(365),
+        )
+
+    def test_drawdown_restarts_in_every_period(self):
+        report = _calculate_performance_report(
+            trades=[
+                ("BTCUSDT", 0, 5),
+                ("BTCUSDT", 1, -3),
+                ("ETHUSDT", 2, -2),
+                ("ETHUSDT", 3, 1),
+            ],
+            aggregation_period=crypto_enums.AggregationPeriod.MONTH,
+        )
+
+        self.assertEqual(
+            [
+                (period.period_start, period.pnl, period.max_drawdown, period.max_drawdown_duration)
+                for period in report.periods
+            ],
+            [
+                (datetime.date(2023, 4, 1), 2, -3, 1),
+                (datetime.date(2023, 5, 1), -1, -2, 2),
+            ],
+        )
+        self.assertEqual(
+            (report.portfolio.max_drawdown, report.portfolio.max_drawdown_duration),
+            (-5, 3),
+        )
+        self.assertEqual(
+            [
+                (
+                    instrument.market_instrument_name,
+                    instrument.max_drawdown,
+                    instrument.profit_factor,
+                    instrument.exposure_share,
+                )
+                for instrument in report.instruments
+            ],
+            [("BTCUSDT", -3, 5 / 3, 0.5), ("ETHUSDT", -2, 0.5, 0.5)],
+        )
+
+    def test_report_at_scale_is_well_under_a_second(self):
+        # Three years of 300 symbols, 1M closed trades.
+        pnl_series, balance_series = analytics_benchmark_services.get_synthetic_series(
+            years=3, symbols_count=300, trades_count=1000000
+        )
+
+        results = analytics_benchmark_services.run_performance_report_benchmark(
+            pnl_series=pnl_series, balance_series=balance_series, repeat=1
+        )
+
+        for result in results:
+            with self.subTest(aggregation_period=result["aggregation_period"]):
+                self.assertLess(result["wall_time"], 1)
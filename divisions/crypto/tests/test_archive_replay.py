@@ -0,0 +1,73 @@
+import datetime
+import tempfile
+
+import simplejson
+
+from django.test import TestCase
+
+from divisions.blockchain.integrations.clients.bybit import archive as response_archive
+from divisions.crypto import models as crypto_models
+from divisions.crypto.services import archive_replay
+
+_CREATED_AT = datetime.datetime(2023, 5, 1, tzinfo=datetime.timezone.utc)
+
+
+def _to_milliseconds(value: datetime.datetime) -> int:
+    return int(value.timestamp() * 1000)
+
+
+def _get_transaction(transaction_id: int) -> dict:
+    return {
+        "id": str(transaction_id),
+        "symbol": "BTCUSDT",
+        "side": "Buy",
+        "type": "TRADE",
+        "currency": "USDT",
+        "qty": "0.001",
+        "size": "0.001",
+        "tradePrice": "27000.5",
+        "funding": "0",
+        "fee": "0.0135",
+        "cashFlow": "0",
+        "change": "-0.0135",
+        "cashBalance": "1000",
+        "feeRate": "",
+        "tradeId": "",
+        "orderId": "",
+        "transactionTime": _to_milliseconds(
+            value=_CREATED_AT + datetime.timedelta(minutes=transaction_id)
+        ),
+    }
+
+
+class ReplayEntriesTestCase(TestCase):
+    def test_full_transactions_page_is_replayed(self):
+        with tempfile.TemporaryDirectory() as archive_dir:
+            entry = response_archive.ResponseArchive(directory=archive_dir).write(
+                endpoint="/v5/account/transaction-log",
+                params={
+                    "limit": 50,
+                    "accountType": "UNIFIED",
+                    "startTime": _to_milliseconds(value=_CREATED_AT),
+                    "endTime": _to_milliseconds(
+                        value=_CREATED_AT + datetime.timedelta(days=7)
+                    ),
+                },
+                content=simplejson.dumps(
+                    {
+                        "retCode": 0,
+                        "retMsg": "OK",
+                        "result": {
+                            "list": [_get_transaction(transaction_id=i) for i in range(50)],
+                            "nextPageCursor": "",
+                        },
+                    }
+                ).encode("utf-8"),
+            )
+
+            replay_counts = archive_replay.replay_entries(
+                archive_dir=archive_dir, entries=[entry]
+            )
+
+        self.assertEqual(replay_counts, {"replayed": 1, "failed": 0})
+        self.assertEqual(crypto_models.PortfolioTransactionLogEntry.objects.count(), 50)
@@ -0,0 +1,36 @@
+import datetime
+
+from django.test import TestCase
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.services import bulk_loader
+
+_CREATED_AT = datetime.datetime(2023, 5, 1, tzinfo=datetime.timezone.utc)
+
+
+class BulkInsertTestCase(TestCase):
+    def _bulk_insert(self, execution_ids: list) -> int:
+        return bulk_loader.bulk_insert_columns(
+            model=crypto_models.TradeExecutionTransaction,
+            columns={
+                "instrument_name": ["BTCUSDT"] * len(execution_ids),
+                "execution_id": execution_ids,
+                "execution_side": ["Buy"] * len(execution_ids),
+                "execution_type": ["Trade"] * len(execution_ids),
+                "executed_fee": ["0.10000000"] * len(execution_ids),
+                "execution_price": ["27000.50000000"] * len(execution_ids),
+                "execution_quantity": ["0.00100000"] * len(execution_ids),
+                "execution_value": ["27.00050000"] * len(execution_ids),
+                "is_maker": [False] * len(execution_ids),
+                "provider": [crypto_enums.CryptoProvider.BYBIT.to_integer_choice()]
+                * len(execution_ids),
+                "created_at": [_CREATED_AT] * len(execution_ids),
+            },
+            conflict_field_names=["execution_id"],
+        )
+
+    def test_returns_number_of_inserted_rows(self):
+        self.assertEqual(self._bulk_insert(execution_ids=["1", "2"]), 2)
+        self.assertEqual(self._bulk_insert(execution_ids=["2", "3"]), 1)
+        self.assertEqual(crypto_models.TradeExecutionTransaction.objects.count(), 3)
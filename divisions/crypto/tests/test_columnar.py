@@ -0,0 +1,93 @@
+import datetime
+import decimal
+
+from django.test import SimpleTestCase
+
+from divisions.crypto.integrations.provider import columnar
+from divisions.crypto.integrations.provider import messages as provider_messages
+
+
+def _get_trade_execution(**fields) -> provider_messages.TradeExecution:
+    return provider_messages.TradeExecution(
+        **{
+            "market_instrument_name": "BTCUSDT",
+            "order_id": "order-1",
+            "execution_id": "execution-1",
+            "execution_side": "Buy",
+            "executed_fee": decimal.Decimal("0.01350000"),
+            "execution_price": decimal.Decimal("27000.50000000"),
+            "execution_quantity": decimal.Decimal("0.00100000"),
+            "execution_type": "Trade",
+            "execution_value": decimal.Decimal("27.00050000"),
+            "is_maker": False,
+            "created_at": datetime.datetime.fromtimestamp(1682935200),
+            **fields,
+        }
+    )
+
+
+class ColumnarBatchTestCase(SimpleTestCase):
+    def test_messages_round_trip(self):
+        trade_executions = [
+            _get_trade_execution(),
+            _get_trade_execution(
+                order_id=None,
+                execution_id="execution-2",
+                execution_side="Sell",
+                executed_fee=decimal.Decimal("-0.00000001"),
+                is_maker=True,
+            ),
+        ]
+
+        batch = columnar.ColumnarBatch.from_messages(
+            message_class=provider_messages.TradeExecution, messages=trade_executions
+        )
+
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch.to_messages(), trade_executions)
+
+    def test_database_columns(self):
+        batch = columnar.ColumnarBatch.from_messages(
+            message_class=provider_messages.TradeExecution,
+            messages=[
+                _get_trade_execution(),
+                _get_trade_execution(order_id=None, execution_id="execution-2"),
+            ],
+        )
+
+        self.assertEqual(
+            batch.get_database_column("execution_price"),
+            ["27000.50000000", "27000.50000000"],
+        )
+        self.assertEqual(batch.get_database_column("order_id"), ["order-1", None])
+        self.assertEqual(
+            batch.get_database_column("created_at"),
+            [datetime.datetime(2023, 5, 1, 10, 0, tzinfo=datetime.timezone.utc)] * 2,
+        )
+
+    def test_decimal_out_of_int64_range_stays_exact(self):
+        trade_execution = _get_trade_execution(
+            execution_value=decimal.Decimal("123456789012.12345678")
+        )
+
+        batch = columnar.ColumnarBatch.from_messages(
+            message_class=provider_messages.TradeExecution, messages=[trade_execution]
+        )
+
+        self.assertEqual(
+            batch.get_database_column("execution_value"), ["123456789012.12345678"]
+        )
+        self.assertEqual(batch.to_messages(), [trade_execution])
+        self.assertAlmostEqual(
+            batch.get_float_column("execution_value")[0], 123456789012.12345678
+        )
+
+    def test_decimals_are_rounded_to_database_places(self):
+        batch = columnar.ColumnarBatch.from_messages(
+            message_class=provider_messages.TradeExecution,
+            messages=[
+                _get_trade_execution(execution_price=decimal.Decimal("1.000000005"))
+            ],
+        )
+
+        self.assertEqual(batch.get_database_column("execution_price"), ["1.00000000"])
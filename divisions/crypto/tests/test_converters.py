@@ -0,0 +1,51 @@
+import copy
+
+from django.test import SimpleTestCase
+
+from divisions.crypto.integrations.provider.bybit import client as bybit_client
+from divisions.crypto.integrations.provider.bybit import converters
+from divisions.crypto.services import conversion_benchmark as conversion_benchmark_services
+
+
+class RowConverterTestCase(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.pages = conversion_benchmark_services.get_synthetic_pages(rows_count=200)
+
+    @staticmethod
+    def _convert(page_name: str, page: list, use_fast_converters: bool) -> list:
+        _, method_name, method_kwargs, _ = conversion_benchmark_services._PAGES[
+            page_name
+        ]
+        provider_client = bybit_client.ByBitProvider(
+            use_fast_converters=use_fast_converters
+        )
+        provider_client._rest_api_client = conversion_benchmark_services._PageReplayClient(
+            page=copy.deepcopy(page)
+        )
+        return getattr(provider_client, method_name)(**method_kwargs)
+
+    def test_fast_path_matches_marshmallow(self):
+        self.assertEqual(set(self.pages), {"orders", "executions", "pnl"})
+        for page_name, page in self.pages.items():
+            with self.subTest(page_name=page_name):
+                self.assertEqual(
+                    self._convert(page_name=page_name, page=page, use_fast_converters=True),
+                    self._convert(page_name=page_name, page=page, use_fast_converters=False),
+                )
+
+    def test_invalid_row_is_left_to_marshmallow(self):
+        page = copy.deepcopy(self.pages["executions"])
+        page[0]["execPrice"] = "not a number"
+
+        self.assertIsNone(converters.TRADE_EXECUTIONS.convert(rows=page))
+        self.assertIsNone(converters.TRADE_EXECUTIONS.convert_columnar(rows=page))
+
+    def test_columnar_path_matches_messages(self):
+        page = self.pages["executions"]
+
+        self.assertEqual(
+            converters.TRADE_EXECUTIONS.convert_columnar(rows=page).to_messages(),
+            converters.TRADE_EXECUTIONS.convert(rows=page),
+        )
@@ -0,0 +1,77 @@
+from unittest import mock
+
+from django.core import management
+from django.test import TestCase
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider.services import (
+    data_importer as data_importer_services,
+)
+from divisions.crypto.services import import_runs as import_runs_services
+
+
+class _ProviderClient(object):
+    # Every call counts as one API call returning one page.
+    def __init__(self):
+        self.api_calls = 0
+
+    def get_api_call_counts(self):
+        self.api_calls += 1
+        return self.api_calls, self.api_calls
+
+
+class ImportRunRecorderTestCase(TestCase):
+    def test_stage_counters_are_summed_into_run(self):
+        provider_client = _ProviderClient()
+        run_recorder = import_runs_services.ImportRunRecorder(
+            provider=crypto_enums.CryptoProvider.BYBIT, command="import_trading_data"
+        )
+        run_recorder.start()
+
+        with run_recorder.stage(
+            stream=crypto_enums.ImportStream.TRADE_EXECUTIONS,
+            provider_client=provider_client,
+            symbol="BTCUSDT",
+        ) as counters:
+            counters["rows_fetched"] += 10
+            counters["rows_inserted"] += 8
+        with self.assertRaises(ValueError):
+            with run_recorder.stage(
+                stream=crypto_enums.ImportStream.TRADE_EXECUTIONS,
+                provider_client=provider_client,
+                symbol="ETHUSDT",
+            ) as counters:
+                counters["rows_fetched"] += 5
+                raise ValueError("Invalid page")
+
+        import_run = run_recorder.finish(failed=True)
+
+        self.assertEqual(import_run.status, crypto_enums.ImportRunStatus.FAILED.value)
+        self.assertEqual(import_run.rows_fetched, 15)
+        self.assertEqual(import_run.rows_inserted, 8)
+        self.assertEqual(import_run.errors, 1)
+        self.assertEqual(import_run.api_calls, 2)
+        self.assertEqual(
+            list(import_run.stages.order_by("id").values_list("symbol", "errors")),
+            [("BTCUSDT", 0), ("ETHUSDT", 1)],
+        )
+
+    def test_interrupted_command_finishes_run_as_failed(self):
+        with mock.patch.object(
+            data_importer_services.CryptoProviderImporter,
+            "import_wallet_internal_transfers",
+            side_effect=KeyboardInterrupt,
+        ):
+            with self.assertRaises(KeyboardInterrupt):
+                management.call_command(
+                    "import_account_transfers",
+                    provider="BYBIT",
+                    wallet_type="DERIVATIVE",
+                    currency="USDT",
+                )
+
+        import_run = crypto_models.ImportRun.objects.get()
+        self.assertEqual(import_run.command, "import_account_transfers")
+        self.assertEqual(import_run.status, crypto_enums.ImportRunStatus.FAILED.value)
+        self.assertIsNotNone(import_run.finished_at)
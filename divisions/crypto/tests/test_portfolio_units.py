@@ -0,0 +1,161 @@
+import datetime
+import decimal
+
+from django.test import TestCase
+
+from divisions.common import enums as common_enums
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider import enums as provider_enums
+from divisions.crypto.services import portfolio_units as portfolio_units_services
+
+_PROVIDER = crypto_enums.CryptoProvider.BYBIT
+_WALLET_TYPE = provider_enums.WalletType.DERIVATIVE
+_STARTED_AT = datetime.datetime(2023, 5, 1, tzinfo=datetime.timezone.utc)
+
+
+def _at(days: int) -> datetime.datetime:
+    return _STARTED_AT + datetime.timedelta(days=days)
+
+
+class PortfolioUnitsTestCase(TestCase):
+    def setUp(self):
+        self.first_investor = self._create_investor(email="first@example.com")
+        self.second_investor = self._create_investor(email="second@example.com")
+
+    @staticmethod
+    def _create_investor(email: str) -> crypto_models.PortfolioAccountProfile:
+        return crypto_models.PortfolioAccountProfile.objects.create(
+            name="Investor",
+            last_name="Investor",
+            email=email,
+            type=provider_enums.PortfolioAccountType.INVESTOR.value,
+            status="ACTIVE",
+            datetime=_STARTED_AT,
+            created_at=_STARTED_AT,
+        )
+
+    @staticmethod
+    def _create_transfer(
+        investor: crypto_models.PortfolioAccountProfile,
+        transfer_type: provider_enums.WalletTransferType,
+        amount: str,
+        days: int,
+    ) -> None:
+        crypto_models.PortfolioTransfer.objects.create(
+            provider=_PROVIDER.to_integer_choice(),
+            transaction_currency=common_enums.Currency.USDT.value,
+            chain_currency=common_enums.Currency.USDT.value,
+            type=transfer_type.value,
+            status=provider_enums.WalletTransferStatus.SUCCESS.value,
+            portfolio_type=_WALLET_TYPE.name,
+            amount=decimal.Decimal(amount),
+            network_datetime=_at(days=days),
+            portfolio_user=investor,
+        )
+
+    @staticmethod
+    def _get_participation(
+        investor: crypto_models.PortfolioAccountProfile, days: int
+    ):
+        return portfolio_units_services.get_investor_participation(
+            portfolio_user_id=investor.id,
+            provider=_PROVIDER,
+            wallet_type=_WALLET_TYPE,
+            at_datetime=_at(days=days),
+        )
+
+    def test_units_are_issued_at_net_asset_value(self):
+        self._create_transfer(
+            investor=self.first_investor,
+            transfer_type=provider_enums.WalletTransferType.DEPOSIT,
+            amount="1000",
+            days=1,
+        )
+        # Portfolio grew 20% before second investor joined.
+        crypto_models.PortfolioWalletBalanceSnapshot.objects.create(
+            provider=_PROVIDER.to_integer_choice(),
+            portfolio_type=_WALLET_TYPE.name,
+            currency=common_enums.Currency.USDT.value,
+            amount=decimal.Decimal("1200"),
+            created_at=_at(days=2),
+        )
+        self._create_transfer(
+            investor=self.second_investor,
+            transfer_type=provider_enums.WalletTransferType.DEPOSIT,
+            amount="600",
+            days=3,
+        )
+        self._create_transfer(
+            investor=self.first_investor,
+            transfer_type=provider_enums.WalletTransferType.WITHDRAWAL,
+            amount="240",
+            days=4,
+        )
+
+        processed_count = portfolio_units_services.update_portfolio_units(
+            provider=_PROVIDER, wallet_type=_WALLET_TYPE
+        )
+
+        self.assertEqual(processed_count, 3)
+        unit_transactions = list(
+            crypto_models.PortfolioUnitTransaction.objects.order_by("datetime")
+        )
+        self.assertEqual(
+            [unit_transaction.unit_price for unit_transaction in unit_transactions],
+            [decimal.Decimal("1"), decimal.Decimal("1.2"), decimal.Decimal("1.2")],
+        )
+        self.assertEqual(
+            [unit_transaction.units for unit_transaction in unit_transactions],
+            [decimal.Decimal("1000"), decimal.Decimal("500"), decimal.Decimal("-200")],
+        )
+
+        first_participation = self._get_participation(
+            investor=self.first_investor, days=5
+        )
+        second_participation = self._get_participation(
+            investor=self.second_investor, days=5
+        )
+        self.assertEqual(first_participation.portfolio_units, decimal.Decimal("1300"))
+        self.assertEqual(first_participation.units, decimal.Decimal("800"))
+        self.assertEqual(first_participation.participation, decimal.Decimal("0.61538462"))
+        self.assertEqual(first_participation.value, decimal.Decimal("960"))
+        self.assertEqual(second_participation.value, decimal.Decimal("600"))
+
+    def test_late_transfer_rewinds_units_issued_after_it(self):
+        self._create_transfer(
+            investor=self.first_investor,
+            transfer_type=provider_enums.WalletTransferType.DEPOSIT,
+            amount="1000",
+            days=1,
+        )
+        self._create_transfer(
+            investor=self.second_investor,
+            transfer_type=provider_enums.WalletTransferType.DEPOSIT,
+            amount="1000",
+            days=3,
+        )
+        portfolio_units_services.update_portfolio_units(
+            provider=_PROVIDER, wallet_type=_WALLET_TYPE
+        )
+
+        # Withdrawal of first investor arrives after units of day 3 were issued.
+        self._create_transfer(
+            investor=self.first_investor,
+            transfer_type=provider_enums.WalletTransferType.WITHDRAWAL,
+            amount="500",
+            days=2,
+        )
+        processed_count = portfolio_units_services.update_portfolio_units(
+            provider=_PROVIDER, wallet_type=_WALLET_TYPE
+        )
+
+        self.assertEqual(processed_count, 2)
+        self.assertEqual(
+            crypto_models.PortfolioUnitBalance.objects.get().total_units,
+            decimal.Decimal("1500"),
+        )
+        self.assertEqual(
+            self._get_participation(investor=self.first_investor, days=5).units,
+            decimal.Decimal("500"),
+        )
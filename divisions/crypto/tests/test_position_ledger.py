@@ -0,0 +1,160 @@
+import datetime
+import decimal
+
+from django.test import SimpleTestCase, TestCase
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.services import position_ledger as position_ledger_services
+
+_CREATED_AT = datetime.datetime(2023, 5, 1, tzinfo=datetime.timezone.utc)
+
+
+def _apply_fills(
+    ledger_state: position_ledger_services.PositionLedgerState, fills: list
+) -> None:
+    for execution_id, (execution_side, quantity, price) in enumerate(fills, start=1):
+        ledger_state.apply_execution(
+            execution_id=execution_id,
+            created_at=_CREATED_AT + datetime.timedelta(minutes=execution_id),
+            execution_side=execution_side,
+            execution_type="Trade",
+            execution_quantity=decimal.Decimal(quantity),
+            execution_price=decimal.Decimal(price),
+            executed_fee=decimal.Decimal("0.1"),
+        )
+
+
+class PositionLedgerStateTestCase(SimpleTestCase):
+    fills = [
+        ("Buy", "1", "100"),
+        ("Buy", "1", "120"),
+        ("Sell", "1.5", "130"),
+    ]
+
+    def test_fifo_closes_oldest_lots_first(self):
+        ledger_state = position_ledger_services.PositionLedgerState(
+            cost_basis_method=crypto_enums.CostBasisMethod.FIFO
+        )
+
+        _apply_fills(ledger_state=ledger_state, fills=self.fills)
+
+        # 1 @ 100 and 0.5 @ 120 closed at 130.
+        self.assertEqual(ledger_state.realised_pnl, decimal.Decimal("35"))
+        self.assertEqual(ledger_state.position_quantity, decimal.Decimal("0.5"))
+        self.assertEqual(ledger_state.average_entry_price, decimal.Decimal("120"))
+        self.assertEqual(ledger_state.fees, decimal.Decimal("0.3"))
+        self.assertEqual(ledger_state.executions_count, 3)
+
+    def test_average_cost_closes_at_average_price(self):
+        ledger_state = position_ledger_services.PositionLedgerState(
+            cost_basis_method=crypto_enums.CostBasisMethod.AVERAGE_COST
+        )
+
+        _apply_fills(ledger_state=ledger_state, fills=self.fills)
+
+        # 1.5 closed at 130 against average entry 110.
+        self.assertEqual(ledger_state.realised_pnl, decimal.Decimal("30"))
+        self.assertEqual(ledger_state.position_quantity, decimal.Decimal("0.5"))
+        self.assertEqual(ledger_state.average_entry_price, decimal.Decimal("110"))
+
+    def test_fill_flipping_position_opens_opposite_side(self):
+        for cost_basis_method in crypto_enums.CostBasisMethod:
+            with self.subTest(cost_basis_method=cost_basis_method):
+                ledger_state = position_ledger_services.PositionLedgerState(
+                    cost_basis_method=cost_basis_method
+                )
+
+                _apply_fills(
+                    ledger_state=ledger_state,
+                    fills=[("Buy", "1", "100"), ("Sell", "3", "90")],
+                )
+
+                self.assertEqual(ledger_state.realised_pnl, decimal.Decimal("-10"))
+                self.assertEqual(ledger_state.position_quantity, decimal.Decimal("-2"))
+                self.assertEqual(ledger_state.average_entry_price, decimal.Decimal("90"))
+                self.assertEqual(
+                    ledger_state.get_unrealised_pnl(mark_price=decimal.Decimal("80")),
+                    decimal.Decimal("20"),
+                )
+
+    def test_funding_only_adds_fees(self):
+        ledger_state = position_ledger_services.PositionLedgerState(
+            cost_basis_method=crypto_enums.CostBasisMethod.FIFO
+        )
+
+        ledger_state.apply_execution(
+            execution_id=1,
+            created_at=_CREATED_AT,
+            execution_side="Buy",
+            execution_type="Funding",
+            execution_quantity=decimal.Decimal("1"),
+            execution_price=decimal.Decimal("100"),
+            executed_fee=decimal.Decimal("0.5"),
+        )
+
+        self.assertEqual(ledger_state.position_quantity, decimal.Decimal("0"))
+        self.assertEqual(ledger_state.fees, decimal.Decimal("0.5"))
+
+    def test_checkpoint_fields_restore_state(self):
+        ledger_state = position_ledger_services.PositionLedgerState(
+            cost_basis_method=crypto_enums.CostBasisMethod.FIFO
+        )
+        _apply_fills(ledger_state=ledger_state, fills=self.fills)
+
+        restored_ledger_state = position_ledger_services.PositionLedgerState(
+            cost_basis_method=crypto_enums.CostBasisMethod.FIFO,
+            **ledger_state.to_checkpoint_fields()
+        )
+        _apply_fills(ledger_state=ledger_state, fills=[("Sell", "0.5", "140")])
+        _apply_fills(ledger_state=restored_ledger_state, fills=[("Sell", "0.5", "140")])
+
+        self.assertEqual(restored_ledger_state.realised_pnl, ledger_state.realised_pnl)
+        self.assertEqual(
+            restored_ledger_state.position_quantity, ledger_state.position_quantity
+        )
+
+
+class UpdatePositionLedgerTestCase(TestCase):
+    def _create_execution(
+        self, execution_id: str, minutes: int, execution_side: str, price: str
+    ) -> None:
+        crypto_models.TradeExecutionTransaction.objects.create(
+            instrument_name="BTCUSDT",
+            execution_id=execution_id,
+            execution_side=execution_side,
+            execution_type="Trade",
+            executed_fee=decimal.Decimal("0"),
+            execution_price=decimal.Decimal(price),
+            execution_quantity=decimal.Decimal("1"),
+            execution_value=decimal.Decimal(price),
+            is_maker=False,
+            provider=crypto_enums.CryptoProvider.BYBIT.to_integer_choice(),
+            created_at=_CREATED_AT + datetime.timedelta(minutes=minutes),
+        )
+
+    def test_backfilled_execution_is_replayed_after_invalidation(self):
+        self._create_execution(execution_id="1", minutes=0, execution_side="Buy", price="100")
+        self._create_execution(execution_id="2", minutes=20, execution_side="Sell", price="110")
+        position_ledger_services.update_position_ledger(
+            provider=crypto_enums.CryptoProvider.BYBIT,
+            instrument_name="BTCUSDT",
+            cost_basis_method=crypto_enums.CostBasisMethod.FIFO,
+        )
+
+        self._create_execution(execution_id="3", minutes=10, execution_side="Buy", price="105")
+        deleted_count = position_ledger_services.invalidate_checkpoints(
+            provider=crypto_enums.CryptoProvider.BYBIT,
+            instrument_name="BTCUSDT",
+            from_datetime=_CREATED_AT + datetime.timedelta(minutes=10),
+        )
+        checkpoint = position_ledger_services.update_position_ledger(
+            provider=crypto_enums.CryptoProvider.BYBIT,
+            instrument_name="BTCUSDT",
+            cost_basis_method=crypto_enums.CostBasisMethod.FIFO,
+        )
+
+        self.assertEqual(deleted_count, 1)
+        self.assertEqual(checkpoint.executions_count, 3)
+        self.assertEqual(checkpoint.position_quantity, decimal.Decimal("1"))
+        self.assertEqual(checkpoint.realised_pnl, decimal.Decimal("10"))
@@ -0,0 +1,104 @@
+import datetime
+import decimal
+
+from django.test import TestCase
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider import enums as provider_enums
+from divisions.crypto.integrations.provider.services import (
+    provider as provider_services,
+)
+from divisions.crypto.integrations.reporter.services import (
+    portfolio as portfolio_services,
+)
+
+_PROVIDER = crypto_enums.CryptoProvider.BYBIT
+_TRADING_CATEGORY = provider_enums.TradingCategory.LINEAR
+
+
+class TradePositionPerformanceTestCase(TestCase):
+    @staticmethod
+    def _create_rollup(instrument_name: str, day: datetime.date, closed_pnl: str) -> None:
+        crypto_models.TradePnLDailyRollup.objects.create(
+            provider=_PROVIDER.to_integer_choice(),
+            trading_category=_TRADING_CATEGORY.name,
+            instrument_name=instrument_name,
+            day=day,
+            closed_pnl=decimal.Decimal(closed_pnl),
+            trade_count=1,
+        )
+
+    @staticmethod
+    def _get_performance(aggregation_period: crypto_enums.AggregationPeriod, **kwargs):
+        return [
+            (
+                trade_position_performance.period_start,
+                trade_position_performance.market_instrument_name,
+                trade_position_performance.pnl,
+                trade_position_performance.cumulative_pnl,
+                trade_position_performance.rolling_pnl,
+                trade_position_performance.rank,
+            )
+            for trade_position_performance in provider_services.get_trade_position_performance(
+                provider=_PROVIDER,
+                trading_category=_TRADING_CATEGORY,
+                aggregation_period=aggregation_period,
+                **kwargs
+            )
+        ]
+
+    def test_daily_cumulative_rolling_and_rank(self):
+        self._create_rollup(instrument_name="BTCUSDT", day=datetime.date(2023, 5, 1), closed_pnl="10")
+        self._create_rollup(instrument_name="ETHUSDT", day=datetime.date(2023, 5, 1), closed_pnl="20")
+        self._create_rollup(instrument_name="BTCUSDT", day=datetime.date(2023, 5, 2), closed_pnl="-5")
+        # No BTCUSDT PnL on 3 and 4 May, 1 May is out of 3 day window on 5 May.
+        self._create_rollup(instrument_name="BTCUSDT", day=datetime.date(2023, 5, 5), closed_pnl="7")
+
+        performance = self._get_performance(
+            aggregation_period=crypto_enums.AggregationPeriod.DAY, rolling_window=3
+        )
+
+        D = decimal.Decimal
+        self.assertEqual(
+            performance,
+            [
+                (datetime.date(2023, 5, 1), "ETHUSDT", D("20"), D("20"), D("20"), 1),
+                (datetime.date(2023, 5, 1), "BTCUSDT", D("10"), D("10"), D("10"), 2),
+                (datetime.date(2023, 5, 2), "BTCUSDT", D("-5"), D("5"), D("5"), 1),
+                (datetime.date(2023, 5, 5), "BTCUSDT", D("7"), D("12"), D("7"), 1),
+            ],
+        )
+
+    def test_monthly_rolling_window_spans_calendar_months(self):
+        self._create_rollup(instrument_name="BTCUSDT", day=datetime.date(2022, 12, 5), closed_pnl="1")
+        self._create_rollup(instrument_name="BTCUSDT", day=datetime.date(2023, 1, 10), closed_pnl="2")
+        self._create_rollup(instrument_name="BTCUSDT", day=datetime.date(2023, 1, 20), closed_pnl="3")
+        self._create_rollup(instrument_name="BTCUSDT", day=datetime.date(2023, 3, 1), closed_pnl="4")
+
+        performance = self._get_performance(
+            aggregation_period=crypto_enums.AggregationPeriod.MONTH, rolling_window=2
+        )
+
+        self.assertEqual(
+            [(period_start, rolling_pnl) for period_start, _, _, _, rolling_pnl, _ in performance],
+            [
+                (datetime.date(2022, 12, 1), decimal.Decimal("1")),
+                (datetime.date(2023, 1, 1), decimal.Decimal("6")),
+                (datetime.date(2023, 3, 1), decimal.Decimal("4")),
+            ],
+        )
+
+    def test_performance_sheet_table(self):
+        self._create_rollup(instrument_name="BTCUSDT", day=datetime.date(2023, 5, 1), closed_pnl="10")
+        self._create_rollup(instrument_name="BTCUSDT", day=datetime.date(2023, 6, 1), closed_pnl="-4")
+
+        self.assertEqual(
+            portfolio_services.get_performance_table(
+                provider=_PROVIDER, trading_category=_TRADING_CATEGORY
+            )[1:],
+            [
+                ["BTCUSDT", datetime.date(2023, 5, 1), decimal.Decimal("10"), 1, decimal.Decimal("10")],
+                ["BTCUSDT", datetime.date(2023, 6, 1), decimal.Decimal("-4"), 1, decimal.Decimal("6")],
+            ],
+        )
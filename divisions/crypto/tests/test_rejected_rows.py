@@ -0,0 +1,29 @@
+import decimal
+
+from django.test import TestCase
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider import messages as provider_messages
+from divisions.crypto.services import rejected_rows as rejected_rows_services
+
+
+class StoreRejectedRowsTestCase(TestCase):
+    def test_stores_row_with_decimal_values(self):
+        rejected_row = provider_messages.RejectedRow(
+            data_type="trade_executions",
+            row={"execId": "1", "execPrice": decimal.Decimal("27000.5"), "execQty": None},
+            errors={"execQty": ["Field may not be null."]},
+        )
+
+        created_count = rejected_rows_services.store_rejected_rows(
+            provider=crypto_enums.CryptoProvider.BYBIT, rejected_rows=[rejected_row]
+        )
+        rejected_rows_services.store_rejected_rows(
+            provider=crypto_enums.CryptoProvider.BYBIT, rejected_rows=[rejected_row]
+        )
+
+        self.assertEqual(created_count, 1)
+        stored_row = crypto_models.ProviderRejectedRow.objects.get()
+        self.assertEqual(stored_row.row["execPrice"], "27000.5")
+        self.assertEqual(stored_row.occurrences, 2)
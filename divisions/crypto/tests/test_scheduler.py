@@ -0,0 +1,101 @@
+import datetime
+
+from django.test import SimpleTestCase
+
+from divisions.crypto.services import scheduler as scheduler_services
+
+
+def _utc(*args: int) -> datetime.datetime:
+    return datetime.datetime(*args, tzinfo=datetime.timezone.utc)
+
+
+class CronScheduleParseTestCase(SimpleTestCase):
+    def test_parses_values_ranges_lists_and_steps(self):
+        cron = scheduler_services.CronSchedule.parse(expression="*/15 8-10 1,15 * 1-5")
+
+        self.assertEqual(cron.minutes, frozenset({0, 15, 30, 45}))
+        self.assertEqual(cron.hours, frozenset({8, 9, 10}))
+        self.assertEqual(cron.days, frozenset({1, 15}))
+        self.assertEqual(cron.months, frozenset(range(1, 13)))
+        self.assertEqual(cron.weekdays, frozenset({1, 2, 3, 4, 5}))
+
+    def test_value_with_step_runs_to_end_of_range(self):
+        cron = scheduler_services.CronSchedule.parse(expression="5/20 * * * *")
+
+        self.assertEqual(cron.minutes, frozenset({5, 25, 45}))
+
+    def test_rejects_invalid_expressions(self):
+        for expression in ("* * * *", "60 * * * *", "* 5-3 * * *", "* * 0 * *"):
+            with self.subTest(expression=expression):
+                with self.assertRaises(ValueError):
+                    scheduler_services.CronSchedule.parse(expression=expression)
+
+
+class CronScheduleNextRunTestCase(SimpleTestCase):
+    def test_next_run_is_next_matching_minute(self):
+        cron = scheduler_services.CronSchedule.parse(expression="*/15 * * * *")
+
+        self.assertEqual(
+            cron.get_next_run(after=_utc(2023, 5, 1, 10, 7, 30)),
+            _utc(2023, 5, 1, 10, 15),
+        )
+        self.assertEqual(
+            cron.get_next_run(after=_utc(2023, 5, 1, 10, 15)),
+            _utc(2023, 5, 1, 10, 30),
+        )
+
+    def test_next_run_rolls_over_day_and_month(self):
+        cron = scheduler_services.CronSchedule.parse(expression="30 2 1 * *")
+
+        self.assertEqual(
+            cron.get_next_run(after=_utc(2023, 1, 31, 23, 0)),
+            _utc(2023, 2, 1, 2, 30),
+        )
+
+    def test_restricted_day_and_weekday_match_either(self):
+        # 2023-05-06 is Saturday, 2023-05-08 is Monday.
+        cron = scheduler_services.CronSchedule.parse(expression="0 0 10 * 1")
+
+        self.assertEqual(
+            cron.get_next_run(after=_utc(2023, 5, 6, 12, 0)), _utc(2023, 5, 8, 0, 0)
+        )
+        self.assertEqual(
+            cron.get_next_run(after=_utc(2023, 5, 8, 12, 0)), _utc(2023, 5, 10, 0, 0)
+        )
+
+    def test_schedule_never_matching_raises(self):
+        cron = scheduler_services.CronSchedule.parse(expression="0 0 31 2 *")
+
+        with self.assertRaises(ValueError):
+            cron.get_next_run(after=_utc(2023, 1, 1, 0, 0))
+
+
+class ScheduledJobTestCase(SimpleTestCase):
+    def test_from_settings_needs_either_interval_or_cron(self):
+        for job_settings in (
+            {"name": "job", "command": "import_wallet_balances"},
+            {
+                "name": "job",
+                "command": "import_wallet_balances",
+                "interval_seconds": 60,
+                "cron": "* * * * *",
+            },
+        ):
+            with self.subTest(job_settings=job_settings):
+                with self.assertRaises(ValueError):
+                    scheduler_services.ScheduledJob.from_settings(
+                        job_settings=job_settings
+                    )
+
+    def test_interval_job_next_run(self):
+        job = scheduler_services.ScheduledJob.from_settings(
+            job_settings={
+                "name": "job",
+                "command": "import_wallet_balances",
+                "interval_seconds": 300,
+            }
+        )
+
+        self.assertEqual(
+            job.get_next_run(after=_utc(2023, 5, 1, 10, 0)), _utc(2023, 5, 1, 10, 5)
+        )
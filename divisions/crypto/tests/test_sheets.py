@@ -0,0 +1,72 @@
+from django.test import SimpleTestCase
+
+from divisions.crypto.integrations.reporter.services import sheets as sheets_services
+
+
+class GetChangedRangesTestCase(SimpleTestCase):
+    def test_unchanged_table_has_no_ranges(self):
+        rows = [["Symbol", "PnL"], ["BTCUSDT", "10"]]
+
+        self.assertEqual(
+            sheets_services.get_changed_ranges(
+                worksheet="Report", previous_rows=rows, rows=rows
+            ),
+            [],
+        )
+
+    def test_first_publish_writes_whole_table(self):
+        rows = [["Symbol", "PnL"], ["BTCUSDT", "10"]]
+
+        self.assertEqual(
+            sheets_services.get_changed_ranges(
+                worksheet="Report", previous_rows=[], rows=rows
+            ),
+            [{"range": "'Report'!A1:B2", "values": rows}],
+        )
+
+    def test_changed_cells_on_consecutive_rows_are_merged(self):
+        previous_rows = [["Symbol", "PnL", "Fees"], ["BTCUSDT", "10", "1"], ["ETHUSDT", "5", "1"]]
+        rows = [["Symbol", "PnL", "Fees"], ["BTCUSDT", "12", "2"], ["ETHUSDT", "6", "3"]]
+
+        self.assertEqual(
+            sheets_services.get_changed_ranges(
+                worksheet="Report", previous_rows=previous_rows, rows=rows
+            ),
+            [{"range": "'Report'!B2:C3", "values": [["12", "2"], ["6", "3"]]}],
+        )
+
+    def test_separate_runs_in_one_row(self):
+        previous_rows = [["a", "b", "c", "d"]]
+        rows = [["x", "b", "c", "y"]]
+
+        self.assertEqual(
+            sheets_services.get_changed_ranges(
+                worksheet="Report", previous_rows=previous_rows, rows=rows
+            ),
+            [
+                {"range": "'Report'!A1:A1", "values": [["x"]]},
+                {"range": "'Report'!D1:D1", "values": [["y"]]},
+            ],
+        )
+
+    def test_removed_cells_and_rows_are_cleared(self):
+        previous_rows = [["a", "b"], ["c", "d"]]
+        rows = [["a"]]
+
+        self.assertEqual(
+            sheets_services.get_changed_ranges(
+                worksheet="Report", previous_rows=previous_rows, rows=rows
+            ),
+            [
+                {"range": "'Report'!B1:B1", "values": [[""]]},
+                {"range": "'Report'!A2:B2", "values": [["", ""]]},
+            ],
+        )
+
+    def test_worksheet_name_quote_is_escaped(self):
+        self.assertEqual(
+            sheets_services.get_changed_ranges(
+                worksheet="Bob's", previous_rows=[], rows=[["a"]]
+            ),
+            [{"range": "'Bob''s'!A1:A1", "values": [["a"]]}],
+        )
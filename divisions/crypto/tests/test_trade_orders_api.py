@@ -0,0 +1,65 @@
+import datetime
+from unittest import mock
+
+import simplejson
+
+from django.test import TestCase
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.fab.gateways.api.private import trading
+
+_CREATED_AT = datetime.datetime(2023, 5, 1, tzinfo=datetime.timezone.utc)
+_URL = "/private-api/trade-orders"
+
+
+class TradeOrdersApiTestCase(TestCase):
+    def setUp(self):
+        # Second and third order share created_at, cursor has to tell them apart.
+        for order_number, minutes in enumerate([0, 10, 10, 20, 30], start=1):
+            crypto_models.TradeOrder.objects.create(
+                instrument_name="BTCUSDT",
+                order_id="order-{}".format(order_number),
+                order_status="Filled",
+                created_at=_CREATED_AT + datetime.timedelta(minutes=minutes),
+                updated_at=_CREATED_AT,
+                provider=crypto_enums.CryptoProvider.BYBIT.to_integer_choice(),
+            )
+
+    def _get_order_ids(self, limit: int) -> list:
+        order_ids = []
+        params = {"provider": "BYBIT", "limit": limit}
+        while True:
+            response = self.client.get(_URL, params)
+            self.assertEqual(response.status_code, 200)
+            content = simplejson.loads(
+                b"".join(response.streaming_content)
+                if response.streaming
+                else response.content
+            )
+            self.assertLessEqual(len(content["results"]), limit)
+            order_ids.extend(row["order_id"] for row in content["results"])
+            if not content["next_cursor"]:
+                return order_ids
+
+            params["cursor"] = content["next_cursor"]
+
+    def test_cursor_walks_all_orders_once(self):
+        self.assertEqual(
+            self._get_order_ids(limit=2),
+            ["order-1", "order-2", "order-3", "order-4", "order-5"],
+        )
+
+    def test_streamed_pages_match_built_ones(self):
+        with mock.patch.object(trading.TradeOrders, "STREAMING_PAGE_SIZE", 1), mock.patch.object(
+            trading.TradeOrders, "ITERATOR_CHUNK_SIZE", 2
+        ):
+            self.assertEqual(
+                self._get_order_ids(limit=3),
+                ["order-1", "order-2", "order-3", "order-4", "order-5"],
+            )
+
+    def test_invalid_limit_is_rejected(self):
+        response = self.client.get(_URL, {"limit": 0})
+
+        self.assertEqual(response.status_code, 400)
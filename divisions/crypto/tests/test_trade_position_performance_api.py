@@ -0,0 +1,103 @@
+import datetime
+import decimal
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider import enums as provider_enums
+from divisions.crypto.integrations.provider.bybit import client as bybit_client
+from divisions.crypto.integrations.provider.services import (
+    data_importer as data_importer_services,
+)
+from divisions.crypto.services import (
+    conversion_benchmark as conversion_benchmark_services,
+)
+from divisions.crypto.services import pnl_rollup as pnl_rollup_services
+
+_CREATED_AT = datetime.datetime(2023, 5, 1, tzinfo=datetime.timezone.utc)
+_URL = "/private-api/trade-position-performance"
+_PARAMS = {
+    "provider": "BYBIT",
+    "trading_category": "linear",
+    "aggregation_period": "DAY",
+}
+
+
+class TradePositionPerformanceApiTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        crypto_models.TradePnLDailyRollup.objects.create(
+            provider=crypto_enums.CryptoProvider.BYBIT.to_integer_choice(),
+            trading_category=provider_enums.TradingCategory.LINEAR.name,
+            instrument_name="BTCUSDT",
+            day=_CREATED_AT.date(),
+            closed_pnl=decimal.Decimal("10"),
+            trade_count=1,
+        )
+
+    def _get(self, **headers):
+        return self.client.get(_URL, _PARAMS, **headers)
+
+    def _import_pnl_transaction(self) -> None:
+        crypto_models.TradeOrder.objects.create(
+            instrument_name="BTCUSDT",
+            order_id="order-1",
+            created_at=_CREATED_AT,
+            updated_at=_CREATED_AT,
+            provider=crypto_enums.CryptoProvider.BYBIT.to_integer_choice(),
+        )
+        provider_client = bybit_client.ByBitProvider()
+        provider_client._rest_api_client = conversion_benchmark_services._PageReplayClient(
+            page=[
+                {
+                    "symbol": "BTCUSDT",
+                    "orderId": "order-1",
+                    "side": "Sell",
+                    "qty": "1",
+                    "orderPrice": "110",
+                    "orderType": "Market",
+                    "closedSize": "1",
+                    "cumEntryValue": "100",
+                    "avgEntryPrice": "100",
+                    "cumExitValue": "110",
+                    "avgExitPrice": "110",
+                    "closedPnl": "10",
+                    "createdTime": str(int(_CREATED_AT.timestamp() * 1000)),
+                }
+            ]
+        )
+        data_importer_services.CryptoProviderImporter(
+            provider_client=provider_client
+        ).import_trade_pnl_transactions(
+            trading_category=provider_enums.TradingCategory.LINEAR,
+            market_instrument_symbol="BTCUSDT",
+            from_datetime=_CREATED_AT,
+            to_datetime=_CREATED_AT + datetime.timedelta(days=1),
+        )
+
+    def test_unchanged_response_is_not_modified(self):
+        response = self._get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["results"][0]["pnl"], 10.0)
+        self.assertEqual(
+            self._get(HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 304
+        )
+
+    def test_committed_pnl_changes_etag_when_rollup_fails(self):
+        etag = self._get()["ETag"]
+
+        with mock.patch.object(
+            pnl_rollup_services,
+            "apply_pnl_transactions",
+            side_effect=RuntimeError("Rollup unavailable"),
+        ):
+            self._import_pnl_transaction()
+
+        self.assertEqual(crypto_models.TradePnLTransaction.objects.count(), 1)
+        response = self._get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
@@ -0,0 +1,109 @@
+import datetime
+import decimal
+import gzip
+import os
+import tempfile
+
+import simplejson
+
+from django.core import management
+from django.test import TestCase
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.services import (
+    transaction_export as transaction_export_services,
+)
+
+_CREATED_AT = datetime.datetime(2023, 5, 1, tzinfo=datetime.timezone.utc)
+
+
+class TransactionExportTestCase(TestCase):
+    def setUp(self):
+        for execution_id, minutes in [("1", 0), ("2", 20)]:
+            crypto_models.TradeExecutionTransaction.objects.create(
+                instrument_name="BTCUSDT",
+                execution_id=execution_id,
+                execution_side="Buy",
+                execution_type="Trade",
+                executed_fee=decimal.Decimal("0"),
+                execution_price=decimal.Decimal("27000.5"),
+                execution_quantity=decimal.Decimal("0.001"),
+                execution_value=decimal.Decimal("27.0005"),
+                is_maker=False,
+                provider=crypto_enums.CryptoProvider.BYBIT.to_integer_choice(),
+                created_at=_CREATED_AT + datetime.timedelta(minutes=minutes),
+            )
+
+    @staticmethod
+    def _export(**kwargs) -> bytes:
+        return b"".join(
+            transaction_export_services.iter_export(
+                dataset=crypto_enums.ExportDataset.EXECUTIONS, **kwargs
+            )
+        )
+
+    def test_csv_export(self):
+        lines = (
+            self._export(export_format=crypto_enums.ExportFormat.CSV)
+            .decode("utf-8")
+            .splitlines()
+        )
+
+        self.assertEqual(
+            lines[0].split(","),
+            transaction_export_services.get_export_columns(
+                dataset=crypto_enums.ExportDataset.EXECUTIONS
+            ),
+        )
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(
+            lines[1].split(",")[1:],
+            [
+                "BYBIT",
+                "BTCUSDT",
+                "1",
+                "",
+                "Buy",
+                "Trade",
+                "27000.50000000",
+                "0.00100000",
+                "27.00050000",
+                "0.00000000",
+                "False",
+                "2023-05-01T00:00:00+00:00",
+            ],
+        )
+
+    def test_compressed_ndjson_export(self):
+        rows = [
+            simplejson.loads(line, use_decimal=True)
+            for line in gzip.decompress(
+                self._export(
+                    export_format=crypto_enums.ExportFormat.NDJSON,
+                    from_datetime=_CREATED_AT + datetime.timedelta(minutes=10),
+                    compress=True,
+                )
+            ).splitlines()
+        ]
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["execution_id"], "2")
+        self.assertEqual(rows[0]["execution_price"], decimal.Decimal("27000.50000000"))
+
+    def test_command_keeps_datetime_offset(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "executions.csv")
+            # 02:10 at +02:00 is 00:10 UTC, only second execution is exported.
+            management.call_command(
+                "export_transactions",
+                dataset="EXECUTIONS",
+                output=output,
+                from_datetime="2023-05-01T02:10:00+02:00",
+            )
+
+            with open(output) as f:
+                lines = f.read().splitlines()
+
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[1].split(",")[3], "2")
@@ -0,0 +1,67 @@
+import datetime
+import decimal
+import os
+import tempfile
+
+from django.test import TestCase
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider.services import (
+    transaction_log_importer as transaction_log_importer_services,
+)
+from divisions.crypto.services import position_ledger as position_ledger_services
+
+_CREATED_AT = datetime.datetime(2023, 5, 1, tzinfo=datetime.timezone.utc)
+
+_TRANSACTION_LOG = """Time,Currency,Contract,Type,Direction,Quantity,Position,Filled Price,Funding,Fee Paid,Cash Flow,Change,Wallet Balance,Fee Rate,Trade ID,Order ID
+2023-05-01 00:10:00,USDT,BTCUSDT,TRADE,Open Long,1,2,105,0,0,0,0,1000,0.0001,trade-3,
+"""
+
+
+class TransactionLogImporterTestCase(TestCase):
+    def _create_execution(
+        self, execution_id: str, minutes: int, execution_side: str, price: str
+    ) -> None:
+        crypto_models.TradeExecutionTransaction.objects.create(
+            instrument_name="BTCUSDT",
+            execution_id=execution_id,
+            execution_side=execution_side,
+            execution_type="Trade",
+            executed_fee=decimal.Decimal("0"),
+            execution_price=decimal.Decimal(price),
+            execution_quantity=decimal.Decimal("1"),
+            execution_value=decimal.Decimal(price),
+            is_maker=False,
+            provider=crypto_enums.CryptoProvider.BYBIT.to_integer_choice(),
+            created_at=_CREATED_AT + datetime.timedelta(minutes=minutes),
+        )
+
+    @staticmethod
+    def _update_position_ledger() -> crypto_models.TradePositionLedgerCheckpoint:
+        return position_ledger_services.update_position_ledger(
+            provider=crypto_enums.CryptoProvider.BYBIT,
+            instrument_name="BTCUSDT",
+            cost_basis_method=crypto_enums.CostBasisMethod.FIFO,
+        )
+
+    def test_backfilled_executions_invalidate_position_ledger(self):
+        self._create_execution(execution_id="trade-1", minutes=0, execution_side="Buy", price="100")
+        self._create_execution(execution_id="trade-2", minutes=20, execution_side="Sell", price="110")
+        self._update_position_ledger()
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "transaction_log.csv")
+            with open(file_path, "w") as f:
+                f.write(_TRANSACTION_LOG)
+
+            stats = transaction_log_importer_services.TransactionLogImporter(
+                provider=crypto_enums.CryptoProvider.BYBIT
+            ).import_file(file_path=file_path)
+
+        checkpoint = self._update_position_ledger()
+
+        self.assertEqual(stats, {"rows": 1, "executions": 1, "entries": 1})
+        self.assertEqual(checkpoint.executions_count, 3)
+        self.assertEqual(checkpoint.position_quantity, decimal.Decimal("1"))
+        self.assertEqual(checkpoint.realised_pnl, decimal.Decimal("10"))
@@ -0,0 +1,114 @@
+import datetime
+
+from django.test import TestCase
+
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider import enums as provider_enums
+from divisions.crypto.integrations.provider.bybit import client as bybit_client
+from divisions.crypto.integrations.provider.services import (
+    data_importer as data_importer_services,
+)
+from divisions.crypto.services import import_watermark as import_watermark_services
+
+_CREATED_AT = datetime.datetime(2023, 5, 1, tzinfo=datetime.timezone.utc)
+
+
+def _to_milliseconds(value: datetime.datetime) -> int:
+    return int(value.timestamp() * 1000)
+
+
+class _TransactionLogApi(object):
+    # Stands in for REST API client, returns stored rows of requested window newest
+    # first, truncated at depth pages like the paginated API.
+    def __init__(self, rows: list):
+        self.rows = rows
+        self.windows = []
+
+    def get_transactions(
+        self, depth: int, limit: int, from_datetime, to_datetime, **kwargs
+    ) -> list:
+        self.windows.append((from_datetime, to_datetime))
+        window_rows = [
+            row
+            for row in self.rows
+            if _to_milliseconds(value=from_datetime)
+            <= row["transactionTime"]
+            <= _to_milliseconds(value=to_datetime)
+        ]
+        return sorted(window_rows, key=lambda row: -row["transactionTime"])[
+            : depth * limit
+        ]
+
+
+def _get_transaction(hours: int) -> dict:
+    return {
+        "id": str(hours),
+        "symbol": "BTCUSDT",
+        "side": "Buy",
+        "type": "TRADE",
+        "currency": "USDT",
+        "qty": "0.001",
+        "size": "0.001",
+        "tradePrice": "27000.5",
+        "funding": "0",
+        "fee": "0.0135",
+        "cashFlow": "0",
+        "change": "-0.0135",
+        "cashBalance": "1000",
+        "feeRate": "",
+        "tradeId": "",
+        "orderId": "",
+        "transactionTime": _to_milliseconds(
+            value=_CREATED_AT + datetime.timedelta(hours=hours)
+        ),
+    }
+
+
+class ImportTransactionsTestCase(TestCase):
+    def setUp(self):
+        # 120 transactions, one per hour, over 5 days of a 7 day window.
+        self.api = _TransactionLogApi(rows=[_get_transaction(hours=hours) for hours in range(120)])
+        provider_client = bybit_client.ByBitProvider()
+        provider_client._rest_api_client = self.api
+        self.importer = data_importer_services.CryptoProviderImporter(
+            provider_client=provider_client
+        )
+
+    def _import_transactions(self, **kwargs) -> None:
+        self.importer.import_transactions(
+            wallet_type=provider_enums.WalletType.GENERAL,
+            depth=1,
+            to_datetime=_CREATED_AT + datetime.timedelta(days=7),
+            **kwargs
+        )
+
+    def test_truncated_window_is_split(self):
+        self._import_transactions(from_datetime=_CREATED_AT)
+
+        self.assertEqual(crypto_models.PortfolioTransactionLogEntry.objects.count(), 120)
+        self.assertEqual(
+            import_watermark_services.get_watermark(
+                provider=crypto_enums.CryptoProvider.BYBIT,
+                stream=crypto_enums.ImportStream.TRANSACTION_LOG,
+                key="GENERAL:ALL",
+            ),
+            _CREATED_AT + datetime.timedelta(days=7),
+        )
+        # Full 7 day window was truncated at one page and fetched again in halves.
+        self.assertEqual(
+            self.api.windows[:2],
+            [
+                (_CREATED_AT, _CREATED_AT + datetime.timedelta(days=7)),
+                (_CREATED_AT, _CREATED_AT + datetime.timedelta(days=3.5)),
+            ],
+        )
+
+    def test_next_run_resumes_from_watermark(self):
+        self._import_transactions(from_datetime=_CREATED_AT)
+        self.api.windows = []
+
+        self._import_transactions()
+
+        self.assertEqual(self.api.windows, [])
+        self.assertEqual(crypto_models.PortfolioTransactionLogEntry.objects.count(), 120)
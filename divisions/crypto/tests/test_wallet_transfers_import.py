@@ -0,0 +1,108 @@
+import datetime
+import decimal
+
+from django.test import TestCase
+
+from divisions.blockchain.integrations.clients.bybit import (
+    exceptions as rest_api_client_exceptions,
+)
+from divisions.common import enums as common_enums
+from divisions.crypto import models as crypto_models
+from divisions.crypto.integrations.provider import enums as provider_enums
+from divisions.crypto.integrations.provider.bybit import client as bybit_client
+from divisions.crypto.integrations.provider.services import (
+    data_importer as data_importer_services,
+)
+
+_CREATED_AT = datetime.datetime(2023, 5, 1, tzinfo=datetime.timezone.utc)
+
+
+class _DepositApi(object):
+    # Stands in for REST API client, every window returns the same deposits unless
+    # it is one of failing windows.
+    def __init__(self, rows: list, failing_from_datetimes: tuple = ()):
+        self.rows = rows
+        self.failing_from_datetimes = failing_from_datetimes
+        self.windows = []
+
+    def get_wallet_deposit_transfers(self, from_datetime, to_datetime, **kwargs) -> list:
+        self.windows.append((from_datetime, to_datetime))
+        if from_datetime in self.failing_from_datetimes:
+            raise rest_api_client_exceptions.ByBitClientError("Too many visits")
+
+        return self.rows
+
+
+def _get_deposit(txid: str, status: int) -> dict:
+    return {
+        "txID": txid,
+        "coin": "USDT",
+        "chain": "TRX",
+        "amount": "1000",
+        "depositFee": "",
+        "status": status,
+        "successAt": int(_CREATED_AT.timestamp() * 1000),
+    }
+
+
+class ImportWalletExternalTransfersTestCase(TestCase):
+    def _import_deposits(self, api: _DepositApi, **kwargs) -> None:
+        provider_client = bybit_client.ByBitProvider()
+        provider_client._rest_api_client = api
+        data_importer_services.CryptoProviderImporter(
+            provider_client=provider_client
+        ).import_wallet_external_transfers(
+            wallet_type=provider_enums.WalletType.DERIVATIVE,
+            transfer_type=provider_enums.WalletTransferType.DEPOSIT,
+            currency=common_enums.Currency.USDT,
+            max_workers=2,
+            **kwargs
+        )
+
+    def test_pending_deposit_status_is_updated(self):
+        # 1 is TO_BE_CONFIRMED, 3 SUCCESS.
+        self._import_deposits(api=_DepositApi(rows=[_get_deposit(txid="tx-1", status=1)]))
+        self._import_deposits(
+            api=_DepositApi(
+                rows=[
+                    _get_deposit(txid="tx-1", status=3),
+                    _get_deposit(txid="tx-2", status=3),
+                ]
+            )
+        )
+
+        self.assertEqual(
+            list(
+                crypto_models.PortfolioTransfer.objects.order_by("txid").values_list(
+                    "txid", "type", "status", "amount"
+                )
+            ),
+            [
+                ("tx-1", "DEPOSIT", "SUCCESS", decimal.Decimal("1000")),
+                ("tx-2", "DEPOSIT", "SUCCESS", decimal.Decimal("1000")),
+            ],
+        )
+
+    def test_failed_window_does_not_drop_others(self):
+        api = _DepositApi(
+            rows=[_get_deposit(txid="tx-1", status=3)],
+            failing_from_datetimes=(_CREATED_AT,),
+        )
+
+        self._import_deposits(
+            api=api,
+            from_datetime=_CREATED_AT,
+            to_datetime=_CREATED_AT + datetime.timedelta(days=45),
+        )
+
+        self.assertEqual(
+            sorted(api.windows),
+            [
+                (_CREATED_AT, _CREATED_AT + datetime.timedelta(days=30)),
+                (
+                    _CREATED_AT + datetime.timedelta(days=30),
+                    _CREATED_AT + datetime.timedelta(days=45),
+                ),
+            ],
+        )
+        self.assertEqual(crypto_models.PortfolioTransfer.objects.count(), 1)
@@ -0,0 +1,115 @@
+import datetime
+import typing
+
+import simplejson
+
+from django.http import HttpResponse
+from django.views import View
+
+from divisions.common import utils as common_utils
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto.services import import_runs as import_runs_services
+from divisions.crypto.services import import_watermark as import_watermark_services
+
+MAX_LIMIT = 500
+
+
+def _json_response(content: typing.Any, status: int = 200) -> HttpResponse:
+    return HttpResponse(
+        status=status,
+        headers={"Content-Type": "application/json"},
+        content=simplejson.dumps(content, default=_serialize_value),
+    )
+
+
+def _serialize_value(value: typing.Any) -> typing.Any:
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+
+    raise TypeError("Object of type {} is not JSON serializable".format(type(value)))
+
+
+def _get_common_params(params: typing.Mapping) -> dict:
+    limit = int(params.get("limit", 50))
+    if not 0 < limit <= MAX_LIMIT:
+        raise ValueError("Limit must be between 1 and {}".format(MAX_LIMIT))
+
+    from_datetime = (
+        datetime.datetime.fromisoformat(params["from_datetime"])
+        if params.get("from_datetime")
+        else None
+    )
+    if from_datetime and from_datetime.tzinfo is None:
+        from_datetime = from_datetime.replace(tzinfo=datetime.timezone.utc)
+
+    return {
+        "provider": crypto_enums.CryptoProvider(params["provider"]),
+        "from_datetime": from_datetime,
+        "limit": limit,
+    }
+
+
+class ImportRuns(View):
+    def get(self, request, *args, **kwargs):
+        try:
+            params = _get_common_params(params=request.GET)
+            params["command"] = request.GET.get("command") or None
+        except Exception as e:
+            return _json_response(
+                content={"error": common_utils.get_exception_message(exception=e)},
+                status=400,
+            )
+
+        return _json_response(
+            content={"results": import_runs_services.get_import_runs(**params)}
+        )
+
+
+class ImportRunStages(View):
+    def get(self, request, *args, **kwargs):
+        try:
+            params = _get_common_params(params=request.GET)
+            params["stream"] = (
+                crypto_enums.ImportStream(request.GET["stream"])
+                if request.GET.get("stream")
+                else None
+            )
+        except Exception as e:
+            return _json_response(
+                content={"error": common_utils.get_exception_message(exception=e)},
+                status=400,
+            )
+
+        return _json_response(
+            content={"results": import_runs_services.get_import_stage_summary(**params)}
+        )
+
+
+class DataFreshness(View):
+    def get(self, request, *args, **kwargs):
+        try:
+            params = {
+                "provider": crypto_enums.CryptoProvider(request.GET["provider"]),
+                "stream": crypto_enums.ImportStream(request.GET["stream"])
+                if request.GET.get("stream")
+                else None,
+                "max_lag_seconds": int(request.GET["max_lag_seconds"])
+                if request.GET.get("max_lag_seconds")
+                else None,
+                "max_success_age_seconds": int(request.GET["max_success_age_seconds"])
+                if request.GET.get("max_success_age_seconds")
+                else None,
+            }
+        except Exception as e:
+            return _json_response(
+                content={"error": common_utils.get_exception_message(exception=e)},
+                status=400,
+            )
+
+        freshness = import_watermark_services.get_freshness(**params)
+        return _json_response(
+            content={
+                "results": freshness,
+                "stale_count": sum(row["stale"] for row in freshness),
+            }
+        )
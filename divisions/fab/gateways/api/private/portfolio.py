@@ -0,0 +1,150 @@
+import asyncio
+import datetime
+import decimal
+import typing
+
+import simplejson
+from asgiref.sync import sync_to_async
+
+from django import db
+from django.db import models as django_db_models
+from django.http import HttpResponse
+from django.views import View
+
+from divisions.common import utils as common_utils
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto.integrations.provider import enums as provider_enums
+from divisions.crypto.services import portfolio_overview as portfolio_overview_services
+
+
+def _json_response(content: typing.Any, status: int = 200) -> HttpResponse:
+    return HttpResponse(
+        status=status,
+        headers={"Content-Type": "application/json"},
+        content=simplejson.dumps(content, default=_serialize_value),
+    )
+
+
+def _serialize_value(value: typing.Any) -> typing.Any:
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+
+    raise TypeError("Object of type {} is not JSON serializable".format(type(value)))
+
+
+def _fetch_rows(queryset: django_db_models.QuerySet) -> typing.List[dict]:
+    # Runs on a pool thread with its own connection, drop it if it went stale.
+    db.close_old_connections()
+    return list(queryset)
+
+
+# Django async ORM calls all run on one shared thread, so independent queries are
+# sent to the thread pool instead to actually overlap.
+_fetch_rows_concurrently = sync_to_async(_fetch_rows, thread_sensitive=False)
+
+
+class TradePositions(View):
+    async def get(self, request, *args, **kwargs):
+        try:
+            provider = crypto_enums.CryptoProvider(request.GET["provider"])
+        except Exception as e:
+            return _json_response(
+                content={"error": common_utils.get_exception_message(exception=e)},
+                status=400,
+            )
+
+        return _json_response(
+            content={
+                "results": [
+                    trade_position
+                    async for trade_position in portfolio_overview_services.get_trade_positions(
+                        provider=provider
+                    )
+                ]
+            }
+        )
+
+
+class WalletBalances(View):
+    async def get(self, request, *args, **kwargs):
+        try:
+            provider = crypto_enums.CryptoProvider(request.GET["provider"])
+            wallet_type = provider_enums.WalletType(
+                request.GET.get("wallet_type", provider_enums.WalletType.DERIVATIVE.value)
+            )
+        except Exception as e:
+            return _json_response(
+                content={"error": common_utils.get_exception_message(exception=e)},
+                status=400,
+            )
+
+        return _json_response(
+            content={
+                "results": [
+                    wallet_balance
+                    async for wallet_balance in portfolio_overview_services.get_latest_wallet_balances(
+                        provider=provider, wallet_type=wallet_type
+                    )
+                ]
+            }
+        )
+
+
+class PortfolioOverview(View):
+    async def get(self, request, *args, **kwargs):
+        try:
+            provider = crypto_enums.CryptoProvider(request.GET["provider"])
+            wallet_type = provider_enums.WalletType(
+                request.GET.get("wallet_type", provider_enums.WalletType.DERIVATIVE.value)
+            )
+            trading_category = (
+                provider_enums.TradingCategory(request.GET["trading_category"])
+                if request.GET.get("trading_category")
+                else None
+            )
+        except Exception as e:
+            return _json_response(
+                content={"error": common_utils.get_exception_message(exception=e)},
+                status=400,
+            )
+
+        trade_positions, wallet_balances, day_pnl = await asyncio.gather(
+            _fetch_rows_concurrently(
+                portfolio_overview_services.get_trade_positions(provider=provider)
+            ),
+            _fetch_rows_concurrently(
+                portfolio_overview_services.get_latest_wallet_balances(
+                    provider=provider, wallet_type=wallet_type
+                )
+            ),
+            _fetch_rows_concurrently(
+                portfolio_overview_services.get_day_pnl(
+                    provider=provider, trading_category=trading_category
+                )
+            ),
+        )
+
+        return _json_response(
+            content={
+                "trade_positions": trade_positions,
+                "unrealised_pnl": sum(
+                    (
+                        trade_position["unrealised_pnl"]
+                        for trade_position in trade_positions
+                    ),
+                    decimal.Decimal("0"),
+                ),
+                "wallet_balances": wallet_balances,
+                "day_pnl": {
+                    "instruments": day_pnl,
+                    "closed_pnl": sum(
+                        (instrument_pnl["closed_pnl"] for instrument_pnl in day_pnl),
+                        decimal.Decimal("0"),
+                    ),
+                    "fees": sum(
+                        (instrument_pnl["fees"] for instrument_pnl in day_pnl),
+                        decimal.Decimal("0"),
+                    ),
+                },
+            }
+        )
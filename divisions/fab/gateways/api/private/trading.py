@@ -1,11 +1,327 @@
+import datetime
+import enum
+import hashlib
+import typing
+
 import simplejson
 
+from django.core.cache import cache
 from django.http import HttpResponse
+from django.http import HttpResponseNotModified
+from django.http import StreamingHttpResponse
+from django.utils import http as django_http_utils
 from django.views import View
 
+from divisions.common import utils as common_utils
+from divisions.crypto import enums as crypto_enums
+from divisions.crypto.integrations.provider import enums as provider_enums
+from divisions.crypto.integrations.provider import messages as provider_messages
+from divisions.crypto.integrations.provider.services import (
+    provider as provider_services,
+)
+from divisions.crypto.services import import_watermark as import_watermark_services
+from divisions.crypto.services import trade_orders as trade_orders_services
+from divisions.crypto.services import (
+    transaction_export as transaction_export_services,
+)
+
 
 class TradeOrders(View):
+    DEFAULT_PAGE_SIZE = 100
+    MAX_PAGE_SIZE = 50000
+    # Pages above this size are streamed instead of being built in memory.
+    STREAMING_PAGE_SIZE = 1000
+    ITERATOR_CHUNK_SIZE = 2000
+
+    def get(self, request, *args, **kwargs):
+        try:
+            filters = self._get_filters(params=request.GET)
+            page_size = int(request.GET.get("limit", self.DEFAULT_PAGE_SIZE))
+            if not 0 < page_size <= self.MAX_PAGE_SIZE:
+                raise ValueError(
+                    "Limit must be between 1 and {}".format(self.MAX_PAGE_SIZE)
+                )
+        except Exception as e:
+            return HttpResponse(
+                status=400,
+                headers={"Content-Type": "application/json"},
+                content=simplejson.dumps(
+                    {"error": common_utils.get_exception_message(exception=e)}
+                ),
+            )
+
+        # One extra row tells whether next page exists without a COUNT query.
+        trade_orders_qs = trade_orders_services.get_trade_orders(**filters)[
+            : page_size + 1
+        ]
+
+        if page_size > self.STREAMING_PAGE_SIZE:
+            return StreamingHttpResponse(
+                self._stream_page(
+                    rows=trade_orders_qs.iterator(chunk_size=self.ITERATOR_CHUNK_SIZE),
+                    page_size=page_size,
+                ),
+                content_type="application/json",
+            )
+
+        rows = [self._serialize_row(row=row) for row in trade_orders_qs]
+        return HttpResponse(
+            headers={"Content-Type": "application/json"},
+            content=simplejson.dumps(
+                {
+                    "results": rows[:page_size],
+                    "next_cursor": self._get_next_cursor(rows=rows, page_size=page_size),
+                },
+                default=self._serialize_value,
+            ),
+        )
+
+    def _stream_page(
+        self, rows: typing.Iterator[dict], page_size: int
+    ) -> typing.Iterator[str]:
+        yield '{"results": ['
+        chunk = []
+        is_first_chunk = True
+        last_row = None
+        next_cursor = None
+        for count, row in enumerate(rows, start=1):
+            if count > page_size:
+                next_cursor = self._get_cursor(row=last_row)
+                break
+
+            chunk.append(
+                simplejson.dumps(
+                    self._serialize_row(row=row), default=self._serialize_value
+                )
+            )
+            last_row = row
+            if len(chunk) == self.ITERATOR_CHUNK_SIZE:
+                yield ("" if is_first_chunk else ",") + ",".join(chunk)
+                chunk = []
+                is_first_chunk = False
+
+        if chunk:
+            yield ("" if is_first_chunk else ",") + ",".join(chunk)
+
+        yield '], "next_cursor": {}}}'.format(simplejson.dumps(next_cursor))
+
+    def _get_filters(self, params: typing.Mapping) -> dict:
+        after = None
+        if params.get("cursor"):
+            after_created_at, after_id = common_utils.decode_keyset_cursor(
+                cursor=params["cursor"]
+            )
+            after = (datetime.datetime.fromisoformat(after_created_at), int(after_id))
+
+        return {
+            "provider": crypto_enums.CryptoProvider(params["provider"])
+            if params.get("provider")
+            else None,
+            "instrument_names": params.getlist("instrument"),
+            "order_statuses": params.getlist("status"),
+            "from_datetime": self._parse_datetime(value=params.get("from_datetime")),
+            "to_datetime": self._parse_datetime(value=params.get("to_datetime")),
+            "after": after,
+        }
+
+    def _get_next_cursor(
+        self, rows: typing.List[dict], page_size: int
+    ) -> typing.Optional[str]:
+        if len(rows) <= page_size:
+            return None
+
+        return self._get_cursor(row=rows[page_size - 1])
+
+    @staticmethod
+    def _get_cursor(row: dict) -> str:
+        return common_utils.encode_keyset_cursor(values=[row["created_at"], row["id"]])
+
+    @staticmethod
+    def _serialize_row(row: dict) -> dict:
+        row["provider"] = crypto_enums.CryptoProvider.from_integer_choice(
+            row["provider"]
+        ).value
+        return row
+
+    @staticmethod
+    def _serialize_value(value: typing.Any) -> typing.Any:
+        if isinstance(value, datetime.datetime):
+            return value.isoformat()
+
+        raise TypeError("Object of type {} is not JSON serializable".format(type(value)))
+
+    @staticmethod
+    def _parse_datetime(value: typing.Optional[str]) -> typing.Optional[datetime.datetime]:
+        if not value:
+            return None
+
+        parsed_datetime = datetime.datetime.fromisoformat(value)
+        if parsed_datetime.tzinfo is None:
+            parsed_datetime = parsed_datetime.replace(tzinfo=datetime.timezone.utc)
+
+        return parsed_datetime
+
+
+class TradePositionPerformance(View):
+    CACHE_KEY_PREFIX = "trade-position-performance"
+
+    def get(self, request, *args, **kwargs):
+        try:
+            params = self._get_params(params=request.GET)
+        except Exception as e:
+            return HttpResponse(
+                status=400,
+                headers={"Content-Type": "application/json"},
+                content=simplejson.dumps(
+                    {"error": common_utils.get_exception_message(exception=e)}
+                ),
+            )
+
+        # Rollup only changes when PnL import commits, PnL watermarks of trading category
+        # version the response.
+        watermark_version = import_watermark_services.get_watermark_version(
+            provider=params["provider"],
+            stream=crypto_enums.ImportStream.TRADE_PNL,
+            key=params["trading_category"].name,
+        )
+        params_key = hashlib.sha1(
+            simplejson.dumps(
+                {
+                    key: value.name if isinstance(value, enum.Enum) else value
+                    for key, value in params.items()
+                },
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        ).hexdigest()
+        etag = django_http_utils.quote_etag(
+            hashlib.sha1(
+                "{}:{}".format(params_key, watermark_version).encode("utf-8")
+            ).hexdigest()
+        )
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+        if etag in django_http_utils.parse_etags(
+            request.headers.get("If-None-Match", "")
+        ):
+            return HttpResponseNotModified(headers=headers)
+
+        cache_key = "{}:{}:{}".format(
+            self.CACHE_KEY_PREFIX, params_key, watermark_version
+        )
+        content = cache.get(cache_key)
+        if content is None:
+            content = simplejson.dumps(
+                {
+                    "results": [
+                        self._serialize_trade_position_performance(
+                            trade_position_performance=trade_position_performance
+                        )
+                        for trade_position_performance in provider_services.get_trade_position_performance(
+                            **params
+                        )
+                    ]
+                }
+            )
+            cache.set(cache_key, content)
+
+        headers["Content-Type"] = "application/json"
+        return HttpResponse(headers=headers, content=content)
+
+    @staticmethod
+    def _get_params(params: typing.Mapping) -> dict:
+        rolling_window = int(
+            params.get("rolling_window") or provider_services.DEFAULT_ROLLING_WINDOW
+        )
+        if rolling_window < 1:
+            raise ValueError("Rolling window must be at least 1 bucket")
+
+        return {
+            "provider": crypto_enums.CryptoProvider(params["provider"]),
+            "trading_category": provider_enums.TradingCategory(
+                params["trading_category"]
+            ),
+            "aggregation_period": crypto_enums.AggregationPeriod[
+                params["aggregation_period"]
+            ],
+            "symbol": params.get("symbol") or None,
+            "from_date": datetime.date.fromisoformat(params["from_date"])
+            if params.get("from_date")
+            else None,
+            "to_date": datetime.date.fromisoformat(params["to_date"])
+            if params.get("to_date")
+            else None,
+            "rolling_window": rolling_window,
+        }
+
+    @staticmethod
+    def _serialize_trade_position_performance(
+        trade_position_performance: provider_messages.TradePositionPerformance,
+    ) -> dict:
+        serialized_trade_position_performance = trade_position_performance._asdict()
+        serialized_trade_position_performance[
+            "provider"
+        ] = trade_position_performance.provider.value
+        serialized_trade_position_performance[
+            "trading_category"
+        ] = trade_position_performance.trading_category.value
+        serialized_trade_position_performance["period_start"] = (
+            trade_position_performance.period_start.isoformat()
+            if trade_position_performance.period_start
+            else None
+        )
+        return serialized_trade_position_performance
+
+
+class TransactionExport(View):
+    CONTENT_TYPES = {
+        crypto_enums.ExportFormat.CSV: "text/csv",
+        crypto_enums.ExportFormat.NDJSON: "application/x-ndjson",
+    }
 
     def get(self, request, *args, **kwargs):
-        return HttpResponse(headers={'Content-Type': "application/json"}, content=simplejson.dumps({'test': 'response'}))
+        try:
+            dataset = crypto_enums.ExportDataset(request.GET["dataset"])
+            export_format = crypto_enums.ExportFormat(
+                request.GET.get("format", crypto_enums.ExportFormat.CSV.value)
+            )
+            compress = request.GET.get("gzip", "false").lower() == "true"
+            filters = {
+                "provider": crypto_enums.CryptoProvider(request.GET["provider"])
+                if request.GET.get("provider")
+                else None,
+                "instrument_names": request.GET.getlist("instrument"),
+                "from_datetime": TradeOrders._parse_datetime(
+                    value=request.GET.get("from_datetime")
+                ),
+                "to_datetime": TradeOrders._parse_datetime(
+                    value=request.GET.get("to_datetime")
+                ),
+            }
+        except Exception as e:
+            return HttpResponse(
+                status=400,
+                headers={"Content-Type": "application/json"},
+                content=simplejson.dumps(
+                    {"error": common_utils.get_exception_message(exception=e)}
+                ),
+            )
+
+        filename = "{}.{}".format(dataset.value.lower(), export_format.value)
+        if compress:
+            filename = "{}.gz".format(filename)
 
+        return StreamingHttpResponse(
+            transaction_export_services.iter_export(
+                dataset=dataset,
+                export_format=export_format,
+                compress=compress,
+                **filters,
+            ),
+            content_type="application/gzip"
+            if compress
+            else self.CONTENT_TYPES[export_format],
+            headers={
+                "Content-Disposition": 'attachment; filename="{}"'.format(filename)
+            },
+        )
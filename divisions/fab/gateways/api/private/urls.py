@@ -1,5 +1,7 @@
 from django.urls import path
 
+from divisions.fab.gateways.api.private import imports
+from divisions.fab.gateways.api.private import portfolio
 from divisions.fab.gateways.api.private import trading
 
 urlpatterns = [
@@ -8,4 +10,44 @@ urlpatterns = [
         trading.TradeOrders.as_view(),
         name="trading.trade_orders",
     ),
+    path(
+        "private-api/trade-position-performance",
+        trading.TradePositionPerformance.as_view(),
+        name="trading.trade_position_performance",
+    ),
+    path(
+        "private-api/transaction-export",
+        trading.TransactionExport.as_view(),
+        name="trading.transaction_export",
+    ),
+    path(
+        "private-api/trade-positions",
+        portfolio.TradePositions.as_view(),
+        name="portfolio.trade_positions",
+    ),
+    path(
+        "private-api/wallet-balances",
+        portfolio.WalletBalances.as_view(),
+        name="portfolio.wallet_balances",
+    ),
+    path(
+        "private-api/portfolio-overview",
+        portfolio.PortfolioOverview.as_view(),
+        name="portfolio.portfolio_overview",
+    ),
+    path(
+        "private-api/import-runs",
+        imports.ImportRuns.as_view(),
+        name="imports.import_runs",
+    ),
+    path(
+        "private-api/import-run-stages",
+        imports.ImportRunStages.as_view(),
+        name="imports.import_run_stages",
+    ),
+    path(
+        "private-api/data-freshness",
+        imports.DataFreshness.as_view(),
+        name="imports.data_freshness",
+    ),
 ]
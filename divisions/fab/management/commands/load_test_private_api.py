@@ -0,0 +1,154 @@
+import concurrent.futures
+import logging
+import threading
+import time
+import typing
+from urllib import parse as url_parser
+
+import requests
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from divisions.common import utils as common_utils
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = """
+            Fires concurrent GET requests at running private API server and reports latency percentiles.
+            Run once against WSGI and once against ASGI server with same arguments to compare them.
+            ex. python manage.py load_test_private_api --base-url=http://localhost:8001 --path=private-api/portfolio-overview --query=provider=BYBIT [--concurrency=32] [--requests=2000]
+            """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--base-url",
+            help="Base URL of running server.",
+            required=True,
+            type=str,
+        )
+        parser.add_argument(
+            "--path",
+            help="API path to request. Can be repeated, paths are requested round robin.",
+            required=True,
+            action="append",
+        )
+        parser.add_argument(
+            "--query",
+            help="Query string appended to every request.",
+            required=False,
+            type=str,
+            default="",
+        )
+        parser.add_argument(
+            "--concurrency",
+            help="Number of concurrent clients.",
+            required=False,
+            type=int,
+            default=32,
+        )
+        parser.add_argument(
+            "--requests",
+            help="Total number of requests.",
+            required=False,
+            type=int,
+            default=2000,
+        )
+        parser.add_argument(
+            "--timeout",
+            help="Request timeout in seconds.",
+            required=False,
+            type=float,
+            default=30,
+        )
+
+    base_url = None
+    paths = None
+    query = None
+    concurrency = None
+    number_of_requests = None
+    timeout = None
+
+    log_prefix = "[LOAD-TEST-PRIVATE-API]"
+
+    def handle(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self._setup_config_variables(kwargs=kwargs)
+        logger.info(
+            "{} Started command '{}' (base_url={}, paths={}, concurrency={}, requests={}).".format(
+                self.log_prefix,
+                __name__.split(".")[-1],
+                self.base_url,
+                self.paths,
+                self.concurrency,
+                self.number_of_requests,
+            )
+        )
+
+        urls = [
+            "{}?{}".format(url_parser.urljoin(self.base_url, path), self.query)
+            for path in self.paths
+        ]
+        sessions = threading.local()
+
+        def request(request_number: int) -> typing.Tuple[float, typing.Optional[int]]:
+            if not hasattr(sessions, "session"):
+                sessions.session = requests.Session()
+
+            started_at = time.perf_counter()
+            try:
+                status_code = sessions.session.get(
+                    urls[request_number % len(urls)], timeout=self.timeout
+                ).status_code
+            except requests.RequestException:
+                status_code = None
+
+            return time.perf_counter() - started_at, status_code
+
+        started_at = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.concurrency
+        ) as executor:
+            results = list(executor.map(request, range(self.number_of_requests)))
+        elapsed = time.perf_counter() - started_at
+
+        latencies = sorted(latency for latency, _ in results)
+        errors_count = sum(
+            1 for _, status_code in results if status_code is None or status_code >= 400
+        )
+        logger.info(
+            "{} Finished {} requests in {:.2f}s ({:.1f} req/s, errors={}). Latency ms p50={:.1f} p90={:.1f} p99={:.1f} max={:.1f}.".format(
+                self.log_prefix,
+                len(results),
+                elapsed,
+                len(results) / elapsed,
+                errors_count,
+                self._get_percentile(latencies=latencies, percentile=50) * 1000,
+                self._get_percentile(latencies=latencies, percentile=90) * 1000,
+                self._get_percentile(latencies=latencies, percentile=99) * 1000,
+                latencies[-1] * 1000,
+            )
+        )
+
+    @staticmethod
+    def _get_percentile(latencies: typing.List[float], percentile: int) -> float:
+        return latencies[min(len(latencies) - 1, len(latencies) * percentile // 100)]
+
+    def _setup_config_variables(self, kwargs: typing.Dict) -> None:
+        try:
+            self.base_url = kwargs["base_url"]
+            self.paths = kwargs["path"]
+            self.query = kwargs["query"]
+            self.concurrency = kwargs["concurrency"]
+            self.number_of_requests = kwargs["requests"]
+            self.timeout = kwargs["timeout"]
+            if self.concurrency <= 0 or self.number_of_requests <= 0:
+                raise ValueError("Concurrency and number of requests must be positive")
+        except Exception as e:
+            msg = "Unable to setup config variables. Error: {}".format(
+                common_utils.get_exception_message(exception=e)
+            )
+            logger.exception("{} {}. Exiting.".format(self.log_prefix, msg))
+            raise CommandError(msg)
@@ -0,0 +1,35 @@
+# Generated by Django 4.1.7 on 2026-10-19 00:08
+
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crypto', '0012_alter_tradeorder_order_side'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TradePnLDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('provider', models.PositiveSmallIntegerField()),
+                ('trading_category', models.CharField(max_length=255)),
+                ('instrument_name', models.CharField(max_length=255)),
+                ('day', models.DateField()),
+                ('closed_pnl', models.DecimalField(decimal_places=8, default=Decimal('0'), max_digits=21)),
+                ('fees', models.DecimalField(decimal_places=8, default=Decimal('0'), max_digits=21)),
+                ('volume', models.DecimalField(decimal_places=8, default=Decimal('0'), max_digits=21)),
+                ('trade_count', models.PositiveIntegerField(default=0)),
+                ('win_count', models.PositiveIntegerField(default=0)),
+                ('loss_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'crypto_tradepnldailyrollup',
+                'unique_together': {('provider', 'trading_category', 'instrument_name', 'day')},
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.1.7 on 2026-10-19 00:13
+
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crypto', '0013_tradepnldailyrollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TradePositionLedgerCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('provider', models.PositiveSmallIntegerField()),
+                ('instrument_name', models.CharField(max_length=255)),
+                ('cost_basis_method', models.CharField(max_length=255)),
+                ('position_quantity', models.DecimalField(decimal_places=8, default=Decimal('0'), max_digits=21)),
+                ('position_cost', models.DecimalField(decimal_places=8, default=Decimal('0'), max_digits=21)),
+                ('realised_pnl', models.DecimalField(decimal_places=8, default=Decimal('0'), max_digits=21)),
+                ('fees', models.DecimalField(decimal_places=8, default=Decimal('0'), max_digits=21)),
+                ('open_lots', models.JSONField(default=list)),
+                ('executions_count', models.PositiveBigIntegerField(default=0)),
+                ('last_execution_created_at', models.DateTimeField()),
+                ('last_execution_id', models.BigIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'crypto_tradepositionledgercheckpoint',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='tradeexecutiontransaction',
+            index=models.Index(fields=['provider', 'instrument_name', 'created_at', 'id'], name='crypto_execution_replay_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tradepositionledgercheckpoint',
+            index=models.Index(fields=['provider', 'instrument_name', 'cost_basis_method', 'last_execution_created_at'], name='crypto_ledger_checkpoint_idx'),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 4.1.7 on 2026-10-19 00:14
+
+from decimal import Decimal
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crypto', '0014_tradepositionledgercheckpoint_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PortfolioUnitTransaction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('provider', models.PositiveSmallIntegerField()),
+                ('portfolio_type', models.CharField(max_length=255)),
+                ('net_asset_value', models.DecimalField(decimal_places=8, max_digits=21)),
+                ('unit_price', models.DecimalField(decimal_places=8, max_digits=21)),
+                ('units', models.DecimalField(decimal_places=8, max_digits=21)),
+                ('investor_units', models.DecimalField(decimal_places=8, max_digits=21)),
+                ('portfolio_units', models.DecimalField(decimal_places=8, max_digits=21)),
+                ('datetime', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('portfolio_user', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='portfolio_unit_transaction', to='crypto.portfolioaccountprofile')),
+                ('transfer', models.OneToOneField(on_delete=django.db.models.deletion.PROTECT, related_name='portfolio_unit_transaction', to='crypto.portfoliotransfer')),
+            ],
+            options={
+                'db_table': 'crypto_portfoliounittransaction',
+            },
+        ),
+        migrations.CreateModel(
+            name='PortfolioUnitBalance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('provider', models.PositiveSmallIntegerField()),
+                ('portfolio_type', models.CharField(max_length=255)),
+                ('total_units', models.DecimalField(decimal_places=8, default=Decimal('0'), max_digits=21)),
+                ('last_transaction_datetime', models.DateTimeField(null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'crypto_portfoliounitbalance',
+                'unique_together': {('provider', 'portfolio_type')},
+            },
+        ),
+        migrations.CreateModel(
+            name='PortfolioInvestorUnitBalance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('provider', models.PositiveSmallIntegerField()),
+                ('portfolio_type', models.CharField(max_length=255)),
+                ('units', models.DecimalField(decimal_places=8, default=Decimal('0'), max_digits=21)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('portfolio_user', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='portfolio_unit_balance', to='crypto.portfolioaccountprofile')),
+            ],
+            options={
+                'db_table': 'crypto_portfolioinvestorunitbalance',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='portfoliounittransaction',
+            index=models.Index(fields=['provider', 'portfolio_type', 'datetime'], name='crypto_unit_tx_portfolio_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='portfoliounittransaction',
+            index=models.Index(fields=['provider', 'portfolio_type', 'portfolio_user', 'datetime'], name='crypto_unit_tx_investor_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='portfolioinvestorunitbalance',
+            unique_together={('provider', 'portfolio_type', 'portfolio_user')},
+        ),
+    ]
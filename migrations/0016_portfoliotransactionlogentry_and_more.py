@@ -0,0 +1,49 @@
+# Generated by Django 4.1.7 on 2026-10-19 00:17
+
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crypto', '0015_portfoliounittransaction_portfoliounitbalance_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PortfolioTransactionLogEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('provider', models.PositiveSmallIntegerField()),
+                ('transaction_id', models.CharField(max_length=255)),
+                ('currency', models.CharField(max_length=255)),
+                ('instrument_name', models.CharField(max_length=255, null=True)),
+                ('type', models.CharField(max_length=255)),
+                ('side', models.CharField(max_length=255, null=True)),
+                ('quantity', models.DecimalField(decimal_places=8, default=Decimal('0'), max_digits=21)),
+                ('position_size', models.DecimalField(decimal_places=8, default=Decimal('0'), max_digits=21)),
+                ('price', models.DecimalField(decimal_places=8, max_digits=21, null=True)),
+                ('funding', models.DecimalField(decimal_places=8, default=Decimal('0'), max_digits=21)),
+                ('fee', models.DecimalField(decimal_places=8, default=Decimal('0'), max_digits=21)),
+                ('cash_flow', models.DecimalField(decimal_places=8, default=Decimal('0'), max_digits=21)),
+                ('change', models.DecimalField(decimal_places=8, default=Decimal('0'), max_digits=21)),
+                ('wallet_balance', models.DecimalField(decimal_places=8, default=Decimal('0'), max_digits=21)),
+                ('fee_rate', models.DecimalField(decimal_places=8, max_digits=21, null=True)),
+                ('trade_id', models.CharField(max_length=255, null=True)),
+                ('order_id', models.CharField(max_length=255, null=True)),
+                ('created_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'crypto_portfoliotransactionlogentry',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='portfoliotransactionlogentry',
+            index=models.Index(fields=['provider', 'currency', 'created_at'], name='crypto_transaction_log_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='portfoliotransactionlogentry',
+            unique_together={('provider', 'transaction_id')},
+        ),
+    ]
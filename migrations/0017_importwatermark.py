@@ -0,0 +1,28 @@
+# Generated by Django 4.1.7 on 2026-10-19 00:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crypto', '0016_portfoliotransactionlogentry_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('provider', models.PositiveSmallIntegerField()),
+                ('stream', models.CharField(max_length=255)),
+                ('key', models.CharField(default='', max_length=255)),
+                ('watermark', models.DateTimeField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'crypto_importwatermark',
+                'unique_together': {('provider', 'stream', 'key')},
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.1.7 on 2026-10-19 00:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crypto', '0017_importwatermark'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tradeorder',
+            index=models.Index(fields=['created_at', 'id'], name='crypto_order_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.1.7 on 2026-10-19 00:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crypto', '0018_tradeorder_crypto_order_keyset_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProviderRejectedRow',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('provider', models.PositiveSmallIntegerField()),
+                ('data_type', models.CharField(max_length=255)),
+                ('row_hash', models.CharField(max_length=64)),
+                ('row', models.JSONField()),
+                ('errors', models.JSONField()),
+                ('occurrences', models.PositiveIntegerField(default=1)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_seen_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'crypto_providerrejectedrow',
+                'unique_together': {('provider', 'data_type', 'row_hash')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.1.7 on 2026-10-19 00:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crypto', '0020_importrun_importrunstage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importwatermark',
+            name='last_success_at',
+            field=models.DateTimeField(null=True),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.1.7 on 2026-10-19 01:13
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crypto', '0021_importwatermark_last_success_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='providerrejectedrow',
+            name='errors',
+            field=models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder),
+        ),
+        migrations.AlterField(
+            model_name='providerrejectedrow',
+            name='row',
+            field=models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.1.7 on 2026-10-19 01:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crypto', '0022_providerrejectedrow_json_encoder'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tradeorder',
+            name='trading_category',
+            field=models.CharField(max_length=255, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.1.7 on 2026-10-19 01:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crypto', '0023_tradeorder_trading_category'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='importwatermark',
+            name='watermark',
+            field=models.DateTimeField(null=True),
+        ),
+    ]